@@ -24,7 +24,9 @@ from enum import Enum, auto, unique
 from typing import Dict, Type
 
 from bip_utils import Bip39SeedGenerator
-from tests import (BenchmarkTestsBase, Ed25519Blake2bTests, Ed25519KholawTests,
+from tests import (BenchmarkTestsBase, Bip32ChildKeyTests,
+                   Bip32ChildrenRangeTests, Bip32ParallelTests, Bip44IterAddressesTests, Ed25519Blake2bTests,
+                   Ed25519KholawTests,
                    Ed25519Tests, MoneroTests, Nist256p1Tests, Secp256k1Tests,
                    SubstrateTests)
 
@@ -39,6 +41,10 @@ class TestTypes(Enum):
     ED25519_KHOLAW = auto()
     SUBSTRATE = auto()
     MONERO = auto()
+    BIP32_CHILD_KEY = auto()
+    BIP32_CHILDREN_RANGE = auto()
+    BIP32_PARALLEL = auto()
+    BIP44_ITER_ADDRESSES = auto()
 
 
 # Tests constants
@@ -52,6 +58,10 @@ class TestsConsts:
         TestTypes.ED25519_KHOLAW: Ed25519KholawTests,
         TestTypes.SUBSTRATE: SubstrateTests,
         TestTypes.MONERO: MoneroTests,
+        TestTypes.BIP32_CHILD_KEY: Bip32ChildKeyTests,
+        TestTypes.BIP32_CHILDREN_RANGE: Bip32ChildrenRangeTests,
+        TestTypes.BIP32_PARALLEL: Bip32ParallelTests,
+        TestTypes.BIP44_ITER_ADDRESSES: Bip44IterAddressesTests,
     }
 
 
@@ -0,0 +1,74 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import timeit
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicDecoder, Bip39MnemonicEncoder, Bip39MnemonicValidator, Bip39WordsNum, Sha256
+)
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39MnemonicConst
+
+
+class TestsConf:
+    ITR_NUM: int = 20000
+    RUN_NUM: int = 5
+    LANG: Bip39Languages = Bip39Languages.ENGLISH
+
+
+def best_time_us(fct, itr_num: int, run_num: int) -> float:
+    return min(timeit.repeat(fct, number=itr_num, repeat=run_num)) / itr_num * 1e6
+
+
+def main() -> None:
+    # Print info
+    print("\nBIP39 benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of iterations: {TestsConf.ITR_NUM}")
+    print(f"  - Number of runs: {TestsConf.RUN_NUM}")
+    print(f"  - Language: {TestsConf.LANG}\n")
+
+    encoder = Bip39MnemonicEncoder(TestsConf.LANG)
+    decoder = Bip39MnemonicDecoder(TestsConf.LANG)
+    auto_decoder = Bip39MnemonicDecoder()
+    validator = Bip39MnemonicValidator()
+
+    print("|Words|Encode|Decode|Decode (auto language)|Validate (auto language)|SHA256 of entropy|")
+    print("|---|---|---|---|---|---|")
+    for words_num in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+        entropy_bytes = os.urandom(Bip39WordsNum(words_num) * Bip39MnemonicConst.WORD_BIT_LEN * 32 // 33 // 8)
+        mnemonic = encoder.Encode(entropy_bytes)
+
+        times = [
+            best_time_us(fct, TestsConf.ITR_NUM, TestsConf.RUN_NUM)
+            for fct in (lambda: encoder.Encode(entropy_bytes),
+                        lambda: decoder.Decode(mnemonic),
+                        lambda: auto_decoder.Decode(mnemonic),
+                        lambda: validator.IsValid(mnemonic),
+                        lambda: Sha256.QuickDigest(entropy_bytes))
+        ]
+        print(f"|{int(words_num)}|" + "|".join(f"{t:.2f}us" for t in times) + "|")
+
+    print("\nBIP39 benchmark completed.\n")
+
+
+if __name__ == "__main__":
+    main()
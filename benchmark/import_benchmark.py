@@ -0,0 +1,81 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+
+class TestsConf:
+    RUN_NUM: int = 5
+    HEAVY_MODULES: List[str] = [
+        "Crypto", "cbor2", "coincurve", "crcmod", "ecdsa", "ed25519_blake2b", "nacl", "sr25519",
+    ]
+
+
+# Code executed in a fresh interpreter, so that no module is already cached
+SCENARIOS: Dict[str, str] = {
+    "import": "import bip_utils",
+    "bip39+bip44 (secp256k1)": (
+        "import bip_utils\n"
+        "seed = bip_utils.Bip39SeedGenerator(bip_utils.Bip39MnemonicGenerator().FromWordsNumber(12)).Generate()\n"
+        "bip_utils.Bip44.FromSeed(seed, bip_utils.Bip44Coins.BITCOIN).DeriveDefaultPath().PublicKey().ToAddress()\n"
+    ),
+}
+
+RUNNER_CODE: str = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({"time": elapsed, "modules": sorted(m.split(".")[0] for m in sys.modules)}))
+"""
+
+
+def run_scenario(code: str) -> Dict:
+    out = subprocess.run([sys.executable, "-c", RUNNER_CODE, code],
+                         check=True,
+                         capture_output=True,
+                         text=True).stdout
+    return json.loads(out)
+
+
+def main() -> None:
+    # Print info
+    print("\nImport benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of runs: {TestsConf.RUN_NUM}\n")
+
+    for name, code in SCENARIOS.items():
+        results = [run_scenario(code) for _ in range(TestsConf.RUN_NUM)]
+        best_time = min(res["time"] for res in results)
+        loaded = [mod for mod in TestsConf.HEAVY_MODULES if mod in results[0]["modules"]]
+
+        print(f"Scenario: {name}")
+        print(f"  - Best time: {best_time * 1000:.0f}ms")
+        print(f"  - Heavy modules loaded: {', '.join(loaded) if loaded else 'none'}\n")
+
+    print("Import benchmark completed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import gc
+import tracemalloc
+from typing import List
+
+from bip_utils import Bip32Secp256k1, Bip39SeedGenerator
+
+
+class TestsConf:
+    NODE_NUM: int = 20000
+    DER_PATH: str = "m/44'/0'/0'/0"
+
+
+def derive_nodes(bip32_ctx: Bip32Secp256k1,
+                 node_num: int) -> List[Bip32Secp256k1]:
+    nodes = bip32_ctx.DeriveChildrenRange(0, node_num)
+    # Access the data usually needed for address matching, so that lazy members are computed
+    for node in nodes:
+        node.PublicKey().RawCompressed()
+        node.ParentFingerPrint()
+    return nodes
+
+
+def main() -> None:
+    # Print info
+    print("\nMemory benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of nodes: {TestsConf.NODE_NUM}")
+    print(f"  - Derivation path: {TestsConf.DER_PATH}\n")
+
+    # Generate a seed
+    mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "\
+               "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon art"
+    seed_bytes = Bip39SeedGenerator(mnemonic).Generate()
+
+    # Get the watch-only account node
+    bip32_ctx = Bip32Secp256k1.FromSeedAndPath(seed_bytes, TestsConf.DER_PATH)
+    bip32_ctx.ConvertToPublic()
+
+    # Measure memory allocated by Python for the derived nodes
+    gc.collect()
+    tracemalloc.start()
+    nodes = derive_nodes(bip32_ctx, TestsConf.NODE_NUM)
+    gc.collect()
+    mem_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Print memory usage
+    print("Memory benchmark completed.")
+    print(f"Total memory: {mem_size / 1024 / 1024:.1f}MB")
+    print(f"Memory per node: {mem_size / len(nodes):.0f} bytes\n")
+
+
+if __name__ == "__main__":
+    main()
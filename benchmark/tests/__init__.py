@@ -1,4 +1,7 @@
 from tests.benchmark_tests_base import BenchmarkTestsBase
+from tests.bip32_children_tests import (
+    Bip32ChildKeyTests, Bip32ChildrenRangeTests, Bip32ParallelTests, Bip44IterAddressesTests
+)
 from tests.ed25519_blake2b_tests import Ed25519Blake2bTests
 from tests.ed25519_kholaw_tests import Ed25519KholawTests
 from tests.ed25519_tests import Ed25519Tests
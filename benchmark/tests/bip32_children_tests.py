@@ -0,0 +1,114 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from abc import abstractmethod
+
+from bip_utils import (
+    Bip32ParallelDerivator, Bip32Secp256k1, Bip44, Bip44Changes, Bip44Coins, CoinsConf, P2PKHAddrEncoder
+)
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Bip32 children tests base class
+class Bip32ChildrenTestsBase(BenchmarkTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        bip32_ctx = Bip32Secp256k1.FromSeedAndPath(seed_bytes, "m/44'/0'/0'/0")
+        bip32_ctx.ConvertToPublic()
+
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            self._DeriveAddresses(bip32_ctx, i * self.m_test_cache_num, self.m_test_cache_num)
+
+    # Derive addresses
+    @abstractmethod
+    def _DeriveAddresses(self,
+                         bip32_ctx: Bip32Secp256k1,
+                         start: int,
+                         count: int) -> None:
+        pass
+
+
+# Bip32 ChildKey tests class
+class Bip32ChildKeyTests(Bip32ChildrenTestsBase):
+    # Derive addresses
+    def _DeriveAddresses(self,
+                         bip32_ctx: Bip32Secp256k1,
+                         start: int,
+                         count: int) -> None:
+        net_ver = CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver")
+        for i in range(start, start + count):
+            P2PKHAddrEncoder.EncodeKey(bip32_ctx.ChildKey(i).PublicKey().KeyObject(),
+                                       net_ver=net_ver)
+
+
+# Bip32 children range tests class
+class Bip32ChildrenRangeTests(Bip32ChildrenTestsBase):
+    # Derive addresses
+    def _DeriveAddresses(self,
+                         bip32_ctx: Bip32Secp256k1,
+                         start: int,
+                         count: int) -> None:
+        net_ver = CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver")
+        for pub_key_bytes, _ in bip32_ctx.IterChildrenKeysRange(start, count):
+            P2PKHAddrEncoder.EncodeKey(pub_key_bytes,
+                                       net_ver=net_ver)
+
+
+# Bip44 IterAddresses tests class
+class Bip44IterAddressesTests(BenchmarkTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        bip44_chg_ctx = Bip44.FromSeed(seed_bytes, Bip44Coins.BITCOIN).Purpose().Coin().Account(0).Change(
+            Bip44Changes.CHAIN_EXT
+        )
+
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            for _ in bip44_chg_ctx.IterAddresses(i * self.m_test_cache_num, self.m_test_cache_num):
+                pass
+
+
+# Encode P2PKH address (module-level to be picklable by the parallel derivator)
+def encode_p2pkh_addr(bip32_ctx: Bip32Secp256k1) -> str:
+    return P2PKHAddrEncoder.EncodeKey(bip32_ctx.PublicKey().KeyObject(),
+                                      net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"))
+
+
+# Bip32 parallel derivator tests class
+class Bip32ParallelTests(Bip32ChildrenTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        bip32_ctx = Bip32Secp256k1.FromSeedAndPath(seed_bytes, "m/44'/0'/0'/0")
+        bip32_ctx.ConvertToPublic()
+
+        # Derive all addresses at once, using the cache number as chunk size
+        self._DeriveAddresses(bip32_ctx, 0, self.m_test_itr_num)
+
+    # Derive addresses
+    def _DeriveAddresses(self,
+                         bip32_ctx: Bip32Secp256k1,
+                         start: int,
+                         count: int) -> None:
+        par_der = Bip32ParallelDerivator(bip32_ctx, chunk_size=self.m_test_cache_num)
+        for _ in par_der.DeriveChildrenRange(start, count, result_fn=encode_p2pkh_addr):
+            pass
@@ -1,52 +1,127 @@
-from bip_utils.addr.ada_byron_addr import (
-    AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
-    AdaByronLegacyAddrEncoder
-)
-from bip_utils.addr.ada_shelley_addr import (
-    AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr,
-    AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder,
-    AdaShelleyStakingAddrEncoder
-)
-from bip_utils.addr.algo_addr import AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder
-from bip_utils.addr.aptos_addr import AptosAddr, AptosAddrDecoder, AptosAddrEncoder
-from bip_utils.addr.atom_addr import AtomAddr, AtomAddrDecoder, AtomAddrEncoder
-from bip_utils.addr.avax_addr import (
-    AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder,
-    AvaxXChainAddrEncoder
-)
-from bip_utils.addr.bch_addr_converter import BchAddrConverter
-from bip_utils.addr.egld_addr import EgldAddr, EgldAddrDecoder, EgldAddrEncoder
-from bip_utils.addr.eos_addr import EosAddr, EosAddrDecoder, EosAddrEncoder
-from bip_utils.addr.ergo_addr import ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder
-from bip_utils.addr.eth_addr import EthAddr, EthAddrDecoder, EthAddrEncoder
-from bip_utils.addr.fil_addr import FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder
-from bip_utils.addr.iaddr_encoder import IAddrEncoder
-from bip_utils.addr.icx_addr import IcxAddr, IcxAddrDecoder, IcxAddrEncoder
-from bip_utils.addr.inj_addr import InjAddr, InjAddrDecoder, InjAddrEncoder
-from bip_utils.addr.nano_addr import NanoAddr, NanoAddrDecoder, NanoAddrEncoder
-from bip_utils.addr.near_addr import NearAddr, NearAddrDecoder, NearAddrEncoder
-from bip_utils.addr.neo_addr import NeoAddr, NeoAddrDecoder, NeoAddrEncoder
-from bip_utils.addr.okex_addr import OkexAddr, OkexAddrDecoder, OkexAddrEncoder
-from bip_utils.addr.one_addr import OneAddr, OneAddrDecoder, OneAddrEncoder
-from bip_utils.addr.P2PKH_addr import (
-    BchP2PKHAddr, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder,
-    P2PKHPubKeyModes
-)
-from bip_utils.addr.P2SH_addr import (
-    BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder
-)
-from bip_utils.addr.P2TR_addr import P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder
-from bip_utils.addr.P2WPKH_addr import P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder
-from bip_utils.addr.sol_addr import SolAddr, SolAddrDecoder, SolAddrEncoder
-from bip_utils.addr.substrate_addr import (
-    SubstrateEd25519Addr, SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519Addr,
-    SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder
-)
-from bip_utils.addr.trx_addr import TrxAddr, TrxAddrDecoder, TrxAddrEncoder
-from bip_utils.addr.xlm_addr import XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes
-from bip_utils.addr.xmr_addr import (
-    XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder
-)
-from bip_utils.addr.xrp_addr import XrpAddr, XrpAddrDecoder, XrpAddrEncoder
-from bip_utils.addr.xtz_addr import XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes
-from bip_utils.addr.zil_addr import ZilAddr, ZilAddrDecoder, ZilAddrEncoder
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.addr.ada_byron_addr import (
+        AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
+        AdaByronLegacyAddrEncoder
+    )
+    from bip_utils.addr.ada_shelley_addr import (
+        AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr,
+        AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder,
+        AdaShelleyStakingAddrEncoder
+    )
+    from bip_utils.addr.algo_addr import AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder
+    from bip_utils.addr.aptos_addr import AptosAddr, AptosAddrDecoder, AptosAddrEncoder
+    from bip_utils.addr.atom_addr import AtomAddr, AtomAddrDecoder, AtomAddrEncoder
+    from bip_utils.addr.avax_addr import (
+        AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder,
+        AvaxXChainAddrEncoder
+    )
+    from bip_utils.addr.bch_addr_converter import BchAddrConverter
+    from bip_utils.addr.egld_addr import EgldAddr, EgldAddrDecoder, EgldAddrEncoder
+    from bip_utils.addr.eos_addr import EosAddr, EosAddrDecoder, EosAddrEncoder
+    from bip_utils.addr.ergo_addr import ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder
+    from bip_utils.addr.eth_addr import EthAddr, EthAddrDecoder, EthAddrEncoder
+    from bip_utils.addr.fil_addr import FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder
+    from bip_utils.addr.iaddr_encoder import IAddrEncoder
+    from bip_utils.addr.icx_addr import IcxAddr, IcxAddrDecoder, IcxAddrEncoder
+    from bip_utils.addr.inj_addr import InjAddr, InjAddrDecoder, InjAddrEncoder
+    from bip_utils.addr.nano_addr import NanoAddr, NanoAddrDecoder, NanoAddrEncoder
+    from bip_utils.addr.near_addr import NearAddr, NearAddrDecoder, NearAddrEncoder
+    from bip_utils.addr.neo_addr import NeoAddr, NeoAddrDecoder, NeoAddrEncoder
+    from bip_utils.addr.okex_addr import OkexAddr, OkexAddrDecoder, OkexAddrEncoder
+    from bip_utils.addr.one_addr import OneAddr, OneAddrDecoder, OneAddrEncoder
+    from bip_utils.addr.P2PKH_addr import (
+        BchP2PKHAddr, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder,
+        P2PKHPubKeyModes
+    )
+    from bip_utils.addr.P2SH_addr import (
+        BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder
+    )
+    from bip_utils.addr.P2TR_addr import P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder
+    from bip_utils.addr.P2WPKH_addr import P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder
+    from bip_utils.addr.sol_addr import SolAddr, SolAddrDecoder, SolAddrEncoder
+    from bip_utils.addr.substrate_addr import (
+        SubstrateEd25519Addr, SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519Addr,
+        SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder
+    )
+    from bip_utils.addr.trx_addr import TrxAddr, TrxAddrDecoder, TrxAddrEncoder
+    from bip_utils.addr.xlm_addr import XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes
+    from bip_utils.addr.xmr_addr import (
+        XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder
+    )
+    from bip_utils.addr.xrp_addr import XrpAddr, XrpAddrDecoder, XrpAddrEncoder
+    from bip_utils.addr.xtz_addr import XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes
+    from bip_utils.addr.zil_addr import ZilAddr, ZilAddrDecoder, ZilAddrEncoder
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.addr.ada_byron_addr": (
+        "AdaByronAddrDecoder", "AdaByronAddrTypes", "AdaByronIcarusAddr", "AdaByronIcarusAddrEncoder",
+        "AdaByronLegacyAddr", "AdaByronLegacyAddrEncoder",
+    ),
+    "bip_utils.addr.ada_shelley_addr": (
+        "AdaShelleyAddr", "AdaShelleyAddrDecoder", "AdaShelleyAddrEncoder", "AdaShelleyAddrNetworkTags",
+        "AdaShelleyRewardAddr", "AdaShelleyRewardAddrDecoder", "AdaShelleyRewardAddrEncoder", "AdaShelleyStakingAddr",
+        "AdaShelleyStakingAddrDecoder", "AdaShelleyStakingAddrEncoder",
+    ),
+    "bip_utils.addr.algo_addr": ("AlgoAddr", "AlgoAddrDecoder", "AlgoAddrEncoder"),
+    "bip_utils.addr.aptos_addr": ("AptosAddr", "AptosAddrDecoder", "AptosAddrEncoder"),
+    "bip_utils.addr.atom_addr": ("AtomAddr", "AtomAddrDecoder", "AtomAddrEncoder"),
+    "bip_utils.addr.avax_addr": (
+        "AvaxPChainAddr", "AvaxPChainAddrDecoder", "AvaxPChainAddrEncoder", "AvaxXChainAddr", "AvaxXChainAddrDecoder",
+        "AvaxXChainAddrEncoder",
+    ),
+    "bip_utils.addr.bch_addr_converter": ("BchAddrConverter",),
+    "bip_utils.addr.egld_addr": ("EgldAddr", "EgldAddrDecoder", "EgldAddrEncoder"),
+    "bip_utils.addr.eos_addr": ("EosAddr", "EosAddrDecoder", "EosAddrEncoder"),
+    "bip_utils.addr.ergo_addr": ("ErgoNetworkTypes", "ErgoP2PKHAddr", "ErgoP2PKHAddrDecoder", "ErgoP2PKHAddrEncoder"),
+    "bip_utils.addr.eth_addr": ("EthAddr", "EthAddrDecoder", "EthAddrEncoder"),
+    "bip_utils.addr.fil_addr": ("FilSecp256k1Addr", "FilSecp256k1AddrDecoder", "FilSecp256k1AddrEncoder"),
+    "bip_utils.addr.iaddr_encoder": ("IAddrEncoder",),
+    "bip_utils.addr.icx_addr": ("IcxAddr", "IcxAddrDecoder", "IcxAddrEncoder"),
+    "bip_utils.addr.inj_addr": ("InjAddr", "InjAddrDecoder", "InjAddrEncoder"),
+    "bip_utils.addr.nano_addr": ("NanoAddr", "NanoAddrDecoder", "NanoAddrEncoder"),
+    "bip_utils.addr.near_addr": ("NearAddr", "NearAddrDecoder", "NearAddrEncoder"),
+    "bip_utils.addr.neo_addr": ("NeoAddr", "NeoAddrDecoder", "NeoAddrEncoder"),
+    "bip_utils.addr.okex_addr": ("OkexAddr", "OkexAddrDecoder", "OkexAddrEncoder"),
+    "bip_utils.addr.one_addr": ("OneAddr", "OneAddrDecoder", "OneAddrEncoder"),
+    "bip_utils.addr.P2PKH_addr": (
+        "BchP2PKHAddr", "BchP2PKHAddrDecoder", "BchP2PKHAddrEncoder", "P2PKHAddr", "P2PKHAddrDecoder",
+        "P2PKHAddrEncoder", "P2PKHPubKeyModes",
+    ),
+    "bip_utils.addr.P2SH_addr": (
+        "BchP2SHAddr", "BchP2SHAddrDecoder", "BchP2SHAddrEncoder", "P2SHAddr", "P2SHAddrDecoder", "P2SHAddrEncoder",
+    ),
+    "bip_utils.addr.P2TR_addr": ("P2TRAddr", "P2TRAddrDecoder", "P2TRAddrEncoder"),
+    "bip_utils.addr.P2WPKH_addr": ("P2WPKHAddr", "P2WPKHAddrDecoder", "P2WPKHAddrEncoder"),
+    "bip_utils.addr.sol_addr": ("SolAddr", "SolAddrDecoder", "SolAddrEncoder"),
+    "bip_utils.addr.substrate_addr": (
+        "SubstrateEd25519Addr", "SubstrateEd25519AddrDecoder", "SubstrateEd25519AddrEncoder", "SubstrateSr25519Addr",
+        "SubstrateSr25519AddrDecoder", "SubstrateSr25519AddrEncoder",
+    ),
+    "bip_utils.addr.trx_addr": ("TrxAddr", "TrxAddrDecoder", "TrxAddrEncoder"),
+    "bip_utils.addr.xlm_addr": ("XlmAddr", "XlmAddrDecoder", "XlmAddrEncoder", "XlmAddrTypes"),
+    "bip_utils.addr.xmr_addr": (
+        "XmrAddr", "XmrAddrDecoder", "XmrAddrEncoder", "XmrIntegratedAddr", "XmrIntegratedAddrDecoder",
+        "XmrIntegratedAddrEncoder",
+    ),
+    "bip_utils.addr.xrp_addr": ("XrpAddr", "XrpAddrDecoder", "XrpAddrEncoder"),
+    "bip_utils.addr.xtz_addr": ("XtzAddr", "XtzAddrDecoder", "XtzAddrEncoder", "XtzAddrPrefixes"),
+    "bip_utils.addr.zil_addr": ("ZilAddr", "ZilAddrDecoder", "ZilAddrEncoder"),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -21,12 +21,9 @@
 """Module with utility functions for validating address public keys."""
 
 # Imports
-from typing import Type, Union
+from typing import Union
 
-from bip_utils.ecc import (
-    Ed25519Blake2bPublicKey, Ed25519MoneroPublicKey, Ed25519PublicKey, EllipticCurveGetter, IPublicKey,
-    Nist256p1PublicKey, Secp256k1PublicKey, Sr25519PublicKey
-)
+from bip_utils.ecc import EllipticCurveGetter, EllipticCurveTypes, IPublicKey
 
 
 class AddrKeyValidator:
@@ -47,7 +44,7 @@ class AddrKeyValidator:
             TypeError: If the public key is not ed25519
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Ed25519PublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.ED25519)
 
     @staticmethod
     def ValidateAndGetEd25519Blake2bKey(pub_key: Union[bytes, IPublicKey]) -> IPublicKey:
@@ -64,7 +61,7 @@ class AddrKeyValidator:
             TypeError: If the public key is not ed25519-blake2b
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Ed25519Blake2bPublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.ED25519_BLAKE2B)
 
     @staticmethod
     def ValidateAndGetEd25519MoneroKey(pub_key: Union[bytes, IPublicKey]) -> IPublicKey:
@@ -81,7 +78,7 @@ class AddrKeyValidator:
             TypeError: If the public key is not ed25519-monero
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Ed25519MoneroPublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.ED25519_MONERO)
 
     @staticmethod
     def ValidateAndGetNist256p1Key(pub_key: Union[bytes, IPublicKey]) -> IPublicKey:
@@ -98,7 +95,7 @@ class AddrKeyValidator:
             TypeError: If the public key is not nist256p1
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Nist256p1PublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.NIST256P1)
 
     @staticmethod
     def ValidateAndGetSecp256k1Key(pub_key: Union[bytes, IPublicKey]) -> IPublicKey:
@@ -115,7 +112,7 @@ class AddrKeyValidator:
             TypeError: If the public key is not secp256k1
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Secp256k1PublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.SECP256K1)
 
     @staticmethod
     def ValidateAndGetSr25519Key(pub_key: Union[bytes, IPublicKey]) -> IPublicKey:
@@ -132,17 +129,17 @@ class AddrKeyValidator:
             TypeError: If the public key is not sr25519
             ValueError: If the public key is not valid
         """
-        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Sr25519PublicKey)
+        return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, EllipticCurveTypes.SR25519)
 
     @staticmethod
     def __ValidateAndGetGenericKey(pub_key: Union[bytes, IPublicKey],
-                                   pub_key_cls: Type[IPublicKey]) -> IPublicKey:
+                                   curve_type: EllipticCurveTypes) -> IPublicKey:
         """
         Validate and get a generic public key.
 
         Args:
             pub_key (bytes or IPublicKey object): Public key bytes or object
-            pub_key_cls (IPublicKey)            : Public key class type
+            curve_type (EllipticCurveTypes)     : Curve type
 
         Returns:
             IPublicKey object: IPublicKey object
@@ -151,10 +148,12 @@ class AddrKeyValidator:
             TypeError: If the public key is not of the correct class type
             ValueError: If the public key is not valid
         """
+        curve = EllipticCurveGetter.FromType(curve_type)
+        pub_key_cls = curve.PublicKeyClass()
+
         if isinstance(pub_key, bytes):
             pub_key = pub_key_cls.FromBytes(pub_key)
         elif not isinstance(pub_key, pub_key_cls):
-            curve = EllipticCurveGetter.FromType(pub_key_cls.CurveType())
             raise TypeError(f"A {curve.Name()} public key is required"
                             f"(expected: {pub_key_cls}, got: {type(pub_key)}")
 
@@ -23,18 +23,24 @@
 # Imports
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Optional, Type, Union
+from typing import Iterator, List, Optional, Sequence, Tuple, Type, Union
 
+from bip_utils.bip.bip32.base.bip32_der_cache import Bip32DerivationCache
 from bip_utils.bip.bip32.base.ibip32_key_derivator import IBip32KeyDerivator
 from bip_utils.bip.bip32.base.ibip32_mst_key_generator import IBip32MstKeyGenerator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
-from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_data import (
+    Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyDataConst, Bip32KeyIndex
+)
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
 from bip_utils.bip.bip32.bip32_key_ser import Bip32KeyDeserializer
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
+from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser, Bip32PathTemplate
+from bip_utils.bip.bip32.bip32_snapshot import Bip32SnapshotDecoder, Bip32SnapshotEncoder
 from bip_utils.ecc import EllipticCurve, EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey
+from bip_utils.utils.crypto import Sha256
 
 
 class Bip32Base(ABC):
@@ -203,6 +209,38 @@ class Bip32Base(ABC):
             key_net_ver=key_net_ver or cls._DefaultKeyNetVersion()
         )
 
+    @classmethod
+    def FromBytes(cls,
+                  snapshot_bytes: bytes) -> Bip32Base:
+        """
+        Create a Bip32 object from a binary snapshot record (see ToBytes).
+        Differently from FromExtendedKey, there is no Base58 decoding and checksum computation.
+        The cached public key of private records, if any, is not used since validating it costs more than
+        computing it (it can be got with Bip32SnapshotDecoder without constructing any key object).
+
+        Args:
+            snapshot_bytes (bytes): Snapshot record bytes
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the record or the key is not valid
+        """
+        snapshot = Bip32SnapshotDecoder.Decode(snapshot_bytes)
+        if snapshot.CurveType() != cls.CurveType():
+            raise Bip32KeyError(
+                f"Invalid snapshot curve type ({snapshot.CurveType()}), a {cls.Curve().Name()} key is required"
+            )
+
+        key_bytes = snapshot.KeyBytes()
+        return cls(
+            priv_key=key_bytes if not snapshot.IsPublic() else None,
+            pub_key=key_bytes if snapshot.IsPublic() else None,
+            key_data=snapshot.KeyData(),
+            key_net_ver=snapshot.KeyNetVersions()
+        )
+
     #
     # Public methods
     #
@@ -271,12 +309,16 @@ class Bip32Base(ABC):
         return self.__ValidateAndCkdPriv(index) if not self.IsPublicOnly() else self.__ValidateAndCkdPub(index)
 
     def DerivePath(self,
-                   path: Union[str, Bip32Path]) -> Bip32Base:
+                   path: Union[str, Bip32Path],
+                   cache: Optional[Bip32DerivationCache] = None) -> Bip32Base:
         """
         Derive children keys from the specified path.
+        If a cache is specified, the longest cached prefix of the path is reused and the derived nodes are
+        added to the cache.
 
         Args:
-            path (str or Bip32Path object): Path
+            path (str or Bip32Path object)               : Path
+            cache (Bip32DerivationCache object, optional): Derivation cache (default: None)
 
         Returns:
             Bip32Base object: Bip32Base object
@@ -290,17 +332,149 @@ class Bip32Base(ABC):
         if self.Depth() > 0 and path.IsAbsolute():
             raise ValueError("Absolute paths can only be derived from a master key, not child ones")
 
-        bip32_obj = self
-        # Derive children keys
-        for path_elem in path:
-            bip32_obj = bip32_obj.ChildKey(path_elem)
+        if cache is None:
+            bip32_obj = self
+            # Derive children keys
+            for path_elem in path:
+                bip32_obj = bip32_obj.ChildKey(path_elem)
+            return bip32_obj
+
+        return self.__DerivePathCached(path, cache)
+
+    def DerivePathTemplate(self,
+                           template: Union[str, Bip32PathTemplate]) -> Iterator[Tuple[Bip32Path, Bip32Base]]:
+        """
+        Derive all the paths of the specified template (e.g. m/84'/0'/0'/{0,1}/[0..9999]), lazily.
+        Nodes in common between paths are derived only once and ranges in the last element are derived
+        in batch.
+
+        Args:
+            template (str or Bip32PathTemplate object): Path template
+
+        Returns:
+            Iterator: Iterator of tuples with path and Bip32Base object, in lexicographic order of paths
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+            Bip32PathError: If the path template is not valid
+            ValueError: If the path template is a master one and the key is a child key
+        """
+        if isinstance(template, str):
+            template = Bip32PathParser.ParseTemplate(template)
+        if self.Depth() > 0 and template.IsAbsolute():
+            raise ValueError("Absolute paths can only be derived from a master key, not child ones")
+
+        return self.__DerivePathTemplateLevel(template.Elements(), (), template.IsAbsolute())
+
+    def DeriveChildrenRange(self,
+                            start: Union[int, Bip32KeyIndex],
+                            count: int,
+                            public_only: bool = False) -> List[Bip32Base]:
+        """
+        Derive a range of consecutive children keys of the current one.
+        It's equivalent to calling ChildKey for each index, but all the per-parent work is done only once.
+
+        Args:
+            start (int or Bip32KeyIndex object): First index
+            count (int)                        : Number of children
+            public_only (bool, optional)       : True for getting public-only children (default: False)
+
+        Returns:
+            list[Bip32Base]: List of Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If the indexes result in an invalid key
+            ValueError: If the range is not valid
+        """
+        return list(self.IterChildrenRange(start, count, public_only))
+
+    def IterChildrenRange(self,
+                          start: Union[int, Bip32KeyIndex],
+                          count: int,
+                          public_only: bool = False) -> Iterator[Bip32Base]:
+        """
+        Iterate over a range of consecutive children keys of the current one.
+        Generator version of DeriveChildrenRange.
+
+        Args:
+            start (int or Bip32KeyIndex object): First index
+            count (int)                        : Number of children
+            public_only (bool, optional)       : True for getting public-only children (default: False)
+
+        Returns:
+            Iterator object: Iterator over Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If the indexes result in an invalid key
+            ValueError: If the range is not valid
+        """
+        # Validate before returning the generator, so that errors are raised immediately
+        return self.__IterChildrenRange(self.__ValidateChildrenRange(start, count), public_only)
 
-        return bip32_obj
+    def IterChildrenKeysRange(self,
+                              start: Union[int, Bip32KeyIndex],
+                              count: int,
+                              public_only: bool = False) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterate over the raw keys of a range of consecutive children of the current one.
+        No child object is constructed, so it's the fastest way for getting many children keys.
+        Public keys are returned in compressed format.
+
+        Args:
+            start (int or Bip32KeyIndex object): First index
+            count (int)                        : Number of children
+            public_only (bool, optional)       : True for getting public keys also from a private parent
+                                                 (default: False)
+
+        Returns:
+            Iterator object: Iterator over key bytes (index 0) and chain code bytes (index 1)
+
+        Raises:
+            Bip32KeyError: If the indexes result in an invalid key
+            ValueError: If the range is not valid
+        """
+        # Validate before returning the generator, so that errors are raised immediately
+        return self.__IterChildrenKeysRange(self.__ValidateChildrenRange(start, count), public_only)
 
     def ConvertToPublic(self) -> None:
         """Convert the object into a public one."""
+
+        # Compute the public key and the parent fingerprint, if not done yet, so that no reference
+        # to the private key (or to the parent one) is kept
+        self.m_pub_key.KeyObject()
+        self.ParentFingerPrint()
         self.m_priv_key = None
 
+    def ToBytes(self,
+                include_pub_key: bool = False) -> bytes:
+        """
+        Get the object as a fixed-width binary snapshot record, that can be restored with FromBytes.
+        The record contains the key, the key data, the key net versions and the curve type.
+
+        Args:
+            include_pub_key (bool, optional): True for caching the public key, only for private objects
+                                              (default: False)
+
+        Returns:
+            bytes: Snapshot record bytes
+
+        Raises:
+            Bip32KeyError: If the curve is not supported
+        """
+        is_public = self.IsPublicOnly()
+        return Bip32SnapshotEncoder.Encode(
+            self.CurveType(),
+            (self.m_pub_key.RawCompressed().ToBytes()
+             if is_public
+             else self.PrivateKey().Raw().ToBytes()),
+            (self.m_pub_key.RawCompressed().ToBytes()
+             if include_pub_key and not is_public
+             else None),
+            self.m_pub_key.Data(),
+            self.KeyNetVersions(),
+            is_public
+        )
+
     def IsPublicOnly(self) -> bool:
         """
         Get if it's public-only.
@@ -413,6 +587,196 @@ class Bip32Base(ABC):
     # Private methods
     #
 
+    def __DerivePathCached(self,
+                           path: Bip32Path,
+                           cache: Bip32DerivationCache) -> Bip32Base:
+        """
+        Derive children keys from the specified path using the specified cache.
+        Cached nodes are never returned directly, so that they cannot be modified by the caller.
+
+        Args:
+            path (Bip32Path object)            : Path
+            cache (Bip32DerivationCache object): Derivation cache
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+        root_id = self.__CacheRootId()
+        path_elems = path.ToList()
+
+        found_len, bip32_obj = cache.Lookup(root_id, path_elems)
+        if bip32_obj is None:
+            bip32_obj = self
+
+        # Derive the remaining children keys
+        for i in range(found_len, len(path_elems)):
+            bip32_obj = bip32_obj.ChildKey(path_elems[i])
+            cache.Store(root_id, path_elems[:i + 1], bip32_obj)
+
+        return copy.copy(bip32_obj) if bip32_obj is not self else self
+
+    def __CacheRootId(self) -> bytes:
+        """
+        Get the identifier of the current node for the derivation cache.
+        The whole node is hashed, so that different nodes never share cached children.
+
+        Returns:
+            bytes: Node identifier
+        """
+        key_data = self.m_pub_key.Data()
+        key_bytes = (self.m_pub_key.RawCompressed().ToBytes()
+                     if self.IsPublicOnly()
+                     else self.PrivateKey().Raw().ToBytes())
+
+        return Sha256.QuickDigest(
+            self.__class__.__qualname__.encode()
+            + (b"\x01" if self.IsPublicOnly() else b"\x00")
+            + key_bytes
+            + key_data.ChainCode().ToBytes()
+            + key_data.Depth().ToBytes()
+            + key_data.Index().ToBytes()
+            + key_data.ParentFingerPrint().ToBytes()
+            + self.KeyNetVersions().Public()
+            + self.KeyNetVersions().Private()
+        )
+
+    def __IterChildrenRange(self,
+                            indexes: Iterator[Bip32KeyIndex],
+                            public_only: bool) -> Iterator[Bip32Base]:
+        """
+        Iterate over the children keys with the specified (already validated) indexes.
+
+        Args:
+            indexes (Iterator object): Iterator over Bip32KeyIndex objects
+            public_only (bool)       : True for getting public-only children
+
+        Returns:
+            Iterator object: Iterator over Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If the indexes result in an invalid key
+        """
+        # Per-parent data, computed only once
+        key_derivator = self._KeyDerivator()
+        key_net_ver = self.KeyNetVersions()
+        depth = self.Depth().Increase()
+        parent_fprint = self.m_pub_key.DeferredFingerPrint()
+
+        for index in indexes:
+            if not self.IsPublicOnly():
+                assert self.m_priv_key is not None
+                priv_key_bytes, chain_code_bytes = key_derivator.CkdPriv(self.m_priv_key,
+                                                                         self.m_pub_key,
+                                                                         index)
+                child = self.__class__(
+                    priv_key=priv_key_bytes,
+                    pub_key=None,
+                    key_data=Bip32KeyData(depth, index, chain_code_bytes, parent_fprint),
+                    key_net_ver=key_net_ver
+                )
+                if public_only:
+                    child.ConvertToPublic()
+            else:
+                pub_key, chain_code_bytes = key_derivator.CkdPub(self.m_pub_key,
+                                                                 index)
+                child = self.__class__(
+                    priv_key=None,
+                    pub_key=pub_key,
+                    key_data=Bip32KeyData(depth, index, chain_code_bytes, parent_fprint),
+                    key_net_ver=key_net_ver
+                )
+            yield child
+
+    def __IterChildrenKeysRange(self,
+                                indexes: Iterator[Bip32KeyIndex],
+                                public_only: bool) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterate over the raw children keys with the specified (already validated) indexes.
+
+        Args:
+            indexes (Iterator object): Iterator over Bip32KeyIndex objects
+            public_only (bool)       : True for getting public keys also from a private parent
+
+        Returns:
+            Iterator object: Iterator over key bytes (index 0) and chain code bytes (index 1)
+
+        Raises:
+            Bip32KeyError: If the indexes result in an invalid key
+        """
+        # Per-parent data, computed only once
+        key_derivator = self._KeyDerivator()
+        curve = self.Curve()
+        priv_key_cls = curve.PrivateKeyClass()
+        pub_key_cls = curve.PublicKeyClass()
+
+        for index in indexes:
+            if not self.IsPublicOnly():
+                assert self.m_priv_key is not None
+                key_bytes, chain_code_bytes = key_derivator.CkdPriv(self.m_priv_key,
+                                                                    self.m_pub_key,
+                                                                    index)
+                if public_only:
+                    try:
+                        key_bytes = priv_key_cls.FromBytes(key_bytes).PublicKey().RawCompressed().ToBytes()
+                    except ValueError as ex:
+                        raise Bip32KeyError("Invalid private key bytes") from ex
+            else:
+                pub_key, chain_code_bytes = key_derivator.CkdPub(self.m_pub_key,
+                                                                 index)
+                # Compressed key bytes computed by the derivator are already valid
+                if isinstance(pub_key, bytes) and len(pub_key) == pub_key_cls.CompressedLength():
+                    key_bytes = pub_key
+                else:
+                    try:
+                        key_bytes = (pub_key_cls.FromBytes(pub_key)
+                                     if isinstance(pub_key, bytes)
+                                     else pub_key_cls.FromPoint(pub_key)).RawCompressed().ToBytes()
+                    except ValueError as ex:
+                        raise Bip32KeyError("Invalid public key") from ex
+            yield key_bytes, chain_code_bytes
+
+    def __ValidateChildrenRange(self,
+                                start: Union[int, Bip32KeyIndex],
+                                count: int) -> Iterator[Bip32KeyIndex]:
+        """
+        Check the validity of a range of children indexes and get an iterator over them.
+        Since the hardened bit is the most significant one, checking the first and last index is enough.
+
+        Args:
+            start (int or Bip32KeyIndex object): First index
+            count (int)                        : Number of children
+
+        Returns:
+            Iterator object: Iterator over Bip32KeyIndex objects
+
+        Raises:
+            Bip32KeyError: If the indexes cannot be derived
+            ValueError: If the range is not valid
+        """
+        start_int = int(start)
+        if count < 0:
+            raise ValueError(f"Invalid children count ({count})")
+        if start_int < 0 or start_int + count - 1 > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError(f"Invalid children range ({start_int}, {count})")
+        if count == 0:
+            return iter(())
+
+        has_not_hardened = not Bip32KeyIndex.IsHardenedIndex(start_int)
+        has_hardened = Bip32KeyIndex.IsHardenedIndex(start_int + count - 1)
+
+        if self.IsPublicOnly():
+            if not self.IsPublicDerivationSupported():
+                raise Bip32KeyError("Public child derivation is not supported")
+            if has_hardened:
+                raise Bip32KeyError("Public child derivation cannot be used to create an hardened child key")
+        elif has_not_hardened and not self.IsPublicDerivationSupported():
+            raise Bip32KeyError("Private child derivation with not-hardened index is not supported")
+
+        return map(Bip32KeyIndex, range(start_int, start_int + count))
+
     def __ValidateAndCkdPriv(self,
                              index: Bip32KeyIndex) -> Bip32Base:
         """
@@ -485,7 +849,7 @@ class Bip32Base(ABC):
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.m_pub_key.DeferredFingerPrint()
             ),
             key_net_ver=self.KeyNetVersions()
         )
@@ -513,7 +877,7 @@ class Bip32Base(ABC):
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.m_pub_key.DeferredFingerPrint()
             ),
             key_net_ver=self.KeyNetVersions()
         )
@@ -531,6 +895,38 @@ class Bip32Base(ABC):
         """
         return Bip32KeyIndex(index) if isinstance(index, int) else index
 
+    def __DerivePathTemplateLevel(self,
+                                  elems: Sequence[Sequence[int]],
+                                  prefix: Tuple[Bip32KeyIndex, ...],
+                                  is_absolute: bool) -> Iterator[Tuple[Bip32Path, Bip32Base]]:
+        """
+        Derive the path template elements starting from the current object.
+
+        Args:
+            elems (sequence[sequence[int]]): Remaining path template elements
+            prefix (tuple[Bip32KeyIndex])  : Path of the current object
+            is_absolute (bool)             : True if path is an absolute one, false otherwise
+
+        Returns:
+            Iterator: Iterator of tuples with path and Bip32Base object
+        """
+        if len(elems) == 0:
+            yield Bip32Path(prefix, is_absolute), self
+            return
+
+        indexes = elems[0]
+        # Last element with a range of indexes, derive them in batch
+        if len(elems) == 1 and isinstance(indexes, range) and indexes.step == 1:
+            for child in self.IterChildrenRange(indexes.start, len(indexes)):
+                yield Bip32Path(prefix + (child.Index(),), is_absolute), child
+            return
+
+        for index in indexes:
+            child = self.ChildKey(index)
+            yield from child.__DerivePathTemplateLevel(elems[1:],
+                                                       prefix + (child.Index(),),
+                                                       is_absolute)
+
     @staticmethod
     def __GetPath(path: Union[str, Bip32Path]) -> Bip32Path:
         """
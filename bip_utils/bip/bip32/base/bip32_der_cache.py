@@ -0,0 +1,242 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 derivation cache."""
+
+# Imports
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+
+
+class Bip32DerivationCacheConst:
+    """Class container for BIP32 derivation cache constants."""
+
+    # Default maximum number of cached nodes
+    DEF_MAX_SIZE: int = 1024
+
+
+class _Bip32DerivationCacheNode:
+    """
+    BIP32 derivation cache node class.
+    It represents a node of the cache trie. The key is the root identifier for root nodes and the
+    path element for the other ones.
+    """
+
+    __slots__ = ("key", "parent", "children", "bip32_obj")
+
+    key: Union[bytes, int]
+    parent: Optional[_Bip32DerivationCacheNode]
+    children: Dict[int, _Bip32DerivationCacheNode]
+    bip32_obj: Optional[Bip32Base]
+
+    def __init__(self,
+                 key: Union[bytes, int],
+                 parent: Optional[_Bip32DerivationCacheNode]) -> None:
+        """
+        Construct class.
+
+        Args:
+            key (bytes or int)                          : Node key
+            parent (_Bip32DerivationCacheNode, optional): Parent node (None for root nodes)
+        """
+        self.key = key
+        self.parent = parent
+        self.children = {}
+        self.bip32_obj = None
+
+
+class Bip32DerivationCache:
+    """
+    BIP32 derivation cache class.
+    It caches the nodes derived by Bip32Base.DerivePath, so that paths sharing a prefix with a previously
+    derived one only derive the remaining elements.
+    Nodes are organized in a trie for each root node and the number of cached nodes is bounded using a
+    least recently used policy.
+    """
+
+    m_lock: threading.Lock
+    m_max_size: int
+    m_roots: Dict[bytes, _Bip32DerivationCacheNode]
+    m_lru: OrderedDict
+    m_hits: int
+    m_misses: int
+
+    def __init__(self,
+                 max_size: int = Bip32DerivationCacheConst.DEF_MAX_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached nodes (default: 1024)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if max_size <= 0:
+            raise ValueError(f"Invalid maximum cache size ({max_size})")
+
+        self.m_lock = threading.Lock()
+        self.m_max_size = max_size
+        self.m_roots = {}
+        self.m_lru = OrderedDict()
+        self.m_hits = 0
+        self.m_misses = 0
+
+    def MaxSize(self) -> int:
+        """
+        Get the maximum number of cached nodes.
+
+        Returns:
+            int: Maximum number of cached nodes
+        """
+        return self.m_max_size
+
+    def Size(self) -> int:
+        """
+        Get the number of cached nodes.
+
+        Returns:
+            int: Number of cached nodes
+        """
+        return len(self.m_lru)
+
+    def Hits(self) -> int:
+        """
+        Get the number of lookups that found a cached prefix.
+
+        Returns:
+            int: Number of hits
+        """
+        return self.m_hits
+
+    def Misses(self) -> int:
+        """
+        Get the number of lookups that found no cached prefix.
+
+        Returns:
+            int: Number of misses
+        """
+        return self.m_misses
+
+    def Purge(self) -> None:
+        """
+        Remove all the cached nodes and reset the counters.
+        Purging only drops the references kept by the cache, key bytes are not wiped from memory (they are
+        immutable). So, private keys still stay in memory if they are referenced elsewhere, until they are
+        garbage-collected.
+        """
+        with self.m_lock:
+            for node in self.m_lru:
+                node.bip32_obj = None
+            self.m_roots.clear()
+            self.m_lru.clear()
+            self.m_hits = 0
+            self.m_misses = 0
+
+    def Lookup(self,
+               root_id: bytes,
+               path_elems: Sequence[int]) -> Tuple[int, Optional[Bip32Base]]:
+        """
+        Look up the longest cached prefix of the specified path.
+
+        Args:
+            root_id (bytes)           : Root node identifier
+            path_elems (list[int])    : Path elements
+
+        Returns:
+            tuple[int, Bip32Base object]: Prefix length (index 0) and cached node, None if not found (index 1)
+        """
+        with self.m_lock:
+            found_len = 0
+            found_node = None
+
+            node = self.m_roots.get(root_id)
+            if node is not None:
+                for i, elem in enumerate(path_elems):
+                    node = node.children.get(elem)
+                    if node is None:
+                        break
+                    if node.bip32_obj is not None:
+                        found_len, found_node = i + 1, node
+
+            if found_node is None:
+                self.m_misses += 1
+                return 0, None
+
+            self.m_hits += 1
+            self.m_lru.move_to_end(found_node)
+            return found_len, found_node.bip32_obj
+
+    def Store(self,
+              root_id: bytes,
+              path_elems: Sequence[int],
+              bip32_obj: Bip32Base) -> None:
+        """
+        Store the node derived from the specified path.
+
+        Args:
+            root_id (bytes)            : Root node identifier
+            path_elems (list[int])     : Path elements
+            bip32_obj (Bip32Base object): Derived node
+        """
+        if len(path_elems) == 0:
+            return
+
+        with self.m_lock:
+            node = self.m_roots.get(root_id)
+            if node is None:
+                node = self.m_roots[root_id] = _Bip32DerivationCacheNode(root_id, None)
+            for elem in path_elems:
+                child_node = node.children.get(elem)
+                if child_node is None:
+                    child_node = node.children[elem] = _Bip32DerivationCacheNode(elem, node)
+                node = child_node
+
+            node.bip32_obj = bip32_obj
+            self.m_lru[node] = None
+            self.m_lru.move_to_end(node)
+
+            while len(self.m_lru) > self.m_max_size:
+                self.__Evict(self.m_lru.popitem(last=False)[0])
+
+    def __Evict(self,
+                node: _Bip32DerivationCacheNode) -> None:
+        """
+        Evict a node, removing the trie nodes that are no more needed.
+
+        Args:
+            node (_Bip32DerivationCacheNode object): Node to be evicted
+        """
+        node.bip32_obj = None
+        while node.bip32_obj is None and len(node.children) == 0:
+            if node.parent is None:
+                assert isinstance(node.key, bytes)
+                del self.m_roots[node.key]
+                break
+            assert isinstance(node.key, int)
+            del node.parent.children[node.key]
+            node = node.parent
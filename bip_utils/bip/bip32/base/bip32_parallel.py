@@ -0,0 +1,346 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 parallel derivation."""
+
+# Imports
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent import futures
+from itertools import islice
+from typing import (
+    TYPE_CHECKING, Any, Callable, Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+)
+
+from bip_utils.bip.bip32.base.bip32_der_cache import Bip32DerivationCache
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyData, Bip32KeyDataConst, Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
+from bip_utils.bip.bip32.bip32_path import Bip32Path
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+
+
+class Bip32ParallelDerivatorConst:
+    """Class container for BIP32 parallel derivator constants."""
+
+    # Default number of items for each chunk
+    DEF_CHUNK_SIZE: int = 1000
+    # Default number of pending chunks for each worker
+    DEF_PENDING_CHUNKS_PER_WORKER: int = 2
+
+
+class _Bip32NodeState(NamedTuple):
+    """
+    BIP32 node state class.
+    It's a compact and picklable representation of a BIP32 object, used to send it to the worker processes.
+    """
+
+    bip32_cls: Type[Bip32Base]
+    key_bytes: bytes
+    is_public: bool
+    depth: int
+    key_index: int
+    chain_code: bytes
+    parent_fprint: bytes
+    key_net_ver: Bip32KeyNetVersions
+
+    @classmethod
+    def FromBip32(cls,
+                  bip32_obj: Bip32Base) -> _Bip32NodeState:
+        """
+        Create from a BIP32 object.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object
+
+        Returns:
+            _Bip32NodeState object: _Bip32NodeState object
+        """
+        is_public = bip32_obj.IsPublicOnly()
+        return cls(
+            type(bip32_obj),
+            (bip32_obj.PublicKey().RawCompressed().ToBytes()
+             if is_public
+             else bip32_obj.PrivateKey().Raw().ToBytes()),
+            is_public,
+            bip32_obj.Depth().ToInt(),
+            bip32_obj.Index().ToInt(),
+            bip32_obj.ChainCode().ToBytes(),
+            bip32_obj.ParentFingerPrint().ToBytes(),
+            bip32_obj.KeyNetVersions()
+        )
+
+    def ToBip32(self) -> Bip32Base:
+        """
+        Convert to a BIP32 object.
+
+        Returns:
+            Bip32Base object: Bip32Base object
+        """
+        return self.bip32_cls(
+            priv_key=None if self.is_public else self.key_bytes,
+            pub_key=self.key_bytes if self.is_public else None,
+            key_data=Bip32KeyData(self.depth, self.key_index, self.chain_code, self.parent_fprint),
+            key_net_ver=self.key_net_ver
+        )
+
+
+class _Bip32ParallelWorker:
+    """
+    BIP32 parallel worker class.
+    It contains the state and the tasks executed by each worker process.
+    """
+
+    bip32_obj: Optional[Bip32Base] = None
+    result_fn: Optional[Callable[[Bip32Base], Any]] = None
+    der_cache: Optional[Bip32DerivationCache] = None
+
+    @classmethod
+    def Initialize(cls,
+                   node_state: _Bip32NodeState,
+                   result_fn: Optional[Callable[[Bip32Base], Any]]) -> None:
+        """
+        Initialize the worker process.
+
+        Args:
+            node_state (_Bip32NodeState object): State of the node to derive from
+            result_fn (function)               : Function applied to each derived object (None for node states)
+        """
+        cls.bip32_obj = node_state.ToBip32()
+        cls.result_fn = result_fn
+        cls.der_cache = Bip32DerivationCache()
+
+    @classmethod
+    def DeriveChildrenRange(cls,
+                            start: int,
+                            count: int,
+                            public_only: bool) -> List[Any]:
+        """
+        Derive a range of children.
+
+        Args:
+            start (int)       : First index
+            count (int)       : Number of children
+            public_only (bool): True for getting public-only children
+
+        Returns:
+            list: Results of result_fn for each child, or raw key and chain code bytes if no result_fn
+        """
+        assert cls.bip32_obj is not None
+
+        if cls.result_fn is None:
+            return list(cls.bip32_obj.IterChildrenKeysRange(start, count, public_only))
+        return list(map(cls.result_fn, cls.bip32_obj.IterChildrenRange(start, count, public_only)))
+
+    @classmethod
+    def DerivePaths(cls,
+                    paths: List[Union[str, Bip32Path]]) -> List[Any]:
+        """
+        Derive a list of paths.
+
+        Args:
+            paths (list[str or Bip32Path object]): Paths
+
+        Returns:
+            list: Results of result_fn for each path, or node states if no result_fn
+        """
+        assert cls.bip32_obj is not None
+
+        result_fn = cls.result_fn or _Bip32NodeState.FromBip32
+        return [result_fn(cls.bip32_obj.DerivePath(path, cls.der_cache)) for path in paths]
+
+
+class Bip32ParallelDerivator:
+    """
+    BIP32 parallel derivator class.
+    It derives children or paths of a BIP32 object using a pool of processes, streaming the results in order.
+    The work is split in chunks and the number of pending chunks is bounded, so that memory usage does not grow
+    with the job size if results are consumed as they come.
+    If specified, result_fn is applied to each derived object in the worker processes, so it shall be picklable
+    (e.g. a module-level function) and shall return picklable objects (e.g. the address string).
+    """
+
+    m_bip32_obj: Bip32Base
+    m_workers: Optional[int]
+    m_chunk_size: int
+    m_max_pending_chunks: Optional[int]
+
+    def __init__(self,
+                 bip32_obj: Bip32Base,
+                 workers: Optional[int] = None,
+                 chunk_size: int = Bip32ParallelDerivatorConst.DEF_CHUNK_SIZE,
+                 max_pending_chunks: Optional[int] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip32_obj (Bip32Base object)      : Object to derive from
+            workers (int, optional)           : Number of worker processes (default: number of CPUs)
+            chunk_size (int, optional)        : Number of items for each chunk (default: 1000)
+            max_pending_chunks (int, optional): Maximum number of pending chunks (default: 2 for each worker)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"Invalid number of workers ({workers})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        if max_pending_chunks is not None and max_pending_chunks <= 0:
+            raise ValueError(f"Invalid maximum number of pending chunks ({max_pending_chunks})")
+
+        self.m_bip32_obj = bip32_obj
+        self.m_workers = workers
+        self.m_chunk_size = chunk_size
+        self.m_max_pending_chunks = max_pending_chunks
+
+    def DeriveChildrenRange(self,
+                            start: Union[int, Bip32KeyIndex],
+                            count: int,
+                            public_only: bool = False,
+                            result_fn: Optional[Callable[[Bip32Base], Any]] = None) -> Iterator[Any]:
+        """
+        Derive a range of consecutive children keys in parallel.
+        Derivation errors (e.g. hardened indexes from a public key) are raised while iterating.
+
+        Args:
+            start (int or Bip32KeyIndex object): First index
+            count (int)                        : Number of children
+            public_only (bool, optional)       : True for getting public-only children (default: False)
+            result_fn (function, optional)     : Function applied to each child (default: None)
+
+        Returns:
+            Iterator: Results of result_fn for each child, or Bip32Base objects if no result_fn
+
+        Raises:
+            Bip32KeyError: If the indexes cannot be derived
+            ValueError: If the range is not valid
+        """
+        start_int = int(start)
+        if count < 0:
+            raise ValueError(f"Invalid children count ({count})")
+        if start_int + count - 1 > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError(f"Invalid children range ({start_int}, {count})")
+
+        tasks = (
+            (_Bip32ParallelWorker.DeriveChildrenRange,
+             (chunk_start, min(self.m_chunk_size, start_int + count - chunk_start), public_only))
+            for chunk_start in range(start_int, start_int + count, self.m_chunk_size)
+        )
+        results = self.__Run(tasks, result_fn)
+        if result_fn is not None:
+            return results
+        return self.__ChildrenFromKeys(results, start_int, public_only)
+
+    def DerivePaths(self,
+                    paths: Iterable[Union[str, Bip32Path]],
+                    result_fn: Optional[Callable[[Bip32Base], Any]] = None) -> Iterator[Any]:
+        """
+        Derive the specified paths in parallel.
+        Paths are consumed lazily, so they can be generated on the fly.
+        Each worker keeps a derivation cache, so common prefixes are derived only once.
+
+        Args:
+            paths (iterable[str or Bip32Path object]): Paths
+            result_fn (function, optional)           : Function applied to each derived object (default: None)
+
+        Returns:
+            Iterator: Results of result_fn for each path, or Bip32Base objects if no result_fn
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+            Bip32PathError: If the path is not valid
+            ValueError: If the path is a master path and the key is a child key
+        """
+        paths_iter = iter(paths)
+        tasks = (
+            (_Bip32ParallelWorker.DerivePaths, (chunk,))
+            for chunk in iter(lambda: list(islice(paths_iter, self.m_chunk_size)), [])
+        )
+        results = self.__Run(tasks, result_fn)
+        if result_fn is not None:
+            return results
+        return (node_state.ToBip32() for node_state in results)
+
+    def __ChildrenFromKeys(self,
+                           keys: Iterator[Tuple[bytes, bytes]],
+                           start: int,
+                           public_only: bool) -> Iterator[Bip32Base]:
+        """
+        Construct children objects from raw key and chain code bytes.
+
+        Args:
+            keys (Iterator)   : Iterator of key and chain code bytes
+            start (int)       : First index
+            public_only (bool): True for public-only children
+
+        Returns:
+            Iterator: Bip32Base objects
+        """
+        bip32_cls = type(self.m_bip32_obj)
+        is_public = public_only or self.m_bip32_obj.IsPublicOnly()
+        depth = self.m_bip32_obj.Depth().Increase()
+        parent_fprint = self.m_bip32_obj.FingerPrint()
+        key_net_ver = self.m_bip32_obj.KeyNetVersions()
+
+        for index, (key_bytes, chain_code_bytes) in enumerate(keys, start):
+            yield bip32_cls(
+                priv_key=None if is_public else key_bytes,
+                pub_key=key_bytes if is_public else None,
+                key_data=Bip32KeyData(depth, index, chain_code_bytes, parent_fprint),
+                key_net_ver=key_net_ver
+            )
+
+    def __Run(self,
+              tasks: Iterator[Tuple[Callable[..., List[Any]], Tuple[Any, ...]]],
+              result_fn: Optional[Callable[[Bip32Base], Any]]) -> Iterator[Any]:
+        """
+        Run tasks in the process pool, yielding their results in order.
+
+        Args:
+            tasks (Iterator)    : Iterator of task functions and their arguments
+            result_fn (function): Function applied to each derived object
+
+        Returns:
+            Iterator: Results
+        """
+        workers = self.m_workers or os.cpu_count() or 1
+        max_pending = (self.m_max_pending_chunks
+                       or Bip32ParallelDerivatorConst.DEF_PENDING_CHUNKS_PER_WORKER * workers)
+
+        with futures.ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_Bip32ParallelWorker.Initialize,
+                                         initargs=(_Bip32NodeState.FromBip32(self.m_bip32_obj), result_fn)) as executor:
+            pending: Deque[futures.Future] = deque()
+            try:
+                for task_fct, task_args in tasks:
+                    # Wait for the oldest chunk if too many are pending
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().result()
+                    pending.append(executor.submit(task_fct, *task_args))
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
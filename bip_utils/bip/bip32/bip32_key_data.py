@@ -23,7 +23,7 @@
 # Imports
 from __future__ import annotations
 
-from typing import Union
+from typing import Callable, Dict, Tuple, Union
 
 from bip_utils.utils.misc import BitUtils, BytesUtils, DataBytes, IntegerUtils
 from bip_utils.utils.typing import Literal
@@ -46,6 +46,10 @@ class Bip32KeyDataConst:
     KEY_INDEX_MAX_VAL: int = 2**32 - 1
     # Key index hardened bit number
     KEY_INDEX_HARDENED_BIT_NUM: int = 31
+    # Maximum depth of interned depth objects
+    DEPTH_INTERNED_MAX_VAL: int = 255
+    # Number of interned key index objects, for both non-hardened and hardened indexes
+    KEY_INDEX_INTERNED_NUM: int = 1024
 
 
 class Bip32ChainCode(DataBytes):
@@ -54,6 +58,8 @@ class Bip32ChainCode(DataBytes):
     It represents a BIP32 chaincode.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  chaincode: bytes = b"\x00" * Bip32KeyDataConst.CHAINCODE_BYTE_LEN) -> None:
         """
@@ -86,6 +92,8 @@ class Bip32FingerPrint(DataBytes):
     It represents a BIP32 fingerprint.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  fprint: bytes = Bip32KeyDataConst.FINGERPRINT_MASTER_KEY) -> None:
         """
@@ -125,10 +133,35 @@ class Bip32Depth:
     """
     BIP32 depth class.
     It represents a BIP32 depth.
+    Objects are immutable and the ones with small depths are interned.
     """
 
+    __slots__ = ("m_depth",)
+
     m_depth: int
 
+    # Interned objects
+    _interned: Dict[int, Bip32Depth] = {}
+
+    def __new__(cls,
+                depth: int) -> Bip32Depth:
+        """
+        Create the object, returning the interned one for small depths.
+
+        Args:
+            depth (int): Depth
+
+        Returns:
+            Bip32Depth object: Bip32Depth object
+        """
+        if cls is not Bip32Depth or not 0 <= depth <= Bip32KeyDataConst.DEPTH_INTERNED_MAX_VAL:
+            return super().__new__(cls)
+
+        obj = cls._interned.get(depth)
+        if obj is None:
+            obj = cls._interned[depth] = super().__new__(cls)
+        return obj
+
     def __init__(self,
                  depth: int) -> None:
         """
@@ -199,6 +232,24 @@ class Bip32Depth:
         """
         return self.ToBytes()
 
+    def __getnewargs__(self) -> Tuple[int]:
+        """
+        Get the arguments for creating the object when unpickling or copying.
+
+        Returns:
+            tuple[int]: Depth
+        """
+        return (self.m_depth,)
+
+    def __hash__(self) -> int:
+        """
+        Get the object hash.
+
+        Returns:
+            int: Hash (same of the depth integer)
+        """
+        return hash(self.m_depth)
+
     def __eq__(self,
                other: object) -> bool:
         """
@@ -255,10 +306,16 @@ class Bip32KeyIndex:
     """
     BIP32 key index class.
     It represents a BIP32 key index.
+    Objects are immutable and the ones with small indexes (both non-hardened and hardened) are interned.
     """
 
+    __slots__ = ("m_idx",)
+
     m_idx: int
 
+    # Interned objects
+    _interned: Dict[int, Bip32KeyIndex] = {}
+
     @staticmethod
     def HardenIndex(index: int) -> int:
         """
@@ -315,6 +372,27 @@ class Bip32KeyIndex:
         """
         return cls(BytesUtils.ToInteger(index_bytes))
 
+    def __new__(cls,
+                idx: int) -> Bip32KeyIndex:
+        """
+        Create the object, returning the interned one for small indexes.
+
+        Args:
+            idx (int): Key index
+
+        Returns:
+            Bip32KeyIndex object: Bip32KeyIndex object
+        """
+        if (cls is not Bip32KeyIndex
+                or not 0 <= idx <= Bip32KeyDataConst.KEY_INDEX_MAX_VAL
+                or cls.UnhardenIndex(idx) >= Bip32KeyDataConst.KEY_INDEX_INTERNED_NUM):
+            return super().__new__(cls)
+
+        obj = cls._interned.get(idx)
+        if obj is None:
+            obj = cls._interned[idx] = super().__new__(cls)
+        return obj
+
     def __init__(self,
                  idx: int) -> None:
         """
@@ -409,6 +487,24 @@ class Bip32KeyIndex:
         """
         return self.ToBytes()
 
+    def __getnewargs__(self) -> Tuple[int]:
+        """
+        Get the arguments for creating the object when unpickling or copying.
+
+        Returns:
+            tuple[int]: Key index
+        """
+        return (self.m_idx,)
+
+    def __hash__(self) -> int:
+        """
+        Get the object hash.
+
+        Returns:
+            int: Hash (same of the key index integer)
+        """
+        return hash(self.m_idx)
+
     def __eq__(self,
                other: object) -> bool:
         """
@@ -435,33 +531,38 @@ class Bip32KeyData:
     """
     BIP32 key data class.
     It contains all additional data related to a BIP32 key (e.g. depth, chain code, etc...).
+    The parent fingerprint can be deferred by specifying a function that computes it, which is called only
+    the first time the parent fingerprint is needed.
     """
 
+    __slots__ = ("m_depth", "m_index", "m_chain_code", "m_parent_fprint")
+
     m_depth: Bip32Depth
     m_index: Bip32KeyIndex
     m_chain_code: Bip32ChainCode
-    m_parent_fprint: Bip32FingerPrint
+    m_parent_fprint: Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]
 
     def __init__(self,
                  depth: Union[int, Bip32Depth] = Bip32Depth(0),
                  index: Union[int, Bip32KeyIndex] = Bip32KeyIndex(0),
                  chain_code: Union[bytes, Bip32ChainCode] = Bip32ChainCode(),
-                 parent_fprint: Union[bytes, Bip32FingerPrint] = Bip32FingerPrint()) -> None:
+                 parent_fprint: Union[bytes, Bip32FingerPrint, Callable[[], Bip32FingerPrint]] = Bip32FingerPrint()
+                 ) -> None:
         """
         Construct class.
 
         Args:
-            depth (Bip32Depth object)               : Key depth
-            index (Bip32KeyIndex object)            : Key index
-            chain_code (Bip32ChainCode object)      : Key chain code
-            parent_fprint (Bip32FingerPrint object) : Key parent fingerprint
+            depth (Bip32Depth object)                         : Key depth
+            index (Bip32KeyIndex object)                      : Key index
+            chain_code (Bip32ChainCode object)                : Key chain code
+            parent_fprint (Bip32FingerPrint object or function): Key parent fingerprint, or function computing it
         """
         self.m_depth = depth if isinstance(depth, Bip32Depth) else Bip32Depth(depth)
         self.m_index = index if isinstance(index, Bip32KeyIndex) else Bip32KeyIndex(index)
         self.m_chain_code = chain_code if isinstance(chain_code, Bip32ChainCode) else Bip32ChainCode(chain_code)
-        self.m_parent_fprint = (parent_fprint
-                                if isinstance(parent_fprint, Bip32FingerPrint)
-                                else Bip32FingerPrint(parent_fprint))
+        self.m_parent_fprint = (Bip32FingerPrint(parent_fprint)
+                                if isinstance(parent_fprint, bytes)
+                                else parent_fprint)
 
     def Depth(self) -> Bip32Depth:
         """
@@ -493,8 +594,11 @@ class Bip32KeyData:
     def ParentFingerPrint(self) -> Bip32FingerPrint:
         """
         Get parent fingerprint.
+        If deferred, it's computed the first time.
 
         Returns:
             Bip32FingerPrint object: Parent fingerprint
         """
+        if not isinstance(self.m_parent_fprint, Bip32FingerPrint):
+            self.m_parent_fprint = self.m_parent_fprint()
         return self.m_parent_fprint
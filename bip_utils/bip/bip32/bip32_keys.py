@@ -24,21 +24,67 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import lru_cache
-from typing import Union
+from typing import Callable, Optional, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32FingerPrint, Bip32KeyData
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
 from bip_utils.bip.bip32.bip32_key_ser import Bip32PrivateKeySerializer, Bip32PublicKeySerializer
 from bip_utils.ecc import EllipticCurve, EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey
-from bip_utils.utils.crypto import Hash160
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.crypto import Hash160, HmacSha512Context
+from bip_utils.utils.misc import DataBytes, MemoizedMethod
+
+
+class _Bip32DeferredFingerPrint:
+    """
+    BIP32 deferred fingerprint class.
+    It computes the fingerprint of a key from its private key bytes only when called for the first time, so that
+    it can be used as a parent fingerprint without keeping the parent key objects (and, through them, all their
+    ancestors) alive. The private key bytes are released once the fingerprint is computed.
+    """
+
+    __slots__ = ("m_priv_key_bytes", "m_curve_type", "m_fprint")
+
+    m_priv_key_bytes: Optional[bytes]
+    m_curve_type: EllipticCurveTypes
+    m_fprint: Optional[Bip32FingerPrint]
+
+    def __init__(self,
+                 priv_key_bytes: bytes,
+                 curve_type: EllipticCurveTypes) -> None:
+        """
+        Construct class.
+
+        Args:
+            priv_key_bytes (bytes)         : Private key bytes
+            curve_type (EllipticCurveTypes): Elliptic curve type
+        """
+        self.m_priv_key_bytes = priv_key_bytes
+        self.m_curve_type = curve_type
+        self.m_fprint = None
+
+    def __call__(self) -> Bip32FingerPrint:
+        """
+        Get the fingerprint, computing it the first time.
+
+        Returns:
+            Bip32FingerPrint object: Fingerprint
+        """
+        if self.m_fprint is None:
+            assert self.m_priv_key_bytes is not None
+            priv_key_cls = EllipticCurveGetter.FromType(self.m_curve_type).PrivateKeyClass()
+            pub_key = priv_key_cls.FromBytes(self.m_priv_key_bytes).PublicKey()
+            self.m_fprint = Bip32FingerPrint(Hash160.QuickDigest(pub_key.RawCompressed().ToBytes()))
+            self.m_priv_key_bytes = None
+        return self.m_fprint
 
 
 class _Bip32KeyBase(ABC):
     """Base class for a generic BIP32 key."""
 
+    __slots__ = (("m_curve", "m_curve_type", "m_key_data", "m_key_net_ver")
+                 + MemoizedMethod.AttrNames("_Bip32KeyBase", "ChainCodeHmac"))
+
     m_curve: EllipticCurve
     m_curve_type: EllipticCurveTypes
     m_key_data: Bip32KeyData
@@ -97,6 +143,17 @@ class _Bip32KeyBase(ABC):
         """
         return self.Data().ChainCode()
 
+    @MemoizedMethod
+    def ChainCodeHmac(self) -> HmacSha512Context:
+        """
+        Return the HMAC-SHA512 context keyed with the chain code.
+        It is created only once, so that it can be reused for deriving all the children of the key.
+
+        Returns:
+            HmacSha512Context object: HmacSha512Context object
+        """
+        return HmacSha512Context(self.ChainCode().ToBytes())
+
     def KeyNetVersions(self) -> Bip32KeyNetVersions:
         """
         Get key net versions.
@@ -122,7 +179,15 @@ class Bip32PublicKey(_Bip32KeyBase):
     It represents a public key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
-    m_pub_key: IPublicKey
+    __slots__ = ("m_pub_key", "m_priv_key") + MemoizedMethod.AttrNames("Bip32PublicKey",
+                                                                       "RawCompressed",
+                                                                       "RawUncompressed",
+                                                                       "FingerPrint",
+                                                                       "KeyIdentifier",
+                                                                       "ToExtended")
+
+    m_pub_key: Optional[IPublicKey]
+    m_priv_key: Optional[IPrivateKey]
 
     @classmethod
     def FromBytesOrKeyObject(cls,
@@ -193,31 +258,57 @@ class Bip32PublicKey(_Bip32KeyBase):
                    key_data,
                    key_net_ver)
 
+    @classmethod
+    def FromPrivateKey(cls,
+                       priv_key: IPrivateKey,
+                       key_data: Bip32KeyData,
+                       key_net_ver: Bip32KeyNetVersions) -> Bip32PublicKey:
+        """
+        Create from private key.
+        The public key is computed from the private one only the first time it's needed.
+
+        Args:
+            priv_key (IPrivateKey object)           : Private key object
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+        """
+        return cls(priv_key, key_data, key_net_ver)
+
     def __init__(self,
-                 pub_key: IPublicKey,
+                 pub_key: Union[IPublicKey, IPrivateKey],
                  key_data: Bip32KeyData,
                  key_net_ver: Bip32KeyNetVersions) -> None:
         """
         Construct class.
 
         Args:
-            pub_key (IPublicKey object)             : Key object
-            key_data (Bip32KeyData object)          : Key data
-            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            pub_key (IPublicKey or IPrivateKey object): Key object, or private key object to compute it from
+            key_data (Bip32KeyData object)            : Key data
+            key_net_ver (Bip32KeyNetVersions object)  : Key net versions
         """
         super().__init__(key_data, key_net_ver, pub_key.CurveType())
-        self.m_pub_key = pub_key
+        if isinstance(pub_key, IPrivateKey):
+            self.m_pub_key = None
+            self.m_priv_key = pub_key
+        else:
+            self.m_pub_key = pub_key
+            self.m_priv_key = None
 
     def KeyObject(self) -> IPublicKey:
         """
         Return the key object.
+        If the public key was not computed yet, it's computed and the private key is released.
 
         Returns:
             IPublicKey object: Key object
         """
+        if self.m_pub_key is None:
+            assert self.m_priv_key is not None
+            self.m_pub_key = self.m_priv_key.PublicKey()
+            self.m_priv_key = None
         return self.m_pub_key
 
-    @lru_cache()
+    @MemoizedMethod
     def RawCompressed(self) -> DataBytes:
         """
         Return raw compressed public key.
@@ -225,9 +316,9 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawCompressed()
+        return self.KeyObject().RawCompressed()
 
-    @lru_cache()
+    @MemoizedMethod
     def RawUncompressed(self) -> DataBytes:
         """
         Return raw uncompressed public key.
@@ -235,7 +326,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawUncompressed()
+        return self.KeyObject().RawUncompressed()
 
     def Point(self) -> IPoint:
         """
@@ -244,9 +335,9 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             IPoint object: IPoint object
         """
-        return self.m_pub_key.Point()
+        return self.KeyObject().Point()
 
-    @lru_cache()
+    @MemoizedMethod
     def FingerPrint(self) -> Bip32FingerPrint:
         """
         Get key fingerprint.
@@ -256,7 +347,22 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return Bip32FingerPrint(self.KeyIdentifier())
 
-    @lru_cache()
+    def DeferredFingerPrint(self) -> Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]:
+        """
+        Get key fingerprint, or a function computing it if the public key was not computed yet.
+        The function only keeps the private key bytes, so it can be used as the parent fingerprint of children keys
+        without computing the public key and without keeping this object alive.
+
+        Returns:
+            Bip32FingerPrint object: Key fingerprint
+            function: Function computing the key fingerprint, if the public key was not computed yet
+        """
+        if self.m_pub_key is None:
+            assert self.m_priv_key is not None
+            return _Bip32DeferredFingerPrint(self.m_priv_key.Raw().ToBytes(), self.m_priv_key.CurveType())
+        return self.FingerPrint()
+
+    @MemoizedMethod
     def KeyIdentifier(self) -> bytes:
         """
         Get key identifier.
@@ -264,9 +370,9 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             bytes: Key identifier bytes
         """
-        return Hash160.QuickDigest(self.m_pub_key.RawCompressed().ToBytes())
+        return Hash160.QuickDigest(self.RawCompressed().ToBytes())
 
-    @lru_cache()
+    @MemoizedMethod
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -274,7 +380,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             str: Key in serialized extended format
         """
-        return Bip32PublicKeySerializer.Serialize(self.m_pub_key,
+        return Bip32PublicKeySerializer.Serialize(self.KeyObject(),
                                                   self.m_key_data,
                                                   self.m_key_net_ver)
 
@@ -327,6 +433,11 @@ class Bip32PrivateKey(_Bip32KeyBase):
     It represents a private key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_priv_key",) + MemoizedMethod.AttrNames("Bip32PrivateKey",
+                                                           "Raw",
+                                                           "PublicKey",
+                                                           "ToExtended")
+
     m_priv_key: IPrivateKey
 
     @classmethod
@@ -400,7 +511,7 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         return self.m_priv_key
 
-    @lru_cache()
+    @MemoizedMethod
     def Raw(self) -> DataBytes:
         """
         Return raw private key.
@@ -410,7 +521,7 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKey(self) -> Bip32PublicKey:
         """
         Get the public key correspondent to the private one.
@@ -418,11 +529,11 @@ class Bip32PrivateKey(_Bip32KeyBase):
         Returns:
             Bip32PublicKey object: Bip32PublicKey object
         """
-        return Bip32PublicKey(self.m_priv_key.PublicKey(),
-                              self.m_key_data,
-                              self.m_key_net_ver)
+        return Bip32PublicKey.FromPrivateKey(self.m_priv_key,
+                                             self.m_key_data,
+                                             self.m_key_net_ver)
 
-    @lru_cache()
+    @MemoizedMethod
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -23,6 +23,7 @@
 # Import
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32PathError
@@ -36,15 +37,26 @@ class Bip32PathConst:
     HARDENED_CHARS: Tuple[str, str, str] = ("'", "h", "p")
     # Master character
     MASTER_CHAR: str = "m"
+    # Maximum number of parsed paths kept in cache
+    PARSE_CACHE_MAX_SIZE: int = 1024
+    # Template set delimiters and separator
+    TEMPLATE_SET_DELIMS: Tuple[str, str] = ("{", "}")
+    TEMPLATE_SET_SEP: str = ","
+    # Template range delimiters and separator
+    TEMPLATE_RANGE_DELIMS: Tuple[str, str] = ("[", "]")
+    TEMPLATE_RANGE_SEP: str = ".."
 
 
 class Bip32Path:
     """
     BIP32 path class.
     It represents a BIP-0032 path.
+    Objects are immutable, so they can be shared and used as dictionary keys.
     """
 
-    m_elems: List[Bip32KeyIndex]
+    __slots__ = ("m_elems", "m_is_absolute")
+
+    m_elems: Tuple[Bip32KeyIndex, ...]
     m_is_absolute: bool
 
     def __init__(self,
@@ -58,9 +70,9 @@ class Bip32Path:
             is_absolute (bool, optional): True if path is an absolute one, false otherwise (default: True)
         """
         try:
-            self.m_elems = ([]
+            self.m_elems = (()
                             if elems is None
-                            else [Bip32KeyIndex(elem) if isinstance(elem, int) else elem for elem in elems])
+                            else tuple(Bip32KeyIndex(elem) if isinstance(elem, int) else elem for elem in elems))
         except ValueError as ex:
             raise Bip32PathError("The path contains some invalid key indexes") from ex
 
@@ -81,8 +93,11 @@ class Bip32Path:
             Bip32PathError: If the path element is not valid
         """
         if isinstance(elem, int):
-            elem = Bip32KeyIndex(elem)
-        return Bip32Path(self.m_elems + [elem], self.m_is_absolute)
+            try:
+                elem = Bip32KeyIndex(elem)
+            except ValueError as ex:
+                raise Bip32PathError("The path contains some invalid key indexes") from ex
+        return self._FromValidElems(self.m_elems + (elem,), self.m_is_absolute)
 
     def IsAbsolute(self) -> bool:
         """
@@ -156,13 +171,156 @@ class Bip32Path:
         Returns:
             Iterator object: Iterator to the current element
         """
-        yield from self.m_elems
+        return iter(self.m_elems)
+
+    def __eq__(self,
+               other: object) -> bool:
+        """
+        Equality operator.
+
+        Args:
+            other (Bip32Path object): Other object to compare
+
+        Returns:
+            bool: True if equal false otherwise
+        """
+        if not isinstance(other, Bip32Path):
+            return NotImplemented
+        return self.m_is_absolute == other.m_is_absolute and self.m_elems == other.m_elems
+
+    def __hash__(self) -> int:
+        """
+        Get the object hash.
+
+        Returns:
+            int: Hash
+        """
+        return hash((self.m_is_absolute, self.m_elems))
+
+    @classmethod
+    def _FromValidElems(cls,
+                        elems: Tuple[Bip32KeyIndex, ...],
+                        is_absolute: bool) -> Bip32Path:
+        """
+        Create a path from already valid elements, without converting or checking them.
+
+        Args:
+            elems (tuple[Bip32KeyIndex]): Path elements
+            is_absolute (bool)          : True if path is an absolute one, false otherwise
+
+        Returns:
+            Bip32Path object: Bip32Path object
+        """
+        path = cls.__new__(cls)
+        path.m_elems = elems
+        path.m_is_absolute = is_absolute
+        return path
+
+
+class Bip32PathTemplate:
+    """
+    BIP32 path template class.
+    It represents a template that expands to multiple BIP-0032 paths. Each element of the template is a sequence
+    of possible indexes, that can be a single index (e.g. 0'), a set (e.g. {0,1}) or an inclusive range
+    (e.g. [0..9999]). A hardened character after a set or a range hardens all its indexes.
+    Paths are expanded lazily, in lexicographic order.
+    """
+
+    __slots__ = ("m_elems", "m_is_absolute")
+
+    m_elems: Tuple[Sequence[int], ...]
+    m_is_absolute: bool
+
+    def __init__(self,
+                 elems: Sequence[Sequence[int]],
+                 is_absolute: bool = True) -> None:
+        """
+        Construct class.
+
+        Args:
+            elems (list[sequence[int]]) : Possible indexes for each path element
+            is_absolute (bool, optional): True if path is an absolute one, false otherwise (default: True)
+
+        Raises:
+            Bip32PathError: If the template is not valid
+        """
+        for elem in elems:
+            if len(elem) == 0:
+                raise Bip32PathError("The path template contains some empty elements")
+            try:
+                # Checking the bounds is enough for ranges
+                for idx in ((elem[0], elem[-1]) if isinstance(elem, range) else elem):
+                    Bip32KeyIndex(idx)
+            except ValueError as ex:
+                raise Bip32PathError("The path template contains some invalid key indexes") from ex
+
+        self.m_elems = tuple(elems)
+        self.m_is_absolute = is_absolute
+
+    def Elements(self) -> Tuple[Sequence[int], ...]:
+        """
+        Get the possible indexes for each path element.
+
+        Returns:
+            tuple[sequence[int]]: Possible indexes for each path element
+        """
+        return self.m_elems
+
+    def IsAbsolute(self) -> bool:
+        """
+        Get if absolute path.
+
+        Returns:
+            bool: True if absolute path, false otherwise
+        """
+        return self.m_is_absolute
+
+    def Count(self) -> int:
+        """
+        Get the number of paths the template expands to.
+
+        Returns:
+            int: Number of paths
+        """
+        count = 1
+        for elem in self.m_elems:
+            count *= len(elem)
+        return count
+
+    def __iter__(self) -> Iterator[Bip32Path]:
+        """
+        Get an iterator over the expanded paths.
+
+        Returns:
+            Iterator object: Iterator of Bip32Path objects
+        """
+        return self.__Expand(0, ())
+
+    def __Expand(self,
+                 level: int,
+                 prefix: Tuple[Bip32KeyIndex, ...]) -> Iterator[Bip32Path]:
+        """
+        Expand the paths starting from the specified level.
+
+        Args:
+            level (int)                  : Level
+            prefix (tuple[Bip32KeyIndex]): Path prefix
+
+        Returns:
+            Iterator object: Iterator of Bip32Path objects
+        """
+        if level == len(self.m_elems):
+            yield Bip32Path._FromValidElems(prefix, self.m_is_absolute)
+            return
+        for idx in self.m_elems[level]:
+            yield from self.__Expand(level + 1, prefix + (Bip32KeyIndex(idx),))
 
 
 class Bip32PathParser:
     """
     BIP32 path parser class.
     It parses a BIP-0032 path and returns a Bip32Path object.
+    Since Bip32Path objects are immutable, the most recently parsed paths are cached.
     """
 
     @staticmethod
@@ -179,23 +337,41 @@ class Bip32PathParser:
         Raises:
             Bip32PathError: If the path is not valid
         """
+        return Bip32PathParser.__ParseCached(path)
 
-        # Remove trailing "/" if any
-        if path.endswith("/"):
-            path = path[:-1]
+    @staticmethod
+    def ParseTemplate(template: str) -> Bip32PathTemplate:
+        """
+        Parse a path template (e.g. m/84'/0'/0'/{0,1}/[0..9999]) and return a Bip32PathTemplate object.
+
+        Args:
+            template (str): Path template
+
+        Returns:
+            Bip32PathTemplate object: Bip32PathTemplate object
 
-        # Parse elements
-        return Bip32PathParser.__ParseElements(
-            list(filter(None, path.split("/")))
+        Raises:
+            Bip32PathError: If the template is not valid
+        """
+        path_elems, is_absolute = Bip32PathParser.__SplitElements(template)
+        return Bip32PathTemplate(
+            list(map(Bip32PathParser.__ParseTemplateElem, path_elems)),
+            is_absolute
         )
 
     @staticmethod
-    def __ParseElements(path_elems: List[str]) -> Bip32Path:
+    def ClearCache() -> None:
+        """Clear the cache of parsed paths."""
+        Bip32PathParser.__ParseCached.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=Bip32PathConst.PARSE_CACHE_MAX_SIZE)
+    def __ParseCached(path: str) -> Bip32Path:
         """
-        Parse path elements and return a Bip32Path object.
+        Parse a path and return a Bip32Path object, caching the result.
 
         Args:
-            path_elems (list[str]): Path elements
+            path (str): Path
 
         Returns:
             Bip32Path object: Bip32Path object
@@ -203,17 +379,33 @@ class Bip32PathParser:
         Raises:
             Bip32PathError: If the path is not valid
         """
+        path_elems, is_absolute = Bip32PathParser.__SplitElements(path)
+        return Bip32Path(
+            list(map(Bip32PathParser.__ParseElem, path_elems)),
+            is_absolute
+        )
+
+    @staticmethod
+    def __SplitElements(path: str) -> Tuple[List[str], bool]:
+        """
+        Split a path in its elements.
+
+        Args:
+            path (str): Path
+
+        Returns:
+            tuple[list[str], bool]: Path elements and True if the path is absolute, false otherwise
+        """
+
+        # Remove trailing "/" if any
+        if path.endswith("/"):
+            path = path[:-1]
+        path_elems = list(filter(None, path.split("/")))
 
         # Remove the initial "m" character if any
         if len(path_elems) > 0 and path_elems[0] == Bip32PathConst.MASTER_CHAR:
-            path_elems = path_elems[1:]
-            is_absolute = True
-        else:
-            is_absolute = False
-
-        # Parse elements
-        parsed_elems = list(map(Bip32PathParser.__ParseElem, path_elems))
-        return Bip32Path(parsed_elems, is_absolute)
+            return path_elems[1:], True
+        return path_elems, False
 
     @staticmethod
     def __ParseElem(path_elem: str) -> int:
@@ -245,3 +437,57 @@ class Bip32PathParser:
             raise Bip32PathError(f"Invalid path element ({path_elem})")
 
         return int(path_elem) if not is_hardened else Bip32KeyIndex.HardenIndex(int(path_elem))
+
+    @staticmethod
+    def __ParseTemplateElem(path_elem: str) -> Sequence[int]:
+        """
+        Parse path template element and get the correspondent indexes.
+
+        Args:
+            path_elem (str): Path template element
+
+        Returns:
+            sequence[int]: Indexes of the element
+
+        Raises:
+            Bip32PathError: If the template is not valid
+        """
+
+        # Strip spaces and get if the whole element is hardened
+        path_elem = path_elem.strip()
+        is_hardened = path_elem.endswith(Bip32PathConst.HARDENED_CHARS)
+        if is_hardened:
+            path_elem = path_elem[:-1]
+
+        set_delims = Bip32PathConst.TEMPLATE_SET_DELIMS
+        range_delims = Bip32PathConst.TEMPLATE_RANGE_DELIMS
+
+        # Set
+        if path_elem.startswith(set_delims[0]) and path_elem.endswith(set_delims[1]):
+            indexes = tuple(map(Bip32PathParser.__ParseElem,
+                                path_elem[1:-1].split(Bip32PathConst.TEMPLATE_SET_SEP)))
+            if is_hardened:
+                if any(Bip32KeyIndex.IsHardenedIndex(idx) for idx in indexes):
+                    raise Bip32PathError(f"Invalid path template element ({path_elem})")
+                indexes = tuple(map(Bip32KeyIndex.HardenIndex, indexes))
+            return indexes
+
+        # Range
+        if path_elem.startswith(range_delims[0]) and path_elem.endswith(range_delims[1]):
+            bounds = path_elem[1:-1].split(Bip32PathConst.TEMPLATE_RANGE_SEP)
+            if len(bounds) != 2 or not all(bound.strip().isnumeric() for bound in bounds):
+                raise Bip32PathError(f"Invalid path template element ({path_elem})")
+            first, last = (int(bound) for bound in bounds)
+            if first > last or (is_hardened and Bip32KeyIndex.IsHardenedIndex(last)):
+                raise Bip32PathError(f"Invalid path template element ({path_elem})")
+            if is_hardened:
+                first, last = Bip32KeyIndex.HardenIndex(first), Bip32KeyIndex.HardenIndex(last)
+            return range(first, last + 1)
+
+        # Single index (the hardened character was removed, so add it back)
+        idx = Bip32PathParser.__ParseElem(path_elem)
+        if is_hardened:
+            if Bip32KeyIndex.IsHardenedIndex(idx):
+                raise Bip32PathError(f"Invalid path template element ({path_elem})")
+            idx = Bip32KeyIndex.HardenIndex(idx)
+        return (idx,)
@@ -0,0 +1,484 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 binary snapshots, i.e. compact fixed-width records for saving and restoring BIP32 nodes."""
+
+# Imports
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, Iterator, Optional, Type
+
+from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyData
+from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
+from bip_utils.ecc import EllipticCurveGetter, EllipticCurveTypes
+from bip_utils.utils.crypto import Crc32
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+
+
+class Bip32SnapshotConst:
+    """Class container for BIP32 snapshot constants."""
+
+    # Format version
+    VERSION: int = 1
+
+    # Flag for private keys
+    FLAG_PRIVATE: int = 0x01
+    # Flag for cached public keys
+    FLAG_PUB_KEY: int = 0x02
+
+    # Curve type to curve identifier (fixed values, they shall not change between versions)
+    CURVE_TYPE_TO_ID: Dict[EllipticCurveTypes, int] = {
+        EllipticCurveTypes.ED25519: 1,
+        EllipticCurveTypes.ED25519_BLAKE2B: 2,
+        EllipticCurveTypes.ED25519_KHOLAW: 3,
+        EllipticCurveTypes.NIST256P1: 4,
+        EllipticCurveTypes.SECP256K1: 5,
+    }
+    # Curve identifier to curve type
+    CURVE_ID_TO_TYPE: Dict[int, EllipticCurveTypes] = {v: k for k, v in CURVE_TYPE_TO_ID.items()}
+
+    # Key field length in bytes (it shall fit the longest key, i.e. ed25519-kholaw private key)
+    KEY_BYTE_LEN: int = 64
+    # Public key field length in bytes
+    PUB_KEY_BYTE_LEN: int = 33
+
+    # Record structure (without CRC): version, curve ID, flags, depth, index, parent fingerprint, chain code,
+    # public net version, private net version, key, public key
+    RECORD_STRUCT: struct.Struct = struct.Struct(">BBBBI4s32s4s4s64s33s")
+    # CRC structure
+    CRC_STRUCT: struct.Struct = struct.Struct(">I")
+    # Record length in bytes
+    RECORD_BYTE_LEN: int = RECORD_STRUCT.size + CRC_STRUCT.size
+
+
+class Bip32Snapshot:
+    """
+    BIP32 snapshot class.
+    It contains the fields of a decoded BIP32 snapshot record.
+    """
+
+    m_curve_type: EllipticCurveTypes
+    m_key_bytes: bytes
+    m_pub_key_bytes: Optional[bytes]
+    m_key_data: Bip32KeyData
+    m_key_net_ver: Bip32KeyNetVersions
+    m_is_public: bool
+
+    def __init__(self,
+                 curve_type: EllipticCurveTypes,
+                 key_bytes: bytes,
+                 pub_key_bytes: Optional[bytes],
+                 key_data: Bip32KeyData,
+                 key_net_ver: Bip32KeyNetVersions,
+                 is_public: bool) -> None:
+        """
+        Construct class.
+
+        Args:
+            curve_type (EllipticCurveTypes)         : Elliptic curve type
+            key_bytes (bytes)                       : Key bytes
+            pub_key_bytes (bytes)                   : Cached public key bytes (None if not present)
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            is_public (bool)                        : True if the key is public, false otherwise
+        """
+        self.m_curve_type = curve_type
+        self.m_key_bytes = key_bytes
+        self.m_pub_key_bytes = pub_key_bytes
+        self.m_key_data = key_data
+        self.m_key_net_ver = key_net_ver
+        self.m_is_public = is_public
+
+    def CurveType(self) -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+            EllipticCurveTypes: Elliptic curve type
+        """
+        return self.m_curve_type
+
+    def KeyBytes(self) -> bytes:
+        """
+        Get key bytes.
+
+        Returns:
+            bytes: Key bytes
+        """
+        return self.m_key_bytes
+
+    def PublicKeyBytes(self) -> Optional[bytes]:
+        """
+        Get the cached public key bytes.
+        For public keys, it's the same of KeyBytes.
+
+        Returns:
+            bytes: Public key bytes (None if not present)
+        """
+        return self.m_key_bytes if self.m_is_public else self.m_pub_key_bytes
+
+    def KeyData(self) -> Bip32KeyData:
+        """
+        Get key data.
+
+        Returns:
+            Bip32KeyData object: Bip32KeyData object
+        """
+        return self.m_key_data
+
+    def KeyNetVersions(self) -> Bip32KeyNetVersions:
+        """
+        Get key net versions.
+
+        Returns:
+            Bip32KeyNetVersions object: Bip32KeyNetVersions object
+        """
+        return self.m_key_net_ver
+
+    def IsPublic(self) -> bool:
+        """
+        Get if the key is public.
+
+        Returns:
+            bool: True if the key is public, false otherwise
+        """
+        return self.m_is_public
+
+
+class Bip32SnapshotEncoder:
+    """
+    BIP32 snapshot encoder class.
+    It encodes BIP32 nodes to fixed-width binary records.
+    """
+
+    @staticmethod
+    def Encode(curve_type: EllipticCurveTypes,
+               key_bytes: bytes,
+               pub_key_bytes: Optional[bytes],
+               key_data: Bip32KeyData,
+               key_net_ver: Bip32KeyNetVersions,
+               is_public: bool) -> bytes:
+        """
+        Encode a BIP32 node.
+
+        Args:
+            curve_type (EllipticCurveTypes)         : Elliptic curve type
+            key_bytes (bytes)                       : Key bytes (private or compressed public key)
+            pub_key_bytes (bytes)                   : Compressed public key bytes to be cached, only for private keys
+                                                      (None for not caching it)
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            is_public (bool)                        : True if the key is public, false otherwise
+
+        Returns:
+            bytes: Encoded record
+
+        Raises:
+            Bip32KeyError: If the curve is not supported
+        """
+        if curve_type not in Bip32SnapshotConst.CURVE_TYPE_TO_ID:
+            raise Bip32KeyError(f"Curve type {curve_type} is not supported by snapshots")
+
+        flags = 0 if is_public else Bip32SnapshotConst.FLAG_PRIVATE
+        if pub_key_bytes is not None and not is_public:
+            flags |= Bip32SnapshotConst.FLAG_PUB_KEY
+        else:
+            pub_key_bytes = b""
+
+        record = Bip32SnapshotConst.RECORD_STRUCT.pack(
+            Bip32SnapshotConst.VERSION,
+            Bip32SnapshotConst.CURVE_TYPE_TO_ID[curve_type],
+            flags,
+            key_data.Depth().ToInt(),
+            key_data.Index().ToInt(),
+            key_data.ParentFingerPrint().ToBytes(),
+            key_data.ChainCode().ToBytes(),
+            key_net_ver.Public(),
+            key_net_ver.Private(),
+            key_bytes,
+            pub_key_bytes
+        )
+        return record + Bip32SnapshotConst.CRC_STRUCT.pack(Crc32.QuickIntDigest(record))
+
+
+class Bip32SnapshotDecoder:
+    """
+    BIP32 snapshot decoder class.
+    It decodes fixed-width binary records to BIP32 snapshots.
+    """
+
+    @staticmethod
+    def Decode(record_bytes: bytes) -> Bip32Snapshot:
+        """
+        Decode a record.
+
+        Args:
+            record_bytes (bytes): Record bytes
+
+        Returns:
+            Bip32Snapshot object: Bip32Snapshot object
+
+        Raises:
+            Bip32KeyError: If the record is not valid
+        """
+        if len(record_bytes) != Bip32SnapshotConst.RECORD_BYTE_LEN:
+            raise Bip32KeyError(f"Invalid snapshot record length ({len(record_bytes)})")
+
+        record_len = Bip32SnapshotConst.RECORD_STRUCT.size
+        crc = Bip32SnapshotConst.CRC_STRUCT.unpack_from(record_bytes, record_len)[0]
+        if crc != Crc32.QuickIntDigest(record_bytes[:record_len]):
+            raise Bip32KeyError("Invalid snapshot record CRC")
+
+        (version, curve_id, flags, depth, index, parent_fprint, chain_code,
+         pub_net_ver, priv_net_ver, key_bytes, pub_key_bytes) = Bip32SnapshotConst.RECORD_STRUCT.unpack_from(
+            record_bytes
+        )
+        if version != Bip32SnapshotConst.VERSION:
+            raise Bip32KeyError(f"Invalid snapshot record version ({version})")
+        if curve_id not in Bip32SnapshotConst.CURVE_ID_TO_TYPE:
+            raise Bip32KeyError(f"Invalid snapshot record curve ({curve_id})")
+
+        # Get the actual key length from the curve
+        curve_type = Bip32SnapshotConst.CURVE_ID_TO_TYPE[curve_id]
+        curve = EllipticCurveGetter.FromType(curve_type)
+        is_public = (flags & Bip32SnapshotConst.FLAG_PRIVATE) == 0
+        key_len = curve.PublicKeyClass().CompressedLength() if is_public else curve.PrivateKeyClass().Length()
+
+        return Bip32Snapshot(
+            curve_type,
+            key_bytes[:key_len],
+            pub_key_bytes if flags & Bip32SnapshotConst.FLAG_PUB_KEY else None,
+            Bip32KeyData(depth, index, chain_code, parent_fprint),
+            Bip32KeyNetVersions(pub_net_ver, priv_net_ver),
+            is_public
+        )
+
+
+class Bip32SnapshotWriter:
+    """
+    BIP32 snapshot writer class.
+    It writes BIP32 nodes to a file of fixed-width records, that can be read back with Bip32SnapshotReader.
+    """
+
+    m_file: BinaryIO
+    m_include_pub_key: bool
+
+    def __init__(self,
+                 file_path: str,
+                 include_pub_key: bool = False,
+                 append: bool = False) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str)                 : File path
+            include_pub_key (bool, optional): True for caching public keys of private nodes (default: False)
+            append (bool, optional)         : True for appending to an existing file (default: False)
+        """
+        self.m_file = open(file_path, "ab" if append else "wb")  # pylint: disable=consider-using-with
+        self.m_include_pub_key = include_pub_key
+
+    def Write(self,
+              bip32_obj: Bip32Base) -> None:
+        """
+        Write a BIP32 node.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object
+        """
+        self.m_file.write(bip32_obj.ToBytes(self.m_include_pub_key))
+
+    def WriteMany(self,
+                  bip32_objs: Iterable[Bip32Base]) -> None:
+        """
+        Write BIP32 nodes.
+
+        Args:
+            bip32_objs (iterable[Bip32Base object]): Bip32Base objects
+        """
+        self.m_file.writelines(bip32_obj.ToBytes(self.m_include_pub_key) for bip32_obj in bip32_objs)
+
+    def Close(self) -> None:
+        """Close the file."""
+        self.m_file.close()
+
+    def __enter__(self) -> Bip32SnapshotWriter:
+        """
+        Enter the context.
+
+        Returns:
+            Bip32SnapshotWriter object: The object itself
+        """
+        return self
+
+    def __exit__(self,
+                 *args: object) -> None:
+        """
+        Exit the context, closing the file.
+
+        Args:
+            args: Exception information (not used)
+        """
+        self.Close()
+
+
+class Bip32SnapshotReader:
+    """
+    BIP32 snapshot reader class.
+    It reads BIP32 nodes from a file of fixed-width records by memory-mapping it, so that records are
+    decoded only when accessed.
+    """
+
+    m_bip32_cls: Type[Bip32Base]
+    m_mmap: Optional[mmap.mmap]
+    m_count: int
+
+    def __init__(self,
+                 file_path: str,
+                 bip32_cls: Type[Bip32Base]) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str)            : File path
+            bip32_cls (Bip32Base class): Class of the BIP32 nodes
+
+        Raises:
+            Bip32KeyError: If the file size is not valid
+        """
+        with open(file_path, "rb") as fin:
+            fin.seek(0, 2)
+            file_size = fin.tell()
+            if file_size % Bip32SnapshotConst.RECORD_BYTE_LEN != 0:
+                raise Bip32KeyError(f"Invalid snapshot file size ({file_size})")
+            # Empty files cannot be memory-mapped
+            self.m_mmap = (mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+                           if file_size > 0
+                           else None)
+
+        self.m_bip32_cls = bip32_cls
+        self.m_count = file_size // Bip32SnapshotConst.RECORD_BYTE_LEN
+
+    def RecordBytes(self,
+                    idx: int) -> bytes:
+        """
+        Get the bytes of the record with the specified index.
+
+        Args:
+            idx (int): Record index
+
+        Returns:
+            bytes: Record bytes
+
+        Raises:
+            IndexError: If the index is not valid
+        """
+        if idx < 0:
+            idx += self.m_count
+        if idx < 0 or idx >= self.m_count or self.m_mmap is None:
+            raise IndexError(f"Invalid record index ({idx})")
+
+        offset = idx * Bip32SnapshotConst.RECORD_BYTE_LEN
+        return self.m_mmap[offset:offset + Bip32SnapshotConst.RECORD_BYTE_LEN]
+
+    def Close(self) -> None:
+        """Close the memory-mapped file."""
+        if self.m_mmap is not None:
+            self.m_mmap.close()
+            self.m_mmap = None
+
+    def Snapshot(self,
+                 idx: int) -> Bip32Snapshot:
+        """
+        Get the decoded record with the specified index, without constructing any key object.
+        It's useful when only the key bytes are needed (e.g. the cached public keys for address matching).
+
+        Args:
+            idx (int): Record index
+
+        Returns:
+            Bip32Snapshot object: Bip32Snapshot object
+
+        Raises:
+            Bip32KeyError: If the record is not valid
+            IndexError: If the index is not valid
+        """
+        return Bip32SnapshotDecoder.Decode(self.RecordBytes(idx))
+
+    def __len__(self) -> int:
+        """
+        Get the number of records.
+
+        Returns:
+            int: Number of records
+        """
+        return self.m_count
+
+    def __getitem__(self,
+                    idx: int) -> Bip32Base:
+        """
+        Get the BIP32 node with the specified index.
+
+        Args:
+            idx (int): Record index
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the record is not valid
+            IndexError: If the index is not valid
+        """
+        return self.m_bip32_cls.FromBytes(self.RecordBytes(idx))
+
+    def __iter__(self) -> Iterator[Bip32Base]:
+        """
+        Get an iterator over all the BIP32 nodes.
+
+        Returns:
+            Iterator: Iterator of Bip32Base objects
+        """
+        for idx in range(self.m_count):
+            yield self[idx]
+
+    def __enter__(self) -> Bip32SnapshotReader:
+        """
+        Enter the context.
+
+        Returns:
+            Bip32SnapshotReader object: The object itself
+        """
+        return self
+
+    def __exit__(self,
+                 *args: object) -> None:
+        """
+        Exit the context, closing the file.
+
+        Args:
+            args: Exception information (not used)
+        """
+        self.Close()
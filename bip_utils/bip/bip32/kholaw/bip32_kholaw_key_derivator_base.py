@@ -72,29 +72,25 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
             Bip32KeyError: If the index results in an invalid key
         """
 
-        # Get index and key bytes
+        # Get index, key bytes and chain code HMAC
         index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = priv_key.ChainCode().ToBytes()
+        chain_code_hmac = priv_key.ChainCodeHmac()
         priv_key_bytes = priv_key.Raw().ToBytes()
-        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
 
         # Compute Z and chain code
         if index.IsHardened():
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x00" + priv_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x01" + priv_key_bytes + index_bytes)[1]
+            z_bytes = chain_code_hmac.Digest(b"\x00" + priv_key_bytes + index_bytes)
+            chain_code_bytes = chain_code_hmac.DigestHalves(b"\x01" + priv_key_bytes + index_bytes)[1]
         else:
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x02" + pub_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x03" + pub_key_bytes + index_bytes)[1]
+            pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
+            z_bytes = chain_code_hmac.Digest(b"\x02" + pub_key_bytes + index_bytes)
+            chain_code_bytes = chain_code_hmac.DigestHalves(b"\x03" + pub_key_bytes + index_bytes)[1]
 
         # Compute the left and right part of the new private key
         hmac_half_len = HmacSha512.DigestSize() // 2
         kl_bytes = cls._NewPrivateKeyLeftPart(z_bytes[:hmac_half_len],
                                               priv_key_bytes[:hmac_half_len],
-                                              pub_key.Curve())
+                                              priv_key.Curve())
         kr_bytes = cls._NewPrivateKeyRightPart(z_bytes[hmac_half_len:],
                                                priv_key_bytes[hmac_half_len:])
 
@@ -118,16 +114,14 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
             Bip32KeyError: If the index results in an invalid key
         """
 
-        # Get index and key bytes
+        # Get index, key bytes and chain code HMAC
         index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = pub_key.ChainCode().ToBytes()
+        chain_code_hmac = pub_key.ChainCodeHmac()
         pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
 
         # Compute Z and chain code
-        z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                         b"\x02" + pub_key_bytes + index_bytes)
-        chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                        b"\x03" + pub_key_bytes + index_bytes)[1]
+        z_bytes = chain_code_hmac.Digest(b"\x02" + pub_key_bytes + index_bytes)
+        chain_code_bytes = chain_code_hmac.DigestHalves(b"\x03" + pub_key_bytes + index_bytes)[1]
 
         # Compute the new public key point
         hmac_half_len = HmacSha512.DigestSize() // 2
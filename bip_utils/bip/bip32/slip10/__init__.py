@@ -1,6 +1,8 @@
 from bip_utils.bip.bip32.slip10.bip32_slip10_ed25519 import Bip32Ed25519Slip, Bip32Slip10Ed25519
 from bip_utils.bip.bip32.slip10.bip32_slip10_ed25519_blake2b import Bip32Ed25519Blake2bSlip, Bip32Slip10Ed25519Blake2b
-from bip_utils.bip.bip32.slip10.bip32_slip10_key_derivator import Bip32Slip10EcdsaDerivator, Bip32Slip10Ed25519Derivator
+from bip_utils.bip.bip32.slip10.bip32_slip10_key_derivator import (
+    Bip32Slip10EcdsaDerivator, Bip32Slip10Ed25519Derivator, Bip32Slip10Secp256k1Derivator
+)
 from bip_utils.bip.bip32.slip10.bip32_slip10_mst_key_generator import (
     Bip32Slip10Ed2519MstKeyGenerator, Bip32Slip10Nist256p1MstKeyGenerator, Bip32Slip10Secp256k1MstKeyGenerator
 )
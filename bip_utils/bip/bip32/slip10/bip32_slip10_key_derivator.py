@@ -30,10 +30,10 @@ References:
 from typing import Tuple, Union
 
 from bip_utils.bip.bip32.base import IBip32KeyDerivator
+from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.ecc import IPoint
-from bip_utils.utils.crypto import HmacSha512
+from bip_utils.ecc import IPoint, Secp256k1Utils
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
@@ -79,7 +79,7 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        curve = pub_key.Curve()
+        curve = priv_key.Curve()
         priv_key_bytes = priv_key.Raw().ToBytes()
 
         # Data for HMAC
@@ -91,8 +91,7 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
             data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
 
         # Compute HMAC halves
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                                          data_bytes)
+        il_bytes, ir_bytes = priv_key.ChainCodeHmac().DigestHalves(data_bytes)
 
         # Construct new key secret from iL and current private key
         il_int = BytesUtils.ToInteger(il_bytes)
@@ -123,14 +122,56 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
 
         # Get HMAC of data
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(pub_key.ChainCode().ToBytes(),
-                                                          data_bytes)
+        il_bytes, ir_bytes = pub_key.ChainCodeHmac().DigestHalves(data_bytes)
+
+        return cls._NewPublicKey(pub_key, il_bytes), ir_bytes
+
+    @staticmethod
+    def _NewPublicKey(pub_key: Bip32PublicKey,
+                      il_bytes: bytes) -> Union[bytes, IPoint]:
+        """
+        Compute the new public key for public derivation.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+            il_bytes (bytes)               : Leftmost HMAC 32-byte
+
+        Returns:
+            bytes or IPoint: Public key bytes or point
+        """
         il_int = BytesUtils.ToInteger(il_bytes)
 
         # Get a new public key point: pub_key_point + G*iL
-        new_pub_key_point = pub_key.Point() + (pub_key.Curve().Generator() * il_int)
+        return pub_key.Point() + (pub_key.Curve().Generator() * il_int)
+
+
+class Bip32Slip10Secp256k1Derivator(Bip32Slip10EcdsaDerivator):
+    """
+    BIP32 SLIP-0010 secp256k1 key derivator class.
+    It allows keys derivation for secp256k1 curve in according to BIP32 SLIP-0010.
+    Public derivation is computed with a single tweak-add on the parsed key, without any point object.
+    """
+
+    @staticmethod
+    def _NewPublicKey(pub_key: Bip32PublicKey,
+                      il_bytes: bytes) -> Union[bytes, IPoint]:
+        """
+        Compute the new public key for public derivation.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+            il_bytes (bytes)               : Leftmost HMAC 32-byte
+
+        Returns:
+            bytes or IPoint: Public key bytes or point
 
-        return new_pub_key_point, ir_bytes
+        Raises:
+            Bip32KeyError: If the computed public key is not valid
+        """
+        try:
+            return Secp256k1Utils.PublicKeyTweakAdd(pub_key.KeyObject(), il_bytes)
+        except ValueError as ex:
+            raise Bip32KeyError("Computed public child key is not valid, very unlucky index") from ex
 
 
 class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
@@ -174,8 +215,7 @@ class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
                       + priv_key.Raw().ToBytes()
                       + index.ToBytes())
         # Compute HMAC halves
-        return HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                            data_bytes)
+        return priv_key.ChainCodeHmac().DigestHalves(data_bytes)
 
     @classmethod
     def CkdPub(cls,
@@ -26,7 +26,7 @@ from typing import Type
 from bip_utils.bip.bip32.base import Bip32Base, IBip32KeyDerivator, IBip32MstKeyGenerator
 from bip_utils.bip.bip32.bip32_const import Bip32Const
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
-from bip_utils.bip.bip32.slip10.bip32_slip10_key_derivator import Bip32Slip10EcdsaDerivator
+from bip_utils.bip.bip32.slip10.bip32_slip10_key_derivator import Bip32Slip10Secp256k1Derivator
 from bip_utils.bip.bip32.slip10.bip32_slip10_mst_key_generator import Bip32Slip10Secp256k1MstKeyGenerator
 from bip_utils.ecc import EllipticCurveTypes
 
@@ -65,7 +65,7 @@ class Bip32Slip10Secp256k1(Bip32Base):
         Returns:
             IBip32KeyDerivator class: Key derivator class
         """
-        return Bip32Slip10EcdsaDerivator
+        return Bip32Slip10Secp256k1Derivator
 
     @staticmethod
     def _MasterKeyGenerator() -> Type[IBip32MstKeyGenerator]:
@@ -1,8 +1,40 @@
-from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyBitLen, Bip39EntropyGenerator
-from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39WordsNum
-from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
-from bip_utils.bip.bip39.bip39_mnemonic_encoder import Bip39MnemonicEncoder
-from bip_utils.bip.bip39.bip39_mnemonic_generator import Bip39MnemonicGenerator
-from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
-from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGenerator
-from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyBitLen, Bip39EntropyGenerator
+    from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39WordsNum
+    from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
+    from bip_utils.bip.bip39.bip39_mnemonic_encoder import Bip39MnemonicEncoder
+    from bip_utils.bip.bip39.bip39_mnemonic_generator import Bip39MnemonicGenerator
+    from bip_utils.bip.bip39.bip39_mnemonic_recovery import Bip39MnemonicRecovery, Bip39MnemonicRecoveryResult
+    from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
+    from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGenerator
+    from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.bip.bip39.bip39_entropy_generator": ("Bip39EntropyBitLen", "Bip39EntropyGenerator"),
+    "bip_utils.bip.bip39.bip39_mnemonic": ("Bip39Languages", "Bip39Mnemonic", "Bip39WordsNum"),
+    "bip_utils.bip.bip39.bip39_mnemonic_decoder": ("Bip39MnemonicDecoder",),
+    "bip_utils.bip.bip39.bip39_mnemonic_encoder": ("Bip39MnemonicEncoder",),
+    "bip_utils.bip.bip39.bip39_mnemonic_generator": ("Bip39MnemonicGenerator",),
+    "bip_utils.bip.bip39.bip39_mnemonic_recovery": ("Bip39MnemonicRecovery", "Bip39MnemonicRecoveryResult"),
+    "bip_utils.bip.bip39.bip39_mnemonic_validator": ("Bip39MnemonicValidator",),
+    "bip_utils.bip.bip39.bip39_seed_generator": ("Bip39SeedGenerator",),
+    "bip_utils.bip.bip39.ibip39_seed_generator": ("IBip39SeedGenerator",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -103,4 +103,4 @@ class Bip39Mnemonic(Mnemonic):
             list[str]: Normalized mnemonic list
         """
         mnemonic = Mnemonic._Normalize(mnemonic)
-        return list(map(lambda s: StringUtils.NormalizeNfkd(s.lower()), mnemonic))
+        return [StringUtils.NormalizeNfkd(word.lower()) for word in mnemonic]
@@ -24,12 +24,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
 from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.utils.misc import IntegerUtils
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicWordsList
 
 
@@ -68,9 +68,9 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        entropy_bytes, _, _ = self.__DecodeAndVerify(mnemonic)
 
-        return self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
+        return entropy_bytes
 
     def DecodeWithChecksum(self,
                            mnemonic: Union[str, Mnemonic]) -> bytes:
@@ -87,26 +87,21 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        _, mnemonic_int, mnemonic_bit_len = self.__DecodeAndVerify(mnemonic)
 
-        # Compute pad bit length
-        mnemonic_bit_len = len(mnemonic_bin_str)
-        pad_bit_len = (mnemonic_bit_len
-                       if mnemonic_bit_len % 8 == 0
-                       else mnemonic_bit_len + (8 - mnemonic_bit_len % 8))
+        # Pad to a whole number of bytes
+        return IntegerUtils.ToBytes(mnemonic_int, bytes_num=(mnemonic_bit_len + 7) // 8)
 
-        return BytesUtils.FromBinaryStr(mnemonic_bin_str, pad_bit_len // 4)
-
-    def __DecodeAndVerifyBinaryStr(self,
-                                   mnemonic: Union[str, Mnemonic]) -> str:
+    def __DecodeAndVerify(self,
+                          mnemonic: Union[str, Mnemonic]) -> Tuple[bytes, int, int]:
         """
-        Decode a mnemonic phrase to its mnemonic binary string by verifying the checksum.
+        Decode a mnemonic phrase by verifying the checksum.
 
         Args:
             mnemonic (str or Mnemonic object): Mnemonic
 
         Returns:
-            str: Mnemonic binary string
+            tuple[bytes, int, int]: Entropy bytes (index 0), mnemonic integer (index 1) and its bit length (index 2)
 
         Raises:
             MnemonicChecksumError: If checksum is not valid
@@ -121,94 +116,42 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
         # Detect language if it was not specified at construction
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
-        # Get back mnemonic binary string
-        mnemonic_bin_str = self.__MnemonicToBinaryStr(mnemonic_obj, words_list)
+        # Get back mnemonic integer
+        mnemonic_int = self.__MnemonicToInteger(mnemonic_obj, words_list)
+        mnemonic_bit_len = mnemonic_obj.WordsCount() * Bip39MnemonicConst.WORD_BIT_LEN
 
-        # Verify checksum
-        checksum_bin_str = mnemonic_bin_str[-self.__GetChecksumLen(mnemonic_bin_str):]
-        checksum_bin_str_got = self.__ComputeChecksumBinaryStr(mnemonic_bin_str)
+        # Split entropy and checksum
+        checksum_bit_len = mnemonic_bit_len // 33
+        entropy_bytes = IntegerUtils.ToBytes(mnemonic_int >> checksum_bit_len, bytes_num=checksum_bit_len * 4)
+        checksum = mnemonic_int & ((1 << checksum_bit_len) - 1)
 
-        if checksum_bin_str != checksum_bin_str_got:
+        # Verify checksum, i.e. the first bits of the entropy hash
+        checksum_got = Sha256.QuickDigest(entropy_bytes)[0] >> (8 - checksum_bit_len)
+        if checksum != checksum_got:
             raise MnemonicChecksumError(
-                f"Invalid checksum (expected {checksum_bin_str}, got {checksum_bin_str_got})"
+                f"Invalid checksum (expected {checksum:0{checksum_bit_len}b}, "
+                f"got {checksum_got:0{checksum_bit_len}b})"
             )
 
-        return mnemonic_bin_str
-
-    def __ComputeChecksumBinaryStr(self,
-                                   mnemonic_bin_str: str) -> str:
-        """
-        Compute checksum from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           str: Computed checksum binary string
-        """
-
-        # Get entropy bytes
-        entropy_bytes = self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
-        # Convert entropy hash to binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-
-        # Return checksum
-        return entropy_hash_bin_str[:self.__GetChecksumLen(mnemonic_bin_str)]
-
-    def __EntropyBytesFromBinaryStr(self,
-                                    mnemonic_bin_str: str) -> bytes:
-        """
-        Get entropy bytes from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           bytes: Entropy bytes
-        """
-
-        # Get checksum length
-        checksum_len = self.__GetChecksumLen(mnemonic_bin_str)
-        # Get back entropy binary string
-        entropy_bin_str = mnemonic_bin_str[:-checksum_len]
-
-        # Get entropy bytes from binary string
-        return BytesUtils.FromBinaryStr(entropy_bin_str, checksum_len * 8)
+        return entropy_bytes, mnemonic_int, mnemonic_bit_len
 
     @staticmethod
-    def __MnemonicToBinaryStr(mnemonic: Mnemonic,
-                              words_list: MnemonicWordsList) -> str:
+    def __MnemonicToInteger(mnemonic: Mnemonic,
+                            words_list: MnemonicWordsList) -> int:
         """
-        Get mnemonic binary string from mnemonic phrase.
+        Get mnemonic integer from mnemonic phrase, by concatenating the 11-bit word indexes.
 
         Args:
             mnemonic (Mnemonic object)           : Mnemonic object
             words_list (MnemonicWordsList object): Words list object
 
         Returns:
-           str: Mnemonic binary string
+           int: Mnemonic integer
 
         Raises:
             ValueError: If the one of the mnemonic word is not valid
         """
-
-        # Convert each word to its index in binary format
-        mnemonic_bin_str = map(lambda word: IntegerUtils.ToBinaryStr(words_list.GetWordIdx(word),
-                                                                     Bip39MnemonicConst.WORD_BIT_LEN),
-                               mnemonic.ToList())
-
-        return "".join(mnemonic_bin_str)
-
-    @staticmethod
-    def __GetChecksumLen(mnemonic_bin_str: str) -> int:
-        """
-        Get checksum length from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           int: Checksum length
-        """
-        return len(mnemonic_bin_str) // 33
+        mnemonic_int = 0
+        for word in mnemonic.ToList():
+            mnemonic_int = (mnemonic_int << Bip39MnemonicConst.WORD_BIT_LEN) | words_list.GetWordIdx(word)
+        return mnemonic_int
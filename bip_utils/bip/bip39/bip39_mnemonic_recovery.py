@@ -0,0 +1,639 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Module for recovering BIP39 mnemonics with missing or misspelled words.
+Candidate mnemonics are enumerated in a fixed order and filtered by checksum, which is cheap, before computing
+the seed and the addresses, which is expensive.
+"""
+
+# Imports
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from concurrent import futures
+from itertools import combinations
+from typing import Deque, Generator, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGeneratorConst
+from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes
+from bip_utils.bip.conf.common import BipCoins
+from bip_utils.utils.crypto import Pbkdf2HmacSha512, Sha256
+from bip_utils.utils.misc import StringUtils
+
+
+class Bip39MnemonicRecoveryConst:
+    """Class container for BIP39 mnemonic recovery constants."""
+
+    # Placeholder for unknown words
+    UNKNOWN_WORD: str = "?"
+    # Default maximum edit distance of misspelled words
+    DEF_MAX_EDIT_DIST: int = 1
+    # Default number of candidates for each chunk
+    DEF_CHUNK_SIZE: int = 1 << 16
+    # Default number of pending chunks for each worker
+    DEF_PENDING_CHUNKS_PER_WORKER: int = 2
+    # Checkpoint file version
+    CHECKPOINT_VERSION: int = 1
+
+
+# Candidates for each word position, as word indexes
+_Bip39Template = Tuple[Tuple[int, ...], ...]
+
+
+class _Bip39RecoveryJob(NamedTuple):
+    """
+    BIP39 recovery job class.
+    It contains everything needed for searching candidates, so that it can be sent to the worker processes.
+    """
+
+    templates: Tuple[_Bip39Template, ...]
+    words: Tuple[str, ...]
+    passphrase: str
+    bip_cls: Type[Bip44Base]
+    coin_type: BipCoins
+    account: int
+    change: Bip44Changes
+    addr_num: int
+    address: str
+
+
+class _Bip39RecoveryUtils:
+    """Class container for BIP39 recovery utility functions."""
+
+    @staticmethod
+    def EditDistance(word1: str,
+                     word2: str) -> int:
+        """
+        Compute the edit distance between two words, i.e. the number of insertions, deletions, substitutions and
+        transpositions of adjacent characters needed for changing a word into the other one.
+
+        Args:
+            word1 (str): First word
+            word2 (str): Second word
+
+        Returns:
+            int: Edit distance
+        """
+        rows = [list(range(len(word2) + 1))]
+        for i in range(1, len(word1) + 1):
+            row = [i] + [0] * len(word2)
+            for j in range(1, len(word2) + 1):
+                row[j] = min(rows[i - 1][j] + 1,
+                             row[j - 1] + 1,
+                             rows[i - 1][j - 1] + (word1[i - 1] != word2[j - 1]))
+                if i > 1 and j > 1 and word1[i - 1] == word2[j - 2] and word1[i - 2] == word2[j - 1]:
+                    row[j] = min(row[j], rows[i - 2][j - 2] + 1)
+            rows.append(row)
+        return rows[-1][-1]
+
+    @staticmethod
+    def IterCandidates(templates: Sequence[_Bip39Template],
+                       start: int,
+                       count: int) -> Iterator[Tuple[int, _Bip39Template, List[int]]]:
+        """
+        Iterate over a range of candidates.
+        Candidates are numbered template by template, with the last word changing fastest, and the mnemonic
+        integer is updated incrementally, so only the changed words are taken into account for each candidate.
+
+        Args:
+            templates (sequence): Templates
+            start (int)         : First candidate index
+            count (int)         : Number of candidates
+
+        Returns:
+            Iterator object: Iterator over mnemonic integer, template and its word choices (index 0, 1 and 2).
+                             Word choices are updated in place, so they are valid only until the next iteration.
+        """
+        for template in templates:
+            template_size = _Bip39RecoveryUtils.TemplateSize(template)
+            if start >= template_size:
+                start -= template_size
+                continue
+
+            words_num = len(template)
+            shifts = [(words_num - 1 - i) * Bip39MnemonicConst.WORD_BIT_LEN for i in range(words_num)]
+
+            # Get the word choices of the first candidate
+            choices = [0] * words_num
+            rem = start
+            for i in reversed(range(words_num)):
+                rem, choices[i] = divmod(rem, len(template[i]))
+            mnemonic_int = 0
+            for i in range(words_num):
+                mnemonic_int |= template[i][choices[i]] << shifts[i]
+
+            curr_count = min(count, template_size - start)
+            for _ in range(curr_count):
+                yield mnemonic_int, template, choices
+
+                # Move to the next candidate
+                i = words_num - 1
+                while i >= 0:
+                    word_choices = template[i]
+                    old_word_idx = word_choices[choices[i]]
+                    choices[i] = (choices[i] + 1) % len(word_choices)
+                    mnemonic_int += (word_choices[choices[i]] - old_word_idx) << shifts[i]
+                    if choices[i] != 0:
+                        break
+                    i -= 1
+
+            count -= curr_count
+            if count == 0:
+                return
+            start = 0
+
+    @staticmethod
+    def TemplateSize(template: _Bip39Template) -> int:
+        """
+        Get the number of candidates of a template.
+
+        Args:
+            template (tuple): Template
+
+        Returns:
+            int: Number of candidates
+        """
+        size = 1
+        for word_choices in template:
+            size *= len(word_choices)
+        return size
+
+
+class _Bip39CandidatesSearcher:
+    """
+    BIP39 candidates searcher class.
+    It searches a range of candidates for the one matching the job address.
+    """
+
+    m_job: _Bip39RecoveryJob
+    m_salt: str
+
+    def __init__(self,
+                 job: _Bip39RecoveryJob) -> None:
+        """
+        Construct class.
+
+        Args:
+            job (_Bip39RecoveryJob object): Job
+        """
+        self.m_job = job
+        self.m_salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + job.passphrase)
+
+    def SearchRange(self,
+                    start: int,
+                    count: int) -> Optional[Tuple[str, int]]:
+        """
+        Search a range of candidates.
+
+        Args:
+            start (int): First candidate index
+            count (int): Number of candidates
+
+        Returns:
+            tuple[str, int]: Mnemonic (index 0) and address index (index 1) if found, None otherwise
+        """
+        words = self.m_job.words
+        chk_bit_len = len(self.m_job.templates[0]) * Bip39MnemonicConst.WORD_BIT_LEN // 33
+        chk_mask = (1 << chk_bit_len) - 1
+        entropy_byte_len = chk_bit_len * 4
+
+        candidates = _Bip39RecoveryUtils.IterCandidates(self.m_job.templates, start, count)
+        for mnemonic_int, template, choices in candidates:
+            # Filter by checksum first, which discards most candidates
+            entropy_bytes = (mnemonic_int >> chk_bit_len).to_bytes(entropy_byte_len, "big")
+            if Sha256.QuickDigest(entropy_bytes)[0] >> (8 - chk_bit_len) != mnemonic_int & chk_mask:
+                continue
+
+            mnemonic = " ".join(words[word_choices[choice]] for word_choices, choice in zip(template, choices))
+            addr_idx = self.__FindAddress(mnemonic)
+            if addr_idx is not None:
+                return mnemonic, addr_idx
+        return None
+
+    def __FindAddress(self,
+                      mnemonic: str) -> Optional[int]:
+        """
+        Find the job address among the addresses of a mnemonic.
+
+        Args:
+            mnemonic (str): Mnemonic, with a valid checksum
+
+        Returns:
+            int: Address index if found, None otherwise
+        """
+        seed_bytes = Pbkdf2HmacSha512.DeriveKey(mnemonic, self.m_salt, Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+        bip_obj = (self.m_job.bip_cls.FromSeed(seed_bytes, self.m_job.coin_type)
+                   .Purpose()
+                   .Coin()
+                   .Account(self.m_job.account)
+                   .Change(self.m_job.change))
+        # Address index and address are the first and last items
+        for addr in bip_obj.IterAddresses(0, self.m_job.addr_num):
+            if addr[-1] == self.m_job.address:
+                return addr[0]
+        return None
+
+
+class _Bip39RecoveryWorker:
+    """
+    BIP39 recovery worker class.
+    It contains the state and the tasks executed by each worker process.
+    """
+
+    searcher: Optional[_Bip39CandidatesSearcher] = None
+
+    @classmethod
+    def Initialize(cls,
+                   job: _Bip39RecoveryJob) -> None:
+        """
+        Initialize the worker process.
+
+        Args:
+            job (_Bip39RecoveryJob object): Job
+        """
+        cls.searcher = _Bip39CandidatesSearcher(job)
+
+    @classmethod
+    def SearchRange(cls,
+                    start: int,
+                    count: int) -> Optional[Tuple[str, int]]:
+        """
+        Search a range of candidates.
+
+        Args:
+            start (int): First candidate index
+            count (int): Number of candidates
+
+        Returns:
+            tuple[str, int]: Mnemonic (index 0) and address index (index 1) if found, None otherwise
+        """
+        assert cls.searcher is not None
+        return cls.searcher.SearchRange(start, count)
+
+
+class Bip39MnemonicRecoveryResult:
+    """
+    BIP39 mnemonic recovery result class.
+    It contains the recovered mnemonic and the index of the address that matched.
+    """
+
+    m_mnemonic: Bip39Mnemonic
+    m_addr_idx: int
+
+    def __init__(self,
+                 mnemonic: Bip39Mnemonic,
+                 addr_idx: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (Bip39Mnemonic object): Recovered mnemonic
+            addr_idx (int)                 : Address index
+        """
+        self.m_mnemonic = mnemonic
+        self.m_addr_idx = addr_idx
+
+    def Mnemonic(self) -> Bip39Mnemonic:
+        """
+        Get the recovered mnemonic.
+
+        Returns:
+            Bip39Mnemonic object: Bip39Mnemonic object
+        """
+        return self.m_mnemonic
+
+    def AddressIndex(self) -> int:
+        """
+        Get the index of the address that matched.
+
+        Returns:
+            int: Address index
+        """
+        return self.m_addr_idx
+
+
+class Bip39MnemonicRecovery:
+    """
+    BIP39 mnemonic recovery class.
+    It recovers a mnemonic with missing or misspelled words, given one of its addresses.
+    Unknown words are specified with the "?" placeholder (or None in a list) and all words of the list are tried
+    for them. Words that are not in the words list are considered misspelled and the words within the maximum edit
+    distance are tried for them. If the words are less than a valid mnemonic, the missing ones are tried in every
+    position.
+    Candidates are first filtered by checksum, which is cheap and discards most of them (e.g. 15/16 for 12-word
+    mnemonics), then the seed and the first addresses of the specified account and change are computed for the
+    remaining ones. The search can be split among processes and progress can be saved to a checkpoint file,
+    so that an interrupted search can be resumed.
+    """
+
+    m_job: _Bip39RecoveryJob
+    m_job_id: str
+    m_lang: Bip39Languages
+
+    def __init__(self,
+                 mnemonic: Union[str, Sequence[Optional[str]]],
+                 bip_cls: Type[Bip44Base],
+                 coin_type: BipCoins,
+                 address: str,
+                 passphrase: str = "",
+                 lang: Bip39Languages = Bip39Languages.ENGLISH,
+                 account: int = 0,
+                 change: Bip44Changes = Bip44Changes.CHAIN_EXT,
+                 addr_num: int = 1,
+                 max_edit_dist: int = Bip39MnemonicRecoveryConst.DEF_MAX_EDIT_DIST) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (str or list)         : Partial mnemonic, with "?" (or None in a list) for unknown words
+            bip_cls (Bip44Base class)      : BIP44 class used for deriving addresses (e.g. Bip44, Bip84)
+            coin_type (BipCoins)           : Coin type (the type depends on the BIP44 class)
+            address (str)                  : Known address
+            passphrase (str, optional)     : Passphrase (default: empty)
+            lang (Bip39Languages, optional): Language (default: English)
+            account (int, optional)        : Account index (default: 0)
+            change (Bip44Changes, optional): Change type (default: external chain)
+            addr_num (int, optional)       : Number of addresses to check for each candidate (default: 1)
+            max_edit_dist (int, optional)  : Maximum edit distance of misspelled words (default: 1)
+
+        Raises:
+            TypeError: If the coin type or the change type is not valid
+            ValueError: If the parameters are not valid
+        """
+        # Check the coin type
+        bip_cls.GetCoinConf(coin_type)
+        if not isinstance(change, Bip44Changes):
+            raise TypeError("Change index is not an enumerative of Bip44Changes")
+        if account < 0:
+            raise ValueError(f"Invalid account index ({account})")
+        if addr_num <= 0:
+            raise ValueError(f"Invalid number of addresses ({addr_num})")
+        if max_edit_dist < 0:
+            raise ValueError(f"Invalid maximum edit distance ({max_edit_dist})")
+
+        words_list = Bip39WordsListGetter.Instance().GetByLanguage(lang)
+        words = tuple(words_list.GetWordAtIdx(i) for i in range(words_list.Length()))
+
+        self.m_job = _Bip39RecoveryJob(
+            self.__BuildTemplates(mnemonic, words, max_edit_dist),
+            words,
+            passphrase,
+            bip_cls,
+            coin_type,
+            account,
+            change,
+            addr_num,
+            address
+        )
+        self.m_job_id = self.__JobId(self.m_job, lang)
+        self.m_lang = lang
+
+    def CandidatesNum(self) -> int:
+        """
+        Get the number of candidates, before filtering them by checksum.
+
+        Returns:
+            int: Number of candidates
+        """
+        return sum(map(_Bip39RecoveryUtils.TemplateSize, self.m_job.templates))
+
+    def Recover(self,
+                workers: int = 1,
+                checkpoint_file: Optional[str] = None,
+                chunk_size: int = Bip39MnemonicRecoveryConst.DEF_CHUNK_SIZE) -> Optional[Bip39MnemonicRecoveryResult]:
+        """
+        Recover the mnemonic, stopping at the first match.
+        If a checkpoint file is specified, the progress is saved to it after each chunk and, if it already exists,
+        the search is resumed from where it was left.
+
+        Args:
+            workers (int, optional)        : Number of worker processes, 1 for searching in the current process
+                                             (default: 1)
+            checkpoint_file (str, optional): Checkpoint file path (default: None)
+            chunk_size (int, optional)     : Number of candidates for each chunk (default: 65536)
+
+        Returns:
+            Bip39MnemonicRecoveryResult object: Result if found, None otherwise
+
+        Raises:
+            ValueError: If the parameters are not valid or the checkpoint file belongs to a different search
+        """
+        if workers <= 0:
+            raise ValueError(f"Invalid number of workers ({workers})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+
+        candidates_num = self.CandidatesNum()
+        start = self.__LoadCheckpoint(checkpoint_file) if checkpoint_file is not None else 0
+        chunks = [(chunk_start, min(chunk_size, candidates_num - chunk_start))
+                  for chunk_start in range(start, candidates_num, chunk_size)]
+
+        results = self.__SearchChunks(chunks, workers)
+        try:
+            for (chunk_start, chunk_count), result in zip(chunks, results):
+                if result is not None:
+                    mnemonic, addr_idx = result
+                    # Words are taken from the words list, so they are already normalized
+                    return Bip39MnemonicRecoveryResult(Bip39Mnemonic(mnemonic.split(" ")), addr_idx)
+                if checkpoint_file is not None:
+                    self.__SaveCheckpoint(checkpoint_file, chunk_start + chunk_count)
+        finally:
+            # Stop the pending chunks
+            results.close()
+        return None
+
+    def __SearchChunks(self,
+                       chunks: List[Tuple[int, int]],
+                       workers: int) -> Generator[Optional[Tuple[str, int]], None, None]:
+        """
+        Search chunks of candidates, yielding their results in order.
+
+        Args:
+            chunks (list[tuple]): First candidate index and number of candidates of each chunk
+            workers (int)       : Number of worker processes
+
+        Returns:
+            Iterator object: Iterator over the result of each chunk
+        """
+        if workers == 1:
+            searcher = _Bip39CandidatesSearcher(self.m_job)
+            for chunk_start, chunk_count in chunks:
+                yield searcher.SearchRange(chunk_start, chunk_count)
+            return
+
+        max_pending = Bip39MnemonicRecoveryConst.DEF_PENDING_CHUNKS_PER_WORKER * workers
+        # The executor is not used as a context manager, since waiting for it would wait for the running chunks
+        # also when a match is already found
+        executor = futures.ProcessPoolExecutor(max_workers=workers,
+                                               initializer=_Bip39RecoveryWorker.Initialize,
+                                               initargs=(self.m_job,))
+        pending: Deque[futures.Future] = deque()
+        try:
+            for chunk_start, chunk_count in chunks:
+                # Wait for the oldest chunk if too many are pending
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_Bip39RecoveryWorker.SearchRange, chunk_start, chunk_count))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Cancel the chunks not started yet, the running ones are left to finish in the background
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def __LoadCheckpoint(self,
+                         file_path: str) -> int:
+        """
+        Load the checkpoint file.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            int: Index of the first candidate to be searched (0 if the file does not exist)
+
+        Raises:
+            ValueError: If the file is not valid or it belongs to a different search
+        """
+        if not os.path.isfile(file_path):
+            return 0
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as fin:
+                checkpoint = json.load(fin)
+            version, job_id, next_idx = checkpoint["version"], checkpoint["job_id"], checkpoint["next_index"]
+        except (KeyError, TypeError, ValueError) as ex:
+            raise ValueError(f"Invalid checkpoint file ({file_path})") from ex
+
+        if version != Bip39MnemonicRecoveryConst.CHECKPOINT_VERSION:
+            raise ValueError(f"Invalid checkpoint file version ({version})")
+        if job_id != self.m_job_id:
+            raise ValueError("Checkpoint file belongs to a different search")
+        if not isinstance(next_idx, int) or not 0 <= next_idx <= self.CandidatesNum():
+            raise ValueError(f"Invalid checkpoint index ({next_idx})")
+        return next_idx
+
+    def __SaveCheckpoint(self,
+                         file_path: str,
+                         next_idx: int) -> None:
+        """
+        Save the checkpoint file.
+        The file is written to a temporary file and then replaced, so it's never left half written.
+
+        Args:
+            file_path (str): File path
+            next_idx (int) : Index of the first candidate to be searched
+        """
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "w", encoding="utf-8") as fout:
+            json.dump({
+                "version": Bip39MnemonicRecoveryConst.CHECKPOINT_VERSION,
+                "job_id": self.m_job_id,
+                "next_index": next_idx,
+            }, fout)
+        os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def __BuildTemplates(mnemonic: Union[str, Sequence[Optional[str]]],
+                         words: Tuple[str, ...],
+                         max_edit_dist: int) -> Tuple[_Bip39Template, ...]:
+        """
+        Build the templates of a partial mnemonic.
+
+        Args:
+            mnemonic (str or list): Partial mnemonic
+            words (tuple[str])    : Words list
+            max_edit_dist (int)   : Maximum edit distance of misspelled words
+
+        Returns:
+            tuple: Templates
+
+        Raises:
+            ValueError: If the partial mnemonic is not valid
+        """
+        mnemonic_words = (Bip39Mnemonic.FromString(mnemonic).ToList()
+                          if isinstance(mnemonic, str)
+                          else [StringUtils.NormalizeNfkd(word) if word is not None else None for word in mnemonic])
+
+        # Get the valid words number
+        words_num = next((words_num for words_num in Bip39MnemonicConst.MNEMONIC_WORD_NUM
+                          if words_num >= len(mnemonic_words)), None)
+        if words_num is None or len(mnemonic_words) == 0:
+            raise ValueError(f"Mnemonic words count is not valid ({len(mnemonic_words)})")
+
+        # Get the choices of each given word
+        all_choices = tuple(range(len(words)))
+        words_to_idx = {word: i for i, word in enumerate(words)}
+        word_choices_list = []
+        for word in mnemonic_words:
+            if word is None or word == Bip39MnemonicRecoveryConst.UNKNOWN_WORD:
+                word_choices_list.append(all_choices)
+            elif word in words_to_idx:
+                word_choices_list.append((words_to_idx[word],))
+            else:
+                word_choices = tuple(
+                    i for _, i in sorted((dist, i)
+                                         for dist, i in ((_Bip39RecoveryUtils.EditDistance(word, w), i)
+                                                         for i, w in enumerate(words))
+                                         if dist <= max_edit_dist)
+                )
+                if len(word_choices) == 0:
+                    raise ValueError(f"Unable to find words similar to {word}")
+                word_choices_list.append(word_choices)
+
+        # Try missing words in every position
+        missing_num = words_num - len(mnemonic_words)
+        templates = []
+        for missing_pos in combinations(range(words_num), missing_num):
+            given_choices = iter(word_choices_list)
+            templates.append(tuple(all_choices if i in missing_pos else next(given_choices)
+                                   for i in range(words_num)))
+        return tuple(templates)
+
+    @staticmethod
+    def __JobId(job: _Bip39RecoveryJob,
+                lang: Bip39Languages) -> str:
+        """
+        Get the identifier of a job, used for checking that a checkpoint file belongs to it.
+
+        Args:
+            job (_Bip39RecoveryJob object): Job
+            lang (Bip39Languages)         : Language
+
+        Returns:
+            str: Job identifier
+        """
+        job_desc = json.dumps([
+            [[list(word_choices) for word_choices in template] for template in job.templates],
+            lang.name,
+            Sha256.QuickDigest(job.passphrase).hex(),
+            job.bip_cls.__name__,
+            str(job.coin_type),
+            job.account,
+            int(job.change),
+            job.addr_num,
+            job.address,
+        ])
+        return Sha256.QuickDigest(job_desc).hex()
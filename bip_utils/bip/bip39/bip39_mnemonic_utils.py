@@ -21,7 +21,6 @@
 """Module for BIP39 mnemonic utility classes."""
 
 # Imports
-import os
 from typing import Tuple
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst
@@ -62,7 +61,7 @@ class Bip39WordsListGetter(MnemonicWordsListGetterBase):
     @staticmethod
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the specified language file name, relative to the package root.
 
         Args:
             lang (MnemonicLanguages): Language
@@ -70,8 +69,7 @@ class Bip39WordsListGetter(MnemonicWordsListGetterBase):
         Returns:
             str: Language file name
         """
-        return os.path.join(os.path.dirname(__file__),
-                            Bip39MnemonicConst.LANGUAGE_FILES[lang])
+        return f"bip/bip39/{Bip39MnemonicConst.LANGUAGE_FILES[lang]}"
 
 
 class Bip39WordsListFinder(MnemonicWordsListFinderBase):
@@ -24,14 +24,13 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
 from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
-from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicSeedGeneratorBase
 
 
 class Bip39SeedGeneratorConst:
@@ -43,7 +42,7 @@ class Bip39SeedGeneratorConst:
     SEED_PBKDF2_ROUNDS: int = 2048
 
 
-class Bip39SeedGenerator(IBip39SeedGenerator):
+class Bip39SeedGenerator(MnemonicSeedGeneratorBase, IBip39SeedGenerator):
     """
     BIP39 seed generator class.
     It generates the seed from a mnemonic in according to BIP39.
@@ -73,18 +72,25 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
                            if isinstance(mnemonic, str)
                            else mnemonic)
 
-    def Generate(self,
-                 passphrase: str = "") -> bytes:
+    def _PasswordAndSalt(self,
+                         passphrase: str) -> Tuple[Union[bytes, str], str]:
         """
-        Generate the seed using the specified passphrase.
+        Get the PBKDF2 password and salt for the specified passphrase.
 
         Args:
-            passphrase (str, optional): Passphrase, empty if not specified
+            passphrase (str): Passphrase
 
         Returns:
-            bytes: Generated seed
+            tuple[bytes or str, str]: Password (index 0) and salt (index 1)
         """
-        salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
-                                          salt,
-                                          Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+        return self.m_mnemonic.ToStr(), StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
+
+    @staticmethod
+    def _Pbkdf2Rounds() -> int:
+        """
+        Get the number of PBKDF2 rounds.
+
+        Returns:
+            int: Number of PBKDF2 rounds
+        """
+        return Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS
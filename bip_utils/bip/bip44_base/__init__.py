@@ -1,3 +1,7 @@
+from bip_utils.bip.bip44_base.bip44_accounts import Bip44AccountsDerivator
+from bip_utils.bip.bip44_base.bip44_addr_index import Bip44AddrIndex, Bip44AddrIndexBuilder
 from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+from bip_utils.bip.bip44_base.bip44_discovery import Bip44DiscoveredAccount, Bip44DiscoveredChain, Bip44Discovery
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base.bip44_multi_coin import Bip44MultiCoinDerivator
@@ -0,0 +1,261 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for deriving many accounts of a coin in bulk."""
+
+# Imports
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Iterator, Optional
+
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32ParallelDerivator
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Levels
+from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+
+
+class Bip44AccountsDerivatorConst:
+    """Class container for BIP44 accounts derivator constants."""
+
+    # Default number of accounts for each chunk, when deriving in parallel
+    DEF_CHUNK_SIZE: int = 1000
+    # Maximum number of accounts (i.e. hardened indexes)
+    MAX_ACCOUNTS_NUM: int = 1 << Bip32KeyDataConst.KEY_INDEX_HARDENED_BIT_NUM
+
+
+def _ExtendedKey(public_only: bool,
+                 bip32_obj: Bip32Base) -> str:
+    """
+    Get the extended key of a BIP32 object.
+    It's a module-level function, so that it can be sent to worker processes.
+
+    Args:
+        public_only (bool)          : True for the public extended key, false for the private one
+        bip32_obj (Bip32Base object): Bip32Base object
+
+    Returns:
+        str: Extended key
+    """
+    return bip32_obj.PublicKey().ToExtended() if public_only else bip32_obj.PrivateKey().ToExtended()
+
+
+def _Snapshot(bip32_obj: Bip32Base) -> bytes:
+    """
+    Get the snapshot record of a BIP32 object.
+    It's a module-level function, so that it can be sent to worker processes.
+
+    Args:
+        bip32_obj (Bip32Base object): Bip32Base object
+
+    Returns:
+        bytes: Snapshot record bytes
+    """
+    return bip32_obj.ToBytes()
+
+
+class Bip44AccountsDerivator:
+    """
+    BIP44 accounts derivator class.
+    It derives a range of consecutive accounts from a coin-level object in a single pass, e.g. for creating
+    an account for each customer. The per-parent data is computed only once and, if more than one worker is
+    specified, the range is split in chunks derived by a pool of processes.
+    Results are generated in order one chunk at a time, so memory usage does not depend on the number of accounts
+    and they can be passed to a callback or written to a file as they come.
+    """
+
+    m_bip_obj: Bip44Base
+    m_workers: int
+    m_chunk_size: int
+
+    def __init__(self,
+                 bip_obj: Bip44Base,
+                 workers: int = 1,
+                 chunk_size: int = Bip44AccountsDerivatorConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base object): Coin-level object
+            workers (int, optional)   : Number of worker processes, 1 for deriving in the current process (default: 1)
+            chunk_size (int, optional): Number of accounts for each chunk, when deriving in parallel (default: 1000)
+
+        Raises:
+            Bip44DepthError: If the object is not at coin level
+            ValueError: If the parameters are not valid
+        """
+        if not bip_obj.IsLevel(Bip44Levels.COIN):
+            raise Bip44DepthError(
+                f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for deriving accounts"
+            )
+        if workers <= 0:
+            raise ValueError(f"Invalid number of workers ({workers})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+
+        self.m_bip_obj = bip_obj
+        self.m_workers = workers
+        self.m_chunk_size = chunk_size
+
+    def IterAccounts(self,
+                     start: int,
+                     count: int,
+                     public_only: bool = False) -> Iterator[Bip44Base]:
+        """
+        Iterate over a range of accounts.
+
+        Args:
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for getting public-only accounts (default: False)
+
+        Returns:
+            Iterator object: Iterator over account-level Bip44Base objects
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        # Objects are constructed in the current process, so only raw keys are sent back by workers
+        return map(self.m_bip_obj._NewLevel,     # pylint: disable=protected-access
+                   self.__Derive(start, count, public_only, None))
+
+    def IterExtendedKeys(self,
+                         start: int,
+                         count: int,
+                         public_only: bool = True) -> Iterator[str]:
+        """
+        Iterate over the extended keys of a range of accounts.
+
+        Args:
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for public extended keys, false for private ones (default: True)
+
+        Returns:
+            Iterator object: Iterator over extended keys
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        return self.__Derive(start, count, public_only, functools.partial(_ExtendedKey, public_only))
+
+    def IterSnapshots(self,
+                      start: int,
+                      count: int,
+                      public_only: bool = True) -> Iterator[bytes]:
+        """
+        Iterate over the snapshot records of a range of accounts.
+        Records can be restored with Bip32Base.FromBytes or read back with Bip32SnapshotReader if written to a file.
+
+        Args:
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for public-only snapshots (default: True)
+
+        Returns:
+            Iterator object: Iterator over snapshot records bytes
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        return self.__Derive(start, count, public_only, _Snapshot)
+
+    def WriteExtendedKeys(self,
+                          file_path: str,
+                          start: int,
+                          count: int,
+                          public_only: bool = True) -> None:
+        """
+        Write the extended keys of a range of accounts to a file, one for each line.
+
+        Args:
+            file_path (str)             : File path
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for public extended keys, false for private ones (default: True)
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        ex_keys = self.IterExtendedKeys(start, count, public_only)
+        with open(file_path, "w", encoding="utf-8") as fout:
+            fout.writelines(f"{ex_key}\n" for ex_key in ex_keys)
+
+    def WriteSnapshots(self,
+                       file_path: str,
+                       start: int,
+                       count: int,
+                       public_only: bool = True) -> None:
+        """
+        Write the snapshot records of a range of accounts to a file, that can be read with Bip32SnapshotReader.
+
+        Args:
+            file_path (str)             : File path
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for public-only snapshots (default: True)
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        records = self.IterSnapshots(start, count, public_only)
+        with open(file_path, "wb") as fout:
+            fout.writelines(records)
+
+    def __Derive(self,
+                 start: int,
+                 count: int,
+                 public_only: bool,
+                 result_fn: Optional[Callable[[Bip32Base], Any]]) -> Iterator[Any]:
+        """
+        Derive a range of accounts.
+
+        Args:
+            start (int)         : First account index
+            count (int)         : Number of accounts
+            public_only (bool)  : True for public-only accounts
+            result_fn (function): Function applied to each account BIP32 object (None for the object itself)
+
+        Returns:
+            Iterator object: Iterator over results
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid
+        """
+        if start < 0 or count < 0 or start + count > Bip44AccountsDerivatorConst.MAX_ACCOUNTS_NUM:
+            raise ValueError(f"Invalid accounts range ({start}, {count})")
+
+        bip32_obj = self.m_bip_obj.Bip32Object()
+        first_idx = Bip32KeyIndex.HardenIndex(start)
+        if self.m_workers > 1:
+            return Bip32ParallelDerivator(bip32_obj,
+                                          workers=self.m_workers,
+                                          chunk_size=self.m_chunk_size).DeriveChildrenRange(first_idx,
+                                                                                            count,
+                                                                                            public_only,
+                                                                                            result_fn)
+        children = bip32_obj.IterChildrenRange(first_idx, count, public_only)
+        return children if result_fn is None else map(result_fn, children)
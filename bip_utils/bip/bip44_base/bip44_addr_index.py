@@ -0,0 +1,539 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for address reverse index, i.e. a sorted memory-mapped table for finding the derivation path of an address.
+"""
+
+# Imports
+from __future__ import annotations
+
+import array
+import mmap
+import os
+import struct
+import sys
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32PublicKey
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+from bip_utils.utils.crypto import Blake2b
+
+
+# Function returning the address (or its hash, e.g. a script hash) of a public key
+AddrFct = Callable[[Bip32PublicKey], Union[bytes, str]]
+
+
+class Bip44AddrIndexConst:
+    """Class container for BIP44 address index constants."""
+
+    # Magic bytes
+    MAGIC: bytes = b"BUAI"
+    # Format version
+    VERSION: int = 2
+
+    # Key length in bytes (BLAKE2b digest of the address)
+    KEY_BYTE_LEN: int = 8
+    # Number of key bits used for the fan-out table
+    FANOUT_BITS: int = 16
+    # Number of fan-out table entries
+    FANOUT_LEN: int = 1 << FANOUT_BITS
+
+    # Indexed chains
+    CHAINS: Tuple[Bip44Changes, ...] = (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT)
+
+    # Account key identifier length in bytes
+    ACC_KEY_ID_BYTE_LEN: int = 20
+
+    # Header structure: magic, version, number of records, number of indexed addresses for each chain,
+    # account key identifier
+    HEADER_STRUCT: struct.Struct = struct.Struct(f">4sBxxxQII{ACC_KEY_ID_BYTE_LEN}s")
+    # Fan-out table entry structure: number of records whose key prefix is less than or equal to the entry index
+    FANOUT_STRUCT: struct.Struct = struct.Struct(">I")
+    # Record structure: key, change, address index
+    RECORD_STRUCT: struct.Struct = struct.Struct(f">{KEY_BYTE_LEN}sII")
+
+    # Offsets of the fan-out table and the records
+    FANOUT_OFFSET: int = HEADER_STRUCT.size
+    RECORDS_OFFSET: int = FANOUT_OFFSET + FANOUT_LEN * FANOUT_STRUCT.size
+
+
+class _Bip44AddrIndexUtils:
+    """Class container for BIP44 address index utility functions."""
+
+    @staticmethod
+    def Key(addr: Union[bytes, str]) -> bytes:
+        """
+        Compute the key of an address.
+
+        Args:
+            addr (str or bytes): Address (or its hash)
+
+        Returns:
+            bytes: Key bytes
+        """
+        return Blake2b.QuickDigest(addr, Bip44AddrIndexConst.KEY_BYTE_LEN)
+
+    @staticmethod
+    def FanoutIndex(key: bytes) -> int:
+        """
+        Get the fan-out table index of a key.
+
+        Args:
+            key (bytes): Key bytes
+
+        Returns:
+            int: Fan-out table index
+        """
+        return int.from_bytes(key[:Bip44AddrIndexConst.FANOUT_BITS // 8], "big")
+
+    @staticmethod
+    def AccountKeyIdentifier(bip_obj: Union[Bip44Base, Bip32Base]) -> bytes:
+        """
+        Get the key identifier of an account node, i.e. the Hash160 of its public key.
+
+        Args:
+            bip_obj (Bip44Base or Bip32Base object): Account node
+
+        Returns:
+            bytes: Key identifier bytes
+        """
+        bip32_obj = bip_obj.Bip32Object() if isinstance(bip_obj, Bip44Base) else bip_obj
+        return bip32_obj.PublicKey().KeyIdentifier()
+
+
+class Bip44AddrIndex:
+    """
+    BIP44 address index class.
+    It finds the change and address index of an address, by memory-mapping a file of records sorted by address key.
+    A fan-out table gives the range of records with the same key prefix, so that each lookup is a search in a
+    few records of the mapped file and no Python object is kept for each record.
+    The file also contains the key identifier of the indexed account, so that it cannot be extended with the
+    addresses of another account.
+    Only a 64-bit hash of each address is stored, so an address that is not indexed is reported as found with a
+    probability of about N / 2^64 for N indexed addresses (e.g. about 5e-14 for one million addresses). If that's
+    not acceptable, the address of the found change and address index shall be derived and compared.
+    """
+
+    m_mmap: Optional[mmap.mmap]
+    m_records_num: int
+    m_chain_sizes: Tuple[int, ...]
+    m_acc_key_id: bytes
+    m_fanout: array.array
+
+    def __init__(self,
+                 file_path: str) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as fin:
+            self.m_mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.m_records_num, self.m_chain_sizes, self.m_acc_key_id = self.__ReadHeader(self.m_mmap)
+        except ValueError:
+            self.Close()
+            raise
+        self.m_fanout = self.__ReadFanout(self.m_mmap)
+
+    def RecordsNum(self) -> int:
+        """
+        Get the number of records, i.e. of indexed addresses.
+
+        Returns:
+            int: Number of records
+        """
+        return self.m_records_num
+
+    def ChainSize(self,
+                  change: Bip44Changes) -> int:
+        """
+        Get the number of indexed addresses of a chain.
+
+        Args:
+            change (Bip44Changes): Change
+
+        Returns:
+            int: Number of indexed addresses (from index 0)
+        """
+        return self.m_chain_sizes[Bip44AddrIndexConst.CHAINS.index(change)]
+
+    def AccountKeyIdentifier(self) -> bytes:
+        """
+        Get the key identifier of the indexed account, i.e. the Hash160 of its public key.
+
+        Returns:
+            bytes: Key identifier bytes
+        """
+        return self.m_acc_key_id
+
+    def Lookup(self,
+               addr: Union[bytes, str]) -> Optional[Tuple[Bip44Changes, int]]:
+        """
+        Find the change and address index of an address.
+        The address is matched by its 64-bit hash, so a not indexed address is found with a probability of about
+        N / 2^64 for N indexed addresses.
+
+        Args:
+            addr (str or bytes): Address, in the same form used for building the index
+
+        Returns:
+            tuple[Bip44Changes, int]: Change and address index
+            None: If the address is not indexed
+        """
+        key = _Bip44AddrIndexUtils.Key(addr)
+        return self.__FindInBucket(self.__Bucket(_Bip44AddrIndexUtils.FanoutIndex(key)), key)
+
+    def LookupMany(self,
+                   addrs: Iterable[Union[bytes, str]]) -> List[Optional[Tuple[Bip44Changes, int]]]:
+        """
+        Find the change and address index of many addresses.
+        Addresses are looked up in key order, so that the file is read in a single pass and the records with the
+        same key prefix are read only once.
+        Like Lookup, each not indexed address is found with a probability of about N / 2^64 for N indexed addresses.
+
+        Args:
+            addrs (iterable[str or bytes]): Addresses, in the same form used for building the index
+
+        Returns:
+            list: Change and address index for each address (None if the address is not indexed)
+        """
+        keys = [_Bip44AddrIndexUtils.Key(addr) for addr in addrs]
+        results: List[Optional[Tuple[Bip44Changes, int]]] = [None] * len(keys)
+
+        last_fanout_idx = -1
+        bucket = b""
+        for i in sorted(range(len(keys)), key=keys.__getitem__):
+            fanout_idx = _Bip44AddrIndexUtils.FanoutIndex(keys[i])
+            if fanout_idx != last_fanout_idx:
+                bucket = self.__Bucket(fanout_idx)
+                last_fanout_idx = fanout_idx
+            results[i] = self.__FindInBucket(bucket, keys[i])
+        return results
+
+    def RecordsBytes(self) -> bytes:
+        """
+        Get the bytes of all the records.
+
+        Returns:
+            bytes: Records bytes
+        """
+        return self.__Mmap()[Bip44AddrIndexConst.RECORDS_OFFSET:]
+
+    def Close(self) -> None:
+        """Close the memory-mapped file."""
+        if self.m_mmap is not None:
+            self.m_mmap.close()
+            self.m_mmap = None
+
+    def __enter__(self) -> Bip44AddrIndex:
+        """
+        Enter the context.
+
+        Returns:
+            Bip44AddrIndex object: The object itself
+        """
+        return self
+
+    def __exit__(self,
+                 *args: object) -> None:
+        """
+        Exit the context, closing the file.
+
+        Args:
+            args: Exception information (not used)
+        """
+        self.Close()
+
+    def __Bucket(self,
+                 fanout_idx: int) -> bytes:
+        """
+        Get the bytes of the records with the specified fan-out table index.
+
+        Args:
+            fanout_idx (int): Fan-out table index
+
+        Returns:
+            bytes: Records bytes
+        """
+        lo = self.m_fanout[fanout_idx - 1] if fanout_idx > 0 else 0
+        hi = self.m_fanout[fanout_idx]
+        return self.__Mmap()[Bip44AddrIndexConst.RECORDS_OFFSET + lo * Bip44AddrIndexConst.RECORD_STRUCT.size:
+                             Bip44AddrIndexConst.RECORDS_OFFSET + hi * Bip44AddrIndexConst.RECORD_STRUCT.size]
+
+    @staticmethod
+    def __FindInBucket(bucket: bytes,
+                       key: bytes) -> Optional[Tuple[Bip44Changes, int]]:
+        """
+        Find a key in the records with the same fan-out table index.
+
+        Args:
+            bucket (bytes): Records bytes
+            key (bytes)   : Key bytes
+
+        Returns:
+            tuple[Bip44Changes, int]: Change and address index
+            None: If the key is not found
+        """
+        record_len = Bip44AddrIndexConst.RECORD_STRUCT.size
+
+        # Only matches at the beginning of a record are valid
+        offset = bucket.find(key)
+        while offset % record_len != 0:
+            if offset == -1:
+                return None
+            offset = bucket.find(key, offset + 1)
+
+        _, change, addr_idx = Bip44AddrIndexConst.RECORD_STRUCT.unpack_from(bucket, offset)
+        return Bip44Changes(change), addr_idx
+
+    def __Mmap(self) -> mmap.mmap:
+        """
+        Get the memory-mapped file.
+
+        Returns:
+            mmap object: Memory-mapped file
+
+        Raises:
+            ValueError: If the file is closed
+        """
+        if self.m_mmap is None:
+            raise ValueError("Address index is closed")
+        return self.m_mmap
+
+    @staticmethod
+    def __ReadHeader(mm: mmap.mmap) -> Tuple[int, Tuple[int, ...], bytes]:
+        """
+        Read and validate the header.
+
+        Args:
+            mm (mmap object): Memory-mapped file
+
+        Returns:
+            tuple[int, tuple[int], bytes]: Number of records, number of indexed addresses for each chain and
+                                           account key identifier
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        if len(mm) < Bip44AddrIndexConst.RECORDS_OFFSET:
+            raise ValueError(f"Invalid address index file size ({len(mm)})")
+
+        magic, version, records_num, *chain_sizes, acc_key_id = Bip44AddrIndexConst.HEADER_STRUCT.unpack_from(mm, 0)
+        if magic != Bip44AddrIndexConst.MAGIC:
+            raise ValueError("Invalid address index magic")
+        if version != Bip44AddrIndexConst.VERSION:
+            raise ValueError(f"Invalid address index version ({version})")
+        if len(mm) != Bip44AddrIndexConst.RECORDS_OFFSET + records_num * Bip44AddrIndexConst.RECORD_STRUCT.size:
+            raise ValueError(f"Invalid address index file size ({len(mm)})")
+        return records_num, tuple(chain_sizes), acc_key_id
+
+    @staticmethod
+    def __ReadFanout(mm: mmap.mmap) -> array.array:
+        """
+        Read the fan-out table.
+
+        Args:
+            mm (mmap object): Memory-mapped file
+
+        Returns:
+            array object: Fan-out table
+        """
+        fanout = array.array("I")
+        assert fanout.itemsize == Bip44AddrIndexConst.FANOUT_STRUCT.size
+        fanout.frombytes(mm[Bip44AddrIndexConst.FANOUT_OFFSET:Bip44AddrIndexConst.RECORDS_OFFSET])
+        # Entries are stored in big endian
+        if sys.byteorder == "little":
+            fanout.byteswap()
+        return fanout
+
+
+class Bip44AddrIndexBuilder:
+    """
+    BIP44 address index builder class.
+    It builds an address index from an account node, given as a Bip44Base object or as a Bip32Base object
+    (e.g. an account extended public key), and extends it when more addresses are needed.
+    """
+
+    m_bip_obj: Union[Bip44Base, Bip32Base]
+    m_addr_fct: Optional[AddrFct]
+
+    def __init__(self,
+                 bip_obj: Union[Bip44Base, Bip32Base],
+                 addr_fct: Optional[AddrFct] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base or Bip32Base object): Account node
+            addr_fct (function, optional)          : Function returning the address (or its hash) of a public key
+                                                     (default: the coin address, only for Bip44Base objects)
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the address function is not specified for a Bip32Base object
+        """
+        if isinstance(bip_obj, Bip44Base):
+            if not bip_obj.IsLevel(Bip44Levels.ACCOUNT):
+                raise Bip44DepthError(
+                    f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for an address index"
+                )
+        elif addr_fct is None:
+            raise ValueError("The address function shall be specified for Bip32Base objects")
+
+        self.m_bip_obj = bip_obj
+        self.m_addr_fct = addr_fct
+
+    def Build(self,
+              file_path: str,
+              count: int) -> None:
+        """
+        Build an address index with the first addresses of the external and internal chains.
+
+        Args:
+            file_path (str): File path
+            count (int)    : Number of addresses for each chain
+
+        Raises:
+            ValueError: If the count is not valid
+        """
+        self.__Write(file_path, b"", (0,) * len(Bip44AddrIndexConst.CHAINS), count)
+
+    def Extend(self,
+               file_path: str,
+               count: int) -> None:
+        """
+        Extend an address index, so that each chain contains at least the specified number of addresses.
+        Only the missing addresses are derived. The file is replaced atomically.
+
+        Args:
+            file_path (str): File path
+            count (int)    : Number of addresses for each chain
+
+        Raises:
+            ValueError: If the count or the file is not valid, or the file indexes a different account
+        """
+        with Bip44AddrIndex(file_path) as addr_index:
+            if addr_index.AccountKeyIdentifier() != _Bip44AddrIndexUtils.AccountKeyIdentifier(self.m_bip_obj):
+                raise ValueError("The address index was built for a different account")
+            records_bytes = addr_index.RecordsBytes()
+            chain_sizes = tuple(addr_index.ChainSize(change) for change in Bip44AddrIndexConst.CHAINS)
+        self.__Write(file_path, records_bytes, chain_sizes, count)
+
+    def __Write(self,
+                file_path: str,
+                records_bytes: bytes,
+                chain_sizes: Sequence[int],
+                count: int) -> None:
+        """
+        Write an address index, merging the existing records with the ones of the missing addresses.
+
+        Args:
+            file_path (str)          : File path
+            records_bytes (bytes)    : Existing records bytes
+            chain_sizes (list[int])  : Number of existing addresses for each chain
+            count (int)              : Number of addresses for each chain
+
+        Raises:
+            ValueError: If the count is not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid count ({count})")
+
+        record_len = Bip44AddrIndexConst.RECORD_STRUCT.size
+        records = [records_bytes[i:i + record_len] for i in range(0, len(records_bytes), record_len)]
+        for change, chain_size in zip(Bip44AddrIndexConst.CHAINS, chain_sizes):
+            records.extend(
+                Bip44AddrIndexConst.RECORD_STRUCT.pack(_Bip44AddrIndexUtils.Key(addr), change, addr_idx)
+                for addr_idx, addr in self.__IterAddresses(change, chain_size, count - chain_size)
+            )
+        # Records are sorted by key, since it is the first field
+        records.sort()
+
+        # Compute the fan-out table
+        fanout = [0] * Bip44AddrIndexConst.FANOUT_LEN
+        for record in records:
+            fanout[_Bip44AddrIndexUtils.FanoutIndex(record)] += 1
+        for i in range(1, Bip44AddrIndexConst.FANOUT_LEN):
+            fanout[i] += fanout[i - 1]
+
+        # Write to a temporary file and then replace the original one
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "wb") as fout:
+            fout.write(
+                Bip44AddrIndexConst.HEADER_STRUCT.pack(Bip44AddrIndexConst.MAGIC,
+                                                       Bip44AddrIndexConst.VERSION,
+                                                       len(records),
+                                                       *(max(chain_size, count) for chain_size in chain_sizes),
+                                                       _Bip44AddrIndexUtils.AccountKeyIdentifier(self.m_bip_obj))
+            )
+            fout.write(struct.pack(f">{Bip44AddrIndexConst.FANOUT_LEN}I", *fanout))
+            fout.writelines(records)
+        os.replace(tmp_file_path, file_path)
+
+    def __IterAddresses(self,
+                        change: Bip44Changes,
+                        start: int,
+                        count: int) -> Iterable[Tuple[int, Union[bytes, str]]]:
+        """
+        Iterate over the addresses of a chain.
+
+        Args:
+            change (Bip44Changes): Change
+            start (int)          : First address index
+            count (int)          : Number of addresses
+
+        Returns:
+            Iterable object: Iterable over address index and address
+        """
+        if count <= 0:
+            return []
+
+        if isinstance(self.m_bip_obj, Bip44Base):
+            bip_chg_obj = self.m_bip_obj.Change(change)
+            if self.m_addr_fct is None:
+                return (
+                    (addr_item[0], addr_item[-1]) for addr_item in bip_chg_obj.IterAddresses(start, count)
+                )
+            bip44_addr_fct = self.m_addr_fct
+            return (
+                (addr_item[0], bip44_addr_fct(addr_item[1]))      # type: ignore [arg-type]
+                for addr_item in bip_chg_obj.IterAddresses(start, count, include_pub_key=True)
+            )
+
+        # Use hardened derivation if not-hardened one is not supported (e.g. SLIP-0010 ed25519)
+        if self.m_bip_obj.IsPublicDerivationSupported():
+            chg_idx, first_idx = int(change), start
+        else:
+            chg_idx, first_idx = Bip32KeyIndex.HardenIndex(change), Bip32KeyIndex.HardenIndex(start)
+        bip32_chg_obj = self.m_bip_obj.ChildKey(chg_idx)
+        addr_fct = self.m_addr_fct
+        assert addr_fct is not None
+        return (
+            (addr_idx, addr_fct(child.PublicKey()))
+            for addr_idx, child in enumerate(bip32_chg_obj.IterChildrenRange(first_idx, count, True), start)
+        )
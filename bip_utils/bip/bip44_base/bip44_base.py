@@ -26,14 +26,25 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
-from functools import lru_cache
-from typing import Union
+from typing import Iterator, Optional, Tuple, Union
 
-from bip_utils.bip.bip32 import Bip32Base, Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyData, Bip32KeyIndex, Bip32Path, Bip32PublicKey
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
-from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
-from bip_utils.bip.conf.common import BipCoinConf, BipCoins
-from bip_utils.ecc import IPrivateKey, IPublicKey
+from bip_utils.bip.bip44_base.bip44_keys import Bip44KeysConst, Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.conf.common import BipCoinAddrEncoder, BipCoinConf, BipCoins
+from bip_utils.ecc import EllipticCurveTypes, IPrivateKey, IPublicKey
+from bip_utils.utils.misc import MemoizedMethod
+
+
+class Bip44BaseConst:
+    """Class container for BIP44 base constants."""
+
+    # Curves for which public derivation (i.e. a point addition) is faster than computing the public key
+    # from the derived private key
+    FAST_PUBLIC_DERIVATION_CURVES: Tuple[EllipticCurveTypes, ...] = (
+        EllipticCurveTypes.NIST256P1,
+        EllipticCurveTypes.SECP256K1,
+    )
 
 
 @unique
@@ -60,9 +71,15 @@ class Bip44Base(ABC):
     """
     BIP44 base class.
     It allows coin, account, chain and address keys generation in according to BIP44 or its extensions.
-    The class is meant to be derived by classes implementing BIP44 or its extensions.
+    The class is meant to be derived by classes implementing BIP44 or its extensions, which shall define
+    an empty __slots__ so that objects stay small (e.g. when many of them are kept in memory).
+    The coin configuration is shared among all the objects derived from the same one.
     """
 
+    __slots__ = ("m_bip32_obj", "m_coin_conf") + MemoizedMethod.AttrNames("Bip44Base",
+                                                                          "PublicKey",
+                                                                          "PrivateKey")
+
     m_bip32_obj: Bip32Base
     m_coin_conf: BipCoinConf
 
@@ -207,7 +224,7 @@ class Bip44Base(ABC):
         self.m_bip32_obj = bip32_obj
         self.m_coin_conf = coin_conf
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKey(self) -> Bip44PublicKey:
         """
         Return the public key.
@@ -218,7 +235,7 @@ class Bip44Base(ABC):
         return Bip44PublicKey(self.m_bip32_obj.PublicKey(),
                               self.m_coin_conf)
 
-    @lru_cache()
+    @MemoizedMethod
     def PrivateKey(self) -> Bip44PrivateKey:
         """
         Return the private key.
@@ -232,6 +249,34 @@ class Bip44Base(ABC):
         return Bip44PrivateKey(self.m_bip32_obj.PrivateKey(),
                                self.m_coin_conf)
 
+    def PublicKeyBytes(self,
+                       compressed: bool = True) -> bytes:
+        """
+        Return the raw public key bytes.
+        Differently from PublicKey, no key wrapper is constructed, so it's cheaper if only bytes are needed.
+
+        Args:
+            compressed (bool, optional): True for compressed public key, false for uncompressed (default: True)
+
+        Returns:
+            bytes: Public key bytes
+        """
+        pub_key = self.m_bip32_obj.PublicKey()
+        return (pub_key.RawCompressed() if compressed else pub_key.RawUncompressed()).ToBytes()
+
+    def PrivateKeyBytes(self) -> bytes:
+        """
+        Return the raw private key bytes.
+        Differently from PrivateKey, no key wrapper is constructed, so it's cheaper if only bytes are needed.
+
+        Returns:
+            bytes: Private key bytes
+
+        Raises:
+            Bip32KeyError: If the Bip32 object is public-only
+        """
+        return self.m_bip32_obj.PrivateKey().Raw().ToBytes()
+
     def Bip32Object(self) -> Bip32Base:
         """
         Return the BIP32 object.
@@ -289,6 +334,7 @@ class Bip44Base(ABC):
     def DeriveDefaultPath(self) -> Bip44Base:
         """
         Derive the default coin path and return a new Bip44Base object.
+        If the default path cache of the coin configuration is enabled, the nodes are reused among calls.
 
         Returns:
             Bip44Base object: Bip44Base object
@@ -297,17 +343,149 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        # Derive purpose and coin by default
-        bip_obj = self.Purpose().Coin()
+        purpose_idx = self._PurposeIndex()
+        # Derive purpose and coin if the purpose index is not known
+        if purpose_idx is None:
+            bip_obj = self.Purpose().Coin()
+            return self.__class__(bip_obj.m_bip32_obj.DerivePath(bip_obj.m_coin_conf.DefaultBip32Path()),
+                                  bip_obj.m_coin_conf)
+
+        if not self.IsLevel(Bip44Levels.MASTER):
+            raise Bip44DepthError(
+                f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving purpose"
+            )
+
+        # Derive the whole path at once, reusing the nodes cached by previous derivations from the same master key
+        # (if the cache is enabled)
+        path = Bip32Path([purpose_idx, Bip32KeyIndex.HardenIndex(self.m_coin_conf.CoinIndex())]
+                         + self.m_coin_conf.DefaultBip32Path().ToList(),
+                         False)
+        return self.__class__(self.m_bip32_obj.DerivePath(path, self.m_coin_conf.DefaultPathCache()),
+                              self.m_coin_conf)
+
+    def IterAddresses(self,
+                      start: int,
+                      count: int,
+                      include_pub_key: bool = False) -> Iterator[Union[Tuple[int, str],
+                                                                       Tuple[int, Bip32PublicKey, str]]]:
+        """
+        Iterate over the addresses of a range of consecutive address indexes.
+        It shall be called at change level. The address class and parameters are resolved only once and no
+        Bip44Base object is constructed for the children, so it's the fastest way for getting many addresses.
+        Addresses are generated one at a time, so memory usage doesn't depend on the count.
+
+        Args:
+            start (int)                      : First address index
+            count (int)                      : Number of addresses
+            include_pub_key (bool, optional) : True for yielding also the public key of each address (default: False)
+
+        Returns:
+            Iterator object: Iterator over address index and address (index 0 and 1), or address index,
+                             Bip32PublicKey object and address (index 0, 1 and 2) if include_pub_key is True
+
+        Raises:
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid or the coin addresses cannot be computed from a public key
+        """
+        if not self.IsLevel(Bip44Levels.CHANGE):
+            raise Bip44DepthError(
+                f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving address"
+            )
+
+        # Get the address encoder only once
+        addr_encoder = self.m_coin_conf.AddrEncoder()
+        addr_cls_name = addr_encoder.AddrClass().__name__
+        if addr_cls_name in Bip44KeysConst.NO_PUB_KEY_ADDR_ERR_MSGS:
+            raise ValueError(Bip44KeysConst.NO_PUB_KEY_ADDR_ERR_MSGS[addr_cls_name])
+
+        # Use hardened derivation if not-hardended is not supported
+        bip32_obj = self.m_bip32_obj
+        if bip32_obj.IsPublicDerivationSupported():
+            first_idx = start
+            # Only public keys are needed, so use public derivation if faster than the private one
+            if (not bip32_obj.IsPublicOnly()
+                    and bip32_obj.CurveType() in Bip44BaseConst.FAST_PUBLIC_DERIVATION_CURVES):
+                pub_key = bip32_obj.PublicKey()
+                bip32_obj = bip32_obj.FromPublicKey(pub_key.KeyObject(), pub_key.Data(), pub_key.KeyNetVersions())
+        else:
+            first_idx = Bip32KeyIndex.HardenIndex(start)
+
+        # Validate before returning the generator, so that errors are raised immediately
+        return self.__IterAddresses(bip32_obj.IterChildrenRange(first_idx, count, True),
+                                    start,
+                                    addr_encoder,
+                                    include_pub_key)
+
+    def IterAccounts(self,
+                     start: int,
+                     count: int,
+                     public_only: bool = False,
+                     workers: int = 1) -> Iterator[Bip44Base]:
+        """
+        Iterate over a range of consecutive accounts.
+        It shall be called at coin level. It's a shortcut for Bip44AccountsDerivator, which shall be used
+        directly for getting extended keys or snapshots or for setting the chunk size.
+
+        Args:
+            start (int)                 : First account index
+            count (int)                 : Number of accounts
+            public_only (bool, optional): True for getting public-only accounts (default: False)
+            workers (int, optional)     : Number of worker processes, 1 for deriving in the current process (default: 1)
+
+        Returns:
+            Iterator object: Iterator over account-level Bip44Base objects
+
+        Raises:
+            Bip44DepthError: If the current depth is not suitable for deriving accounts
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range or the number of workers is not valid
+        """
+        # Imported here since the accounts derivator depends on this module
+        from bip_utils.bip.bip44_base.bip44_accounts import (  # pylint: disable=import-outside-toplevel
+            Bip44AccountsDerivator
+        )
+
+        return Bip44AccountsDerivator(self, workers).IterAccounts(start, count, public_only)
+
+    @staticmethod
+    def GetCoinConf(coin_type: BipCoins) -> BipCoinConf:
+        """
+        Get the configuration of the specified coin.
+        Child classes shall override it, the default implementation always raises.
+
+        Args:
+            coin_type (BipCoins): Coin type (the type depends on the specific child class)
+
+        Returns:
+            BipCoinConf object: BipCoinConf object
 
-        # Derive the remaining path
-        return self.__class__(bip_obj.m_bip32_obj.DerivePath(bip_obj.m_coin_conf.DefaultPath()),
-                              bip_obj.m_coin_conf)
+        Raises:
+            TypeError: If coin type is not of the correct type or the class does not support it
+        """
+        raise TypeError(f"Getting the configuration of coin {coin_type} is not supported")
 
     #
     # Protected class methods
     #
 
+    def _NewLevel(self,
+                  bip32_obj: Bip32Base) -> Bip44Base:
+        """
+        Construct a new object of the same class and coin configuration for a derived level.
+        The depth is not validated again, since it's guaranteed by the derivation.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object
+
+        Returns:
+            Bip44Base object: Bip44Base object
+        """
+        bip_obj = object.__new__(self.__class__)
+        bip_obj.m_bip32_obj = bip32_obj
+        bip_obj.m_coin_conf = self.m_coin_conf
+        return bip_obj
+
     def _PurposeGeneric(self,
                         purpose: int) -> Bip44Base:
         """
@@ -329,8 +507,7 @@ class Bip44Base(ABC):
                 f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving purpose"
             )
 
-        return self.__class__(self.m_bip32_obj.ChildKey(purpose),
-                              self.m_coin_conf)
+        return self._NewLevel(self.m_bip32_obj.ChildKey(purpose))
 
     def _CoinGeneric(self) -> Bip44Base:
         """
@@ -351,8 +528,7 @@ class Bip44Base(ABC):
 
         coin_idx = self.m_coin_conf.CoinIndex()
 
-        return self.__class__(self.m_bip32_obj.ChildKey(Bip32KeyIndex.HardenIndex(coin_idx)),
-                              self.m_coin_conf)
+        return self._NewLevel(self.m_bip32_obj.ChildKey(Bip32KeyIndex.HardenIndex(coin_idx)))
 
     def _AccountGeneric(self,
                         acc_idx: int) -> Bip44Base:
@@ -375,8 +551,7 @@ class Bip44Base(ABC):
                 f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving account"
             )
 
-        return self.__class__(self.m_bip32_obj.ChildKey(Bip32KeyIndex.HardenIndex(acc_idx)),
-                              self.m_coin_conf)
+        return self._NewLevel(self.m_bip32_obj.ChildKey(Bip32KeyIndex.HardenIndex(acc_idx)))
 
     def _ChangeGeneric(self,
                        change_type: Bip44Changes) -> Bip44Base:
@@ -409,8 +584,7 @@ class Bip44Base(ABC):
         else:
             change_idx = int(change_type)
 
-        return self.__class__(self.m_bip32_obj.ChildKey(change_idx),
-                              self.m_coin_conf)
+        return self._NewLevel(self.m_bip32_obj.ChildKey(change_idx))
 
     def _AddressIndexGeneric(self,
                              addr_idx: int) -> Bip44Base:
@@ -437,8 +611,50 @@ class Bip44Base(ABC):
         if not self.m_bip32_obj.IsPublicDerivationSupported():
             addr_idx = Bip32KeyIndex.HardenIndex(addr_idx)
 
-        return self.__class__(self.m_bip32_obj.ChildKey(addr_idx),
-                              self.m_coin_conf)
+        return self._NewLevel(self.m_bip32_obj.ChildKey(addr_idx))
+
+    @staticmethod
+    def _PurposeIndex() -> Optional[int]:
+        """
+        Get the purpose index, without deriving it.
+        Child classes can override it for deriving the default path from the cache.
+
+        Returns:
+            int: Purpose index
+            None: If not known (default)
+        """
+        return None
+
+    #
+    # Private methods
+    #
+
+    @staticmethod
+    def __IterAddresses(children: Iterator[Bip32Base],
+                        start: int,
+                        addr_encoder: BipCoinAddrEncoder,
+                        include_pub_key: bool) -> Iterator[Union[Tuple[int, str],
+                                                                 Tuple[int, Bip32PublicKey, str]]]:
+        """
+        Iterate over the addresses of the specified (already validated) children.
+
+        Args:
+            children (Iterator object)             : Iterator over public-only Bip32Base children
+            start (int)                            : Address index of the first child
+            addr_encoder (BipCoinAddrEncoder object): Address encoder
+            include_pub_key (bool)                 : True for yielding also the public key of each address
+
+        Returns:
+            Iterator object: Iterator over address index and address (index 0 and 1), or address index,
+                             Bip32PublicKey object and address (index 0, 1 and 2) if include_pub_key is True
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        for addr_idx, child in enumerate(children, start):
+            pub_key = child.PublicKey()
+            address = addr_encoder.Encode(pub_key)
+            yield (addr_idx, pub_key, address) if include_pub_key else (addr_idx, address)
 
     #
     # Abstract methods
@@ -0,0 +1,519 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for discovering the used addresses of BIP44 accounts with a gap limit."""
+
+# Imports
+from __future__ import annotations
+
+import asyncio
+from concurrent import futures
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+
+
+# Predicate returning, for each address of a batch, if the address is used
+IsUsedFct = Callable[[List[str]], Sequence[bool]]
+# Asynchronous version of the predicate
+AsyncIsUsedFct = Callable[[List[str]], Awaitable[Sequence[bool]]]
+
+
+class Bip44DiscoveryConst:
+    """Class container for BIP44 discovery constants."""
+
+    # Default gap limit (as in BIP44)
+    DEF_GAP_LIMIT: int = 20
+    # Default number of addresses for each batch
+    DEF_BATCH_SIZE: int = 20
+    # Scanned chains
+    CHAINS: Tuple[Bip44Changes, ...] = (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT)
+
+
+class Bip44DiscoveredChain:
+    """
+    BIP44 discovered chain class.
+    It contains the result of the discovery of a chain (i.e. external or internal).
+    """
+
+    m_change: Bip44Changes
+    m_used_indexes: List[int]
+
+    def __init__(self,
+                 change: Bip44Changes,
+                 used_indexes: List[int]) -> None:
+        """
+        Construct class.
+
+        Args:
+            change (Bip44Changes)   : Change
+            used_indexes (list[int]): Indexes of the used addresses, in ascending order
+        """
+        self.m_change = change
+        self.m_used_indexes = used_indexes
+
+    def Change(self) -> Bip44Changes:
+        """
+        Get the change.
+
+        Returns:
+            Bip44Changes: Change
+        """
+        return self.m_change
+
+    def UsedIndexes(self) -> List[int]:
+        """
+        Get the indexes of the used addresses.
+
+        Returns:
+            list[int]: Indexes of the used addresses, in ascending order
+        """
+        return self.m_used_indexes
+
+    def IsUsed(self) -> bool:
+        """
+        Get if the chain has at least a used address.
+
+        Returns:
+            bool: True if used, false otherwise
+        """
+        return len(self.m_used_indexes) > 0
+
+    def NextIndex(self) -> int:
+        """
+        Get the index following the last used address, i.e. the index of the next address to be used.
+
+        Returns:
+            int: Next address index
+        """
+        return self.m_used_indexes[-1] + 1 if self.m_used_indexes else 0
+
+
+class Bip44DiscoveredAccount:
+    """
+    BIP44 discovered account class.
+    It contains the result of the discovery of an account.
+    """
+
+    m_bip_obj: Bip44Base
+    m_chains: Dict[Bip44Changes, Bip44DiscoveredChain]
+
+    def __init__(self,
+                 bip_obj: Bip44Base,
+                 chains: Dict[Bip44Changes, Bip44DiscoveredChain]) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            chains (dict)             : Discovered chains
+        """
+        self.m_bip_obj = bip_obj
+        self.m_chains = chains
+
+    def Bip44Object(self) -> Bip44Base:
+        """
+        Get the Bip44Base object at account level.
+
+        Returns:
+            Bip44Base object: Bip44Base object
+        """
+        return self.m_bip_obj
+
+    def AccountIndex(self) -> int:
+        """
+        Get the account index.
+
+        Returns:
+            int: Account index (without hardening)
+        """
+        return self.m_bip_obj.Bip32Object().Index().Unharden().ToInt()
+
+    def Chain(self,
+              change: Bip44Changes) -> Bip44DiscoveredChain:
+        """
+        Get a discovered chain.
+
+        Args:
+            change (Bip44Changes): Change
+
+        Returns:
+            Bip44DiscoveredChain object: Bip44DiscoveredChain object
+        """
+        return self.m_chains[change]
+
+    def IsUsed(self) -> bool:
+        """
+        Get if the account is used, i.e. if its external chain has at least a used address.
+
+        Returns:
+            bool: True if used, false otherwise
+        """
+        return self.m_chains[Bip44Changes.CHAIN_EXT].IsUsed()
+
+
+class _Bip44ChainScanner:
+    """
+    BIP44 chain scanner class.
+    It keeps the state of a chain discovery, independently of how the predicate is called.
+    """
+
+    m_change: Bip44Changes
+    m_gap_limit: int
+    m_used_indexes: List[int]
+    m_unused_num: int
+
+    def __init__(self,
+                 change: Bip44Changes,
+                 gap_limit: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            change (Bip44Changes): Change
+            gap_limit (int)      : Gap limit
+        """
+        self.m_change = change
+        self.m_gap_limit = gap_limit
+        self.m_used_indexes = []
+        self.m_unused_num = 0
+
+    def Update(self,
+               start: int,
+               addresses: List[str],
+               used_flags: Sequence[bool]) -> bool:
+        """
+        Update the state with the predicate result for a batch.
+
+        Args:
+            start (int)            : Index of the first address of the batch
+            addresses (list[str])  : Addresses of the batch
+            used_flags (list[bool]): Predicate result for each address
+
+        Returns:
+            bool: True if the gap limit is reached, false otherwise
+
+        Raises:
+            ValueError: If the predicate result length is not valid
+        """
+        if len(used_flags) != len(addresses):
+            raise ValueError(
+                f"Invalid predicate result length (expected {len(addresses)}, got {len(used_flags)})"
+            )
+
+        for addr_idx, is_used in enumerate(used_flags, start):
+            if is_used:
+                self.m_used_indexes.append(addr_idx)
+                self.m_unused_num = 0
+            else:
+                self.m_unused_num += 1
+                if self.m_unused_num >= self.m_gap_limit:
+                    return True
+        return False
+
+    def Result(self) -> Bip44DiscoveredChain:
+        """
+        Get the discovered chain.
+
+        Returns:
+            Bip44DiscoveredChain object: Bip44DiscoveredChain object
+        """
+        return Bip44DiscoveredChain(self.m_change, self.m_used_indexes)
+
+
+class Bip44Discovery:
+    """
+    BIP44 discovery class.
+    It discovers the used addresses of BIP44/49/84/86 accounts: each chain is scanned until a run of unused
+    addresses reaches the gap limit, and accounts are scanned until one without used external addresses is found.
+    Addresses are passed to the predicate in batches, while the next batch is derived in a background thread.
+    """
+
+    m_gap_limit: int
+    m_batch_size: int
+
+    def __init__(self,
+                 gap_limit: int = Bip44DiscoveryConst.DEF_GAP_LIMIT,
+                 batch_size: int = Bip44DiscoveryConst.DEF_BATCH_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            gap_limit (int, optional) : Gap limit (default: 20)
+            batch_size (int, optional): Number of addresses for each batch (default: 20)
+
+        Raises:
+            ValueError: If the gap limit or the batch size is not valid
+        """
+        if gap_limit <= 0:
+            raise ValueError(f"Invalid gap limit ({gap_limit})")
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch size ({batch_size})")
+
+        self.m_gap_limit = gap_limit
+        self.m_batch_size = batch_size
+
+    def DiscoverChain(self,
+                      bip_obj: Bip44Base,
+                      change: Bip44Changes,
+                      is_used_fct: IsUsedFct) -> Bip44DiscoveredChain:
+        """
+        Discover a chain of an account.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            change (Bip44Changes)     : Change
+            is_used_fct (function)    : Predicate returning, for each address of a batch, if the address is used
+
+        Returns:
+            Bip44DiscoveredChain object: Bip44DiscoveredChain object
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the predicate result length is not valid
+        """
+        bip_chg_obj = self.__ChangeObject(bip_obj, change)
+        scanner = _Bip44ChainScanner(change, self.m_gap_limit)
+
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            start = 0
+            next_batch = executor.submit(self.__DeriveBatch, bip_chg_obj, start)
+            while True:
+                addresses = next_batch.result()
+                # Derive the next batch while the predicate is running
+                next_batch = executor.submit(self.__DeriveBatch, bip_chg_obj, start + self.m_batch_size)
+                if scanner.Update(start, addresses, is_used_fct(addresses)):
+                    next_batch.cancel()
+                    return scanner.Result()
+                start += self.m_batch_size
+
+    def DiscoverAccount(self,
+                        bip_obj: Bip44Base,
+                        is_used_fct: IsUsedFct) -> Bip44DiscoveredAccount:
+        """
+        Discover an account (i.e. both its external and internal chains).
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            is_used_fct (function)    : Predicate returning, for each address of a batch, if the address is used
+
+        Returns:
+            Bip44DiscoveredAccount object: Bip44DiscoveredAccount object
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the predicate result length is not valid
+        """
+        return Bip44DiscoveredAccount(
+            bip_obj,
+            {change: self.DiscoverChain(bip_obj, change, is_used_fct) for change in Bip44DiscoveryConst.CHAINS}
+        )
+
+    def DiscoverAccounts(self,
+                         bip_obj: Bip44Base,
+                         is_used_fct: IsUsedFct,
+                         max_acc_num: Optional[int] = None) -> Iterator[Bip44DiscoveredAccount]:
+        """
+        Discover the accounts of a coin, starting from account 0 and stopping at the first unused account.
+        The internal chain of an account is scanned only if its external chain is used.
+
+        Args:
+            bip_obj (Bip44Base object) : Bip44Base object at coin level
+            is_used_fct (function)     : Predicate returning, for each address of a batch, if the address is used
+            max_acc_num (int, optional): Maximum number of accounts to be discovered (default: no limit)
+
+        Returns:
+            Iterator object: Iterator over the used accounts
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at coin level
+            ValueError: If the predicate result length is not valid
+        """
+        for bip_acc_obj in self.__IterAccounts(bip_obj, max_acc_num):
+            ext_chain = self.DiscoverChain(bip_acc_obj, Bip44Changes.CHAIN_EXT, is_used_fct)
+            if not ext_chain.IsUsed():
+                return
+            int_chain = self.DiscoverChain(bip_acc_obj, Bip44Changes.CHAIN_INT, is_used_fct)
+            yield Bip44DiscoveredAccount(
+                bip_acc_obj, {Bip44Changes.CHAIN_EXT: ext_chain, Bip44Changes.CHAIN_INT: int_chain}
+            )
+
+    async def DiscoverChainAsync(self,
+                                 bip_obj: Bip44Base,
+                                 change: Bip44Changes,
+                                 is_used_fct: AsyncIsUsedFct) -> Bip44DiscoveredChain:
+        """
+        Discover a chain of an account, with an asynchronous predicate.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            change (Bip44Changes)     : Change
+            is_used_fct (function)    : Asynchronous predicate returning, for each address of a batch,
+                                        if the address is used
+
+        Returns:
+            Bip44DiscoveredChain object: Bip44DiscoveredChain object
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the predicate result length is not valid
+        """
+        bip_chg_obj = self.__ChangeObject(bip_obj, change)
+        scanner = _Bip44ChainScanner(change, self.m_gap_limit)
+        loop = asyncio.get_running_loop()
+
+        # The executor is not used as a context manager, since waiting for it would block the event loop
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        start = 0
+        next_batch = loop.run_in_executor(executor, self.__DeriveBatch, bip_chg_obj, start)
+        try:
+            while True:
+                addresses = await next_batch
+                # Derive the next batch while the predicate is awaited
+                next_batch = loop.run_in_executor(executor,
+                                                  self.__DeriveBatch,
+                                                  bip_chg_obj,
+                                                  start + self.m_batch_size)
+                if scanner.Update(start, addresses, await is_used_fct(addresses)):
+                    return scanner.Result()
+                start += self.m_batch_size
+        finally:
+            # Discard the next batch, also if the predicate raised, without waiting for it
+            next_batch.cancel()
+            executor.shutdown(wait=False)
+
+    async def DiscoverAccountAsync(self,
+                                   bip_obj: Bip44Base,
+                                   is_used_fct: AsyncIsUsedFct) -> Bip44DiscoveredAccount:
+        """
+        Discover an account (i.e. both its external and internal chains), with an asynchronous predicate.
+        The chains are discovered concurrently.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            is_used_fct (function)    : Asynchronous predicate returning, for each address of a batch,
+                                        if the address is used
+
+        Returns:
+            Bip44DiscoveredAccount object: Bip44DiscoveredAccount object
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the predicate result length is not valid
+        """
+        chains = await asyncio.gather(
+            *(self.DiscoverChainAsync(bip_obj, change, is_used_fct) for change in Bip44DiscoveryConst.CHAINS)
+        )
+        return Bip44DiscoveredAccount(bip_obj, dict(zip(Bip44DiscoveryConst.CHAINS, chains)))
+
+    async def DiscoverAccountsAsync(self,
+                                    bip_obj: Bip44Base,
+                                    is_used_fct: AsyncIsUsedFct,
+                                    max_acc_num: Optional[int] = None) -> AsyncIterator[Bip44DiscoveredAccount]:
+        """
+        Discover the accounts of a coin with an asynchronous predicate, starting from account 0 and stopping
+        at the first unused account.
+        The internal chain of an account is scanned only if its external chain is used.
+
+        Args:
+            bip_obj (Bip44Base object) : Bip44Base object at coin level
+            is_used_fct (function)     : Asynchronous predicate returning, for each address of a batch,
+                                         if the address is used
+            max_acc_num (int, optional): Maximum number of accounts to be discovered (default: no limit)
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the used accounts
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at coin level
+            ValueError: If the predicate result length is not valid
+        """
+        for bip_acc_obj in self.__IterAccounts(bip_obj, max_acc_num):
+            ext_chain = await self.DiscoverChainAsync(bip_acc_obj, Bip44Changes.CHAIN_EXT, is_used_fct)
+            if not ext_chain.IsUsed():
+                return
+            int_chain = await self.DiscoverChainAsync(bip_acc_obj, Bip44Changes.CHAIN_INT, is_used_fct)
+            yield Bip44DiscoveredAccount(
+                bip_acc_obj, {Bip44Changes.CHAIN_EXT: ext_chain, Bip44Changes.CHAIN_INT: int_chain}
+            )
+
+    def __DeriveBatch(self,
+                      bip_chg_obj: Bip44Base,
+                      start: int) -> List[str]:
+        """
+        Derive a batch of addresses.
+
+        Args:
+            bip_chg_obj (Bip44Base object): Bip44Base object at change level
+            start (int)                   : Index of the first address
+
+        Returns:
+            list[str]: Addresses
+        """
+        return [addr_item[-1] for addr_item in bip_chg_obj.IterAddresses(start, self.m_batch_size)]
+
+    @staticmethod
+    def __ChangeObject(bip_obj: Bip44Base,
+                       change: Bip44Changes) -> Bip44Base:
+        """
+        Get the Bip44Base object at change level from the account one.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            change (Bip44Changes)     : Change
+
+        Returns:
+            Bip44Base object: Bip44Base object at change level
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+        """
+        if not bip_obj.IsLevel(Bip44Levels.ACCOUNT):
+            raise Bip44DepthError(
+                f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for discovering a chain"
+            )
+        return bip_obj.Change(change)
+
+    @staticmethod
+    def __IterAccounts(bip_obj: Bip44Base,
+                       max_acc_num: Optional[int]) -> Iterator[Bip44Base]:
+        """
+        Iterate over the accounts of a coin.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at coin level
+            max_acc_num (int)         : Maximum number of accounts, None for no limit
+
+        Returns:
+            Iterator object: Iterator over the Bip44Base objects at account level
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at coin level
+        """
+        if not bip_obj.IsLevel(Bip44Levels.COIN):
+            raise Bip44DepthError(
+                f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for discovering accounts"
+            )
+
+        acc_idx = 0
+        while max_acc_num is None or acc_idx < max_acc_num:
+            yield bip_obj.Account(acc_idx)
+            acc_idx += 1
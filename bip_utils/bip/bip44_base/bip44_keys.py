@@ -21,21 +21,34 @@
 """Module for BIP44 keys handling."""
 
 # Imports
-from functools import lru_cache
+from typing import Dict
 
-from bip_utils.addr import AdaShelleyAddrEncoder, XmrAddrEncoder
 from bip_utils.bip.bip32 import Bip32ChainCode, Bip32PrivateKey, Bip32PublicKey
 from bip_utils.bip.conf.common import BipCoinConf
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import DataBytes, MemoizedMethod
 from bip_utils.wif import WifEncoder, WifPubKeyModes
 
 
+class Bip44KeysConst:
+    """Class container for BIP44 keys constants."""
+
+    # Error messages for the address classes that cannot compute an address from a public key only.
+    # Classes are specified by name, so that their modules are not imported just for checking them.
+    NO_PUB_KEY_ADDR_ERR_MSGS: Dict[str, str] = {
+        "AdaShelleyAddrEncoder": "Use the CardanoShelley class to get Cardano Shelley addresses",
+        "XmrAddrEncoder": "Use the Monero class to get Monero addresses",
+    }
+
+
 class Bip44PublicKey:
     """
     BIP44 public key class.
     It contains Bip32PublicKey and add the possibility to compute the address from the coin type.
     """
 
+    __slots__ = ("m_pub_key", "m_coin_conf") + MemoizedMethod.AttrNames("Bip44PublicKey",
+                                                                        "ToAddress")
+
     m_pub_key: Bip32PublicKey
     m_coin_conf: BipCoinConf
 
@@ -106,7 +119,7 @@ class Bip44PublicKey:
         """
         return self.m_pub_key.RawUncompressed()
 
-    @lru_cache()
+    @MemoizedMethod
     def ToAddress(self) -> str:
         """
         Return the address correspondent to the public key.
@@ -114,18 +127,14 @@ class Bip44PublicKey:
         Returns:
             str: Address string
         """
-        addr_cls = self.m_coin_conf.AddrClass()
-        pub_key_obj = self.m_pub_key.KeyObject()
+        addr_encoder = self.m_coin_conf.AddrEncoder()
+        addr_cls_name = addr_encoder.AddrClass().__name__
 
-        # Exception for Cardano
-        if addr_cls is AdaShelleyAddrEncoder:
-            raise ValueError("Use the CardanoShelley class to get Cardano Shelley addresses")
-        # Exception for Monero
-        if addr_cls is XmrAddrEncoder:
-            raise ValueError("Use the Monero class to get Monero addresses")
+        # Exception for Cardano Shelley and Monero
+        if addr_cls_name in Bip44KeysConst.NO_PUB_KEY_ADDR_ERR_MSGS:
+            raise ValueError(Bip44KeysConst.NO_PUB_KEY_ADDR_ERR_MSGS[addr_cls_name])
 
-        return addr_cls.EncodeKey(pub_key_obj,
-                                  **self.m_coin_conf.AddrParamsWithResolvedCalls(self.m_pub_key))
+        return addr_encoder.Encode(self.m_pub_key)
 
 
 class Bip44PrivateKey:
@@ -134,6 +143,10 @@ class Bip44PrivateKey:
     It contains Bip32PrivateKey and add the possibility to compute the WIF from the coin type.
     """
 
+    __slots__ = ("m_priv_key", "m_coin_conf") + MemoizedMethod.AttrNames("Bip44PrivateKey",
+                                                                         "PublicKey",
+                                                                         "ToWif")
+
     m_priv_key: Bip32PrivateKey
     m_coin_conf: BipCoinConf
 
@@ -195,7 +208,7 @@ class Bip44PrivateKey:
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKey(self) -> Bip44PublicKey:
         """
         Get the public key correspondent to the private one.
@@ -206,7 +219,7 @@ class Bip44PrivateKey:
         return Bip44PublicKey(self.m_priv_key.PublicKey(),
                               self.m_coin_conf)
 
-    @lru_cache()
+    @MemoizedMethod
     def ToWif(self,
               pub_key_mode: WifPubKeyModes = WifPubKeyModes.COMPRESSED) -> str:
         """
@@ -0,0 +1,265 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for deriving keys of multiple coins from the same seed."""
+
+# Imports
+from __future__ import annotations
+
+from concurrent import futures
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from bip_utils.bip.bip32 import Bip32Base, Bip32DerivationCache, Bip32KeyIndex, Bip32Path
+from bip_utils.bip.bip32.base.bip32_der_cache import Bip32DerivationCacheConst
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf, BipCoins
+
+
+# Group key: BIP32 class, public and private key net versions
+_GroupKey = Tuple[Type[Bip32Base], bytes, bytes]
+
+
+class _Bip44MultiCoinWorker:
+    """
+    BIP44 multi-coin worker class.
+    It derives a group of coins in a worker process.
+    """
+
+    @staticmethod
+    def DeriveGroup(seed_bytes: bytes,
+                    bip_cls: Type[Bip44Base],
+                    coins: Sequence[BipCoins],
+                    acc_idx: Optional[int]) -> List[bytes]:
+        """
+        Derive a group of coins.
+
+        Args:
+            seed_bytes (bytes)       : Seed bytes
+            bip_cls (Bip44Base class): Bip44Base class
+            coins (list[BipCoins])   : Coins of the group
+            acc_idx (int)            : Account index, None for the default path
+
+        Returns:
+            list[bytes]: Snapshot records of the derived BIP32 objects, in the same order of coins
+        """
+        derivator = Bip44MultiCoinDerivator(seed_bytes)
+        bip_objs = (derivator.DeriveDefaultPaths(bip_cls, coins)
+                    if acc_idx is None
+                    else derivator.DeriveAccounts(bip_cls, coins, acc_idx))
+        return [bip_objs[coin].Bip32Object().ToBytes() for coin in coins]
+
+
+class Bip44MultiCoinDerivator:
+    """
+    BIP44 multi-coin derivator class.
+    It derives keys of many coins from the same seed. Coins are grouped by BIP32 class and key net versions,
+    so that the master, purpose and coin nodes in common (e.g. for Ethereum-compatible chains, that share
+    the same coin index) are derived only once and reused also in subsequent calls.
+    """
+
+    m_seed_bytes: bytes
+    m_cache: Bip32DerivationCache
+    m_mst_nodes: Dict[_GroupKey, Bip32Base]
+    m_purpose_nodes: Dict[Tuple[_GroupKey, Type[Bip44Base]], Bip32Base]
+
+    def __init__(self,
+                 seed_bytes: bytes,
+                 cache_max_size: int = Bip32DerivationCacheConst.DEF_MAX_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            seed_bytes (bytes)            : Seed bytes
+            cache_max_size (int, optional): Maximum number of cached nodes below the purpose level (default: 1024)
+
+        Raises:
+            ValueError: If the maximum cache size is not valid
+        """
+        self.m_seed_bytes = seed_bytes
+        self.m_cache = Bip32DerivationCache(cache_max_size)
+        self.m_mst_nodes = {}
+        self.m_purpose_nodes = {}
+
+    def DeriveDefaultPaths(self,
+                           bip_cls: Type[Bip44Base],
+                           coins: Sequence[BipCoins],
+                           workers: int = 1) -> Dict[BipCoins, Bip44Base]:
+        """
+        Derive the default path of the specified coins.
+        The result is the same of calling DeriveDefaultPath for each coin.
+
+        Args:
+            bip_cls (Bip44Base class): Bip44Base class (e.g. Bip44, Bip84)
+            coins (list[BipCoins])   : Coin types, shall be enums accepted by the Bip44Base class
+            workers (int, optional)  : Number of worker processes, 1 for deriving in the current process
+                                       (default: 1)
+
+        Returns:
+            dict: Bip44Base objects for each coin
+
+        Raises:
+            TypeError: If a coin type is not of the correct type
+            ValueError: If the number of workers or the seed is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        return self.__Derive(bip_cls, coins, None, workers)
+
+    def DeriveAccounts(self,
+                       bip_cls: Type[Bip44Base],
+                       coins: Sequence[BipCoins],
+                       acc_idx: int = 0,
+                       workers: int = 1) -> Dict[BipCoins, Bip44Base]:
+        """
+        Derive the specified account of the specified coins.
+        The result is the same of calling Purpose().Coin().Account(acc_idx) for each coin.
+
+        Args:
+            bip_cls (Bip44Base class): Bip44Base class (e.g. Bip44, Bip84)
+            coins (list[BipCoins])   : Coin types, shall be enums accepted by the Bip44Base class
+            acc_idx (int, optional)  : Account index (default: 0)
+            workers (int, optional)  : Number of worker processes, 1 for deriving in the current process
+                                       (default: 1)
+
+        Returns:
+            dict: Bip44Base objects for each coin
+
+        Raises:
+            TypeError: If a coin type is not of the correct type
+            ValueError: If the number of workers or the seed is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        return self.__Derive(bip_cls, coins, acc_idx, workers)
+
+    def Purge(self) -> None:
+        """Remove all the derived nodes."""
+        self.m_cache.Purge()
+        self.m_mst_nodes.clear()
+        self.m_purpose_nodes.clear()
+
+    def __Derive(self,
+                 bip_cls: Type[Bip44Base],
+                 coins: Sequence[BipCoins],
+                 acc_idx: Optional[int],
+                 workers: int) -> Dict[BipCoins, Bip44Base]:
+        """
+        Derive the default path or the specified account of the specified coins.
+
+        Args:
+            bip_cls (Bip44Base class): Bip44Base class
+            coins (list[BipCoins])   : Coin types
+            acc_idx (int)            : Account index, None for the default path
+            workers (int)            : Number of worker processes
+
+        Returns:
+            dict: Bip44Base objects for each coin
+
+        Raises:
+            TypeError: If a coin type is not of the correct type
+            ValueError: If the number of workers or the seed is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers ({workers})")
+
+        coin_confs = {coin: bip_cls.GetCoinConf(coin) for coin in coins}
+
+        if workers == 1:
+            return {
+                coin: bip_cls(self.__DeriveNode(bip_cls, coin_conf, acc_idx), coin_conf)
+                for coin, coin_conf in coin_confs.items()
+            }
+
+        # Group coins, so that each group is derived by a single worker
+        groups: Dict[_GroupKey, List[BipCoins]] = {}
+        for coin, coin_conf in coin_confs.items():
+            groups.setdefault(self.__GroupKey(coin_conf), []).append(coin)
+
+        bip_objs = {}
+        with futures.ProcessPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+            group_futures = [
+                (group_coins, executor.submit(_Bip44MultiCoinWorker.DeriveGroup,
+                                              self.m_seed_bytes,
+                                              bip_cls,
+                                              group_coins,
+                                              acc_idx))
+                for group_coins in groups.values()
+            ]
+            for group_coins, future in group_futures:
+                for coin, snapshot_bytes in zip(group_coins, future.result()):
+                    coin_conf = coin_confs[coin]
+                    bip_objs[coin] = bip_cls(coin_conf.Bip32Class().FromBytes(snapshot_bytes), coin_conf)
+
+        # Keep the same order of the requested coins
+        return {coin: bip_objs[coin] for coin in coin_confs}
+
+    def __DeriveNode(self,
+                     bip_cls: Type[Bip44Base],
+                     coin_conf: BipCoinConf,
+                     acc_idx: Optional[int]) -> Bip32Base:
+        """
+        Derive the node of the default path or the specified account of a coin, reusing the nodes in common.
+
+        Args:
+            bip_cls (Bip44Base class)    : Bip44Base class
+            coin_conf (BipCoinConf object): BipCoinConf object
+            acc_idx (int)                 : Account index, None for the default path
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            ValueError: If the seed is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        group_key = self.__GroupKey(coin_conf)
+
+        purpose_node = self.m_purpose_nodes.get((group_key, bip_cls))
+        if purpose_node is None:
+            mst_node = self.m_mst_nodes.get(group_key)
+            if mst_node is None:
+                mst_node = self.m_mst_nodes[group_key] = coin_conf.Bip32Class().FromSeed(
+                    self.m_seed_bytes,
+                    coin_conf.KeyNetVersions()
+                )
+            purpose_node = bip_cls(mst_node, coin_conf).Purpose().Bip32Object()
+            self.m_purpose_nodes[(group_key, bip_cls)] = purpose_node
+
+        # Coin level and below, the derivation cache takes care of the nodes in common
+        path_elems = [Bip32KeyIndex.HardenIndex(coin_conf.CoinIndex())]
+        if acc_idx is None:
+            path_elems += coin_conf.DefaultBip32Path().ToList()
+        else:
+            path_elems.append(Bip32KeyIndex.HardenIndex(acc_idx))
+
+        return purpose_node.DerivePath(Bip32Path(path_elems, False), self.m_cache)
+
+    @staticmethod
+    def __GroupKey(coin_conf: BipCoinConf) -> _GroupKey:
+        """
+        Get the group key of a coin configuration.
+
+        Args:
+            coin_conf (BipCoinConf object): BipCoinConf object
+
+        Returns:
+            tuple: Group key
+        """
+        key_net_ver = coin_conf.KeyNetVersions()
+        return coin_conf.Bip32Class(), key_net_ver.Public(), key_net_ver.Private()
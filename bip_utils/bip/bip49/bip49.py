@@ -24,12 +24,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0049.mediawiki
 """
 
 # Imports
-from typing import Union
+from typing import Optional, Union
 
 from bip_utils.bip.bip32 import Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.bip.conf.bip49 import Bip49ConfGetter
-from bip_utils.bip.conf.common import BipCoins
+from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 from bip_utils.ecc import IPrivateKey, IPublicKey
 
 
@@ -48,6 +48,8 @@ class Bip49(Bip44Base):
     It allows master key generation and children keys derivation in according to BIP-0049.
     """
 
+    __slots__ = ()
+
     #
     # Class methods for construction
     #
@@ -245,3 +247,29 @@ class Bip49(Bip44Base):
             str: Specification name
         """
         return Bip49Const.SPEC_NAME
+
+    @staticmethod
+    def _PurposeIndex() -> Optional[int]:
+        """
+        Get the purpose index, without deriving it.
+
+        Returns:
+            int: Purpose index
+        """
+        return Bip49Const.PURPOSE
+
+    @staticmethod
+    def GetCoinConf(coin_type: BipCoins) -> BipCoinConf:
+        """
+        Get the configuration of the specified coin.
+
+        Args:
+            coin_type (BipCoins): Coin type, shall be a Bip49Coins enum
+
+        Returns:
+            BipCoinConf object: BipCoinConf object
+
+        Raises:
+            TypeError: If coin type is not a Bip49Coins enum
+        """
+        return Bip49ConfGetter.GetConfig(coin_type)
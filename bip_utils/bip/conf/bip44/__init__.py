@@ -1,3 +1,28 @@
-from bip_utils.bip.conf.bip44.bip44_coins import Bip44Coins
-from bip_utils.bip.conf.bip44.bip44_conf import Bip44Conf
-from bip_utils.bip.conf.bip44.bip44_conf_getter import Bip44ConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.conf.bip44.bip44_coins import Bip44Coins
+    from bip_utils.bip.conf.bip44.bip44_conf import Bip44Conf
+    from bip_utils.bip.conf.bip44.bip44_conf_getter import Bip44ConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.bip.conf.bip44.bip44_coins": ("Bip44Coins",),
+    "bip_utils.bip.conf.bip44.bip44_conf": ("Bip44Conf",),
+    "bip_utils.bip.conf.bip44.bip44_conf_getter": ("Bip44ConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
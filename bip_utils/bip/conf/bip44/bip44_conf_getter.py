@@ -21,95 +21,97 @@
 """Module for getting BIP44 coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.bip.conf.bip44.bip44_coins import Bip44Coins
-from bip_utils.bip.conf.bip44.bip44_conf import Bip44Conf
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 
 
 class Bip44ConfGetterConst:
     """Class container for BIP44 configuration getter constants."""
 
-    # Map from Bip44Coins to configuration classes
-    COIN_TO_CONF: Dict[BipCoins, BipCoinConf] = {
-        Bip44Coins.AKASH_NETWORK: Bip44Conf.AkashNetwork,
-        Bip44Coins.ALGORAND: Bip44Conf.Algorand,
-        Bip44Coins.APTOS: Bip44Conf.Aptos,
-        Bip44Coins.AVAX_C_CHAIN: Bip44Conf.AvaxCChain,
-        Bip44Coins.AVAX_P_CHAIN: Bip44Conf.AvaxPChain,
-        Bip44Coins.AVAX_X_CHAIN: Bip44Conf.AvaxXChain,
-        Bip44Coins.AXELAR: Bip44Conf.Axelar,
-        Bip44Coins.BAND_PROTOCOL: Bip44Conf.BandProtocol,
-        Bip44Coins.BINANCE_CHAIN: Bip44Conf.BinanceChain,
-        Bip44Coins.BINANCE_SMART_CHAIN: Bip44Conf.BinanceSmartChain,
-        Bip44Coins.BITCOIN: Bip44Conf.BitcoinMainNet,
-        Bip44Coins.BITCOIN_TESTNET: Bip44Conf.BitcoinTestNet,
-        Bip44Coins.BITCOIN_CASH: Bip44Conf.BitcoinCashMainNet,
-        Bip44Coins.BITCOIN_CASH_TESTNET: Bip44Conf.BitcoinCashTestNet,
-        Bip44Coins.BITCOIN_CASH_SLP: Bip44Conf.BitcoinCashSlpMainNet,
-        Bip44Coins.BITCOIN_CASH_SLP_TESTNET: Bip44Conf.BitcoinCashSlpTestNet,
-        Bip44Coins.BITCOIN_SV: Bip44Conf.BitcoinSvMainNet,
-        Bip44Coins.BITCOIN_SV_TESTNET: Bip44Conf.BitcoinSvTestNet,
-        Bip44Coins.CARDANO_BYRON_ICARUS: Bip44Conf.CardanoByronIcarus,
-        Bip44Coins.CARDANO_BYRON_LEDGER: Bip44Conf.CardanoByronLedger,
-        Bip44Coins.CELO: Bip44Conf.Celo,
-        Bip44Coins.CERTIK: Bip44Conf.Certik,
-        Bip44Coins.CHIHUAHUA: Bip44Conf.Chihuahua,
-        Bip44Coins.COSMOS: Bip44Conf.Cosmos,
-        Bip44Coins.DASH: Bip44Conf.DashMainNet,
-        Bip44Coins.DASH_TESTNET: Bip44Conf.DashTestNet,
-        Bip44Coins.DOGECOIN: Bip44Conf.DogecoinMainNet,
-        Bip44Coins.DOGECOIN_TESTNET: Bip44Conf.DogecoinTestNet,
-        Bip44Coins.ECASH: Bip44Conf.EcashMainNet,
-        Bip44Coins.ECASH_TESTNET: Bip44Conf.EcashTestNet,
-        Bip44Coins.ELROND: Bip44Conf.Elrond,
-        Bip44Coins.EOS: Bip44Conf.Eos,
-        Bip44Coins.ERGO: Bip44Conf.ErgoMainNet,
-        Bip44Coins.ERGO_TESTNET: Bip44Conf.ErgoTestNet,
-        Bip44Coins.ETHEREUM: Bip44Conf.Ethereum,
-        Bip44Coins.ETHEREUM_CLASSIC: Bip44Conf.EthereumClassic,
-        Bip44Coins.FANTOM_OPERA: Bip44Conf.FantomOpera,
-        Bip44Coins.FILECOIN: Bip44Conf.Filecoin,
-        Bip44Coins.HARMONY_ONE_ATOM: Bip44Conf.HarmonyOneAtom,
-        Bip44Coins.HARMONY_ONE_ETH: Bip44Conf.HarmonyOneEth,
-        Bip44Coins.HARMONY_ONE_METAMASK: Bip44Conf.HarmonyOneMetamask,
-        Bip44Coins.HUOBI_CHAIN: Bip44Conf.HuobiChain,
-        Bip44Coins.ICON: Bip44Conf.Icon,
-        Bip44Coins.INJECTIVE: Bip44Conf.Injective,
-        Bip44Coins.IRIS_NET: Bip44Conf.IrisNet,
-        Bip44Coins.KAVA: Bip44Conf.Kava,
-        Bip44Coins.KUSAMA_ED25519_SLIP: Bip44Conf.KusamaEd25519Slip,
-        Bip44Coins.LITECOIN: Bip44Conf.LitecoinMainNet,
-        Bip44Coins.LITECOIN_TESTNET: Bip44Conf.LitecoinTestNet,
-        Bip44Coins.MONERO_ED25519_SLIP: Bip44Conf.MoneroEd25519Slip,
-        Bip44Coins.MONERO_SECP256K1: Bip44Conf.MoneroSecp256k1,
-        Bip44Coins.NANO: Bip44Conf.Nano,
-        Bip44Coins.NEAR_PROTOCOL: Bip44Conf.NearProtocol,
-        Bip44Coins.NEO: Bip44Conf.Neo,
-        Bip44Coins.NINE_CHRONICLES_GOLD: Bip44Conf.NineChroniclesGold,
-        Bip44Coins.OKEX_CHAIN_ATOM: Bip44Conf.OkexChainAtom,
-        Bip44Coins.OKEX_CHAIN_ATOM_OLD: Bip44Conf.OkexChainAtomOld,
-        Bip44Coins.OKEX_CHAIN_ETH: Bip44Conf.OkexChainEth,
-        Bip44Coins.ONTOLOGY: Bip44Conf.Ontology,
-        Bip44Coins.OSMOSIS: Bip44Conf.Osmosis,
-        Bip44Coins.PI_NETWORK: Bip44Conf.PiNetwork,
-        Bip44Coins.POLKADOT_ED25519_SLIP: Bip44Conf.PolkadotEd25519Slip,
-        Bip44Coins.POLYGON: Bip44Conf.Polygon,
-        Bip44Coins.RIPPLE: Bip44Conf.Ripple,
-        Bip44Coins.SECRET_NETWORK_OLD: Bip44Conf.SecretNetworkOld,
-        Bip44Coins.SECRET_NETWORK_NEW: Bip44Conf.SecretNetworkNew,
-        Bip44Coins.SOLANA: Bip44Conf.Solana,
-        Bip44Coins.STELLAR: Bip44Conf.Stellar,
-        Bip44Coins.TERRA: Bip44Conf.Terra,
-        Bip44Coins.TEZOS: Bip44Conf.Tezos,
-        Bip44Coins.THETA: Bip44Conf.Theta,
-        Bip44Coins.TRON: Bip44Conf.Tron,
-        Bip44Coins.VECHAIN: Bip44Conf.VeChain,
-        Bip44Coins.VERGE: Bip44Conf.Verge,
-        Bip44Coins.ZCASH: Bip44Conf.ZcashMainNet,
-        Bip44Coins.ZCASH_TESTNET: Bip44Conf.ZcashTestNet,
-        Bip44Coins.ZILLIQA: Bip44Conf.Zilliqa,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.bip.conf.bip44.bip44_conf"
+    # Map from Bip44Coins to configuration names in Bip44Conf
+    COIN_TO_CONF_NAME: Dict[BipCoins, str] = {
+        Bip44Coins.AKASH_NETWORK: "AkashNetwork",
+        Bip44Coins.ALGORAND: "Algorand",
+        Bip44Coins.APTOS: "Aptos",
+        Bip44Coins.AVAX_C_CHAIN: "AvaxCChain",
+        Bip44Coins.AVAX_P_CHAIN: "AvaxPChain",
+        Bip44Coins.AVAX_X_CHAIN: "AvaxXChain",
+        Bip44Coins.AXELAR: "Axelar",
+        Bip44Coins.BAND_PROTOCOL: "BandProtocol",
+        Bip44Coins.BINANCE_CHAIN: "BinanceChain",
+        Bip44Coins.BINANCE_SMART_CHAIN: "BinanceSmartChain",
+        Bip44Coins.BITCOIN: "BitcoinMainNet",
+        Bip44Coins.BITCOIN_TESTNET: "BitcoinTestNet",
+        Bip44Coins.BITCOIN_CASH: "BitcoinCashMainNet",
+        Bip44Coins.BITCOIN_CASH_TESTNET: "BitcoinCashTestNet",
+        Bip44Coins.BITCOIN_CASH_SLP: "BitcoinCashSlpMainNet",
+        Bip44Coins.BITCOIN_CASH_SLP_TESTNET: "BitcoinCashSlpTestNet",
+        Bip44Coins.BITCOIN_SV: "BitcoinSvMainNet",
+        Bip44Coins.BITCOIN_SV_TESTNET: "BitcoinSvTestNet",
+        Bip44Coins.CARDANO_BYRON_ICARUS: "CardanoByronIcarus",
+        Bip44Coins.CARDANO_BYRON_LEDGER: "CardanoByronLedger",
+        Bip44Coins.CELO: "Celo",
+        Bip44Coins.CERTIK: "Certik",
+        Bip44Coins.CHIHUAHUA: "Chihuahua",
+        Bip44Coins.COSMOS: "Cosmos",
+        Bip44Coins.DASH: "DashMainNet",
+        Bip44Coins.DASH_TESTNET: "DashTestNet",
+        Bip44Coins.DOGECOIN: "DogecoinMainNet",
+        Bip44Coins.DOGECOIN_TESTNET: "DogecoinTestNet",
+        Bip44Coins.ECASH: "EcashMainNet",
+        Bip44Coins.ECASH_TESTNET: "EcashTestNet",
+        Bip44Coins.ELROND: "Elrond",
+        Bip44Coins.EOS: "Eos",
+        Bip44Coins.ERGO: "ErgoMainNet",
+        Bip44Coins.ERGO_TESTNET: "ErgoTestNet",
+        Bip44Coins.ETHEREUM: "Ethereum",
+        Bip44Coins.ETHEREUM_CLASSIC: "EthereumClassic",
+        Bip44Coins.FANTOM_OPERA: "FantomOpera",
+        Bip44Coins.FILECOIN: "Filecoin",
+        Bip44Coins.HARMONY_ONE_ATOM: "HarmonyOneAtom",
+        Bip44Coins.HARMONY_ONE_ETH: "HarmonyOneEth",
+        Bip44Coins.HARMONY_ONE_METAMASK: "HarmonyOneMetamask",
+        Bip44Coins.HUOBI_CHAIN: "HuobiChain",
+        Bip44Coins.ICON: "Icon",
+        Bip44Coins.INJECTIVE: "Injective",
+        Bip44Coins.IRIS_NET: "IrisNet",
+        Bip44Coins.KAVA: "Kava",
+        Bip44Coins.KUSAMA_ED25519_SLIP: "KusamaEd25519Slip",
+        Bip44Coins.LITECOIN: "LitecoinMainNet",
+        Bip44Coins.LITECOIN_TESTNET: "LitecoinTestNet",
+        Bip44Coins.MONERO_ED25519_SLIP: "MoneroEd25519Slip",
+        Bip44Coins.MONERO_SECP256K1: "MoneroSecp256k1",
+        Bip44Coins.NANO: "Nano",
+        Bip44Coins.NEAR_PROTOCOL: "NearProtocol",
+        Bip44Coins.NEO: "Neo",
+        Bip44Coins.NINE_CHRONICLES_GOLD: "NineChroniclesGold",
+        Bip44Coins.OKEX_CHAIN_ATOM: "OkexChainAtom",
+        Bip44Coins.OKEX_CHAIN_ATOM_OLD: "OkexChainAtomOld",
+        Bip44Coins.OKEX_CHAIN_ETH: "OkexChainEth",
+        Bip44Coins.ONTOLOGY: "Ontology",
+        Bip44Coins.OSMOSIS: "Osmosis",
+        Bip44Coins.PI_NETWORK: "PiNetwork",
+        Bip44Coins.POLKADOT_ED25519_SLIP: "PolkadotEd25519Slip",
+        Bip44Coins.POLYGON: "Polygon",
+        Bip44Coins.RIPPLE: "Ripple",
+        Bip44Coins.SECRET_NETWORK_OLD: "SecretNetworkOld",
+        Bip44Coins.SECRET_NETWORK_NEW: "SecretNetworkNew",
+        Bip44Coins.SOLANA: "Solana",
+        Bip44Coins.STELLAR: "Stellar",
+        Bip44Coins.TERRA: "Terra",
+        Bip44Coins.TEZOS: "Tezos",
+        Bip44Coins.THETA: "Theta",
+        Bip44Coins.TRON: "Tron",
+        Bip44Coins.VECHAIN: "VeChain",
+        Bip44Coins.VERGE: "Verge",
+        Bip44Coins.ZCASH: "ZcashMainNet",
+        Bip44Coins.ZCASH_TESTNET: "ZcashTestNet",
+        Bip44Coins.ZILLIQA: "Zilliqa",
     }
 
 
@@ -123,6 +125,7 @@ class Bip44ConfGetter:
     def GetConfig(coin_type: BipCoins) -> BipCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (BipCoins): Coin type
@@ -135,4 +138,5 @@ class Bip44ConfGetter:
         """
         if not isinstance(coin_type, Bip44Coins):
             raise TypeError("Coin type is not an enumerative of Bip44Coins")
-        return Bip44ConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(Bip44ConfGetterConst.CONF_MODULE).Bip44Conf
+        return getattr(conf_cls, Bip44ConfGetterConst.COIN_TO_CONF_NAME[coin_type])
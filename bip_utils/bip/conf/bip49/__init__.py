@@ -1,3 +1,28 @@
-from bip_utils.bip.conf.bip49.bip49_coins import Bip49Coins
-from bip_utils.bip.conf.bip49.bip49_conf import Bip49Conf
-from bip_utils.bip.conf.bip49.bip49_conf_getter import Bip49ConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.conf.bip49.bip49_coins import Bip49Coins
+    from bip_utils.bip.conf.bip49.bip49_conf import Bip49Conf
+    from bip_utils.bip.conf.bip49.bip49_conf_getter import Bip49ConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.bip.conf.bip49.bip49_coins": ("Bip49Coins",),
+    "bip_utils.bip.conf.bip49.bip49_conf": ("Bip49Conf",),
+    "bip_utils.bip.conf.bip49.bip49_conf_getter": ("Bip49ConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
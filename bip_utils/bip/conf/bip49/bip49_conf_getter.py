@@ -21,36 +21,38 @@
 """Module for getting BIP49 coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.bip.conf.bip49.bip49_coins import Bip49Coins
-from bip_utils.bip.conf.bip49.bip49_conf import Bip49Conf
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 
 
 class Bip49ConfGetterConst:
     """Class container for BIP49 configuration getter constants."""
 
-    # Map from Bip49Coins to configuration classes
-    COIN_TO_CONF: Dict[BipCoins, BipCoinConf] = {
-        Bip49Coins.BITCOIN: Bip49Conf.BitcoinMainNet,
-        Bip49Coins.BITCOIN_TESTNET: Bip49Conf.BitcoinTestNet,
-        Bip49Coins.BITCOIN_CASH: Bip49Conf.BitcoinCashMainNet,
-        Bip49Coins.BITCOIN_CASH_TESTNET: Bip49Conf.BitcoinCashTestNet,
-        Bip49Coins.BITCOIN_CASH_SLP: Bip49Conf.BitcoinCashSlpMainNet,
-        Bip49Coins.BITCOIN_CASH_SLP_TESTNET: Bip49Conf.BitcoinCashSlpTestNet,
-        Bip49Coins.BITCOIN_SV: Bip49Conf.BitcoinSvMainNet,
-        Bip49Coins.BITCOIN_SV_TESTNET: Bip49Conf.BitcoinSvTestNet,
-        Bip49Coins.DASH: Bip49Conf.DashMainNet,
-        Bip49Coins.DASH_TESTNET: Bip49Conf.DashTestNet,
-        Bip49Coins.DOGECOIN: Bip49Conf.DogecoinMainNet,
-        Bip49Coins.DOGECOIN_TESTNET: Bip49Conf.DogecoinTestNet,
-        Bip49Coins.ECASH: Bip49Conf.EcashMainNet,
-        Bip49Coins.ECASH_TESTNET: Bip49Conf.EcashTestNet,
-        Bip49Coins.LITECOIN: Bip49Conf.LitecoinMainNet,
-        Bip49Coins.LITECOIN_TESTNET: Bip49Conf.LitecoinTestNet,
-        Bip49Coins.ZCASH: Bip49Conf.ZcashMainNet,
-        Bip49Coins.ZCASH_TESTNET: Bip49Conf.ZcashTestNet,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.bip.conf.bip49.bip49_conf"
+    # Map from Bip49Coins to configuration names in Bip49Conf
+    COIN_TO_CONF_NAME: Dict[BipCoins, str] = {
+        Bip49Coins.BITCOIN: "BitcoinMainNet",
+        Bip49Coins.BITCOIN_TESTNET: "BitcoinTestNet",
+        Bip49Coins.BITCOIN_CASH: "BitcoinCashMainNet",
+        Bip49Coins.BITCOIN_CASH_TESTNET: "BitcoinCashTestNet",
+        Bip49Coins.BITCOIN_CASH_SLP: "BitcoinCashSlpMainNet",
+        Bip49Coins.BITCOIN_CASH_SLP_TESTNET: "BitcoinCashSlpTestNet",
+        Bip49Coins.BITCOIN_SV: "BitcoinSvMainNet",
+        Bip49Coins.BITCOIN_SV_TESTNET: "BitcoinSvTestNet",
+        Bip49Coins.DASH: "DashMainNet",
+        Bip49Coins.DASH_TESTNET: "DashTestNet",
+        Bip49Coins.DOGECOIN: "DogecoinMainNet",
+        Bip49Coins.DOGECOIN_TESTNET: "DogecoinTestNet",
+        Bip49Coins.ECASH: "EcashMainNet",
+        Bip49Coins.ECASH_TESTNET: "EcashTestNet",
+        Bip49Coins.LITECOIN: "LitecoinMainNet",
+        Bip49Coins.LITECOIN_TESTNET: "LitecoinTestNet",
+        Bip49Coins.ZCASH: "ZcashMainNet",
+        Bip49Coins.ZCASH_TESTNET: "ZcashTestNet",
     }
 
 
@@ -64,6 +66,7 @@ class Bip49ConfGetter:
     def GetConfig(coin_type: BipCoins) -> BipCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (BipCoins): Coin type
@@ -76,4 +79,5 @@ class Bip49ConfGetter:
         """
         if not isinstance(coin_type, Bip49Coins):
             raise TypeError("Coin type is not an enumerative of Bip49Coins")
-        return Bip49ConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(Bip49ConfGetterConst.CONF_MODULE).Bip49Conf
+        return getattr(conf_cls, Bip49ConfGetterConst.COIN_TO_CONF_NAME[coin_type])
@@ -1,3 +1,28 @@
-from bip_utils.bip.conf.bip84.bip84_coins import Bip84Coins
-from bip_utils.bip.conf.bip84.bip84_conf import Bip84Conf
-from bip_utils.bip.conf.bip84.bip84_conf_getter import Bip84ConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.conf.bip84.bip84_coins import Bip84Coins
+    from bip_utils.bip.conf.bip84.bip84_conf import Bip84Conf
+    from bip_utils.bip.conf.bip84.bip84_conf_getter import Bip84ConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.bip.conf.bip84.bip84_coins": ("Bip84Coins",),
+    "bip_utils.bip.conf.bip84.bip84_conf": ("Bip84Conf",),
+    "bip_utils.bip.conf.bip84.bip84_conf_getter": ("Bip84ConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
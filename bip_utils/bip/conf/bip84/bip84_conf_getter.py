@@ -21,22 +21,24 @@
 """Module for getting BIP84 coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.bip.conf.bip84.bip84_coins import Bip84Coins
-from bip_utils.bip.conf.bip84.bip84_conf import Bip84Conf
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 
 
 class Bip84ConfGetterConst:
     """Class container for BIP84 configuration getter constants."""
 
-    # Map from Bip84Coins to configuration classes
-    COIN_TO_CONF: Dict[BipCoins, BipCoinConf] = {
-        Bip84Coins.BITCOIN: Bip84Conf.BitcoinMainNet,
-        Bip84Coins.BITCOIN_TESTNET: Bip84Conf.BitcoinTestNet,
-        Bip84Coins.LITECOIN: Bip84Conf.LitecoinMainNet,
-        Bip84Coins.LITECOIN_TESTNET: Bip84Conf.LitecoinTestNet,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.bip.conf.bip84.bip84_conf"
+    # Map from Bip84Coins to configuration names in Bip84Conf
+    COIN_TO_CONF_NAME: Dict[BipCoins, str] = {
+        Bip84Coins.BITCOIN: "BitcoinMainNet",
+        Bip84Coins.BITCOIN_TESTNET: "BitcoinTestNet",
+        Bip84Coins.LITECOIN: "LitecoinMainNet",
+        Bip84Coins.LITECOIN_TESTNET: "LitecoinTestNet",
     }
 
 
@@ -50,6 +52,7 @@ class Bip84ConfGetter:
     def GetConfig(coin_type: BipCoins) -> BipCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (BipCoins): Coin type
@@ -62,4 +65,5 @@ class Bip84ConfGetter:
         """
         if not isinstance(coin_type, Bip84Coins):
             raise TypeError("Coin type is not an enumerative of Bip84Coins")
-        return Bip84ConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(Bip84ConfGetterConst.CONF_MODULE).Bip84Conf
+        return getattr(conf_cls, Bip84ConfGetterConst.COIN_TO_CONF_NAME[coin_type])
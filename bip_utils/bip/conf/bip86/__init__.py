@@ -1,3 +1,28 @@
-from bip_utils.bip.conf.bip86.bip86_coins import Bip86Coins
-from bip_utils.bip.conf.bip86.bip86_conf import Bip86Conf
-from bip_utils.bip.conf.bip86.bip86_conf_getter import Bip86ConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.conf.bip86.bip86_coins import Bip86Coins
+    from bip_utils.bip.conf.bip86.bip86_conf import Bip86Conf
+    from bip_utils.bip.conf.bip86.bip86_conf_getter import Bip86ConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.bip.conf.bip86.bip86_coins": ("Bip86Coins",),
+    "bip_utils.bip.conf.bip86.bip86_conf": ("Bip86Conf",),
+    "bip_utils.bip.conf.bip86.bip86_conf_getter": ("Bip86ConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -21,20 +21,22 @@
 """Module for getting BIP86 coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.bip.conf.bip86.bip86_coins import Bip86Coins
-from bip_utils.bip.conf.bip86.bip86_conf import Bip86Conf
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 
 
 class Bip86ConfGetterConst:
     """Class container for BIP86 configuration getter constants."""
 
-    # Map from Bip86Coins to configuration classes
-    COIN_TO_CONF: Dict[BipCoins, BipCoinConf] = {
-        Bip86Coins.BITCOIN: Bip86Conf.BitcoinMainNet,
-        Bip86Coins.BITCOIN_TESTNET: Bip86Conf.BitcoinTestNet,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.bip.conf.bip86.bip86_conf"
+    # Map from Bip86Coins to configuration names in Bip86Conf
+    COIN_TO_CONF_NAME: Dict[BipCoins, str] = {
+        Bip86Coins.BITCOIN: "BitcoinMainNet",
+        Bip86Coins.BITCOIN_TESTNET: "BitcoinTestNet",
     }
 
 
@@ -48,6 +50,7 @@ class Bip86ConfGetter:
     def GetConfig(coin_type: BipCoins) -> BipCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (BipCoins): Coin type
@@ -60,4 +63,5 @@ class Bip86ConfGetter:
         """
         if not isinstance(coin_type, Bip86Coins):
             raise TypeError("Coin type is not an enumerative of Bip86Coins")
-        return Bip86ConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(Bip86ConfGetterConst.CONF_MODULE).Bip86Conf
+        return getattr(conf_cls, Bip86ConfGetterConst.COIN_TO_CONF_NAME[coin_type])
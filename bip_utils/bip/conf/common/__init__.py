@@ -1,5 +1,5 @@
 from bip_utils.bip.conf.common.bip_bitcoin_cash_conf import BipBitcoinCashConf
-from bip_utils.bip.conf.common.bip_coin_conf import BipCoinConf, BipCoinFctCallsConf
+from bip_utils.bip.conf.common.bip_coin_conf import BipCoinAddrEncoder, BipCoinConf, BipCoinFctCallsConf
 from bip_utils.bip.conf.common.bip_coins import BipCoins
 from bip_utils.bip.conf.common.bip_conf_const import (
     DER_PATH_HARDENED_FULL, DER_PATH_HARDENED_SHORT, DER_PATH_NON_HARDENED_FULL
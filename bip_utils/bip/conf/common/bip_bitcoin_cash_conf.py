@@ -85,7 +85,9 @@ class BipBitcoinCashConf(BipCoinConf):
         Args:
             value (bool): True for using legacy address, false for using the standard one
         """
-        self.m_use_legacy_addr = value
+        if value != self.m_use_legacy_addr:
+            self.m_use_legacy_addr = value
+            self._InvalidateAddrEncoder()
 
     def AddrClass(self) -> Type[IAddrEncoder]:
         """
@@ -21,13 +21,23 @@
 """Module with helper class for generic BIP coins configuration handling."""
 
 # Imports
-from typing import Any, Dict, Optional, Tuple, Type
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from bip_utils.addr import IAddrEncoder
-from bip_utils.bip.bip32 import Bip32Base, Bip32KeyNetVersions, Bip32PublicKey
+from bip_utils.bip.bip32 import (
+    Bip32Base, Bip32DerivationCache, Bip32KeyNetVersions, Bip32Path, Bip32PathParser, Bip32PublicKey
+)
 from bip_utils.utils.conf import CoinNames as UtilsCoinNames
 
 
+class BipCoinConfConst:
+    """Class container for Bip coin configuration constants."""
+
+    # Maximum number of nodes in the default path cache of each coin
+    DEF_PATH_CACHE_MAX_SIZE: int = 1024
+
+
 class BipCoinFctCallsConf:
     """Bip coin function calls configuration class."""
 
@@ -60,6 +70,70 @@ class BipCoinFctCallsConf:
         return res
 
 
+class BipCoinAddrEncoder:
+    """
+    Bip coin address encoder class.
+    It binds the address class to the address parameters, so that they are resolved only once when encoding
+    many addresses. Only the function calls, if any, are resolved for each public key.
+    """
+
+    m_addr_cls: Type[IAddrEncoder]
+    m_encode_fct: Callable[..., str]
+    m_fct_calls_params: Tuple[Tuple[str, BipCoinFctCallsConf], ...]
+
+    def __init__(self,
+                 addr_cls: Type[IAddrEncoder],
+                 addr_params: Dict[str, Any]) -> None:
+        """
+        Construct class.
+
+        Args:
+            addr_cls (IAddrEncoder class): Address class
+            addr_params (dict)           : Address parameters
+        """
+        self.m_addr_cls = addr_cls
+        self.m_encode_fct = partial(
+            addr_cls.EncodeKey,
+            **{
+                param_name: param_val
+                for param_name, param_val in addr_params.items()
+                if not isinstance(param_val, BipCoinFctCallsConf)
+            }
+        )
+        self.m_fct_calls_params = tuple(
+            (param_name, param_val)
+            for param_name, param_val in addr_params.items()
+            if isinstance(param_val, BipCoinFctCallsConf)
+        )
+
+    def AddrClass(self) -> Type[IAddrEncoder]:
+        """
+        Get the address class.
+
+        Returns:
+            IAddrEncoder class: Address class
+        """
+        return self.m_addr_cls
+
+    def Encode(self,
+               pub_key: Bip32PublicKey) -> str:
+        """
+        Encode a public key to address.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+
+        Returns:
+            str: Address string
+        """
+        if not self.m_fct_calls_params:
+            return self.m_encode_fct(pub_key.KeyObject())
+        return self.m_encode_fct(
+            pub_key.KeyObject(),
+            **{param_name: param_val.ResolveCalls(pub_key) for param_name, param_val in self.m_fct_calls_params}
+        )
+
+
 class BipCoinConf:  # pylint: disable=too-many-instance-attributes
     """Bip coin configuration class."""
 
@@ -67,12 +141,15 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
     m_coin_idx: int
     m_is_testnet: bool
     m_def_path: str
+    m_def_path_obj: Optional[Bip32Path]
+    m_def_path_cache: Optional[Bip32DerivationCache]
     m_key_net_ver: Bip32KeyNetVersions
     m_wif_net_ver: Optional[bytes]
     m_bip32_cls: Type[Bip32Base]
     m_addr_params: Dict[str, Any]
     m_addr_cls: Type[IAddrEncoder]
     m_any_addr_params_fct_call: bool
+    m_addr_encoder: Optional[BipCoinAddrEncoder]
 
     def __init__(self,  # pylint: disable=too-many-arguments
                  coin_names: UtilsCoinNames,
@@ -102,6 +179,8 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
         self.m_coin_idx = coin_idx
         self.m_is_testnet = is_testnet
         self.m_def_path = def_path
+        self.m_def_path_obj = None
+        self.m_def_path_cache = None
         self.m_key_net_ver = key_net_ver
         self.m_wif_net_ver = wif_net_ver
         self.m_bip32_cls = bip32_cls
@@ -110,6 +189,7 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
             (isinstance(param_val, BipCoinFctCallsConf) for param_val in addr_params.values())
         )
         self.m_addr_cls = addr_cls
+        self.m_addr_encoder = None
 
     def CoinNames(self) -> UtilsCoinNames:
         """
@@ -147,6 +227,59 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
         """
         return self.m_def_path
 
+    def DefaultBip32Path(self) -> Bip32Path:
+        """
+        Get the default derivation path as a Bip32Path object.
+        The path is parsed only once.
+
+        Returns:
+            Bip32Path object: Default derivation path
+
+        Raises:
+            Bip32PathError: If the default path is not valid
+        """
+        if self.m_def_path_obj is None:
+            self.m_def_path_obj = Bip32PathParser.Parse(self.m_def_path)
+        return self.m_def_path_obj
+
+    def EnableDefaultPathCache(self,
+                               max_size: int = BipCoinConfConst.DEF_PATH_CACHE_MAX_SIZE) -> None:
+        """
+        Enable the cache of the default path nodes, which is disabled by default.
+        The cache is shared by all the objects using this configuration, so it keeps the private keys of all the
+        master keys used for deriving the default path. Its size is bounded (the least recently used nodes are
+        removed) and it can be emptied with PurgeDefaultPathCache, e.g. when the cached keys are no more needed.
+        Nothing is done if the cache is already enabled.
+
+        Args:
+            max_size (int, optional): Maximum number of cached nodes (default: 1024)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if self.m_def_path_cache is None:
+            self.m_def_path_cache = Bip32DerivationCache(max_size)
+
+    def DisableDefaultPathCache(self) -> None:
+        """Disable the cache of the default path nodes, removing all the nodes from it."""
+        self.PurgeDefaultPathCache()
+        self.m_def_path_cache = None
+
+    def DefaultPathCache(self) -> Optional[Bip32DerivationCache]:
+        """
+        Get the cache of the default path nodes.
+
+        Returns:
+            Bip32DerivationCache object: Bip32DerivationCache object
+            None: If the cache is not enabled
+        """
+        return self.m_def_path_cache
+
+    def PurgeDefaultPathCache(self) -> None:
+        """Remove all the nodes from the default path cache."""
+        if self.m_def_path_cache is not None:
+            self.m_def_path_cache.Purge()
+
     def KeyNetVersions(self) -> Bip32KeyNetVersions:
         """
         Get key net versions.
@@ -184,6 +317,15 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
         """
         return self.m_addr_params
 
+    def HasAddrParamsFctCalls(self) -> bool:
+        """
+        Get if the address parameters contain function calls to be resolved for each public key.
+
+        Returns:
+            bool: True if function calls are present, false otherwise
+        """
+        return self.m_any_addr_params_fct_call
+
     def AddrParamsWithResolvedCalls(self,
                                     pub_key: Bip32PublicKey) -> Dict[str, Any]:
         """
@@ -215,3 +357,19 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
             IAddrEncoder class: Address class
         """
         return self.m_addr_cls
+
+    def AddrEncoder(self) -> BipCoinAddrEncoder:
+        """
+        Get the address encoder, i.e. the address class bound to the address parameters.
+        It is built only once and rebuilt only if the address configuration changes.
+
+        Returns:
+            BipCoinAddrEncoder object: BipCoinAddrEncoder object
+        """
+        if self.m_addr_encoder is None:
+            self.m_addr_encoder = BipCoinAddrEncoder(self.AddrClass(), self.AddrParams())
+        return self.m_addr_encoder
+
+    def _InvalidateAddrEncoder(self) -> None:
+        """Invalidate the address encoder, so that it is rebuilt the next time it is requested."""
+        self.m_addr_encoder = None
@@ -97,7 +97,9 @@ class BipLitecoinConf(BipCoinConf):
         Args:
             value (bool): True for using deprecated address, false for using the standard one
         """
-        self.m_use_depr_addr = value
+        if value != self.m_use_depr_addr:
+            self.m_use_depr_addr = value
+            self._InvalidateAddrEncoder()
 
     def KeyNetVersions(self) -> Bip32KeyNetVersions:
         """
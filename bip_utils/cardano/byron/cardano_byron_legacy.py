@@ -24,13 +24,13 @@
 # Imports
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Union
 
 from bip_utils.addr import AdaByronAddrDecoder, AdaByronLegacyAddrEncoder
 from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32Path, Bip32PrivateKey, Bip32PublicKey
 from bip_utils.cardano.bip32 import CardanoByronLegacyBip32
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class CardanoByronLegacyConst:
@@ -94,7 +94,7 @@ class CardanoByronLegacy:
         """
         return self.m_bip32_obj
 
-    @lru_cache()
+    @MemoizedMethod
     def HdPathKey(self) -> bytes:
         """
         Get the key used for HD path decryption/encryption.
@@ -191,7 +191,7 @@ class CardanoByronLegacy:
         """
         return self.__DeriveKey(first_idx, second_idx).PublicKey()
 
-    @lru_cache()
+    @MemoizedMethod
     def GetAddress(self,
                    first_idx: Union[int, Bip32KeyIndex],
                    second_idx: Union[int, Bip32KeyIndex]) -> str:
@@ -219,7 +219,7 @@ class CardanoByronLegacy:
             hd_path_key=self.HdPathKey()
         )
 
-    @lru_cache()
+    @MemoizedMethod
     def __DeriveKey(self,
                     first_idx: Union[int, Bip32KeyIndex],
                     second_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
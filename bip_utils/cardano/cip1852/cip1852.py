@@ -24,11 +24,11 @@ Reference: https://cips.cardano.org/cips/cip1852
 """
 
 # Imports
-from typing import Union
+from typing import Optional, Union
 
 from bip_utils.bip.bip32 import Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
-from bip_utils.bip.conf.common import BipCoins
+from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 from bip_utils.cardano.cip1852.conf import Cip1852ConfGetter
 from bip_utils.ecc import IPrivateKey, IPublicKey
 
@@ -48,6 +48,8 @@ class Cip1852(Bip44Base):
     It allows master key generation and children keys derivation in according to CIP-1852.
     """
 
+    __slots__ = ()
+
     #
     # Class methods for construction
     #
@@ -237,3 +239,29 @@ class Cip1852(Bip44Base):
             str: Specification name
         """
         return Cip1852Const.SPEC_NAME
+
+    @staticmethod
+    def _PurposeIndex() -> Optional[int]:
+        """
+        Get the purpose index, without deriving it.
+
+        Returns:
+            int: Purpose index
+        """
+        return Cip1852Const.PURPOSE
+
+    @staticmethod
+    def GetCoinConf(coin_type: BipCoins) -> BipCoinConf:
+        """
+        Get the configuration of the specified coin.
+
+        Args:
+            coin_type (BipCoins): Coin type, shall be a Cip1852Coins enum
+
+        Returns:
+            BipCoinConf object: BipCoinConf object
+
+        Raises:
+            TypeError: If coin type is not a Cip1852Coins enum
+        """
+        return Cip1852ConfGetter.GetConfig(coin_type)
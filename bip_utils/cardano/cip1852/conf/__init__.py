@@ -1,3 +1,28 @@
-from bip_utils.cardano.cip1852.conf.cip1852_coins import Cip1852Coins
-from bip_utils.cardano.cip1852.conf.cip1852_conf import Cip1852Conf
-from bip_utils.cardano.cip1852.conf.cip1852_conf_getter import Cip1852ConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.cardano.cip1852.conf.cip1852_coins import Cip1852Coins
+    from bip_utils.cardano.cip1852.conf.cip1852_conf import Cip1852Conf
+    from bip_utils.cardano.cip1852.conf.cip1852_conf_getter import Cip1852ConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.cardano.cip1852.conf.cip1852_coins": ("Cip1852Coins",),
+    "bip_utils.cardano.cip1852.conf.cip1852_conf": ("Cip1852Conf",),
+    "bip_utils.cardano.cip1852.conf.cip1852_conf_getter": ("Cip1852ConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
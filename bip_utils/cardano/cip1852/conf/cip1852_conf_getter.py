@@ -21,22 +21,24 @@
 """Module for getting CIP-1852 coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 from bip_utils.cardano.cip1852.conf.cip1852_coins import Cip1852Coins
-from bip_utils.cardano.cip1852.conf.cip1852_conf import Cip1852Conf
 
 
 class Cip1852ConfGetterConst:
     """Class container for CIP-1852 configuration getter constants."""
 
-    # Map from Cip1852Coins to configuration classes
-    COIN_TO_CONF: Dict[BipCoins, BipCoinConf] = {
-        Cip1852Coins.CARDANO_ICARUS: Cip1852Conf.CardanoIcarusMainNet,
-        Cip1852Coins.CARDANO_LEDGER: Cip1852Conf.CardanoLedgerMainNet,
-        Cip1852Coins.CARDANO_ICARUS_TESTNET: Cip1852Conf.CardanoIcarusTestNet,
-        Cip1852Coins.CARDANO_LEDGER_TESTNET: Cip1852Conf.CardanoLedgerTestNet,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.cardano.cip1852.conf.cip1852_conf"
+    # Map from Cip1852Coins to configuration names in Cip1852Conf
+    COIN_TO_CONF_NAME: Dict[BipCoins, str] = {
+        Cip1852Coins.CARDANO_ICARUS: "CardanoIcarusMainNet",
+        Cip1852Coins.CARDANO_LEDGER: "CardanoLedgerMainNet",
+        Cip1852Coins.CARDANO_ICARUS_TESTNET: "CardanoIcarusTestNet",
+        Cip1852Coins.CARDANO_LEDGER_TESTNET: "CardanoLedgerTestNet",
     }
 
 
@@ -50,6 +52,7 @@ class Cip1852ConfGetter:
     def GetConfig(coin_type: BipCoins) -> BipCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (BipCoins): Coin type
@@ -62,4 +65,5 @@ class Cip1852ConfGetter:
         """
         if not isinstance(coin_type, Cip1852Coins):
             raise TypeError("Coin type is not an enumerative of Cip1852Coins")
-        return Cip1852ConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(Cip1852ConfGetterConst.CONF_MODULE).Cip1852Conf
+        return getattr(conf_cls, Cip1852ConfGetterConst.COIN_TO_CONF_NAME[coin_type])
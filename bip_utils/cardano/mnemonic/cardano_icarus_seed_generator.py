@@ -21,7 +21,7 @@
 """Module for Cardano Icarus mnemonic seed generation."""
 
 # Imports
-from typing import Optional, Union
+from typing import Iterable, Iterator, Optional, Union
 
 from bip_utils.bip.bip39 import Bip39Languages, Bip39MnemonicDecoder
 from bip_utils.utils.mnemonic import Mnemonic
@@ -61,3 +61,26 @@ class CardanoIcarusSeedGenerator:
             bytes: Generated seed
         """
         return self.m_entropy_bytes
+
+    @classmethod
+    def GenerateBatch(cls,
+                      mnemonics: Iterable[Union[str, Mnemonic]],
+                      lang: Optional[Bip39Languages] = None) -> Iterator[bytes]:
+        """
+        Generate the seeds of many mnemonics.
+        Mnemonics are validated lazily while iterating and seeds are yielded in the same order.
+        No parallelism is needed, since the seed is the entropy and PBKDF2 is computed by the master key generator.
+
+        Args:
+            mnemonics (iterable)           : Mnemonics (str or Mnemonic objects)
+            lang (Bip39Languages, optional): Language, None for automatic detection
+
+        Returns:
+            Iterator: Generated seeds
+
+        Raises:
+            ValueError: If a mnemonic is not valid
+        """
+        decoder = Bip39MnemonicDecoder(lang)
+        for mnemonic in mnemonics:
+            yield decoder.Decode(mnemonic)
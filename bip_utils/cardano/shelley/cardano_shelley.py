@@ -27,12 +27,12 @@ Reference: https://cips.cardano.org/cips/cip11
 from __future__ import annotations
 
 import copy
-from functools import lru_cache
 
 from bip_utils.addr import AdaShelleyStakingAddrEncoder
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.cardano.cip1852 import Cip1852
 from bip_utils.cardano.shelley.cardano_shelley_keys import CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class CardanoShelley:
@@ -85,7 +85,7 @@ class CardanoShelley:
         self.m_bip_obj = bip_obj
         self.m_bip_sk_obj = bip_sk_obj
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKeys(self) -> CardanoShelleyPublicKeys:
         """
         Return the public keys.
@@ -97,7 +97,7 @@ class CardanoShelley:
                                         self.m_bip_sk_obj.PublicKey().Bip32Key(),
                                         self.m_bip_obj.CoinConf())
 
-    @lru_cache()
+    @MemoizedMethod
     def PrivateKeys(self) -> CardanoShelleyPrivateKeys:
         """
         Return the private keys.
@@ -194,6 +194,9 @@ class CardanoShelley:
         # Create a new configuration with the staking address class (no need to deep-copying)
         coin_conf = copy.copy(bip_obj.CoinConf())
         coin_conf.m_addr_cls = AdaShelleyStakingAddrEncoder
+        coin_conf.m_addr_encoder = None
+        # The default path cache of the original configuration shall not be shared
+        coin_conf.m_def_path_cache = None
         # Create Cip1852 object for staking keys
         return Cip1852(bip_obj.Bip32Object().DerivePath("2/0"),
                        coin_conf)
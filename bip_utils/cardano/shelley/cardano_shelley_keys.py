@@ -21,11 +21,11 @@
 """Module for Cardano Shelley keys handling."""
 
 # Imports
-from functools import lru_cache
 
 from bip_utils.addr import AdaShelleyAddrEncoder, AdaShelleyStakingAddrEncoder
 from bip_utils.bip.bip32 import Bip32PrivateKey, Bip32PublicKey
 from bip_utils.bip.conf.common import BipCoinConf
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class CardanoShelleyPublicKeys:
@@ -93,7 +93,7 @@ class CardanoShelleyPublicKeys:
         """
         return self.ToStakingAddress()
 
-    @lru_cache()
+    @MemoizedMethod
     def ToStakingAddress(self) -> str:
         """
         Return the staking address correspondent to the public key.
@@ -107,7 +107,7 @@ class CardanoShelleyPublicKeys:
         return AdaShelleyStakingAddrEncoder.EncodeKey(self.m_pub_sk_key.KeyObject(),
                                                       **self.m_coin_conf.AddrParams())
 
-    @lru_cache()
+    @MemoizedMethod
     def ToAddress(self) -> str:
         """
         Return the address correspondent to the public key.
@@ -176,7 +176,7 @@ class CardanoShelleyPrivateKeys:
         """
         return self.m_priv_sk_key
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKeys(self) -> CardanoShelleyPublicKeys:
         """
         Get the public keys correspondent to the private ones.
@@ -1,42 +1,108 @@
-# Common
-from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
-from bip_utils.ecc.common.ipoint import IPoint
-
-# Curve
-from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
-from bip_utils.ecc.curve.elliptic_curve_getter import EllipticCurveGetter
-from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
-
-# ed25519
-from bip_utils.ecc.ed25519.ed25519 import Ed25519
-from bip_utils.ecc.ed25519.ed25519_keys import Ed25519PrivateKey, Ed25519PublicKey
-from bip_utils.ecc.ed25519.ed25519_point import Ed25519Point
-from bip_utils.ecc.ed25519.ed25519_utils import Ed25519Utils
-
-# ed25519-blake2b
-from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b import Ed25519Blake2b
-from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_keys import Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey
-from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_point import Ed25519Blake2bPoint
-
-# ed25519-kholaw
-from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw import Ed25519Kholaw
-from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_keys import Ed25519KholawPrivateKey, Ed25519KholawPublicKey
-from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_point import Ed25519KholawPoint
-
-# ed25519-monero
-from bip_utils.ecc.ed25519_monero.ed25519_monero import Ed25519Monero
-from bip_utils.ecc.ed25519_monero.ed25519_monero_keys import Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey
-from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
-
-# nist256p1
-from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
-from bip_utils.ecc.nist256p1.nist256p1_keys import Nist256p1PrivateKey, Nist256p1PublicKey
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
-
-# secp256k1
-from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
-
-# sr25519
-from bip_utils.ecc.sr25519.sr25519 import Sr25519
-from bip_utils.ecc.sr25519.sr25519_keys import Sr25519PrivateKey, Sr25519PublicKey
-from bip_utils.ecc.sr25519.sr25519_point import Sr25519Point
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    # Common
+    from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+    from bip_utils.ecc.common.ipoint import IPoint
+
+    # Curve
+    from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+    from bip_utils.ecc.curve.elliptic_curve_getter import EllipticCurveGetter
+    from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+
+    # ed25519
+    from bip_utils.ecc.ed25519.ed25519 import Ed25519
+    from bip_utils.ecc.ed25519.ed25519_keys import Ed25519PrivateKey, Ed25519PublicKey
+    from bip_utils.ecc.ed25519.ed25519_point import Ed25519Point
+    from bip_utils.ecc.ed25519.ed25519_utils import Ed25519Utils
+
+    # ed25519-blake2b
+    from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b import Ed25519Blake2b
+    from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_keys import Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey
+    from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_point import Ed25519Blake2bPoint
+
+    # ed25519-kholaw
+    from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw import Ed25519Kholaw
+    from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_keys import Ed25519KholawPrivateKey, Ed25519KholawPublicKey
+    from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_point import Ed25519KholawPoint
+
+    # ed25519-monero
+    from bip_utils.ecc.ed25519_monero.ed25519_monero import Ed25519Monero
+    from bip_utils.ecc.ed25519_monero.ed25519_monero_keys import Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey
+    from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
+
+    # nist256p1
+    from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
+    from bip_utils.ecc.nist256p1.nist256p1_keys import Nist256p1PrivateKey, Nist256p1PublicKey
+    from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+
+    # secp256k1
+    from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
+    from bip_utils.ecc.secp256k1.secp256k1_utils import Secp256k1Utils
+
+    # sr25519
+    from bip_utils.ecc.sr25519.sr25519 import Sr25519
+    from bip_utils.ecc.sr25519.sr25519_keys import Sr25519PrivateKey, Sr25519PublicKey
+    from bip_utils.ecc.sr25519.sr25519_point import Sr25519Point
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    # Common
+    "bip_utils.ecc.common.ikeys": ("IPrivateKey", "IPublicKey"),
+    "bip_utils.ecc.common.ipoint": ("IPoint",),
+
+    # Curve
+    "bip_utils.ecc.curve.elliptic_curve": ("EllipticCurve",),
+    "bip_utils.ecc.curve.elliptic_curve_getter": ("EllipticCurveGetter",),
+    "bip_utils.ecc.curve.elliptic_curve_types": ("EllipticCurveTypes",),
+
+    # ed25519
+    "bip_utils.ecc.ed25519.ed25519": ("Ed25519",),
+    "bip_utils.ecc.ed25519.ed25519_keys": ("Ed25519PrivateKey", "Ed25519PublicKey"),
+    "bip_utils.ecc.ed25519.ed25519_point": ("Ed25519Point",),
+    "bip_utils.ecc.ed25519.ed25519_utils": ("Ed25519Utils",),
+
+    # ed25519-blake2b
+    "bip_utils.ecc.ed25519_blake2b.ed25519_blake2b": ("Ed25519Blake2b",),
+    "bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_keys": ("Ed25519Blake2bPrivateKey", "Ed25519Blake2bPublicKey"),
+    "bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_point": ("Ed25519Blake2bPoint",),
+
+    # ed25519-kholaw
+    "bip_utils.ecc.ed25519_kholaw.ed25519_kholaw": ("Ed25519Kholaw",),
+    "bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_keys": ("Ed25519KholawPrivateKey", "Ed25519KholawPublicKey"),
+    "bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_point": ("Ed25519KholawPoint",),
+
+    # ed25519-monero
+    "bip_utils.ecc.ed25519_monero.ed25519_monero": ("Ed25519Monero",),
+    "bip_utils.ecc.ed25519_monero.ed25519_monero_keys": ("Ed25519MoneroPrivateKey", "Ed25519MoneroPublicKey"),
+    "bip_utils.ecc.ed25519_monero.ed25519_monero_point": ("Ed25519MoneroPoint",),
+
+    # nist256p1
+    "bip_utils.ecc.nist256p1.nist256p1": ("Nist256p1",),
+    "bip_utils.ecc.nist256p1.nist256p1_keys": ("Nist256p1PrivateKey", "Nist256p1PublicKey"),
+    "bip_utils.ecc.nist256p1.nist256p1_point": ("Nist256p1Point",),
+
+    # secp256k1
+    "bip_utils.ecc.secp256k1.secp256k1": ("Secp256k1", "Secp256k1Point", "Secp256k1PrivateKey", "Secp256k1PublicKey"),
+    "bip_utils.ecc.secp256k1.secp256k1_utils": ("Secp256k1Utils",),
+
+    # sr25519
+    "bip_utils.ecc.sr25519.sr25519": ("Sr25519",),
+    "bip_utils.ecc.sr25519.sr25519_keys": ("Sr25519PrivateKey", "Sr25519PublicKey"),
+    "bip_utils.ecc.sr25519.sr25519_point": ("Sr25519Point",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -21,31 +21,25 @@
 """Module for getting elliptic curves classes."""
 
 # Imports
-from typing import Dict
+import importlib
+from typing import Dict, Tuple
 
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
-from bip_utils.ecc.ed25519.ed25519 import Ed25519
-from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b import Ed25519Blake2b
-from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw import Ed25519Kholaw
-from bip_utils.ecc.ed25519_monero.ed25519_monero import Ed25519Monero
-from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
-from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1
-from bip_utils.ecc.sr25519.sr25519 import Sr25519
 
 
 class EllipticCurveGetterConst:
     """Class container for elliptic curve getter constants."""
 
-    # Elliptic curve type to instance
-    TYPE_TO_INSTANCE: Dict[EllipticCurveTypes, EllipticCurve] = {
-        EllipticCurveTypes.ED25519: Ed25519,
-        EllipticCurveTypes.ED25519_BLAKE2B: Ed25519Blake2b,
-        EllipticCurveTypes.ED25519_KHOLAW: Ed25519Kholaw,
-        EllipticCurveTypes.ED25519_MONERO: Ed25519Monero,
-        EllipticCurveTypes.NIST256P1: Nist256p1,
-        EllipticCurveTypes.SECP256K1: Secp256k1,
-        EllipticCurveTypes.SR25519: Sr25519,
+    # Elliptic curve type to module and name of the instance, imported only when requested for the first time
+    TYPE_TO_INSTANCE_NAME: Dict[EllipticCurveTypes, Tuple[str, str]] = {
+        EllipticCurveTypes.ED25519: ("bip_utils.ecc.ed25519.ed25519", "Ed25519"),
+        EllipticCurveTypes.ED25519_BLAKE2B: ("bip_utils.ecc.ed25519_blake2b.ed25519_blake2b", "Ed25519Blake2b"),
+        EllipticCurveTypes.ED25519_KHOLAW: ("bip_utils.ecc.ed25519_kholaw.ed25519_kholaw", "Ed25519Kholaw"),
+        EllipticCurveTypes.ED25519_MONERO: ("bip_utils.ecc.ed25519_monero.ed25519_monero", "Ed25519Monero"),
+        EllipticCurveTypes.NIST256P1: ("bip_utils.ecc.nist256p1.nist256p1", "Nist256p1"),
+        EllipticCurveTypes.SECP256K1: ("bip_utils.ecc.secp256k1.secp256k1", "Secp256k1"),
+        EllipticCurveTypes.SR25519: ("bip_utils.ecc.sr25519.sr25519", "Sr25519"),
     }
 
 
@@ -53,8 +47,12 @@ class EllipticCurveGetter:
     """
     Elliptic curve getter class.
     It allows to get the elliptic curve class from its type.
+    The module of each curve (and its underlying library) is imported only when the curve is requested.
     """
 
+    # Elliptic curve instances already imported
+    _curves: Dict[EllipticCurveTypes, EllipticCurve] = {}
+
     @staticmethod
     def FromType(curve_type: EllipticCurveTypes) -> EllipticCurve:
         """
@@ -69,6 +67,15 @@ class EllipticCurveGetter:
         Raises:
             TypeError: If curve type is not a EllipticCurveTypes enum
         """
+        try:
+            return EllipticCurveGetter._curves[curve_type]
+        except KeyError:
+            pass
+
         if not isinstance(curve_type, EllipticCurveTypes):
             raise TypeError("Curve type is not an enumerative of EllipticCurveTypes")
-        return EllipticCurveGetterConst.TYPE_TO_INSTANCE[curve_type]
+
+        mod_name, curve_name = EllipticCurveGetterConst.TYPE_TO_INSTANCE_NAME[curve_type]
+        curve = getattr(importlib.import_module(mod_name), curve_name)
+        EllipticCurveGetter._curves[curve_type] = curve
+        return curve
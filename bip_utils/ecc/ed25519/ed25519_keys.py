@@ -21,7 +21,7 @@
 """Module for ed25519 keys."""
 
 # Imports
-from typing import Any
+from typing import Any, Optional, Union
 
 from nacl import exceptions, signing
 
@@ -178,13 +178,15 @@ class Ed25519PublicKey(IPublicKey):
 class Ed25519PrivateKey(IPrivateKey):
     """Ed25519 private key class."""
 
-    m_sign_key: signing.SigningKey
+    m_key_bytes: bytes
+    m_sign_key: Optional[signing.SigningKey]
 
     @classmethod
     def FromBytes(cls,
                   key_bytes: bytes) -> IPrivateKey:
         """
         Construct class from key bytes.
+        The underlying signing key is created only when needed, since it requires computing the public key.
 
         Args:
             key_bytes (bytes): Key bytes
@@ -195,20 +197,24 @@ class Ed25519PrivateKey(IPrivateKey):
         Raises:
             ValueError: If key bytes are not valid
         """
-        try:
-            return cls(signing.SigningKey(key_bytes))
-        except (exceptions.RuntimeError, exceptions.ValueError) as ex:
-            raise ValueError("Invalid private key bytes") from ex
+        if not isinstance(key_bytes, bytes) or len(key_bytes) != cls.Length():
+            raise ValueError("Invalid private key bytes")
+        return cls(key_bytes)
 
     def __init__(self,
-                 key_obj: signing.SigningKey) -> None:
+                 key_obj: Union[signing.SigningKey, bytes]) -> None:
         """
         Construct class.
 
         Args:
-            key_obj (signing.SigningKey): Key object
+            key_obj (signing.SigningKey or bytes): Key object or key bytes
         """
-        self.m_sign_key = key_obj
+        if isinstance(key_obj, bytes):
+            self.m_key_bytes = key_obj
+            self.m_sign_key = None
+        else:
+            self.m_key_bytes = bytes(key_obj)
+            self.m_sign_key = key_obj
 
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
@@ -237,7 +243,7 @@ class Ed25519PrivateKey(IPrivateKey):
         Returns:
            Any: Underlying object
         """
-        return self.m_sign_key
+        return self._SigningKey()
 
     def Raw(self) -> DataBytes:
         """
@@ -246,7 +252,7 @@ class Ed25519PrivateKey(IPrivateKey):
         Returns:
             DataBytes object: DataBytes object
         """
-        return DataBytes(bytes(self.m_sign_key))
+        return DataBytes(self.m_key_bytes)
 
     def PublicKey(self) -> IPublicKey:
         """
@@ -255,4 +261,21 @@ class Ed25519PrivateKey(IPrivateKey):
         Returns:
             IPublicKey object: IPublicKey object
         """
-        return Ed25519PublicKey(self.m_sign_key.verify_key)
+        return Ed25519PublicKey(self._SigningKey().verify_key)
+
+    def _SigningKey(self) -> signing.SigningKey:
+        """
+        Get the signing key, creating it if not done yet.
+
+        Returns:
+            signing.SigningKey object: Signing key object
+
+        Raises:
+            ValueError: If key bytes are not valid
+        """
+        if self.m_sign_key is None:
+            try:
+                self.m_sign_key = signing.SigningKey(self.m_key_bytes)
+            except (exceptions.RuntimeError, exceptions.ValueError) as ex:
+                raise ValueError("Invalid private key bytes") from ex
+        return self.m_sign_key
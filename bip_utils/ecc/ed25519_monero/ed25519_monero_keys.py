@@ -125,6 +125,6 @@ class Ed25519MoneroPrivateKey(Ed25519PrivateKey):
         """
         return Ed25519MoneroPublicKey(
             signing.VerifyKey(
-                ed25519_lib.point_scalar_mul_base(bytes(self.m_sign_key))
+                ed25519_lib.point_scalar_mul_base(self.m_key_bytes)
             )
         )
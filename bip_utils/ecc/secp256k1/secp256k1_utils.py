@@ -0,0 +1,81 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for secp256k1 utility functions."""
+
+# Imports
+from typing import Union
+
+from bip_utils.ecc.common.ikeys import IPublicKey
+from bip_utils.ecc.conf import EccConf
+from bip_utils.ecc.secp256k1.secp256k1_const import Secp256k1Const, Secp256k1PublicKey
+
+
+# Use coincurve tweak-add if available
+if EccConf.USE_COINCURVE:
+    import coincurve
+
+    def _PublicKeyTweakAdd(pub_key: Union[bytes, IPublicKey],
+                           tweak_bytes: bytes) -> bytes:
+        # Key objects are already parsed, so the underlying object is tweaked directly (it's not modified)
+        pub_key_obj = (pub_key.UnderlyingObject()
+                       if isinstance(pub_key, IPublicKey)
+                       else coincurve.PublicKey(pub_key))
+        return pub_key_obj.add(tweak_bytes).format(True)
+
+# Fall back to point arithmetic with ecdsa
+else:
+    from bip_utils.utils.misc import BytesUtils
+
+    def _PublicKeyTweakAdd(pub_key: Union[bytes, IPublicKey],
+                           tweak_bytes: bytes) -> bytes:
+        tweak_int = BytesUtils.ToInteger(tweak_bytes)
+        if tweak_int >= Secp256k1Const.CURVE_ORDER:
+            raise ValueError("Invalid tweak")
+        pub_key_point = (pub_key.Point()
+                         if isinstance(pub_key, IPublicKey)
+                         else Secp256k1PublicKey.FromBytes(pub_key).Point())
+        pub_key_point += Secp256k1Const.GENERATOR * tweak_int
+        return Secp256k1PublicKey.FromPoint(pub_key_point).RawCompressed().ToBytes()
+
+
+class Secp256k1Utils:
+    """Class container for secp256k1 utility functions."""
+
+    @staticmethod
+    def PublicKeyTweakAdd(pub_key: Union[bytes, IPublicKey],
+                          tweak_bytes: bytes) -> bytes:
+        """
+        Add the tweak multiplied by the generator to the specified public key (i.e. pub_key + tweak * G).
+        Native tweak-add is used with coincurve, point arithmetic with ecdsa.
+        Passing a key object avoids parsing the key again, e.g. when tweaking the same key many times.
+
+        Args:
+            pub_key (bytes or IPublicKey object): Public key bytes (compressed or uncompressed) or secp256k1
+                                                  public key object
+            tweak_bytes (bytes)                 : Tweak bytes (32-byte)
+
+        Returns:
+            bytes: Compressed public key bytes
+
+        Raises:
+            ValueError: If the public key or the tweak is not valid, or the resulting public key is invalid
+        """
+        return _PublicKeyTweakAdd(pub_key, tweak_bytes)
@@ -23,7 +23,6 @@
 # Imports
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Optional, Union
 
 from bip_utils.addr import P2PKHAddr, P2PKHPubKeyModes
@@ -31,7 +30,7 @@ from bip_utils.bip.bip32 import Bip32KeyIndex
 from bip_utils.coin_conf import CoinsConf
 from bip_utils.ecc import IPrivateKey, IPublicKey, Secp256k1, Secp256k1PrivateKey, Secp256k1PublicKey
 from bip_utils.utils.crypto import DoubleSha256
-from bip_utils.utils.misc import AlgoUtils, BytesUtils, IntegerUtils
+from bip_utils.utils.misc import AlgoUtils, BytesUtils, IntegerUtils, MemoizedMethod
 
 
 class ElectrumV1:
@@ -198,7 +197,7 @@ class ElectrumV1:
                 if self.IsPublicOnly()
                 else self.GetPrivateKey(change_idx, addr_idx).PublicKey())
 
-    @lru_cache()
+    @MemoizedMethod
     def GetAddress(self,
                    change_idx: int,
                    addr_idx: int) -> str:
@@ -220,7 +219,7 @@ class ElectrumV1:
                                    net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
                                    pub_key_mode=P2PKHPubKeyModes.UNCOMPRESSED)
 
-    @lru_cache()
+    @MemoizedMethod
     def __DerivePrivateKey(self,
                            change_idx: int,
                            addr_idx: int) -> IPrivateKey:
@@ -246,7 +245,7 @@ class ElectrumV1:
             IntegerUtils.ToBytes(priv_key_int, Secp256k1PrivateKey.Length())
         )
 
-    @lru_cache()
+    @MemoizedMethod
     def __DerivePublicKey(self,
                           change_idx: int,
                           addr_idx: int) -> IPublicKey:
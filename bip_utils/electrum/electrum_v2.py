@@ -24,12 +24,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import lru_cache
 from typing import Union
 
 from bip_utils.addr import P2PKHAddr, P2WPKHAddr
 from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32PrivateKey, Bip32PublicKey, Bip32Slip10Secp256k1
 from bip_utils.coin_conf import CoinsConf
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class ElectrumV2Base(ABC):
@@ -209,7 +209,7 @@ class ElectrumV2Standard(ElectrumV2Base):
         """
         return self.__DeriveKey(change_idx, addr_idx).PublicKey()
 
-    @lru_cache()
+    @MemoizedMethod
     def GetAddress(self,
                    change_idx: Union[int, Bip32KeyIndex],
                    addr_idx: Union[int, Bip32KeyIndex]) -> str:
@@ -231,7 +231,7 @@ class ElectrumV2Standard(ElectrumV2Base):
         return P2PKHAddr.EncodeKey(self.GetPublicKey(change_idx, addr_idx).KeyObject(),
                                    net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"))
 
-    @lru_cache()
+    @MemoizedMethod
     def __DeriveKey(self,
                     change_idx: Union[int, Bip32KeyIndex],
                     addr_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
@@ -312,7 +312,7 @@ class ElectrumV2Segwit(ElectrumV2Base):
         """
         return self.__DeriveKey(change_idx, addr_idx).PublicKey()
 
-    @lru_cache()
+    @MemoizedMethod
     def GetAddress(self,
                    change_idx: Union[int, Bip32KeyIndex],
                    addr_idx: Union[int, Bip32KeyIndex]) -> str:
@@ -334,7 +334,7 @@ class ElectrumV2Segwit(ElectrumV2Base):
         return P2WPKHAddr.EncodeKey(self.GetPublicKey(change_idx, addr_idx).KeyObject(),
                                     hrp=CoinsConf.BitcoinMainNet.ParamByKey("p2wpkh_hrp"))
 
-    @lru_cache()
+    @MemoizedMethod
     def __DeriveKey(self,
                     change_idx: Union[int, Bip32KeyIndex],
                     addr_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
@@ -21,7 +21,6 @@
 """Module for Electrum v1 mnemonic utility classes."""
 
 # Imports
-import os
 from typing import Tuple
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import ElectrumV1Languages, ElectrumV1MnemonicConst
@@ -62,7 +61,7 @@ class ElectrumV1WordsListGetter(MnemonicWordsListGetterBase):
     @staticmethod
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the specified language file name, relative to the package root.
 
         Args:
             lang (Bip39Languages): Language
@@ -70,8 +69,7 @@ class ElectrumV1WordsListGetter(MnemonicWordsListGetterBase):
         Returns:
             str: Language file name
         """
-        return os.path.join(os.path.dirname(__file__),
-                            ElectrumV1MnemonicConst.LANGUAGE_FILES[lang])
+        return f"electrum/mnemonic_v1/{ElectrumV1MnemonicConst.LANGUAGE_FILES[lang]}"
 
 
 class ElectrumV1WordsListFinder(MnemonicWordsListFinderBase):
@@ -21,13 +21,12 @@
 """Module for Electrum v2 mnemonic seed generation."""
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import ElectrumV2Languages, ElectrumV2Mnemonic
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_validator import ElectrumV2MnemonicValidator
-from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicSeedGeneratorBase
 
 
 class ElectrumV2SeedGeneratorConst:
@@ -39,7 +38,7 @@ class ElectrumV2SeedGeneratorConst:
     SEED_PBKDF2_ROUNDS: int = 2048
 
 
-class ElectrumV2SeedGenerator:
+class ElectrumV2SeedGenerator(MnemonicSeedGeneratorBase):
     """
     Electrum seed generator class (v2).
     It generates the seed from a mnemonic.
@@ -65,18 +64,26 @@ class ElectrumV2SeedGenerator:
                            if isinstance(mnemonic, str)
                            else mnemonic)
 
-    def Generate(self,
-                 passphrase: str = "") -> bytes:
+    def _PasswordAndSalt(self,
+                         passphrase: str) -> Tuple[Union[bytes, str], str]:
         """
-        Generate the seed using the specified passphrase.
+        Get the PBKDF2 password and salt for the specified passphrase.
 
         Args:
-            passphrase (str, optional): Passphrase, empty if not specified
+            passphrase (str): Passphrase
 
         Returns:
-            bytes: Generated seed
+            tuple[bytes or str, str]: Password (index 0) and salt (index 1)
         """
         salt = StringUtils.NormalizeNfkd(ElectrumV2SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
-                                          salt,
-                                          ElectrumV2SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+        return self.m_mnemonic.ToStr(), salt
+
+    @staticmethod
+    def _Pbkdf2Rounds() -> int:
+        """
+        Get the number of PBKDF2 rounds.
+
+        Returns:
+            int: Number of PBKDF2 rounds
+        """
+        return ElectrumV2SeedGeneratorConst.SEED_PBKDF2_ROUNDS
@@ -1,4 +1,30 @@
-from bip_utils.monero.conf.monero_coin_conf import MoneroCoinConf
-from bip_utils.monero.conf.monero_coins import MoneroCoins
-from bip_utils.monero.conf.monero_conf import MoneroConf
-from bip_utils.monero.conf.monero_conf_getter import MoneroConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.monero.conf.monero_coin_conf import MoneroCoinConf
+    from bip_utils.monero.conf.monero_coins import MoneroCoins
+    from bip_utils.monero.conf.monero_conf import MoneroConf
+    from bip_utils.monero.conf.monero_conf_getter import MoneroConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.monero.conf.monero_coin_conf": ("MoneroCoinConf",),
+    "bip_utils.monero.conf.monero_coins": ("MoneroCoins",),
+    "bip_utils.monero.conf.monero_conf": ("MoneroConf",),
+    "bip_utils.monero.conf.monero_conf_getter": ("MoneroConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -21,21 +21,23 @@
 """Module for getting Monero coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.monero.conf.monero_coin_conf import MoneroCoinConf
 from bip_utils.monero.conf.monero_coins import MoneroCoins
-from bip_utils.monero.conf.monero_conf import MoneroConf
 
 
 class MoneroConfGetterConst:
     """Class container for Monero configuration getter constants."""
 
-    # Map from MoneroCoins to configuration classes
-    COIN_TO_CONF: Dict[MoneroCoins, MoneroCoinConf] = {
-        MoneroCoins.MONERO_MAINNET: MoneroConf.MainNet,
-        MoneroCoins.MONERO_STAGENET: MoneroConf.StageNet,
-        MoneroCoins.MONERO_TESTNET: MoneroConf.TestNet,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.monero.conf.monero_conf"
+    # Map from MoneroCoins to configuration names in MoneroConf
+    COIN_TO_CONF_NAME: Dict[MoneroCoins, str] = {
+        MoneroCoins.MONERO_MAINNET: "MainNet",
+        MoneroCoins.MONERO_STAGENET: "StageNet",
+        MoneroCoins.MONERO_TESTNET: "TestNet",
     }
 
 
@@ -49,6 +51,7 @@ class MoneroConfGetter:
     def GetConfig(coin_type: MoneroCoins) -> MoneroCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (MoneroCoins): Coin type
@@ -61,4 +64,5 @@ class MoneroConfGetter:
         """
         if not isinstance(coin_type, MoneroCoins):
             raise TypeError("Coin type is not an enumerative of MoneroCoins")
-        return MoneroConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(MoneroConfGetterConst.CONF_MODULE).MoneroConf
+        return getattr(conf_cls, MoneroConfGetterConst.COIN_TO_CONF_NAME[coin_type])
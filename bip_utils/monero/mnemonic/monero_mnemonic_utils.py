@@ -21,7 +21,6 @@
 """Module for Monero mnemonic utility classes."""
 
 # Imports
-import os
 from typing import List, Tuple
 
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonicConst
@@ -63,7 +62,7 @@ class MoneroWordsListGetter(MnemonicWordsListGetterBase):
     @staticmethod
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the specified language file name, relative to the package root.
 
         Args:
             lang (MnemonicLanguages): Language
@@ -71,8 +70,7 @@ class MoneroWordsListGetter(MnemonicWordsListGetterBase):
         Returns:
             str: Language file name
         """
-        return os.path.join(os.path.dirname(__file__),
-                            MoneroMnemonicConst.LANGUAGE_FILES[lang])
+        return f"monero/mnemonic/{MoneroMnemonicConst.LANGUAGE_FILES[lang]}"
 
 
 class MoneroWordsListFinder(MnemonicWordsListFinderBase):
@@ -23,7 +23,6 @@
 # Imports
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Optional, Union
 
 from bip_utils.addr import XmrIntegratedAddrEncoder
@@ -33,6 +32,7 @@ from bip_utils.monero.monero_ex import MoneroKeyError
 from bip_utils.monero.monero_keys import MoneroPrivateKey, MoneroPublicKey
 from bip_utils.monero.monero_subaddr import MoneroSubaddress
 from bip_utils.utils.crypto import Kekkak256
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class Monero:
@@ -227,7 +227,7 @@ class Monero:
         """
         return self.m_pub_vkey
 
-    @lru_cache()
+    @MemoizedMethod
     def IntegratedAddress(self,
                           payment_id: bytes) -> str:
         """
@@ -244,7 +244,7 @@ class Monero:
                                                   net_ver=self.m_coin_conf.IntegratedAddrNetVersion(),
                                                   payment_id=payment_id)
 
-    @lru_cache()
+    @MemoizedMethod
     def PrimaryAddress(self) -> str:
         """
         Return the primary address.
@@ -256,7 +256,7 @@ class Monero:
                                                    0,
                                                    self.m_coin_conf.AddrNetVersion())
 
-    @lru_cache()
+    @MemoizedMethod
     def Subaddress(self,
                    minor_idx: int,
                    major_idx: int = 0) -> str:
@@ -23,12 +23,11 @@
 # Imports
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Union
 
 from bip_utils.ecc import Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey, IPoint, IPrivateKey, IPublicKey
 from bip_utils.monero.monero_ex import MoneroKeyError
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import DataBytes, MemoizedMethod
 
 
 class MoneroPublicKey:
@@ -114,7 +113,7 @@ class MoneroPublicKey:
         """
         return self.m_pub_key
 
-    @lru_cache()
+    @MemoizedMethod
     def RawCompressed(self) -> DataBytes:
         """
         Return raw compressed public key.
@@ -124,7 +123,7 @@ class MoneroPublicKey:
         """
         return self.m_pub_key.RawCompressed()
 
-    @lru_cache()
+    @MemoizedMethod
     def RawUncompressed(self) -> DataBytes:
         """
         Return raw uncompressed public key.
@@ -236,7 +235,7 @@ class MoneroPrivateKey:
         """
         return self.m_priv_key
 
-    @lru_cache()
+    @MemoizedMethod
     def Raw(self) -> DataBytes:
         """
         Return raw private key.
@@ -246,7 +245,7 @@ class MoneroPrivateKey:
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKey(self) -> MoneroPublicKey:
         """
         Get the public key correspondent to the private one.
@@ -1,4 +1,30 @@
-from bip_utils.substrate.conf.substrate_coin_conf import SubstrateCoinConf
-from bip_utils.substrate.conf.substrate_coins import SubstrateCoins
-from bip_utils.substrate.conf.substrate_conf import SubstrateConf
-from bip_utils.substrate.conf.substrate_conf_getter import SubstrateConfGetter
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.substrate.conf.substrate_coin_conf import SubstrateCoinConf
+    from bip_utils.substrate.conf.substrate_coins import SubstrateCoins
+    from bip_utils.substrate.conf.substrate_conf import SubstrateConf
+    from bip_utils.substrate.conf.substrate_conf_getter import SubstrateConfGetter
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.substrate.conf.substrate_coin_conf": ("SubstrateCoinConf",),
+    "bip_utils.substrate.conf.substrate_coins": ("SubstrateCoins",),
+    "bip_utils.substrate.conf.substrate_conf": ("SubstrateConf",),
+    "bip_utils.substrate.conf.substrate_conf_getter": ("SubstrateConfGetter",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -21,32 +21,34 @@
 """Module for getting Substrate coins configuration."""
 
 # Imports
+import importlib
 from typing import Dict
 
 from bip_utils.substrate.conf.substrate_coin_conf import SubstrateCoinConf
 from bip_utils.substrate.conf.substrate_coins import SubstrateCoins
-from bip_utils.substrate.conf.substrate_conf import SubstrateConf
 
 
 class SubstrateConfGetterConst:
     """Class container for Substrate configuration getter constants."""
 
-    # Map from SubstrateCoins to configuration classes
-    COIN_TO_CONF: Dict[SubstrateCoins, SubstrateCoinConf] = {
-        SubstrateCoins.ACALA: SubstrateConf.Acala,
-        SubstrateCoins.BIFROST: SubstrateConf.Bifrost,
-        SubstrateCoins.CHAINX: SubstrateConf.ChainX,
-        SubstrateCoins.EDGEWARE: SubstrateConf.Edgeware,
-        SubstrateCoins.GENERIC: SubstrateConf.Generic,
-        SubstrateCoins.KARURA: SubstrateConf.Karura,
-        SubstrateCoins.KUSAMA: SubstrateConf.Kusama,
-        SubstrateCoins.MOONBEAM: SubstrateConf.Moonbeam,
-        SubstrateCoins.MOONRIVER: SubstrateConf.Moonriver,
-        SubstrateCoins.PHALA: SubstrateConf.Phala,
-        SubstrateCoins.PLASM: SubstrateConf.Plasm,
-        SubstrateCoins.POLKADOT: SubstrateConf.Polkadot,
-        SubstrateCoins.SORA: SubstrateConf.Sora,
-        SubstrateCoins.STAFI: SubstrateConf.Stafi,
+    # Module of the configuration class, imported when a configuration is requested for the first time
+    CONF_MODULE: str = "bip_utils.substrate.conf.substrate_conf"
+    # Map from SubstrateCoins to configuration names in SubstrateConf
+    COIN_TO_CONF_NAME: Dict[SubstrateCoins, str] = {
+        SubstrateCoins.ACALA: "Acala",
+        SubstrateCoins.BIFROST: "Bifrost",
+        SubstrateCoins.CHAINX: "ChainX",
+        SubstrateCoins.EDGEWARE: "Edgeware",
+        SubstrateCoins.GENERIC: "Generic",
+        SubstrateCoins.KARURA: "Karura",
+        SubstrateCoins.KUSAMA: "Kusama",
+        SubstrateCoins.MOONBEAM: "Moonbeam",
+        SubstrateCoins.MOONRIVER: "Moonriver",
+        SubstrateCoins.PHALA: "Phala",
+        SubstrateCoins.PLASM: "Plasm",
+        SubstrateCoins.POLKADOT: "Polkadot",
+        SubstrateCoins.SORA: "Sora",
+        SubstrateCoins.STAFI: "Stafi",
     }
 
 
@@ -60,6 +62,7 @@ class SubstrateConfGetter:
     def GetConfig(coin_type: SubstrateCoins) -> SubstrateCoinConf:
         """
         Get coin configuration.
+        The configurations are built the first time that one of them is requested.
 
         Args:
             coin_type (SubstrateCoins): Coin type
@@ -72,4 +75,5 @@ class SubstrateConfGetter:
         """
         if not isinstance(coin_type, SubstrateCoins):
             raise TypeError("Coin type is not an enumerative of SubstrateCoins")
-        return SubstrateConfGetterConst.COIN_TO_CONF[coin_type]
+        conf_cls = importlib.import_module(SubstrateConfGetterConst.CONF_MODULE).SubstrateConf
+        return getattr(conf_cls, SubstrateConfGetterConst.COIN_TO_CONF_NAME[coin_type])
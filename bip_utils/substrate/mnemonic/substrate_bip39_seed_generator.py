@@ -21,16 +21,15 @@
 """Module for Substrate mnemonic seed generation."""
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39 import Bip39Languages, Bip39MnemonicDecoder, IBip39SeedGenerator
 from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGeneratorConst
-from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicSeedGeneratorBase
 
 
-class SubstrateBip39SeedGenerator(IBip39SeedGenerator):
+class SubstrateBip39SeedGenerator(MnemonicSeedGeneratorBase, IBip39SeedGenerator):
     """
     Substrate BIP39 seed generator class. It implements a variant for generating seed introduced by Polkadot.
     Reference: https://github.com/paritytech/substrate-bip39
@@ -55,18 +54,25 @@ class SubstrateBip39SeedGenerator(IBip39SeedGenerator):
 
         self.m_entropy_bytes = Bip39MnemonicDecoder(lang).Decode(mnemonic)
 
-    def Generate(self,
-                 passphrase: str = "") -> bytes:
+    def _PasswordAndSalt(self,
+                         passphrase: str) -> Tuple[Union[bytes, str], str]:
         """
-        Generate the seed using the specified passphrase.
+        Get the PBKDF2 password and salt for the specified passphrase.
 
         Args:
-            passphrase (str, optional): Passphrase, empty if not specified
+            passphrase (str): Passphrase
 
         Returns:
-            bytes: Generated seed
+            tuple[bytes or str, str]: Password (index 0) and salt (index 1)
         """
-        salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_entropy_bytes,
-                                          salt,
-                                          Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+        return self.m_entropy_bytes, StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
+
+    @staticmethod
+    def _Pbkdf2Rounds() -> int:
+        """
+        Get the number of PBKDF2 rounds.
+
+        Returns:
+            int: Number of PBKDF2 rounds
+        """
+        return Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS
@@ -23,14 +23,13 @@
 # Imports
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Union
 
 from bip_utils.addr import SubstrateSr25519AddrEncoder
 from bip_utils.ecc import IPrivateKey, IPublicKey, Sr25519PrivateKey, Sr25519PublicKey
 from bip_utils.substrate.conf import SubstrateCoinConf
 from bip_utils.substrate.substrate_ex import SubstrateKeyError
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import DataBytes, MemoizedMethod
 
 
 class SubstratePublicKey:
@@ -105,7 +104,7 @@ class SubstratePublicKey:
         """
         return self.m_pub_key
 
-    @lru_cache()
+    @MemoizedMethod
     def RawCompressed(self) -> DataBytes:
         """
         Return raw compressed public key.
@@ -115,7 +114,7 @@ class SubstratePublicKey:
         """
         return self.m_pub_key.RawCompressed()
 
-    @lru_cache()
+    @MemoizedMethod
     def RawUncompressed(self) -> DataBytes:
         """
         Return raw uncompressed public key.
@@ -125,7 +124,7 @@ class SubstratePublicKey:
         """
         return self.m_pub_key.RawUncompressed()
 
-    @lru_cache()
+    @MemoizedMethod
     def ToAddress(self) -> str:
         """
         Return the address correspondent to the public key.
@@ -228,7 +227,7 @@ class SubstratePrivateKey:
         """
         return self.m_priv_key
 
-    @lru_cache()
+    @MemoizedMethod
     def Raw(self) -> DataBytes:
         """
         Return raw private key.
@@ -238,7 +237,7 @@ class SubstratePrivateKey:
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoizedMethod
     def PublicKey(self) -> SubstratePublicKey:
         """
         Get the public key correspondent to the private one.
@@ -24,7 +24,6 @@
 from __future__ import annotations
 
 import re
-from functools import lru_cache
 from typing import Dict, Iterator, List, Optional, Sequence, Type, Union
 
 from bip_utils.substrate.scale import (
@@ -33,6 +32,7 @@ from bip_utils.substrate.scale import (
 )
 from bip_utils.substrate.substrate_ex import SubstratePathError
 from bip_utils.utils.crypto import Blake2b256
+from bip_utils.utils.misc import MemoizedMethod
 
 
 class SubstratePathConst:
@@ -103,7 +103,7 @@ class SubstratePathElem:
         """
         return not self.IsHard()
 
-    @lru_cache()
+    @MemoizedMethod
     def ChainCode(self) -> bytes:
         """
         Return the chain code.
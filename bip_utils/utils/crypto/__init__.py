@@ -1,11 +1,48 @@
-from bip_utils.utils.crypto.aes_ecb import AesEcbDecrypter, AesEcbEncrypter
-from bip_utils.utils.crypto.blake2 import Blake2b, Blake2b32, Blake2b40, Blake2b160, Blake2b224, Blake2b256, Blake2b512
-from bip_utils.utils.crypto.chacha20_poly1305 import ChaCha20Poly1305
-from bip_utils.utils.crypto.crc import Crc32, XModemCrc
-from bip_utils.utils.crypto.hash160 import Hash160
-from bip_utils.utils.crypto.hmac import HmacSha256, HmacSha512
-from bip_utils.utils.crypto.pbkdf2 import Pbkdf2HmacSha512
-from bip_utils.utils.crypto.ripemd import Ripemd160
-from bip_utils.utils.crypto.scrypt import Scrypt
-from bip_utils.utils.crypto.sha2 import DoubleSha256, Sha256, Sha512, Sha512_256
-from bip_utils.utils.crypto.sha3 import Kekkak256, Sha3_256
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.utils.crypto.aes_ecb import AesEcbDecrypter, AesEcbEncrypter
+    from bip_utils.utils.crypto.blake2 import (
+        Blake2b, Blake2b32, Blake2b40, Blake2b160, Blake2b224, Blake2b256, Blake2b512
+    )
+    from bip_utils.utils.crypto.chacha20_poly1305 import ChaCha20Poly1305
+    from bip_utils.utils.crypto.crc import Crc32, XModemCrc
+    from bip_utils.utils.crypto.hash160 import Hash160
+    from bip_utils.utils.crypto.hmac import HmacSha256, HmacSha512, HmacSha512Context
+    from bip_utils.utils.crypto.pbkdf2 import Pbkdf2HmacSha512
+    from bip_utils.utils.crypto.ripemd import Ripemd160
+    from bip_utils.utils.crypto.scrypt import Scrypt
+    from bip_utils.utils.crypto.sha2 import DoubleSha256, Sha256, Sha512, Sha512_256
+    from bip_utils.utils.crypto.sha3 import Kekkak256, Sha3_256
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.utils.crypto.aes_ecb": ("AesEcbDecrypter", "AesEcbEncrypter"),
+    "bip_utils.utils.crypto.blake2": (
+        "Blake2b", "Blake2b32", "Blake2b40", "Blake2b160", "Blake2b224", "Blake2b256", "Blake2b512",
+    ),
+    "bip_utils.utils.crypto.chacha20_poly1305": ("ChaCha20Poly1305",),
+    "bip_utils.utils.crypto.crc": ("Crc32", "XModemCrc"),
+    "bip_utils.utils.crypto.hash160": ("Hash160",),
+    "bip_utils.utils.crypto.hmac": ("HmacSha256", "HmacSha512", "HmacSha512Context"),
+    "bip_utils.utils.crypto.pbkdf2": ("Pbkdf2HmacSha512",),
+    "bip_utils.utils.crypto.ripemd": ("Ripemd160",),
+    "bip_utils.utils.crypto.scrypt": ("Scrypt",),
+    "bip_utils.utils.crypto.sha2": ("DoubleSha256", "Sha256", "Sha512", "Sha512_256"),
+    "bip_utils.utils.crypto.sha3": ("Kekkak256", "Sha3_256"),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -116,3 +116,53 @@ class HmacSha512:
             int: Digest size in bytes
         """
         return hashlib.sha512().digest_size
+
+
+class HmacSha512Context:
+    """
+    HMAC-SHA512 context class.
+    It computes digests using HMAC-SHA512 algorithm with a fixed key.
+    The inner and outer padded states are computed only once at construction and copied for each message,
+    which is faster than computing the digest from scratch when the same key is used many times.
+    """
+
+    m_hmac: hmac.HMAC
+
+    def __init__(self,
+                 key: Union[bytes, str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            key (str or bytes): Key
+        """
+        self.m_hmac = hmac.new(AlgoUtils.Encode(key), digestmod="sha512")
+
+    def Digest(self,
+               data: Union[bytes, str]) -> bytes:
+        """
+        Compute the digest of the specified data.
+
+        Args:
+            data (str or bytes): Data
+
+        Returns:
+            bytes: Computed digest
+        """
+        h = self.m_hmac.copy()
+        h.update(AlgoUtils.Encode(data))
+        return h.digest()
+
+    def DigestHalves(self,
+                     data: Union[bytes, str]) -> Tuple[bytes, bytes]:
+        """
+        Compute the digest of the specified data and return it split into two halves.
+
+        Args:
+            data (str or bytes): Data
+
+        Returns:
+            tuple[bytes, bytes]: Computed digest left part (index 0) and right part (index 1)
+        """
+        digest_bytes = self.Digest(data)
+        return digest_bytes[:HmacSha512.DigestSize() // 2], digest_bytes[HmacSha512.DigestSize() // 2:]
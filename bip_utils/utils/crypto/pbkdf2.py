@@ -22,16 +22,28 @@
 
 # Imports
 import hashlib
-from typing import Optional, Union
-
-from Crypto.Hash import SHA512
-from Crypto.Protocol.KDF import PBKDF2
+import os
+from collections import deque
+from concurrent import futures
+from typing import Deque, Iterable, Iterator, Optional, Tuple, Union
 
 from bip_utils.utils.misc import AlgoUtils
 
 
 HASHLIB_USE_PBKDF2_SHA512: bool = hasattr(hashlib, "pbkdf2_hmac")   # For future changes
 
+# Import Cryptodome only if needed, since it is slow to import
+if not HASHLIB_USE_PBKDF2_SHA512:
+    from Crypto.Hash import SHA512
+    from Crypto.Protocol.KDF import PBKDF2
+
+
+class Pbkdf2HmacSha512Const:
+    """Class container for PBKDF2 HMAC-SHA512 constants."""
+
+    # Default number of pending derivations for each worker, when deriving many keys
+    DEF_PENDING_PER_WORKER: int = 4
+
 
 class Pbkdf2HmacSha512:
     """
@@ -64,3 +76,78 @@ class Pbkdf2HmacSha512:
                       dklen or SHA512.digest_size,
                       count=itr_num,
                       hmac_hash_module=SHA512)
+
+    @classmethod
+    def DeriveKeys(cls,
+                   passwords_salts: Iterable[Tuple[Union[bytes, str], Union[bytes, str]]],
+                   itr_num: int,
+                   dklen: Optional[int] = None,
+                   workers: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Derive many keys using a pool of threads, since hashlib releases the GIL while deriving.
+        Passwords and salts are consumed lazily in the calling thread, so they can be generated (and validated)
+        on the fly, and keys are yielded in the same order. If getting a password and salt raises, the error is
+        raised in its position, i.e. after yielding the keys of all the previous ones.
+        The number of pending derivations is bounded, so memory usage does not depend on the number of keys
+        if they are consumed as they come.
+
+        Args:
+            passwords_salts (iterable[tuple]): Password and salt (str or bytes) for each key
+            itr_num (int)                    : Iteration number
+            dklen (int, optional)            : Length of the derived keys (default: SHA-512 output length)
+            workers (int, optional)          : Number of worker threads (default: number of CPUs)
+
+        Returns:
+            Iterator: Derived keys
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"Invalid number of workers ({workers})")
+        return cls.__DeriveKeys(passwords_salts, itr_num, dklen, workers or os.cpu_count() or 1)
+
+    @classmethod
+    def __DeriveKeys(cls,
+                     passwords_salts: Iterable[Tuple[Union[bytes, str], Union[bytes, str]]],
+                     itr_num: int,
+                     dklen: Optional[int],
+                     workers: int) -> Iterator[bytes]:
+        """
+        Derive many keys using a pool of threads.
+
+        Args:
+            passwords_salts (iterable[tuple]): Password and salt (str or bytes) for each key
+            itr_num (int)                    : Iteration number
+            dklen (int)                      : Length of the derived keys, None for SHA-512 output length
+            workers (int)                    : Number of worker threads
+
+        Returns:
+            Iterator: Derived keys
+        """
+        max_pending = Pbkdf2HmacSha512Const.DEF_PENDING_PER_WORKER * workers
+
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[futures.Future] = deque()
+            passwords_salts_iter = iter(passwords_salts)
+            try:
+                while True:
+                    try:
+                        password, salt = next(passwords_salts_iter)
+                    except StopIteration:
+                        break
+                    except Exception as ex:     # pylint: disable=broad-except
+                        # Queue the error, so that it's raised after yielding the keys of the previous passwords
+                        error_future: futures.Future = futures.Future()
+                        error_future.set_exception(ex)
+                        pending.append(error_future)
+                        break
+                    # Wait for the oldest key if too many are pending
+                    if len(pending) >= max_pending:
+                        yield pending.popleft().result()
+                    pending.append(executor.submit(cls.DeriveKey, password, salt, itr_num, dklen))
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
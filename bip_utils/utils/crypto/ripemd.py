@@ -21,13 +21,28 @@
 """Module for RIPEMD algorithm."""
 
 # Imports
+import hashlib
 from typing import Union
 
-from Crypto.Hash import RIPEMD160
-
 from bip_utils.utils.misc import AlgoUtils
 
 
+def _HashlibHasRipemd160() -> bool:
+    # RIPEMD160 may be listed but not usable, depending on the OpenSSL configuration
+    try:
+        hashlib.new("ripemd160")
+    except ValueError:
+        return False
+    return True
+
+
+HASHLIB_USE_RIPEMD160: bool = _HashlibHasRipemd160()
+
+# Import Cryptodome only if needed, since it is slow to import
+if not HASHLIB_USE_RIPEMD160:
+    from Crypto.Hash import RIPEMD160
+
+
 class Ripemd160:
     """
     RIPEMD160 class.
@@ -45,6 +60,9 @@ class Ripemd160:
         Returns:
             bytes: Computed digest
         """
+        if HASHLIB_USE_RIPEMD160:
+            return hashlib.new("ripemd160", AlgoUtils.Encode(data)).digest()
+        # Use Cryptodome if not implemented in hashlib
         return RIPEMD160.new(AlgoUtils.Encode(data)).digest()
 
     @staticmethod
@@ -55,4 +73,6 @@ class Ripemd160:
         Returns:
             int: Digest size in bytes
         """
-        return RIPEMD160.digest_size
+        return (hashlib.new("ripemd160").digest_size
+                if HASHLIB_USE_RIPEMD160
+                else RIPEMD160.digest_size)
@@ -24,13 +24,15 @@
 import hashlib
 from typing import Any, Union
 
-from Crypto.Hash import SHA512
-
 from bip_utils.utils.misc import AlgoUtils
 
 
 HASHLIB_USE_SHA512_256: bool = "sha512_256" in hashlib.algorithms_available
 
+# Import Cryptodome only if needed, since it is slow to import
+if not HASHLIB_USE_SHA512_256:
+    from Crypto.Hash import SHA512
+
 
 class Sha256:
     """
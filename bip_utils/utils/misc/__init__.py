@@ -1,8 +1,44 @@
-from bip_utils.utils.misc.algo import AlgoUtils
-from bip_utils.utils.misc.base32 import Base32Decoder, Base32Encoder
-from bip_utils.utils.misc.bit import BitUtils
-from bip_utils.utils.misc.bytes import BytesUtils
-from bip_utils.utils.misc.cbor_indefinite_len_array import CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
-from bip_utils.utils.misc.data_bytes import DataBytes
-from bip_utils.utils.misc.integer import IntegerUtils
-from bip_utils.utils.misc.string import StringUtils
+# Imports
+from typing import TYPE_CHECKING, Any, List
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+if TYPE_CHECKING:
+    from bip_utils.utils.misc.algo import AlgoUtils
+    from bip_utils.utils.misc.base32 import Base32Decoder, Base32Encoder
+    from bip_utils.utils.misc.bit import BitUtils
+    from bip_utils.utils.misc.bytes import BytesUtils
+    from bip_utils.utils.misc.cbor_indefinite_len_array import (
+        CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
+    )
+    from bip_utils.utils.misc.data_bytes import DataBytes
+    from bip_utils.utils.misc.integer import IntegerUtils
+    from bip_utils.utils.misc.memo import MemoizedMethod
+    from bip_utils.utils.misc.string import StringUtils
+
+
+# Public names, imported from the specified modules when accessed for the first time
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, {
+    "bip_utils.utils.misc.algo": ("AlgoUtils",),
+    "bip_utils.utils.misc.base32": ("Base32Decoder", "Base32Encoder"),
+    "bip_utils.utils.misc.bit": ("BitUtils",),
+    "bip_utils.utils.misc.bytes": ("BytesUtils",),
+    "bip_utils.utils.misc.cbor_indefinite_len_array": (
+        "CborIndefiniteLenArrayDecoder", "CborIndefiniteLenArrayEncoder",
+    ),
+    "bip_utils.utils.misc.data_bytes": ("DataBytes",),
+    "bip_utils.utils.misc.integer": ("IntegerUtils",),
+    "bip_utils.utils.misc.memo": ("MemoizedMethod",),
+    "bip_utils.utils.misc.string": ("StringUtils",),
+})
+
+__all__ = _LAZY_IMPORTER.Names()
+
+
+def __getattr__(name: str) -> Any:
+    return _LAZY_IMPORTER.GetAttr(name)
+
+
+def __dir__() -> List[str]:
+    return _LAZY_IMPORTER.Dir()
@@ -33,6 +33,8 @@ class DataBytes:
     It allows to get bytes in different formats.
     """
 
+    __slots__ = ("m_data_bytes",)
+
     m_data_bytes: bytes
 
     def __init__(self,
@@ -0,0 +1,95 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for lazily importing the public names of a package."""
+
+# Imports
+import importlib
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+class LazyImporter:
+    """
+    Lazy importer class.
+    It allows a package to import its public names only when they are accessed for the first time, by means of a
+    module-level __getattr__ (PEP 562). Once imported, a name is stored in the package like a normal attribute.
+    """
+
+    m_pkg_name: str
+    m_name_to_mod: Dict[str, str]
+
+    def __init__(self,
+                 pkg_name: str,
+                 mod_to_names: Dict[str, Tuple[str, ...]]) -> None:
+        """
+        Construct class.
+
+        Args:
+            pkg_name (str)     : Package name
+            mod_to_names (dict): Module names and the public names imported from each of them
+        """
+        self.m_pkg_name = pkg_name
+        self.m_name_to_mod = {
+            name: mod_name
+            for mod_name, names in mod_to_names.items()
+            for name in names
+        }
+
+    def Names(self) -> List[str]:
+        """
+        Get the public names.
+
+        Returns:
+            list[str]: Public names
+        """
+        return list(self.m_name_to_mod.keys())
+
+    def GetAttr(self,
+                name: str) -> Any:
+        """
+        Get a public name, importing it if not already done.
+
+        Args:
+            name (str): Name
+
+        Returns:
+            Any: Imported object
+
+        Raises:
+            AttributeError: If the name is not a public name of the package
+        """
+        try:
+            mod_name = self.m_name_to_mod[name]
+        except KeyError as ex:
+            raise AttributeError(f"module '{self.m_pkg_name}' has no attribute '{name}'") from ex
+
+        value = getattr(importlib.import_module(mod_name), name)
+        setattr(sys.modules[self.m_pkg_name], name, value)
+        return value
+
+    def Dir(self) -> List[str]:
+        """
+        Get the attributes of the package, including the public names not imported yet.
+
+        Returns:
+            list[str]: Attribute names
+        """
+        return sorted(set(vars(sys.modules[self.m_pkg_name])) | set(self.m_name_to_mod))
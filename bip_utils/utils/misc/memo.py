@@ -0,0 +1,240 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for per-instance memoization of methods."""
+
+# Imports
+from __future__ import annotations
+
+from collections import OrderedDict
+from types import MethodType
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar, overload
+
+
+RetType = TypeVar("RetType")
+
+
+class MemoizedMethodConst:
+    """Class container for memoized method constants."""
+
+    # Prefix of the instance attribute where the result is stored
+    ATTR_PREFIX: str = "_memo_"
+    # Maximum number of results stored for each instance, for methods with arguments
+    ARGS_MAX_SIZE: int = 128
+
+
+class _MemoUnset:
+    """Sentinel class for memoized values not computed yet."""
+
+
+class MemoizedMethod(Generic[RetType]):
+    """
+    Memoized method class.
+    It decorates a method and stores its results in an attribute of the instance, so that they are freed
+    together with the object (differently from functools.lru_cache) and can be wiped when not needed anymore.
+    For methods with arguments, the most recent results are kept in a bounded per-instance cache.
+    Classes defining __slots__ shall include the attribute names returned by the AttrNames method.
+    """
+
+    m_func: Callable[..., RetType]
+    m_has_args: bool
+    m_attr_name: str
+
+    # Attribute names of memoized methods for each class, cached for wiping
+    _attr_names: Dict[type, Tuple[str, ...]] = {}
+
+    @classmethod
+    def AttrNames(cls,
+                  owner_name: str,
+                  *func_names: str) -> Tuple[str, ...]:
+        """
+        Get the instance attribute names used for storing the results of the specified methods.
+        It can be used in the class body for defining __slots__.
+
+        Args:
+            owner_name (str): Name of the class defining the methods
+            func_names (str): Method names
+
+        Returns:
+            tuple[str]: Attribute names
+        """
+        return tuple(cls.__AttrName(owner_name, func_name) for func_name in func_names)
+
+    @classmethod
+    def Wipe(cls,
+             instance: Any) -> None:
+        """
+        Wipe all the memoized results of the specified instance.
+
+        Args:
+            instance (object): Instance
+        """
+        for attr_name in cls.__InstanceAttrNames(type(instance)):
+            try:
+                delattr(instance, attr_name)
+            except AttributeError:
+                pass
+
+    def __init__(self,
+                 func: Callable[..., RetType]) -> None:
+        """
+        Construct class.
+
+        Args:
+            func (function): Method to be memoized
+        """
+        self.m_func = func
+        self.m_has_args = func.__code__.co_argcount > 1
+        self.m_attr_name = ""
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self,
+                     owner: type,
+                     name: str) -> None:
+        """
+        Set the attribute name from the owner class and method name.
+
+        Args:
+            owner (type): Owner class
+            name (str)  : Method name
+        """
+        self.m_attr_name = self.__AttrName(owner.__name__, name)
+
+    @overload
+    def __get__(self,
+                instance: None,
+                owner: Optional[Type[Any]] = None) -> MemoizedMethod[RetType]:
+        ...
+
+    @overload
+    def __get__(self,
+                instance: Any,
+                owner: Optional[Type[Any]] = None) -> Callable[..., RetType]:
+        ...
+
+    def __get__(self,
+                instance: Any,
+                owner: Optional[Type[Any]] = None) -> Any:
+        """
+        Get the method bound to the instance.
+
+        Args:
+            instance (object): Instance (None if accessed from the class)
+            owner (type)     : Owner class
+
+        Returns:
+            function: Bound method, or the object itself if accessed from the class
+        """
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self,
+                 instance: Any,
+                 *args: Any,
+                 **kwargs: Any) -> RetType:
+        """
+        Call the method, computing the result only if not already memoized.
+
+        Args:
+            instance (object): Instance
+            args (any)       : Method positional arguments
+            kwargs (any)     : Method keyword arguments
+
+        Returns:
+            Any: Method result
+        """
+        if self.m_has_args:
+            return self.__CallWithArgs(instance, args, kwargs)
+
+        value: Any = getattr(instance, self.m_attr_name, _MemoUnset)
+        if value is _MemoUnset:
+            value = self.m_func(instance)
+            setattr(instance, self.m_attr_name, value)
+        return value
+
+    def __CallWithArgs(self,
+                       instance: Any,
+                       args: Tuple[Any, ...],
+                       kwargs: Dict[str, Any]) -> RetType:
+        """
+        Call a method with arguments, computing the result only if not already memoized.
+
+        Args:
+            instance (object): Instance
+            args (tuple)     : Method positional arguments
+            kwargs (dict)    : Method keyword arguments
+
+        Returns:
+            Any: Method result
+        """
+        results = getattr(instance, self.m_attr_name, None)
+        if results is None:
+            results = OrderedDict()
+            setattr(instance, self.m_attr_name, results)
+
+        key = args + tuple(sorted(kwargs.items())) if kwargs else args
+        try:
+            results.move_to_end(key)
+            return results[key]
+        except KeyError:
+            value = self.m_func(instance, *args, **kwargs)
+            results[key] = value
+            if len(results) > MemoizedMethodConst.ARGS_MAX_SIZE:
+                results.popitem(last=False)
+            return value
+
+    @staticmethod
+    def __AttrName(owner_name: str,
+                   func_name: str) -> str:
+        """
+        Get the instance attribute name for the specified method.
+
+        Args:
+            owner_name (str): Owner class name
+            func_name (str) : Method name
+
+        Returns:
+            str: Attribute name
+        """
+        return f"{MemoizedMethodConst.ATTR_PREFIX}{owner_name}_{func_name}"
+
+    @classmethod
+    def __InstanceAttrNames(cls,
+                            instance_cls: type) -> Tuple[str, ...]:
+        """
+        Get all the memoized attribute names of the specified class, including the base ones.
+
+        Args:
+            instance_cls (type): Class
+
+        Returns:
+            tuple[str]: Attribute names
+        """
+        attr_names = cls._attr_names.get(instance_cls)
+        if attr_names is None:
+            attr_names = tuple(
+                attr.m_attr_name
+                for klass in instance_cls.__mro__
+                for attr in vars(klass).values()
+                if isinstance(attr, MemoizedMethod)
+            )
+            cls._attr_names[instance_cls] = attr_names
+        return attr_names
@@ -3,8 +3,10 @@ from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
 from bip_utils.utils.mnemonic.mnemonic_decoder_base import MnemonicDecoderBase
 from bip_utils.utils.mnemonic.mnemonic_encoder_base import MnemonicEncoderBase
 from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
+from bip_utils.utils.mnemonic.mnemonic_seed_generator_base import MnemonicSeedGeneratorBase
 from bip_utils.utils.mnemonic.mnemonic_utils import (
-    MnemonicUtils, MnemonicWordsList, MnemonicWordsListFileReader, MnemonicWordsListFinderBase,
+    MnemonicLanguagesIndex, MnemonicUtils, MnemonicWordsList, MnemonicWordsListFileReader, MnemonicWordsListFinderBase,
     MnemonicWordsListGetterBase
 )
 from bip_utils.utils.mnemonic.mnemonic_validator import MnemonicValidator
+from bip_utils.utils.mnemonic.mnemonic_words_bundle import MnemonicWordsBundle
@@ -0,0 +1,146 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for mnemonic seed generator base class."""
+
+# Imports
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from bip_utils.utils.crypto import Pbkdf2HmacSha512
+from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
+from bip_utils.utils.mnemonic.mnemonic_utils import MnemonicUtils
+
+
+class MnemonicSeedGeneratorBase(ABC):
+    """
+    Mnemonic seed generator base class.
+    It generates the seed using PBKDF2 HMAC-SHA512, child classes only provide the password and salt.
+    """
+
+    @abstractmethod
+    def __init__(self,
+                 mnemonic: Union[str, Mnemonic],
+                 lang: Optional[MnemonicLanguages]) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (str or Mnemonic object) : Mnemonic
+            lang (MnemonicLanguages, optional): Language, None for automatic detection
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+
+    def Generate(self,
+                 passphrase: str = "") -> bytes:
+        """
+        Generate the seed using the specified passphrase.
+
+        Args:
+            passphrase (str, optional): Passphrase, empty if not specified
+
+        Returns:
+            bytes: Generated seed
+        """
+        password, salt = self._PasswordAndSalt(passphrase)
+        return Pbkdf2HmacSha512.DeriveKey(password, salt, self._Pbkdf2Rounds())
+
+    @classmethod
+    def GenerateBatch(cls,
+                      mnemonics: Iterable[Union[str, Mnemonic]],
+                      passphrases: Union[str, Iterable[str]] = "",
+                      lang: Optional[MnemonicLanguages] = None,
+                      workers: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Generate the seeds of many mnemonics, computing PBKDF2 in parallel.
+        Mnemonics are validated lazily while iterating and seeds are yielded in the same order. If a mnemonic is not
+        valid, the error (containing its index) is raised after yielding the seeds of all the previous ones.
+
+        Args:
+            mnemonics (iterable)              : Mnemonics (str or Mnemonic objects)
+            passphrases (str or iterable[str]): Passphrase for each mnemonic, or the same passphrase for all of them
+            lang (MnemonicLanguages, optional): Language, None for automatic detection
+            workers (int, optional)           : Number of worker threads (default: number of CPUs)
+
+        Returns:
+            Iterator: Generated seeds
+
+        Raises:
+            MnemonicChecksumError: If the checksum of a mnemonic is not valid
+            ValueError: If a mnemonic is not valid, if the number of passphrases is different from the number of
+                        mnemonics or if the number of workers is not valid
+        """
+        return Pbkdf2HmacSha512.DeriveKeys(cls.__PasswordsAndSalts(mnemonics, passphrases, lang),
+                                           cls._Pbkdf2Rounds(),
+                                           workers=workers)
+
+    @classmethod
+    def __PasswordsAndSalts(cls,
+                            mnemonics: Iterable[Union[str, Mnemonic]],
+                            passphrases: Union[str, Iterable[str]],
+                            lang: Optional[MnemonicLanguages]) -> Iterator[Tuple[Union[bytes, str], str]]:
+        """
+        Validate mnemonics and get their PBKDF2 password and salt, lazily.
+
+        Args:
+            mnemonics (iterable)              : Mnemonics (str or Mnemonic objects)
+            passphrases (str or iterable[str]): Passphrase for each mnemonic, or the same passphrase for all of them
+            lang (MnemonicLanguages, optional): Language, None for automatic detection
+
+        Returns:
+            Iterator: Password (index 0) and salt (index 1) of each mnemonic
+
+        Raises:
+            MnemonicChecksumError: If the checksum of a mnemonic is not valid
+            ValueError: If a mnemonic is not valid or the number of passphrases is different from the number of
+                        mnemonics
+        """
+        for idx, (mnemonic, passphrase) in enumerate(MnemonicUtils.PairWithPassphrases(mnemonics, passphrases)):
+            try:
+                seed_gen = cls(mnemonic, lang)
+            except (MnemonicChecksumError, ValueError) as ex:
+                raise type(ex)(f"Invalid mnemonic at index {idx}: {ex}") from ex
+            yield seed_gen._PasswordAndSalt(passphrase)
+
+    @abstractmethod
+    def _PasswordAndSalt(self,
+                         passphrase: str) -> Tuple[Union[bytes, str], str]:
+        """
+        Get the PBKDF2 password and salt for the specified passphrase.
+
+        Args:
+            passphrase (str): Passphrase
+
+        Returns:
+            tuple[bytes or str, str]: Password (index 0) and salt (index 1)
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _Pbkdf2Rounds() -> int:
+        """
+        Get the number of PBKDF2 rounds.
+
+        Returns:
+            int: Number of PBKDF2 rounds
+        """
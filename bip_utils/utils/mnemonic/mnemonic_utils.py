@@ -24,16 +24,47 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Type
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_words_bundle import MnemonicWordsBundle
 from bip_utils.utils.typing import Literal
 
 
+# Generic type for mnemonics
+MnemonicType = TypeVar("MnemonicType", bound=Union[str, Mnemonic])
+
+
 class MnemonicUtils:
     """Class container for mnemonic utility functions."""
 
+    @staticmethod
+    def PairWithPassphrases(mnemonics: Iterable[MnemonicType],
+                            passphrases: Union[str, Iterable[str]]) -> Iterator[Tuple[MnemonicType, str]]:
+        """
+        Pair mnemonics with passphrases, lazily.
+
+        Args:
+            mnemonics (iterable)             : Mnemonics
+            passphrases (str or iterable[str]): Passphrase for each mnemonic, or the same passphrase for all of them
+
+        Returns:
+            Iterator: Mnemonic (index 0) and passphrase (index 1) pairs
+
+        Raises:
+            ValueError: If the number of passphrases is different from the number of mnemonics
+        """
+        passphrases_iter = repeat(passphrases) if isinstance(passphrases, str) else iter(passphrases)
+        for mnemonic in mnemonics:
+            passphrase = next(passphrases_iter, None)
+            if passphrase is None:
+                raise ValueError("Passphrases are less than mnemonics")
+            yield mnemonic, passphrase
+        if not isinstance(passphrases, str) and next(passphrases_iter, None) is not None:
+            raise ValueError("Passphrases are more than mnemonics")
+
     @staticmethod
     def BytesChunkToWords(bytes_chunk: bytes,
                           words_list: MnemonicWordsList,
@@ -107,7 +138,7 @@ class MnemonicWordsList:
         """
         self.m_idx_to_words = words_list
         # Map strings to indexes as well for a quick word searching
-        self.m_words_to_idx = {words_list[i]: i for i in range(len(words_list))}
+        self.m_words_to_idx = dict(zip(words_list, range(len(words_list))))
 
     def Length(self) -> int:
         """
@@ -151,6 +182,51 @@ class MnemonicWordsList:
         return self.m_idx_to_words[word_idx]
 
 
+class MnemonicLanguagesIndex:
+    """
+    Mnemonic languages index class.
+    It's an inverted index that maps each word to the bitmask of the languages containing it, so that
+    the languages of a mnemonic can be found with a single pass on its words.
+    """
+
+    m_langs: Tuple[MnemonicLanguages, ...]
+    m_words_to_mask: Dict[str, int]
+
+    def __init__(self,
+                 words_lists: Dict[MnemonicLanguages, MnemonicWordsList]) -> None:
+        """
+        Construct class.
+
+        Args:
+            words_lists (dict): Words list for each language, in order of priority
+        """
+        self.m_langs = tuple(words_lists.keys())
+        self.m_words_to_mask = {}
+        for i, words_list in enumerate(words_lists.values()):
+            lang_mask = 1 << i
+            for word_idx in range(words_list.Length()):
+                word = words_list.GetWordAtIdx(word_idx)
+                self.m_words_to_mask[word] = self.m_words_to_mask.get(word, 0) | lang_mask
+
+    def FindLanguages(self,
+                      words: Iterable[str]) -> List[MnemonicLanguages]:
+        """
+        Find the languages containing all the specified words.
+
+        Args:
+            words (iterable[str]): Words
+
+        Returns:
+            list[MnemonicLanguages]: Languages, in order of priority (empty if not found)
+        """
+        langs_mask = (1 << len(self.m_langs)) - 1
+        for word in words:
+            langs_mask &= self.m_words_to_mask.get(word, 0)
+            if langs_mask == 0:
+                return []
+        return [lang for i, lang in enumerate(self.m_langs) if langs_mask & (1 << i)]
+
+
 class MnemonicWordsListFileReader:
     """
     Mnemonic words list file reader class.
@@ -191,6 +267,7 @@ class MnemonicWordsListGetterBase(ABC):
     """Mnemonic words list getter base class."""
 
     m_words_lists: Dict[MnemonicLanguages, MnemonicWordsList]
+    m_langs_indexes: Dict[Type[MnemonicLanguages], MnemonicLanguagesIndex]
 
     # Global instance
     __instance: Optional[MnemonicWordsListGetterBase] = None
@@ -198,6 +275,7 @@ class MnemonicWordsListGetterBase(ABC):
     def __init__(self):
         """Construct class."""
         self.m_words_lists = {}
+        self.m_langs_indexes = {}
 
     @abstractmethod
     def GetByLanguage(self,
@@ -217,16 +295,41 @@ class MnemonicWordsListGetterBase(ABC):
             ValueError: If loaded words list is not valid
         """
 
+    def GetLanguagesIndex(self,
+                          langs_enum: Type[MnemonicLanguages]) -> MnemonicLanguagesIndex:
+        """
+        Get the languages index of the words lists of all the languages of the specified class.
+        It's built only the first time it is requested for each language class, loading all the words lists.
+
+        Args:
+            langs_enum (MnemonicLanguages class): Language class
+
+        Returns:
+            MnemonicLanguagesIndex object: MnemonicLanguagesIndex object
+
+        Raises:
+            ValueError: If loaded words list is not valid
+        """
+        try:
+            return self.m_langs_indexes[langs_enum]
+        except KeyError:
+            self.m_langs_indexes[langs_enum] = MnemonicLanguagesIndex(
+                {lang: self.GetByLanguage(lang) for lang in langs_enum}
+            )
+            return self.m_langs_indexes[langs_enum]
+
     def _LoadWordsList(self,
                        lang: MnemonicLanguages,
                        file_name: str,
                        words_num: int) -> MnemonicWordsList:
         """
         Load words list.
+        Words lists are loaded from the words bundle. If the bundle is not available or doesn't contain the words
+        list, it is loaded from its file in the package.
 
         Args:
             lang (MnemonicLanguages): Language
-            file_name (str)         : File name
+            file_name (str)         : File name, relative to the package root (e.g. "bip/bip39/wordlist/english.txt")
             words_num (int)         : Number of expected words
 
         Returns:
@@ -240,8 +343,18 @@ class MnemonicWordsListGetterBase(ABC):
         try:
             return self.m_words_lists[lang]
         except KeyError:
-            self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(file_name,
-                                                                            words_num)
+            try:
+                words_bundle = MnemonicWordsBundle.Instance()
+            except ValueError:
+                words_bundle = None
+
+            if words_bundle is not None and words_bundle.HasKey(file_name):
+                self.m_words_lists[lang] = MnemonicWordsList(words_bundle.GetWords(file_name, words_num))
+            else:
+                self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(
+                    MnemonicWordsBundle.KeyToFilePath(file_name),
+                    words_num
+                )
 
             return self.m_words_lists[lang]
 
@@ -302,17 +415,12 @@ class MnemonicWordsListFinderBase(ABC):
         Raises:
             ValueError: If the mnemonic language cannot be found
         """
-        for lang in langs_enum:
-            # Search all the words because some languages have words in common
-            # (e.g. 'fatigue' both in English and French)
-            # It's more time consuming, but considering only the first word can detect the wrong language sometimes
-            try:
-                words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
-                for word in mnemonic.ToList():
-                    words_list.GetWordIdx(word)
-                return words_list, lang
-            except ValueError:
-                continue
-
-        # Language not found
-        raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+        words_list_getter = words_list_getter_cls.Instance()
+
+        # Search all the words because some languages have words in common
+        # (e.g. 'fatigue' both in English and French), so considering only the first word can detect the wrong
+        # language sometimes. The first language containing all of them is taken.
+        langs = words_list_getter.GetLanguagesIndex(langs_enum).FindLanguages(mnemonic.ToList())
+        if not langs:
+            raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+        return words_list_getter.GetByLanguage(langs[0]), langs[0]
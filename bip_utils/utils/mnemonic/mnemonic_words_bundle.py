@@ -0,0 +1,334 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Module for the mnemonic words lists bundle, i.e. a single precompiled resource containing all the words lists.
+It's loaded through the package loader, so it works also when the package is not installed as plain files
+(e.g. inside a zip application).
+"""
+
+# Imports
+from __future__ import annotations
+
+import os
+import pkgutil
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from bip_utils.utils.crypto import Sha256
+
+
+class MnemonicWordsBundleConst:
+    """Class container for mnemonic words bundle constants."""
+
+    # Package and name of the bundle resource
+    RES_PACKAGE: str = "bip_utils.utils.mnemonic"
+    RES_NAME: str = "wordlists.bin"
+    # Package root directory, i.e. the one the keys are relative to
+    PKG_ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Magic bytes
+    MAGIC: bytes = b"BUWL"
+    # Format version
+    VERSION: int = 1
+
+    # Header: magic, version, SHA256 of the payload, number of entries
+    HEADER_STRUCT: struct.Struct = struct.Struct(">4sBxxx32sI")
+    # Entry: key length, number of words, offset and length of the words in the blob
+    ENTRY_STRUCT: struct.Struct = struct.Struct(">HIII")
+
+    # Name of the directories containing the words lists files
+    WORDS_LIST_DIR_NAME: str = "wordlist"
+    # Extension of the words lists files
+    WORDS_LIST_FILE_EXT: str = ".txt"
+    # Separator of the words in the blob
+    WORDS_SEP: str = "\n"
+
+
+class MnemonicWordsBundle:
+    """
+    Mnemonic words bundle class.
+    It contains the words lists of all mnemonics, identified by the path of their file relative to the package
+    root (e.g. "bip/bip39/wordlist/english.txt").
+    The bundle is made of a table of entries followed by a blob with the UTF-8 encoded words of each list, so only
+    the requested words lists are decoded, directly from the bundle bytes.
+    The checksum is verified when the bundle is built, so it's not computed again when loading it.
+    """
+
+    m_checksum: bytes
+    m_data: memoryview
+    m_blob_offset: int
+    m_entries: Dict[str, Tuple[int, int, int]]
+
+    # Global instance
+    __instance: Optional[MnemonicWordsBundle] = None
+
+    def __init__(self,
+                 data: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            data (bytes): Bundle bytes
+
+        Raises:
+            ValueError: If the bundle is not valid
+        """
+        header_len = MnemonicWordsBundleConst.HEADER_STRUCT.size
+        if len(data) < header_len:
+            raise ValueError("Invalid words bundle (too short)")
+
+        magic, version, checksum, entries_num = MnemonicWordsBundleConst.HEADER_STRUCT.unpack_from(data)
+        if magic != MnemonicWordsBundleConst.MAGIC:
+            raise ValueError("Invalid words bundle (wrong magic)")
+        if version != MnemonicWordsBundleConst.VERSION:
+            raise ValueError(f"Invalid words bundle version ({version})")
+
+        self.m_checksum = checksum
+        self.m_data = memoryview(data)
+
+        self.m_entries = {}
+        offset = header_len
+        for _ in range(entries_num):
+            key_len, words_num, words_offset, words_len = MnemonicWordsBundleConst.ENTRY_STRUCT.unpack_from(data,
+                                                                                                            offset)
+            offset += MnemonicWordsBundleConst.ENTRY_STRUCT.size
+            key = str(self.m_data[offset:offset + key_len], "utf-8")
+            offset += key_len
+            self.m_entries[key] = (words_num, words_offset, words_len)
+        self.m_blob_offset = offset
+
+        if any(self.m_blob_offset + words_offset + words_len > len(data)
+               for _, words_offset, words_len in self.m_entries.values()):
+            raise ValueError("Invalid words bundle (truncated)")
+
+    @classmethod
+    def Instance(cls) -> MnemonicWordsBundle:
+        """
+        Get the global class instance, loading the bundle resource the first time.
+
+        Returns:
+            MnemonicWordsBundle object: MnemonicWordsBundle object
+
+        Raises:
+            ValueError: If the bundle is not valid
+        """
+        if cls.__instance is None:
+            cls.__instance = cls(cls.__ReadResource())
+        return cls.__instance
+
+    def IsChecksumValid(self) -> bool:
+        """
+        Get if the bundle checksum is valid.
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return Sha256.QuickDigest(bytes(self.m_data[MnemonicWordsBundleConst.HEADER_STRUCT.size:])) == self.m_checksum
+
+    def Keys(self) -> List[str]:
+        """
+        Get the keys of the words lists.
+
+        Returns:
+            list[str]: Keys
+        """
+        return list(self.m_entries)
+
+    def HasKey(self,
+               key: str) -> bool:
+        """
+        Get if the bundle contains the specified words list.
+
+        Args:
+            key (str): Key, i.e. the words list file path relative to the package root
+
+        Returns:
+            bool: True if found, false otherwise
+        """
+        return key in self.m_entries
+
+    def GetWords(self,
+                 key: str,
+                 words_num: int) -> List[str]:
+        """
+        Get the words of a words list.
+
+        Args:
+            key (str)      : Key, i.e. the words list file path relative to the package root
+            words_num (int): Number of expected words
+
+        Returns:
+            list[str]: Words
+
+        Raises:
+            ValueError: If the words list is not found or not valid
+        """
+        try:
+            bundle_words_num, words_offset, words_len = self.m_entries[key]
+        except KeyError as ex:
+            raise ValueError(f"Unable to find words list {key}") from ex
+
+        if bundle_words_num != words_num:
+            raise ValueError(f"Number of loaded words list ({bundle_words_num}) is not valid")
+
+        words_offset += self.m_blob_offset
+        words = str(self.m_data[words_offset:words_offset + words_len], "utf-8")
+        return words.split(MnemonicWordsBundleConst.WORDS_SEP)
+
+    @staticmethod
+    def KeyToFilePath(key: str) -> str:
+        """
+        Get the path of the words list file of the specified key.
+
+        Args:
+            key (str): Key, i.e. the words list file path relative to the package root
+
+        Returns:
+            str: Words list file path
+        """
+        return os.path.join(MnemonicWordsBundleConst.PKG_ROOT_DIR, *key.split("/"))
+
+    @staticmethod
+    def __ReadResource() -> bytes:
+        """
+        Read the bundle resource.
+        pkgutil is used instead of importlib.resources, since it's much faster to set up on the first call.
+
+        Returns:
+            bytes: Bundle bytes
+
+        Raises:
+            ValueError: If the bundle resource is not found
+        """
+        data = pkgutil.get_data(MnemonicWordsBundleConst.RES_PACKAGE, MnemonicWordsBundleConst.RES_NAME)
+        if data is None:
+            raise ValueError("Unable to find words bundle")
+        return data
+
+
+class MnemonicWordsBundleBuilder:
+    """
+    Mnemonic words bundle builder class.
+    It builds the bundle from the words lists files, i.e. all the files in the "wordlist" directories. The bundle
+    shall be rebuilt every time a words list file is changed, by running from the repository root:
+    python -c "from bip_utils.utils.mnemonic.mnemonic_words_bundle import MnemonicWordsBundleBuilder as B; B.Write()"
+    """
+
+    @staticmethod
+    def Build(root_dir: str) -> bytes:
+        """
+        Build the bundle.
+
+        Args:
+            root_dir (str): Package root directory
+
+        Returns:
+            bytes: Bundle bytes
+
+        Raises:
+            ValueError: If a words list is not valid
+        """
+        table = []
+        blob = []
+        blob_len = 0
+        keys = MnemonicWordsBundleBuilder.__FindWordsLists(root_dir)
+        for key in keys:
+            words = MnemonicWordsBundleBuilder.__ReadWordsList(os.path.join(root_dir, *key.split("/")))
+            words_bytes = MnemonicWordsBundleConst.WORDS_SEP.join(words).encode("utf-8")
+            key_bytes = key.encode("utf-8")
+
+            table.append(MnemonicWordsBundleConst.ENTRY_STRUCT.pack(len(key_bytes), len(words), blob_len,
+                                                                    len(words_bytes)))
+            table.append(key_bytes)
+            blob.append(words_bytes)
+            blob_len += len(words_bytes)
+
+        payload = b"".join(table + blob)
+        header = MnemonicWordsBundleConst.HEADER_STRUCT.pack(MnemonicWordsBundleConst.MAGIC,
+                                                             MnemonicWordsBundleConst.VERSION,
+                                                             Sha256.QuickDigest(payload),
+                                                             len(keys))
+        bundle = header + payload
+
+        # Validate the bundle by loading it back
+        if not MnemonicWordsBundle(bundle).IsChecksumValid():
+            raise ValueError("Invalid words bundle (wrong checksum)")
+        return bundle
+
+    @staticmethod
+    def Write(root_dir: Optional[str] = None,
+              file_path: Optional[str] = None) -> None:
+        """
+        Build the bundle and write it to file.
+
+        Args:
+            root_dir (str, optional) : Package root directory (default: the one of this package)
+            file_path (str, optional): File path (default: the bundle resource of this package)
+
+        Raises:
+            ValueError: If a words list is not valid
+        """
+        root_dir = root_dir or MnemonicWordsBundleConst.PKG_ROOT_DIR
+        file_path = file_path or os.path.join(root_dir,
+                                              *MnemonicWordsBundleConst.RES_PACKAGE.split(".")[1:],
+                                              MnemonicWordsBundleConst.RES_NAME)
+
+        bundle = MnemonicWordsBundleBuilder.Build(root_dir)
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "wb") as fout:
+            fout.write(bundle)
+        os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def __FindWordsLists(root_dir: str) -> List[str]:
+        """
+        Find the words lists files.
+
+        Args:
+            root_dir (str): Package root directory
+
+        Returns:
+            list[str]: Words lists files paths relative to the root directory, sorted
+        """
+        keys = []
+        for dir_path, _, file_names in os.walk(root_dir):
+            if os.path.basename(dir_path) != MnemonicWordsBundleConst.WORDS_LIST_DIR_NAME:
+                continue
+            rel_dir = os.path.relpath(dir_path, root_dir).replace(os.sep, "/")
+            keys += [f"{rel_dir}/{file_name}"
+                     for file_name in file_names
+                     if file_name.endswith(MnemonicWordsBundleConst.WORDS_LIST_FILE_EXT)]
+        return sorted(keys)
+
+    @staticmethod
+    def __ReadWordsList(file_path: str) -> List[str]:
+        """
+        Read a words list file, skipping empty lines and comments.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            list[str]: Words
+        """
+        with open(file_path, "r", encoding="utf-8") as fin:
+            return [word.strip()
+                    for word in fin.readlines()
+                    if word.strip() != "" and not word.startswith("#")]
@@ -130,6 +130,8 @@ setuptools.setup(
     packages=setuptools.find_packages(exclude=["*tests*"]),
     package_data={
         "bip_utils": [
+            # Words lists bundle
+            "utils/mnemonic/wordlists.bin",
             # BIP39
             "bip/bip39/wordlist/english.txt",
             "bip/bip39/wordlist/italian.txt",
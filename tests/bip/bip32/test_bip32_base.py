@@ -20,7 +20,9 @@
 
 # Imports
 import binascii
+import gc
 import unittest
+import weakref
 
 from bip_utils import (
     Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyError, Bip32KeyIndex, Bip32KeyNetVersions,
@@ -152,6 +154,104 @@ class Bip32BaseTests(unittest.TestCase):
         bip32_ctx = bip32_class.FromPublicKey(binascii.unhexlify(test_vector["pub_key"]))
         self.__test_public_derivation_pub_key(bip32_ctx, test_vector)
 
+    # Test derivation of a range of children
+    def _test_children_range(self, bip32_class, test_vector):
+        start = 0 if bip32_class.IsPublicDerivationSupported() else Bip32KeyIndex.HardenIndex(0)
+        count = 3
+
+        for test in test_vector:
+            bip32_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+            children = [bip32_ctx.ChildKey(start + i) for i in range(count)]
+
+            # Private children
+            children_range = bip32_ctx.DeriveChildrenRange(start, count)
+            self.assertEqual(count, len(children_range))
+            for child, child_range in zip(children, children_range):
+                self.assertFalse(child_range.IsPublicOnly())
+                self.assertEqual(child.PrivateKey().ToExtended(), child_range.PrivateKey().ToExtended())
+                self.assertEqual(child.PublicKey().ToExtended(), child_range.PublicKey().ToExtended())
+
+            # Public-only children
+            for child, child_range in zip(children, bip32_ctx.IterChildrenRange(start, count, public_only=True)):
+                self.assertTrue(child_range.IsPublicOnly())
+                self.assertEqual(child.PublicKey().ToExtended(), child_range.PublicKey().ToExtended())
+
+            # Raw keys
+            for child, (key_bytes, chain_code_bytes) in zip(children, bip32_ctx.IterChildrenKeysRange(start, count)):
+                self.assertEqual(child.PrivateKey().Raw().ToBytes(), key_bytes)
+                self.assertEqual(child.ChainCode().ToBytes(), chain_code_bytes)
+            for child, (key_bytes, chain_code_bytes) in zip(children,
+                                                            bip32_ctx.IterChildrenKeysRange(start, count, True)):
+                self.assertEqual(child.PublicKey().RawCompressed().ToBytes(), key_bytes)
+                self.assertEqual(child.ChainCode().ToBytes(), chain_code_bytes)
+
+            # Public derivation
+            if bip32_class.IsPublicDerivationSupported():
+                bip32_ctx.ConvertToPublic()
+                children = [bip32_ctx.ChildKey(start + i) for i in range(count)]
+                for child, child_range in zip(children, bip32_ctx.DeriveChildrenRange(start, count)):
+                    self.assertTrue(child_range.IsPublicOnly())
+                    self.assertEqual(child.PublicKey().ToExtended(), child_range.PublicKey().ToExtended())
+                for child, (key_bytes, _) in zip(children, bip32_ctx.IterChildrenKeysRange(start, count)):
+                    self.assertEqual(child.PublicKey().RawCompressed().ToBytes(), key_bytes)
+
+                # Hardened indexes cannot be derived from a public key
+                self.assertRaises(Bip32KeyError, bip32_ctx.DeriveChildrenRange, Bip32KeyIndex.HardenIndex(0), 1)
+                self.assertRaises(Bip32KeyError, bip32_ctx.DeriveChildrenRange,
+                                  Bip32KeyIndex.HardenIndex(0) - 1, 2)
+                self.assertRaises(Bip32KeyError, bip32_ctx.IterChildrenKeysRange, Bip32KeyIndex.HardenIndex(0), 1)
+            else:
+                self.assertRaises(Bip32KeyError, bip32_ctx.DeriveChildrenRange, 0, 1)
+                self.assertRaises(Bip32KeyError, bip32_ctx.IterChildrenRange, 0, 1)
+
+            # Empty and invalid ranges
+            self.assertEqual([], bip32_ctx.DeriveChildrenRange(start, 0))
+            self.assertRaises(ValueError, bip32_ctx.DeriveChildrenRange, start, -1)
+            self.assertRaises(ValueError, bip32_ctx.DeriveChildrenRange, Bip32KeyDataConst.KEY_INDEX_MAX_VAL, 2)
+
+            # Errors shall be raised when calling the iterators, not when iterating
+            for iter_fct in (bip32_ctx.IterChildrenRange, bip32_ctx.IterChildrenKeysRange):
+                self.assertRaises(ValueError, iter_fct, -5, 3)
+                self.assertRaises(ValueError, iter_fct, start, -1)
+                self.assertRaises(ValueError, iter_fct, Bip32KeyDataConst.KEY_INDEX_MAX_VAL, 2)
+
+    # Test that derived keys do not keep any reference to the keys of their ancestors
+    def _test_ancestor_keys_release(self, bip32_class, test_vector):
+        index = 0 if bip32_class.IsPublicDerivationSupported() else Bip32KeyIndex.HardenIndex(0)
+        seed_bytes = binascii.unhexlify(test_vector[0]["seed"])
+
+        fprint = bip32_class.FromSeed(seed_bytes).FingerPrint().ToBytes()
+        child_fprint = bip32_class.FromSeed(seed_bytes).ChildKey(Bip32KeyIndex.HardenIndex(0)).FingerPrint().ToBytes()
+
+        # Private derivation, both hardened and not-hardened
+        bip32_ctx = bip32_class.FromSeed(seed_bytes)
+        priv_key_ref = weakref.ref(bip32_ctx.PrivateKey().KeyObject())
+        bip32_child = bip32_ctx.ChildKey(Bip32KeyIndex.HardenIndex(0)).ChildKey(index)
+        bip32_children = bip32_ctx.DeriveChildrenRange(index, 2)
+
+        del bip32_ctx
+        gc.collect()
+        self.assertIsNone(priv_key_ref())
+        self.assertFalse(bip32_child.IsPublicOnly())
+        # Parent fingerprints are computed only when needed, from the parent private key
+        self.assertEqual(child_fprint, bip32_child.ParentFingerPrint().ToBytes())
+        self.assertEqual(fprint, bip32_children[0].ParentFingerPrint().ToBytes())
+        self.assertEqual(fprint, bip32_children[1].ParentFingerPrint().ToBytes())
+
+        # Public derivation
+        if bip32_class.IsPublicDerivationSupported():
+            bip32_ctx = bip32_class.FromSeed(seed_bytes)
+            bip32_ctx.ConvertToPublic()
+            pub_key_ref = weakref.ref(bip32_ctx.PublicKey().KeyObject())
+            bip32_child = bip32_ctx.ChildKey(index)
+            bip32_children = bip32_ctx.DeriveChildrenRange(index, 2)
+
+            del bip32_ctx
+            gc.collect()
+            self.assertIsNone(pub_key_ref())
+            self.assertEqual(fprint, bip32_child.ParentFingerPrint().ToBytes())
+            self.assertEqual(fprint, bip32_children[1].ParentFingerPrint().ToBytes())
+
     # Test elliptic curve
     def _test_elliptic_curve(self, bip32_class, curve_type):
         self.assertEqual(bip32_class.Curve(), EllipticCurveGetter.FromType(curve_type))
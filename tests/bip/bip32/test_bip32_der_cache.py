@@ -0,0 +1,139 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import gc
+import unittest
+import weakref
+
+from bip_utils import Bip32DerivationCache, Bip32KholawEd25519, Bip32Slip10Ed25519, Bip32Slip10Secp256k1
+
+
+# Generic seed for testing
+TEST_SEED = b"\x01" * 32
+
+
+#
+# Tests
+#
+class Bip32DerivationCacheTests(unittest.TestCase):
+    # Test derivation
+    def test_derivation(self):
+        for bip32_class, paths in (
+            (Bip32Slip10Secp256k1, ("m/44'/0'/0'/0/0", "m/44'/0'/0'/0/1", "m/44'/0'/1'", "m/44'/0'/0'/0/0", "m")),
+            (Bip32KholawEd25519, ("m/1852'/1815'/0'/0/0", "m/1852'/1815'/0'/0/1", "m/1852'/1815'/0'")),
+            (Bip32Slip10Ed25519, ("m/44'/501'/0'/0'", "m/44'/501'/1'/0'", "m/44'/501'/0'/0'")),
+        ):
+            cache = Bip32DerivationCache()
+            bip32_ctx = bip32_class.FromSeed(TEST_SEED)
+
+            for path in paths:
+                bip32_cached = bip32_ctx.DerivePath(path, cache)
+                bip32_not_cached = bip32_ctx.DerivePath(path)
+                self.assertEqual(bip32_not_cached.PrivateKey().ToExtended(), bip32_cached.PrivateKey().ToExtended())
+                self.assertEqual(bip32_not_cached.PublicKey().ToExtended(), bip32_cached.PublicKey().ToExtended())
+
+            # Relative paths from a child node
+            bip32_child = bip32_ctx.DerivePath(paths[0].rsplit("/", 1)[0], cache)
+            self.assertEqual(bip32_ctx.DerivePath(paths[0]).PublicKey().ToExtended(),
+                             bip32_child.DerivePath(paths[0].rsplit("/", 1)[1], cache).PublicKey().ToExtended())
+
+    # Test hits and misses
+    def test_hits_misses(self):
+        cache = Bip32DerivationCache()
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+
+        bip32_ctx.DerivePath("m/44'/0'/0'/0/0", cache)
+        self.assertEqual(0, cache.Hits())
+        self.assertEqual(1, cache.Misses())
+        self.assertEqual(5, cache.Size())
+
+        # Shared prefix
+        bip32_ctx.DerivePath("m/44'/0'/0'/0/1", cache)
+        self.assertEqual(1, cache.Hits())
+        self.assertEqual(1, cache.Misses())
+        self.assertEqual(6, cache.Size())
+
+        # Already cached
+        bip32_ctx.DerivePath("m/44'/0'/0'", cache)
+        self.assertEqual(2, cache.Hits())
+        self.assertEqual(6, cache.Size())
+
+        # Different root shall not share nodes
+        bip32_ctx_pub = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+        bip32_ctx_pub.ConvertToPublic()
+        bip32_ctx_pub.DerivePath("m/0/1", cache)
+        self.assertEqual(2, cache.Hits())
+        self.assertEqual(2, cache.Misses())
+        self.assertEqual(8, cache.Size())
+
+    # Test maximum size
+    def test_max_size(self):
+        cache = Bip32DerivationCache(3)
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+        self.assertEqual(3, cache.MaxSize())
+
+        for i in range(10):
+            bip32_ctx.DerivePath(f"m/0/{i}", cache)
+            self.assertTrue(cache.Size() <= 3)
+        self.assertEqual(3, cache.Size())
+
+        # The most recent node shall be still cached
+        hits = cache.Hits()
+        bip32_ctx.DerivePath("m/0/9", cache)
+        self.assertEqual(hits + 1, cache.Hits())
+        self.assertEqual(3, cache.Size())
+
+        self.assertRaises(ValueError, Bip32DerivationCache, 0)
+
+    # Test that cached nodes are not shared with the caller
+    def test_no_sharing(self):
+        cache = Bip32DerivationCache()
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+
+        bip32_ctx.DerivePath("m/0'/1", cache).ConvertToPublic()
+        self.assertFalse(bip32_ctx.DerivePath("m/0'/1", cache).IsPublicOnly())
+        self.assertFalse(bip32_ctx.DerivePath("m/0'", cache).IsPublicOnly())
+
+    # Test purge
+    def test_purge(self):
+        cache = Bip32DerivationCache()
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+
+        bip32_ctx.DerivePath("m/44'/0'/0'", cache)
+        bip32_ctx.DerivePath("m/44'/0'/0'", cache)
+        cache.Purge()
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0, cache.Hits())
+        self.assertEqual(0, cache.Misses())
+
+        self.assertFalse(bip32_ctx.DerivePath("m/44'/0'/0'", cache).IsPublicOnly())
+        self.assertEqual(1, cache.Misses())
+
+        # Purging only drops the cache references, without touching the nodes
+        bip32_node = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+        cache.Store(b"root", [0], bip32_node)
+        cache.Store(b"root", [1], Bip32Slip10Secp256k1.FromSeed(TEST_SEED))
+        bip32_node_ref = weakref.ref(cache.Lookup(b"root", [1])[1])
+        cache.Purge()
+        gc.collect()
+
+        self.assertFalse(bip32_node.IsPublicOnly())
+        self.assertIsNone(bip32_node_ref())
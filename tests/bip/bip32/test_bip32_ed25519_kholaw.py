@@ -251,6 +251,14 @@ class Bip32KholawEd25519Tests(Bip32BaseTests):
     def test_from_seed_and_path(self):
         self._test_from_seed_and_path(Bip32KholawEd25519, TEST_VECT)
 
+    # Test derivation of a range of children
+    def test_children_range(self):
+        self._test_children_range(Bip32KholawEd25519, TEST_VECT)
+
+    # Test that derived keys do not keep any reference to the keys of their ancestors
+    def test_ancestor_keys_release(self):
+        self._test_ancestor_keys_release(Bip32KholawEd25519, TEST_VECT)
+
     # Run all tests in test vector using FromExtendedKey for construction
     def test_from_ex_key(self):
         self._test_from_ex_key(Bip32KholawEd25519, TEST_VECT)
@@ -18,9 +18,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import os
-
 # Imports
+import copy
+import os
+import pickle
 import random
 import unittest
 
@@ -91,6 +92,45 @@ class Bip32KeyDataTests(unittest.TestCase):
         self.assertEqual(key_data.ParentFingerPrint(), fprint)
         self.assertFalse(key_data.ParentFingerPrint().IsMasterKey())
 
+        # Bip32KeyData (deferred parent fingerprint)
+        fprint_calls = []
+
+        def get_fprint():
+            fprint_calls.append(1)
+            return fprint
+
+        key_data = Bip32KeyData(depth, key_idx, chaincode, get_fprint)
+        self.assertEqual(len(fprint_calls), 0)
+        self.assertEqual(key_data.ParentFingerPrint(), fprint)
+        self.assertEqual(key_data.ParentFingerPrint(), fprint)
+        self.assertEqual(len(fprint_calls), 1)
+
+    # Test interning and immutability helpers
+    def test_interning(self):
+        # Small depths and indexes are interned
+        self.assertIs(Bip32Depth(1), Bip32Depth(1))
+        self.assertIs(Bip32Depth(0).Increase(), Bip32Depth(1))
+        self.assertIs(Bip32KeyIndex(5), Bip32KeyIndex(5))
+        self.assertIs(Bip32KeyIndex(5).Harden(), Bip32KeyIndex(Bip32KeyIndex.HardenIndex(5)))
+        self.assertIsNot(Bip32KeyIndex(Bip32KeyDataConst.KEY_INDEX_INTERNED_NUM),
+                         Bip32KeyIndex(Bip32KeyDataConst.KEY_INDEX_INTERNED_NUM))
+        self.assertEqual(Bip32KeyIndex(Bip32KeyDataConst.KEY_INDEX_INTERNED_NUM),
+                         Bip32KeyIndex(Bip32KeyDataConst.KEY_INDEX_INTERNED_NUM))
+
+        # Hashes are consistent with the integer values
+        self.assertEqual(hash(Bip32Depth(3)), hash(3))
+        self.assertEqual(hash(Bip32KeyIndex(2**31 + 7)), hash(2**31 + 7))
+
+        # Objects are compact
+        for obj in (Bip32Depth(0), Bip32KeyIndex(0), Bip32ChainCode(), Bip32FingerPrint(), Bip32KeyData()):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+        # Pickling and copying
+        for obj in (Bip32Depth(1), Bip32KeyIndex(1), Bip32KeyIndex(2**31 + 2**20)):
+            self.assertEqual(pickle.loads(pickle.dumps(obj)), obj)
+            self.assertEqual(copy.deepcopy(obj), obj)
+        self.assertIs(pickle.loads(pickle.dumps(Bip32KeyIndex(1))), Bip32KeyIndex(1))
+
     # Test for operators
     def test_operators(self):
         self.assertTrue(Bip32Depth(1) < Bip32Depth(2))
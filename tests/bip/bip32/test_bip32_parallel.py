@@ -0,0 +1,108 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import (
+    Bip32KeyError, Bip32KeyIndex, Bip32Nist256p1, Bip32ParallelDerivator, Bip32Secp256k1, Bip32Slip10Ed25519
+)
+
+
+# Tests seed
+TEST_SEED = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
+# Number of workers for tests
+TEST_WORKERS = 2
+
+
+# Result function (module-level to be picklable)
+def get_pub_key_ex(bip32_obj):
+    return bip32_obj.PublicKey().ToExtended()
+
+
+#
+# Tests
+#
+class Bip32ParallelDerivatorTests(unittest.TestCase):
+    # Test children range derivation
+    def test_children_range(self):
+        for bip32_class in (Bip32Secp256k1, Bip32Nist256p1):
+            bip32_ctx = bip32_class.FromSeedAndPath(TEST_SEED, "m/0'/1")
+            children = [bip32_ctx.ChildKey(i) for i in range(25)]
+
+            par_der = Bip32ParallelDerivator(bip32_ctx, workers=TEST_WORKERS, chunk_size=4, max_pending_chunks=2)
+
+            # Private children
+            children_par = list(par_der.DeriveChildrenRange(0, 25))
+            self.assertEqual(len(children), len(children_par))
+            for child, child_par in zip(children, children_par):
+                self.assertFalse(child_par.IsPublicOnly())
+                self.assertEqual(child.PrivateKey().ToExtended(), child_par.PrivateKey().ToExtended())
+
+            # Public-only children and result function
+            children_par = list(par_der.DeriveChildrenRange(0, 25, public_only=True))
+            for child, child_par in zip(children, children_par):
+                self.assertTrue(child_par.IsPublicOnly())
+                self.assertEqual(child.PublicKey().ToExtended(), child_par.PublicKey().ToExtended())
+            self.assertEqual([get_pub_key_ex(child) for child in children],
+                             list(par_der.DeriveChildrenRange(0, 25, result_fn=get_pub_key_ex)))
+
+            # Public derivation
+            bip32_ctx.ConvertToPublic()
+            par_der = Bip32ParallelDerivator(bip32_ctx, workers=TEST_WORKERS, chunk_size=10)
+            self.assertEqual([get_pub_key_ex(child) for child in children],
+                             [get_pub_key_ex(child) for child in par_der.DeriveChildrenRange(0, 25)])
+
+            # Hardened indexes cannot be derived from a public key
+            self.assertRaises(Bip32KeyError, list, par_der.DeriveChildrenRange(Bip32KeyIndex.HardenIndex(0), 1))
+
+    # Test paths derivation
+    def test_paths(self):
+        bip32_ctx = Bip32Slip10Ed25519.FromSeed(TEST_SEED)
+        paths = [f"m/{i % 3}'/{i}'" for i in range(20)]
+        children = [bip32_ctx.DerivePath(path) for path in paths]
+
+        par_der = Bip32ParallelDerivator(bip32_ctx, workers=TEST_WORKERS, chunk_size=3)
+
+        # Paths can be consumed lazily
+        children_par = list(par_der.DerivePaths(iter(paths)))
+        self.assertEqual(len(children), len(children_par))
+        for child, child_par in zip(children, children_par):
+            self.assertEqual(child.PrivateKey().ToExtended(), child_par.PrivateKey().ToExtended())
+        self.assertEqual([get_pub_key_ex(child) for child in children],
+                         list(par_der.DerivePaths(paths, result_fn=get_pub_key_ex)))
+
+        # Empty paths
+        self.assertEqual([], list(par_der.DerivePaths([])))
+        # Not-hardened indexes are not supported by ed25519
+        self.assertRaises(Bip32KeyError, list, par_der.DerivePaths(["m/0"]))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip32_ctx = Bip32Secp256k1.FromSeed(TEST_SEED)
+
+        self.assertRaises(ValueError, Bip32ParallelDerivator, bip32_ctx, workers=0)
+        self.assertRaises(ValueError, Bip32ParallelDerivator, bip32_ctx, chunk_size=0)
+        self.assertRaises(ValueError, Bip32ParallelDerivator, bip32_ctx, max_pending_chunks=0)
+
+        par_der = Bip32ParallelDerivator(bip32_ctx, workers=TEST_WORKERS)
+        self.assertRaises(ValueError, par_der.DeriveChildrenRange, 0, -1)
+        self.assertRaises(ValueError, par_der.DeriveChildrenRange, 2**32 - 1, 2)
@@ -170,6 +170,46 @@ TEST_VECT_PATH_INVALID = [
     "0/1/-1",
 ]
 
+# Tests for path templates
+TEST_VECT_TEMPLATE = [
+    {
+        "template": "m/84'/0'/0'/{0,1}/[0..2]",
+        "is_absolute": True,
+        "paths": [
+            "m/84'/0'/0'/0/0", "m/84'/0'/0'/0/1", "m/84'/0'/0'/0/2",
+            "m/84'/0'/0'/1/0", "m/84'/0'/0'/1/1", "m/84'/0'/0'/1/2",
+        ],
+    },
+    {
+        "template": "{0, 3'}/[1..2]'/5",
+        "is_absolute": False,
+        "paths": ["0/1'/5", "0/2'/5", "3'/1'/5", "3'/2'/5"],
+    },
+    {
+        "template": "m/{1,2}'",
+        "is_absolute": True,
+        "paths": ["m/1'", "m/2'"],
+    },
+    {
+        "template": "m",
+        "is_absolute": True,
+        "paths": ["m"],
+    },
+]
+
+# Tests for invalid path templates
+TEST_VECT_TEMPLATE_INVALID = [
+    "m/{}",
+    "m/{0,a}",
+    "m/{0',1}'",
+    "m/[1..0]",
+    "m/[0..1..2]",
+    "m/[a..2]",
+    "m/[0..2147483648]'",
+    "m/0''",
+    "m/[0..4294967296]",
+]
+
 
 #
 # Tests
@@ -194,6 +234,51 @@ class Bip32PathTests(unittest.TestCase):
             path = path.AddElem(test["elem"])
             self.assertEqual(test["path"], path.ToStr())
 
+    # Test immutability and parsing cache
+    def test_immutable(self):
+        path = Bip32PathParser.Parse("m/0'/1")
+        self.assertIs(path, Bip32PathParser.Parse("m/0'/1"))
+        self.assertEqual(path, Bip32Path([Bip32KeyIndex.HardenIndex(0), 1]))
+        self.assertNotEqual(path, Bip32Path([Bip32KeyIndex.HardenIndex(0), 1], False))
+        self.assertEqual(hash(path), hash(Bip32Path([Bip32KeyIndex.HardenIndex(0), 1])))
+        self.assertEqual("m/0'/1", path.ToStr())
+        self.assertEqual("m/0'/1/2", path.AddElem(2).ToStr())
+
+        Bip32PathParser.ClearCache()
+        self.assertIsNot(path, Bip32PathParser.Parse("m/0'/1"))
+        self.assertEqual(path, Bip32PathParser.Parse("m/0'/1"))
+
+    # Test path templates
+    def test_template(self):
+        for test in TEST_VECT_TEMPLATE:
+            template = Bip32PathParser.ParseTemplate(test["template"])
+            self.assertEqual(test["is_absolute"], template.IsAbsolute())
+            self.assertEqual(len(test["paths"]), template.Count())
+            self.assertEqual(test["paths"], [path.ToStr() for path in template])
+            self.assertEqual([Bip32PathParser.Parse(path) for path in test["paths"]], list(template))
+
+        for test in TEST_VECT_TEMPLATE_INVALID:
+            self.assertRaises(Bip32PathError, Bip32PathParser.ParseTemplate, test)
+
+    # Test path templates derivation
+    def test_template_derivation(self):
+        seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
+
+        for bip32_class, test in ((Bip32Slip10Secp256k1, TEST_VECT_TEMPLATE[0]),
+                                  (Bip32Slip10Nist256p1, TEST_VECT_TEMPLATE[1]),
+                                  (Bip32Slip10Ed25519, TEST_VECT_TEMPLATE[2])):
+            bip32_ctx = bip32_class.FromSeed(seed)
+            results = list(bip32_ctx.DerivePathTemplate(test["template"]))
+
+            self.assertEqual(test["paths"], [path.ToStr() for path, _ in results])
+            for path, bip32_obj in results:
+                self.assertEqual(bip32_ctx.DerivePath(path).PrivateKey().ToExtended(),
+                                 bip32_obj.PrivateKey().ToExtended())
+
+        # Absolute templates from child keys
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(seed, "m/0")
+        self.assertRaises(ValueError, bip32_ctx.DerivePathTemplate, "m/[0..1]")
+
     # Test invalid paths
     def test_invalid_paths(self):
         seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
@@ -0,0 +1,128 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip32KeyError, Bip32KholawEd25519, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1,
+    Bip32Slip10Secp256k1, Bip32SnapshotDecoder, Bip32SnapshotReader, Bip32SnapshotWriter, EllipticCurveTypes
+)
+from bip_utils.bip.bip32.bip32_snapshot import Bip32SnapshotConst
+
+
+# Generic seed for testing
+TEST_SEED = b"\x02" * 32
+
+# Tests for classes
+TEST_VECT = [
+    (Bip32Slip10Secp256k1, "m/44'/0'/0'/1", EllipticCurveTypes.SECP256K1),
+    (Bip32Slip10Nist256p1, "m/44'/0'/0'/1", EllipticCurveTypes.NIST256P1),
+    (Bip32Slip10Ed25519, "m/44'/0'/0'/1'", EllipticCurveTypes.ED25519),
+    (Bip32Slip10Ed25519Blake2b, "m/44'/0'/0'/1'", EllipticCurveTypes.ED25519_BLAKE2B),
+    (Bip32KholawEd25519, "m/1852'/1815'/0'/1", EllipticCurveTypes.ED25519_KHOLAW),
+]
+
+
+#
+# Tests
+#
+class Bip32SnapshotTests(unittest.TestCase):
+    # Test ToBytes/FromBytes
+    def test_to_from_bytes(self):
+        for bip32_class, path, curve_type in TEST_VECT:
+            bip32_ctx = bip32_class.FromSeedAndPath(TEST_SEED, path)
+            bip32_pub_ctx = bip32_class.FromExtendedKey(bip32_ctx.PublicKey().ToExtended())
+
+            # Private key, with and without cached public key
+            for include_pub_key in (False, True):
+                snapshot_bytes = bip32_ctx.ToBytes(include_pub_key)
+                self.assertEqual(Bip32SnapshotConst.RECORD_BYTE_LEN, len(snapshot_bytes))
+
+                bip32_rest = bip32_class.FromBytes(snapshot_bytes)
+                self.assertFalse(bip32_rest.IsPublicOnly())
+                self.assertEqual(bip32_ctx.PrivateKey().ToExtended(), bip32_rest.PrivateKey().ToExtended())
+                self.assertEqual(bip32_ctx.PublicKey().ToExtended(), bip32_rest.PublicKey().ToExtended())
+
+                snapshot = Bip32SnapshotDecoder.Decode(snapshot_bytes)
+                self.assertEqual(curve_type, snapshot.CurveType())
+                self.assertFalse(snapshot.IsPublic())
+                self.assertEqual(bip32_ctx.PrivateKey().Raw().ToBytes(), snapshot.KeyBytes())
+                self.assertEqual(bip32_ctx.PublicKey().RawCompressed().ToBytes() if include_pub_key else None,
+                                 snapshot.PublicKeyBytes())
+
+            # Public key
+            snapshot_bytes = bip32_pub_ctx.ToBytes()
+            bip32_rest = bip32_class.FromBytes(snapshot_bytes)
+            self.assertTrue(bip32_rest.IsPublicOnly())
+            self.assertEqual(bip32_pub_ctx.PublicKey().ToExtended(), bip32_rest.PublicKey().ToExtended())
+            self.assertEqual(bip32_pub_ctx.PublicKey().RawCompressed().ToBytes(),
+                             Bip32SnapshotDecoder.Decode(snapshot_bytes).PublicKeyBytes())
+
+    # Test writer and reader
+    def test_writer_reader(self):
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/44'/0'/0'")
+        children = bip32_ctx.DeriveChildrenRange(0, 10)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "nodes.bin")
+
+            with Bip32SnapshotWriter(file_path, include_pub_key=True) as writer:
+                writer.Write(bip32_ctx)
+                writer.WriteMany(children[:5])
+            with Bip32SnapshotWriter(file_path, append=True) as writer:
+                writer.WriteMany(children[5:])
+
+            with Bip32SnapshotReader(file_path, Bip32Slip10Secp256k1) as reader:
+                self.assertEqual(11, len(reader))
+                self.assertEqual(bip32_ctx.PrivateKey().ToExtended(), reader[0].PrivateKey().ToExtended())
+                self.assertEqual(children[-1].PrivateKey().ToExtended(), reader[-1].PrivateKey().ToExtended())
+                self.assertEqual([child.PrivateKey().ToExtended() for child in children],
+                                 [node.PrivateKey().ToExtended() for node in list(reader)[1:]])
+                self.assertIsNotNone(reader.Snapshot(5).PublicKeyBytes())
+                self.assertIsNone(reader.Snapshot(6).PublicKeyBytes())
+                self.assertRaises(IndexError, reader.__getitem__, 11)
+                self.assertRaises(IndexError, reader.__getitem__, -12)
+
+            # Empty file
+            with Bip32SnapshotWriter(file_path):
+                pass
+            with Bip32SnapshotReader(file_path, Bip32Slip10Secp256k1) as reader:
+                self.assertEqual(0, len(reader))
+                self.assertEqual([], list(reader))
+
+            # Truncated file
+            with open(file_path, "wb") as fout:
+                fout.write(bip32_ctx.ToBytes()[:-1])
+            self.assertRaises(Bip32KeyError, Bip32SnapshotReader, file_path, Bip32Slip10Secp256k1)
+
+    # Test invalid records
+    def test_invalid(self):
+        snapshot_bytes = Bip32Slip10Secp256k1.FromSeed(TEST_SEED).ToBytes()
+
+        # Wrong class
+        self.assertRaises(Bip32KeyError, Bip32Slip10Ed25519.FromBytes, snapshot_bytes)
+        # Wrong length
+        self.assertRaises(Bip32KeyError, Bip32Slip10Secp256k1.FromBytes, snapshot_bytes[:-1])
+        # Corrupted record
+        self.assertRaises(Bip32KeyError, Bip32Slip10Secp256k1.FromBytes,
+                          snapshot_bytes[:10] + bytes([snapshot_bytes[10] ^ 1]) + snapshot_bytes[11:])
@@ -381,6 +381,43 @@ class Bip39Tests(unittest.TestCase):
             seed = Bip39SeedGenerator(mnemonic, lang).Generate(TEST_PASSPHRASE)
             self.assertEqual(test["seed"], binascii.hexlify(seed))
 
+    # Test batch seed generation
+    def test_generate_batch(self):
+        mnemonics = [test["mnemonic"] for test in TEST_VECT]
+        seeds = [test["seed"] for test in TEST_VECT]
+
+        # Same passphrase for all mnemonics
+        for workers in (1, 2):
+            gen_seeds = Bip39SeedGenerator.GenerateBatch(mnemonics, TEST_PASSPHRASE, workers=workers)
+            self.assertEqual(seeds, [binascii.hexlify(seed) for seed in gen_seeds])
+        # A passphrase for each mnemonic
+        passphrases = [TEST_PASSPHRASE, ""] * (len(mnemonics) // 2)
+        gen_seeds = Bip39SeedGenerator.GenerateBatch(mnemonics[:len(passphrases)], passphrases, workers=2)
+        self.assertEqual([Bip39SeedGenerator(mnemonic).Generate(passphrase)
+                          for mnemonic, passphrase in zip(mnemonics, passphrases)],
+                         list(gen_seeds))
+
+        # Invalid mnemonic, raised while iterating
+        gen_seeds = Bip39SeedGenerator.GenerateBatch(
+            mnemonics[:1] + [test["mnemonic"] for test in TEST_VECT_MNEMONIC_INVALID]
+        )
+        self.assertRaises(ValueError, list, gen_seeds)
+        # Invalid mnemonic in the middle, the seeds of the previous ones shall be yielded before the error
+        for workers in (1, 2):
+            gen_seeds = Bip39SeedGenerator.GenerateBatch(
+                mnemonics[:6] + [TEST_VECT_MNEMONIC_INVALID[1]["mnemonic"]] + mnemonics[6:9],
+                TEST_PASSPHRASE,
+                workers=workers
+            )
+            self.assertEqual(seeds[:6], [binascii.hexlify(next(gen_seeds)) for _ in range(6)])
+            with self.assertRaisesRegex(MnemonicChecksumError, "index 6"):
+                next(gen_seeds)
+        # Different number of passphrases
+        self.assertRaises(ValueError, list, Bip39SeedGenerator.GenerateBatch(mnemonics, ["", ""]))
+        self.assertRaises(ValueError, list, Bip39SeedGenerator.GenerateBatch(mnemonics[:1], ["", ""]))
+        # Invalid workers
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateBatch, mnemonics, workers=0)
+
     # Test entropy generator and construction from valid entropy bit lengths
     def test_entropy_valid_bitlen(self):
         for test_bit_len in Bip39EntropyBitLen:
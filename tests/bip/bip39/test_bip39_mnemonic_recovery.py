@@ -0,0 +1,206 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent import futures
+from unittest import mock
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicRecovery, Bip39SeedGenerator, Bip44, Bip44Changes, Bip44Coins, Bip84, Bip84Coins
+)
+from bip_utils.bip.bip39.bip39_mnemonic_recovery import _Bip39RecoveryWorker
+
+
+# Mnemonic to be recovered
+TEST_MNEMONIC = "legal winner thank year wave sausage worth useful legal winner thank yellow"
+# Index of the known address
+TEST_ADDR_IDX = 2
+# Known address
+TEST_ADDRESS = (Bip84.FromSeed(Bip39SeedGenerator(TEST_MNEMONIC).Generate(), Bip84Coins.BITCOIN)
+                .Purpose()
+                .Coin()
+                .Account(0)
+                .Change(Bip44Changes.CHAIN_EXT)
+                .AddressIndex(TEST_ADDR_IDX)
+                .PublicKey()
+                .ToAddress())
+
+# Maximum time in seconds a chunk is blocked for (only for not hanging if the test fails)
+TEST_BLOCK_TIMEOUT = 30
+
+# Tests for partial mnemonics
+TEST_VECT = [
+    # Unknown word
+    {
+        "mnemonic": "legal winner thank year wave sausage worth useful legal winner ? yellow",
+        "candidates_num": 2048,
+    },
+    # Unknown word (list)
+    {
+        "mnemonic": ["legal", "winner", "thank", "year", "wave", "sausage", "worth", "useful", "legal", "winner",
+                     None, "yellow"],
+        "candidates_num": 2048,
+    },
+    # Misspelled words (substitution and transposition)
+    {
+        "mnemonic": "legal wnner thank yaer wav sausage worth useful legal winner thank yelow",
+        "candidates_num": 8,
+    },
+    # Missing word in unknown position
+    {
+        "mnemonic": "winner thank year wave sausage worth useful legal winner thank yellow",
+        "candidates_num": 12 * 2048,
+    },
+]
+
+
+#
+# Tests
+#
+class Bip39MnemonicRecoveryTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            recovery = Bip39MnemonicRecovery(test["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS, addr_num=3)
+            self.assertEqual(test["candidates_num"], recovery.CandidatesNum())
+
+            result = recovery.Recover()
+            self.assertEqual(TEST_MNEMONIC, result.Mnemonic().ToStr())
+            self.assertEqual(TEST_ADDR_IDX, result.AddressIndex())
+
+    # Test recovery using more processes
+    def test_workers(self):
+        recovery = Bip39MnemonicRecovery(TEST_VECT[0]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS, addr_num=3)
+        result = recovery.Recover(workers=2, chunk_size=256)
+        self.assertEqual(TEST_MNEMONIC, result.Mnemonic().ToStr())
+        self.assertEqual(TEST_ADDR_IDX, result.AddressIndex())
+
+    # Test that recovery using more processes does not wait for the running chunks after a match
+    def test_workers_match(self):
+        search_range = _Bip39RecoveryWorker.SearchRange
+        chunk_started = threading.Event()
+        chunk_released = threading.Event()
+        chunk_done = threading.Event()
+
+        # Chunks after the first one are blocked until released
+        def blocking_search_range(start, count):
+            if start != 0:
+                chunk_started.set()
+                chunk_released.wait(TEST_BLOCK_TIMEOUT)
+                chunk_done.set()
+            return search_range(start, count)
+
+        # Workers are threads, so that the chunks can be blocked
+        with mock.patch.object(futures, "ProcessPoolExecutor", futures.ThreadPoolExecutor), \
+                mock.patch.object(_Bip39RecoveryWorker, "SearchRange", blocking_search_range):
+            # The match is in the first chunk, the second one is still blocked when it's found
+            recovery = Bip39MnemonicRecovery(TEST_VECT[3]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                                             addr_num=3)
+            try:
+                result = recovery.Recover(workers=2, chunk_size=4096)
+                self.assertTrue(chunk_started.is_set())
+                self.assertFalse(chunk_done.is_set())
+            finally:
+                chunk_released.set()
+        self.assertEqual(TEST_MNEMONIC, result.Mnemonic().ToStr())
+
+    # Test not found mnemonic
+    def test_not_found(self):
+        # Address index not searched
+        recovery = Bip39MnemonicRecovery(TEST_VECT[2]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS)
+        self.assertIsNone(recovery.Recover())
+        # Different passphrase
+        recovery = Bip39MnemonicRecovery(TEST_VECT[2]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                                         passphrase="test", addr_num=3)
+        self.assertIsNone(recovery.Recover())
+
+    # Test checkpoint file
+    def test_checkpoint(self):
+        recovery = Bip39MnemonicRecovery(TEST_VECT[0]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS, addr_num=3)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "recovery.json")
+
+            # The result is in the last chunk, so the previous ones are saved
+            result = recovery.Recover(checkpoint_file=file_path, chunk_size=1024)
+            self.assertEqual(TEST_MNEMONIC, result.Mnemonic().ToStr())
+            with open(file_path, "r", encoding="utf-8") as fin:
+                checkpoint = json.load(fin)
+            self.assertEqual(1024, checkpoint["next_index"])
+            self.assertFalse(os.path.exists(file_path + ".tmp"))
+
+            # Resume the search
+            result = recovery.Recover(checkpoint_file=file_path, chunk_size=256)
+            self.assertEqual(TEST_MNEMONIC, result.Mnemonic().ToStr())
+
+            # Resume after the result
+            checkpoint["next_index"] = 2040
+            with open(file_path, "w", encoding="utf-8") as fout:
+                json.dump(checkpoint, fout)
+            self.assertIsNone(recovery.Recover(checkpoint_file=file_path, chunk_size=4))
+            with open(file_path, "r", encoding="utf-8") as fin:
+                self.assertEqual(2048, json.load(fin)["next_index"])
+
+            # Checkpoint of a different search
+            recovery = Bip39MnemonicRecovery(TEST_VECT[0]["mnemonic"], Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS)
+            self.assertRaises(ValueError, recovery.Recover, checkpoint_file=file_path)
+
+            # Invalid checkpoints
+            for checkpoint_data in ("invalid", "{}", json.dumps(dict(checkpoint, version=0)),
+                                    json.dumps(dict(checkpoint, next_index=-1))):
+                with open(file_path, "w", encoding="utf-8") as fout:
+                    fout.write(checkpoint_data)
+                self.assertRaises(ValueError, recovery.Recover, checkpoint_file=file_path)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        mnemonic = TEST_VECT[0]["mnemonic"]
+
+        # Invalid coin and change types
+        self.assertRaises(TypeError, Bip39MnemonicRecovery, mnemonic, Bip44, Bip84Coins.BITCOIN, TEST_ADDRESS)
+        self.assertRaises(TypeError, Bip39MnemonicRecovery, mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                          change=0)
+        # Invalid parameters
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                          account=-1)
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                          addr_num=0)
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                          max_edit_dist=-1)
+        # Invalid words count
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, "", Bip44, Bip44Coins.BITCOIN, TEST_ADDRESS)
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, " ".join(["?"] * 25), Bip44, Bip44Coins.BITCOIN,
+                          TEST_ADDRESS)
+        # Misspelled word without similar words
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, mnemonic.replace("wave", "xxxxxxx"), Bip84,
+                          Bip84Coins.BITCOIN, TEST_ADDRESS)
+        # Word of a different language
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS,
+                          lang=Bip39Languages.ITALIAN, max_edit_dist=0)
+
+        # Invalid recover parameters
+        recovery = Bip39MnemonicRecovery(mnemonic, Bip84, Bip84Coins.BITCOIN, TEST_ADDRESS)
+        self.assertRaises(ValueError, recovery.Recover, workers=0)
+        self.assertRaises(ValueError, recovery.Recover, chunk_size=0)
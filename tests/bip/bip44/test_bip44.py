@@ -19,7 +19,12 @@
 # THE SOFTWARE.
 
 # Imports
-from bip_utils import Bip44, Bip44Coins, Bip44Conf, Bip49Coins, Bip84Coins, Bip86Coins, Cip1852Coins
+from bip_utils import (
+    Bip32Slip10Ed25519, Bip32Slip10Secp256k1, Bip44, Bip44Changes, Bip44Coins, Bip44Conf, Bip44ConfGetter, Bip49Coins,
+    Bip84Coins, Bip86Coins, Cip1852Coins, P2PKHAddrEncoder, SolAddrEncoder
+)
+from bip_utils.addr import IAddrEncoder
+from bip_utils.bip.bip32 import Bip32Base
 from tests.bip.bip32.test_bip32_base import TEST_SEED
 from tests.bip.bip44_base.test_bip44_base import Bip44BaseTests
 
@@ -2491,6 +2496,67 @@ class Bip44Tests(Bip44BaseTests):
     def test_type_error(self):
         self._test_type_error(Bip44, [Bip49Coins, Bip84Coins, Bip86Coins, Cip1852Coins])
 
+    # Test default path cache
+    def test_default_path_cache(self):
+        self._test_default_path_cache(Bip44, Bip44Coins.BITCOIN, TEST_SEED)
+
+    # Test level objects
+    def test_level_objects(self):
+        self._test_level_objects(Bip44, Bip44Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         self._test_invalid_derivations(Bip44, Bip44Coins.BITCOIN, TEST_SEED)
+
+    # Test addresses iteration
+    def test_iter_addresses(self):
+        self._test_iter_addresses(
+            Bip44,
+            (Bip44Coins.BITCOIN, Bip44Coins.ETHEREUM, Bip44Coins.SOLANA, Bip44Coins.CARDANO_BYRON_ICARUS),
+            TEST_SEED
+        )
+
+        # Monero addresses cannot be computed from a public key
+        bip_chg_ctx = Bip44.FromSeed(TEST_SEED, Bip44Coins.MONERO_SECP256K1).Purpose().Coin().Account(0).Change(
+            Bip44Changes.CHAIN_EXT
+        )
+        self.assertRaises(ValueError, bip_chg_ctx.IterAddresses, 0, 1)
+
+    # Test classes in the configuration
+    def test_conf_classes(self):
+        for coin in Bip44Coins:
+            coin_conf = Bip44ConfGetter.GetConfig(coin)
+            self.assertTrue(issubclass(coin_conf.Bip32Class(), Bip32Base))
+            self.assertTrue(issubclass(coin_conf.AddrClass(), IAddrEncoder))
+
+        self.assertTrue(Bip44Conf.BitcoinMainNet.Bip32Class() is Bip32Slip10Secp256k1)
+        self.assertTrue(Bip44Conf.BitcoinMainNet.AddrClass() is P2PKHAddrEncoder)
+        self.assertTrue(Bip44Conf.Solana.Bip32Class() is Bip32Slip10Ed25519)
+        self.assertTrue(Bip44Conf.Solana.AddrClass() is SolAddrEncoder)
+
+    # Test address encoder
+    def test_addr_encoder(self):
+        # Address encoder is built only once and matches the address class and parameters
+        for coin in (Bip44Coins.BITCOIN, Bip44Coins.CARDANO_BYRON_ICARUS, Bip44Coins.ETHEREUM):
+            coin_conf = Bip44ConfGetter.GetConfig(coin)
+            addr_encoder = coin_conf.AddrEncoder()
+            self.assertTrue(coin_conf.AddrEncoder() is addr_encoder)
+            self.assertTrue(addr_encoder.AddrClass() is coin_conf.AddrClass())
+
+            pub_key = Bip44.FromSeed(TEST_SEED, coin).DeriveDefaultPath().PublicKey().Bip32Key()
+            self.assertEqual(
+                coin_conf.AddrClass().EncodeKey(pub_key.KeyObject(), **coin_conf.AddrParamsWithResolvedCalls(pub_key)),
+                addr_encoder.Encode(pub_key)
+            )
+
+        # Address encoder is rebuilt only when the address type changes
+        for coin_conf, set_fct in ((Bip44Conf.BitcoinCashMainNet, Bip44Conf.BitcoinCashMainNet.UseLegacyAddress),
+                                   (Bip44Conf.LitecoinMainNet, Bip44Conf.LitecoinMainNet.UseDeprecatedAddress)):
+            addr_encoder = coin_conf.AddrEncoder()
+            set_fct(False)
+            self.assertTrue(coin_conf.AddrEncoder() is addr_encoder)
+            set_fct(True)
+            self.assertTrue(coin_conf.AddrEncoder() is not addr_encoder)
+            self.assertTrue(coin_conf.AddrEncoder().AddrClass() is coin_conf.AddrClass())
+            set_fct(False)
+            self.assertTrue(coin_conf.AddrEncoder().AddrClass() is coin_conf.AddrClass())
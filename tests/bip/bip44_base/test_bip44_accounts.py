@@ -0,0 +1,110 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip32Secp256k1, Bip32SnapshotReader, Bip44, Bip44AccountsDerivator, Bip44Coins, Bip44DepthError, Bip44Levels, Bip84,
+    Bip84Coins
+)
+from tests.bip.bip32.test_bip32_base import TEST_SEED
+
+
+# Number of workers for tests
+TEST_WORKERS = 2
+
+# Tests for classes and coins
+TEST_VECT = [
+    (Bip44, Bip44Coins.BITCOIN),
+    (Bip44, Bip44Coins.SOLANA),
+    (Bip84, Bip84Coins.BITCOIN),
+]
+
+
+#
+# Tests
+#
+class Bip44AccountsDerivatorTests(unittest.TestCase):
+    # Test accounts derivation
+    def test_iter_accounts(self):
+        for bip_class, bip_coin in TEST_VECT:
+            bip_coin_obj = bip_class.FromSeed(TEST_SEED, bip_coin).Purpose().Coin()
+            exp_accounts = [bip_coin_obj.Account(i) for i in range(3, 8)]
+
+            for workers in (1, TEST_WORKERS):
+                accounts_der = Bip44AccountsDerivator(bip_coin_obj, workers=workers, chunk_size=2)
+
+                accounts = list(accounts_der.IterAccounts(3, 5))
+                self.assertEqual(5, len(accounts))
+                for account, exp_account in zip(accounts, exp_accounts):
+                    self.assertTrue(isinstance(account, bip_class))
+                    self.assertTrue(account.IsLevel(Bip44Levels.ACCOUNT))
+                    self.assertFalse(account.IsPublicOnly())
+                    self.assertEqual(exp_account.PrivateKey().ToExtended(), account.PrivateKey().ToExtended())
+                    self.assertEqual(exp_account.PublicKey().ToAddress(), account.PublicKey().ToAddress())
+
+                self.assertTrue(all(account.IsPublicOnly() for account in accounts_der.IterAccounts(3, 5, True)))
+                self.assertEqual([account.PublicKey().ToExtended() for account in exp_accounts],
+                                 list(accounts_der.IterExtendedKeys(3, 5)))
+                self.assertEqual([account.PrivateKey().ToExtended() for account in exp_accounts],
+                                 list(accounts_der.IterExtendedKeys(3, 5, False)))
+                self.assertEqual([], list(accounts_der.IterExtendedKeys(3, 0)))
+
+            # Shortcut from the coin-level object
+            self.assertEqual([account.PublicKey().ToExtended() for account in exp_accounts],
+                             [account.PublicKey().ToExtended() for account in bip_coin_obj.IterAccounts(3, 5)])
+
+    # Test writing to files
+    def test_write(self):
+        bip_coin_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin()
+        exp_accounts = [bip_coin_obj.Account(i) for i in range(10)]
+        accounts_der = Bip44AccountsDerivator(bip_coin_obj)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "accounts.txt")
+            accounts_der.WriteExtendedKeys(file_path, 0, 10)
+            with open(file_path, encoding="utf-8") as fin:
+                self.assertEqual([account.PublicKey().ToExtended() for account in exp_accounts],
+                                 fin.read().splitlines())
+
+            file_path = os.path.join(tmp_dir, "accounts.bin")
+            accounts_der.WriteSnapshots(file_path, 0, 10)
+            with Bip32SnapshotReader(file_path, Bip32Secp256k1) as reader:
+                self.assertEqual([account.PublicKey().ToExtended() for account in exp_accounts],
+                                 [bip32_obj.PublicKey().ToExtended() for bip32_obj in reader])
+                self.assertTrue(all(bip32_obj.IsPublicOnly() for bip32_obj in reader))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip_coin_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin()
+
+        self.assertRaises(Bip44DepthError, Bip44AccountsDerivator, bip_coin_obj.Account(0))
+        self.assertRaises(ValueError, Bip44AccountsDerivator, bip_coin_obj, workers=0)
+        self.assertRaises(ValueError, Bip44AccountsDerivator, bip_coin_obj, chunk_size=0)
+        self.assertRaises(Bip44DepthError, bip_coin_obj.Account(0).IterAccounts, 0, 1)
+        self.assertRaises(ValueError, bip_coin_obj.IterAccounts, 0, 1, workers=0)
+
+        accounts_der = Bip44AccountsDerivator(bip_coin_obj)
+        self.assertRaises(ValueError, accounts_der.IterAccounts, -1, 1)
+        self.assertRaises(ValueError, accounts_der.IterAccounts, 0, -1)
+        self.assertRaises(ValueError, accounts_der.IterExtendedKeys, 2**31 - 1, 2)
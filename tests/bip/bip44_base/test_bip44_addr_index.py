@@ -0,0 +1,143 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip32Slip10Secp256k1, Bip44, Bip44AddrIndex, Bip44AddrIndexBuilder, Bip44Changes, Bip44Coins, Bip44DepthError,
+    Bip84, Bip84Coins, Bip84Conf, Hash160, P2WPKHAddrEncoder
+)
+from tests.bip.bip32.test_bip32_base import TEST_SEED
+
+
+#
+# Tests
+#
+class Bip44AddrIndexTests(unittest.TestCase):
+    # Test build and lookup
+    def test_build_lookup(self):
+        bip_acc_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "addr.idx")
+            Bip44AddrIndexBuilder(bip_acc_obj).Build(file_path, 30)
+
+            with Bip44AddrIndex(file_path) as addr_index:
+                self.assertEqual(60, addr_index.RecordsNum())
+                for change in (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT):
+                    self.assertEqual(30, addr_index.ChainSize(change))
+                    bip_chg_obj = bip_acc_obj.Change(change)
+                    for addr_idx in (0, 1, 17, 29):
+                        addr = bip_chg_obj.AddressIndex(addr_idx).PublicKey().ToAddress()
+                        self.assertEqual((change, addr_idx), addr_index.Lookup(addr))
+
+                # Not indexed addresses
+                bip_chg_obj = bip_acc_obj.Change(Bip44Changes.CHAIN_EXT)
+                self.assertIsNone(addr_index.Lookup(bip_chg_obj.AddressIndex(30).PublicKey().ToAddress()))
+                self.assertIsNone(addr_index.Lookup("invalid"))
+                self.assertEqual(
+                    [(Bip44Changes.CHAIN_EXT, 0), None],
+                    addr_index.LookupMany([bip_chg_obj.AddressIndex(0).PublicKey().ToAddress(), "invalid"])
+                )
+
+                # Batched lookup shall give the same results in the same order
+                addrs = [addr for change in (Bip44Changes.CHAIN_INT, Bip44Changes.CHAIN_EXT)
+                         for _, addr in bip_acc_obj.Change(change).IterAddresses(0, 31)]
+                self.assertEqual([addr_index.Lookup(addr) for addr in addrs], addr_index.LookupMany(addrs))
+                self.assertEqual([], addr_index.LookupMany([]))
+
+                # Account
+                self.assertEqual(bip_acc_obj.PublicKey().Bip32Key().KeyIdentifier(), addr_index.AccountKeyIdentifier())
+
+            # Closed index
+            addr_index = Bip44AddrIndex(file_path)
+            addr_index.Close()
+            self.assertRaises(ValueError, addr_index.Lookup, "invalid")
+
+    # Test extend
+    def test_extend(self):
+        bip_acc_obj = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0)
+        addr_index_builder = Bip44AddrIndexBuilder(bip_acc_obj)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "addr.idx")
+            addr_index_builder.Build(file_path, 5)
+            addr_index_builder.Extend(file_path, 12)
+            # Lower count shall not remove addresses
+            addr_index_builder.Extend(file_path, 3)
+
+            with Bip44AddrIndex(file_path) as addr_index:
+                self.assertEqual(24, addr_index.RecordsNum())
+                for change in (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT):
+                    self.assertEqual(12, addr_index.ChainSize(change))
+                    for addr_idx, addr in bip_acc_obj.Change(change).IterAddresses(0, 12):
+                        self.assertEqual((change, addr_idx), addr_index.Lookup(addr))
+
+            self.assertFalse(os.path.exists(file_path + ".tmp"))
+
+            # The index of an account cannot be extended with another account
+            bip_acc_obj = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(1)
+            self.assertRaises(ValueError, Bip44AddrIndexBuilder(bip_acc_obj).Extend, file_path, 20)
+
+    # Test building from an extended public key with a custom address function
+    def test_xpub(self):
+        bip_acc_obj = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0)
+        bip32_obj = Bip32Slip10Secp256k1.FromExtendedKey(bip_acc_obj.PublicKey().ToExtended(),
+                                                        Bip84Conf.BitcoinMainNet.KeyNetVersions())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "addr.idx")
+
+            # Address
+            Bip44AddrIndexBuilder(
+                bip32_obj, lambda pub_key: P2WPKHAddrEncoder.EncodeKey(pub_key.KeyObject(), hrp="bc")
+            ).Build(file_path, 10)
+            with Bip44AddrIndex(file_path) as addr_index:
+                for change in (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT):
+                    for addr_idx, addr in bip_acc_obj.Change(change).IterAddresses(0, 10):
+                        self.assertEqual((change, addr_idx), addr_index.Lookup(addr))
+
+            # Key hash
+            Bip44AddrIndexBuilder(bip32_obj, lambda pub_key: Hash160.QuickDigest(pub_key.RawCompressed().ToBytes())
+                                  ).Build(file_path, 10)
+            with Bip44AddrIndex(file_path) as addr_index:
+                pub_key = bip_acc_obj.Change(Bip44Changes.CHAIN_INT).AddressIndex(7).PublicKey()
+                self.assertEqual((Bip44Changes.CHAIN_INT, 7),
+                                 addr_index.Lookup(Hash160.QuickDigest(pub_key.RawCompressed().ToBytes())))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip_coin_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin()
+
+        self.assertRaises(Bip44DepthError, Bip44AddrIndexBuilder, bip_coin_obj)
+        self.assertRaises(ValueError, Bip44AddrIndexBuilder, Bip32Slip10Secp256k1.FromSeed(TEST_SEED))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "addr.idx")
+            self.assertRaises(ValueError, Bip44AddrIndexBuilder(bip_coin_obj.Account(0)).Build, file_path, -1)
+
+            # Invalid files
+            for file_data in (b"", b"\x00" * 1024, b"XXXX" + b"\x00" * (1 << 20)):
+                with open(file_path, "wb") as fout:
+                    fout.write(file_data)
+                self.assertRaises(ValueError, Bip44AddrIndex, file_path)
@@ -23,8 +23,8 @@ import binascii
 import unittest
 
 from bip_utils import (
-    Bip32KeyData, Bip32KeyError, Bip44Changes, Bip44Coins, Bip44DepthError, Bip44Levels, Bip44PrivateKey,
-    Bip44PublicKey, Bip49Coins, CardanoShelley, Cip1852Coins, Monero
+    Bip32KeyData, Bip32KeyError, Bip32PathParser, Bip44Changes, Bip44Coins, Bip44DepthError, Bip44Levels,
+    Bip44PrivateKey, Bip44PublicKey, Bip49Coins, CardanoShelley, Cip1852Coins, Monero
 )
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from bip_utils.bip.conf.common import BipCoinConf
@@ -234,6 +234,54 @@ class Bip44BaseTests(unittest.TestCase):
                 def_addr = bip_def_ctx.PublicKey().ToAddress()
             self.assertEqual(test["default_address"], def_addr)
 
+    # Test default path cache
+    def _test_default_path_cache(self, bip_class, bip_coin, test_seed_bytes):
+        bip_mst_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin)
+        coin_conf = bip_mst_ctx.CoinConf()
+        self.assertEqual(Bip32PathParser.Parse(coin_conf.DefaultPath()).ToList(),
+                         coin_conf.DefaultBip32Path().ToList())
+        self.assertTrue(coin_conf.DefaultBip32Path() is coin_conf.DefaultBip32Path())
+
+        # Reference derivation, without cache
+        exp_priv_key = bip_mst_ctx.Purpose().Coin().Bip32Object().DerivePath(
+            coin_conf.DefaultPath()
+        ).PrivateKey().ToExtended()
+
+        # Disabled by default
+        self.assertIsNone(coin_conf.DefaultPathCache())
+        self.assertEqual(exp_priv_key, bip_mst_ctx.DeriveDefaultPath().PrivateKey().ToExtended())
+        self.assertIsNone(coin_conf.DefaultPathCache())
+
+        coin_conf.EnableDefaultPathCache()
+        def_path_cache = coin_conf.DefaultPathCache()
+        coin_conf.EnableDefaultPathCache()
+        self.assertTrue(def_path_cache is coin_conf.DefaultPathCache())
+        for i in range(3):
+            bip_def_ctx = bip_mst_ctx.DeriveDefaultPath()
+            self.assertTrue(isinstance(bip_def_ctx, bip_class))
+            self.assertTrue(bip_def_ctx.IsLevel(Bip44Levels.ADDRESS_INDEX))
+            self.assertEqual(exp_priv_key, bip_def_ctx.PrivateKey().ToExtended())
+            self.assertEqual(i, def_path_cache.Hits())
+        self.assertTrue(def_path_cache.Size() > 0)
+
+        # Cached nodes shall not be modified by the caller
+        bip_def_ctx.Bip32Object().ConvertToPublic()
+        self.assertEqual(exp_priv_key, bip_mst_ctx.DeriveDefaultPath().PrivateKey().ToExtended())
+
+        # Purge
+        coin_conf.PurgeDefaultPathCache()
+        self.assertEqual(0, def_path_cache.Size())
+        self.assertEqual(exp_priv_key, bip_mst_ctx.DeriveDefaultPath().PrivateKey().ToExtended())
+
+        # Disable
+        coin_conf.DisableDefaultPathCache()
+        self.assertEqual(0, def_path_cache.Size())
+        self.assertIsNone(coin_conf.DefaultPathCache())
+        self.assertEqual(exp_priv_key, bip_mst_ctx.DeriveDefaultPath().PrivateKey().ToExtended())
+
+        # Invalid level
+        self.assertRaises(Bip44DepthError, bip_mst_ctx.Purpose().DeriveDefaultPath)
+
     # Test for IsLevel method
     def _test_is_level(self, bip_class, bip_coin, test_seed_bytes):
         # Master level
@@ -303,6 +351,56 @@ class Bip44BaseTests(unittest.TestCase):
             self.assertRaises(TypeError, bip_class.FromExtendedKey, "", coin)
             self.assertRaises(TypeError, bip_class.FromPrivateKey, b"", coin)
 
+    # Test addresses iteration at change level
+    def _test_iter_addresses(self, bip_class, test_coins, test_seed_bytes):
+        for bip_coin in test_coins:
+            bip_chg_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin).Purpose().Coin().Account(0).Change(
+                Bip44Changes.CHAIN_EXT
+            )
+            bip_chg_ctxs = [bip_chg_ctx]
+            # Also from a public-only object, if public derivation is supported
+            if bip_chg_ctx.Bip32Object().IsPublicDerivationSupported():
+                bip_chg_ctxs.append(
+                    bip_class.FromExtendedKey(bip_chg_ctx.PublicKey().ToExtended(), bip_coin)
+                )
+
+            for ctx in bip_chg_ctxs:
+                exp_addrs = [(i, ctx.AddressIndex(i).PublicKey().ToAddress()) for i in range(5, 9)]
+                self.assertEqual(exp_addrs, list(ctx.IterAddresses(5, 4)))
+
+                for (addr_idx, pub_key, address), (exp_idx, exp_addr) in zip(ctx.IterAddresses(5, 4, True), exp_addrs):
+                    self.assertEqual(exp_idx, addr_idx)
+                    self.assertEqual(exp_addr, address)
+                    self.assertEqual(ctx.AddressIndex(addr_idx).PublicKey().Bip32Key().RawCompressed().ToBytes(),
+                                     pub_key.RawCompressed().ToBytes())
+
+            # Invalid levels and ranges, raised when calling the iterator and not when iterating
+            bip_mst_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin)
+            self.assertRaises(Bip44DepthError, bip_mst_ctx.IterAddresses, 0, 1)
+            self.assertRaises(Bip44DepthError, bip_mst_ctx.Purpose().Coin().IterAddresses, 0, 1)
+            self.assertRaises(Bip44DepthError, bip_chg_ctx.AddressIndex(0).IterAddresses, 0, 1)
+            self.assertRaises(ValueError, bip_chg_ctx.IterAddresses, 0, -1)
+
+    # Test level objects and raw keys
+    def _test_level_objects(self, bip_class, bip_coin, test_seed_bytes):
+        bip_mst_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin)
+        bip_addr_ctx = bip_mst_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
+
+        # Slotted objects, sharing the coin configuration
+        for ctx in (bip_addr_ctx, bip_addr_ctx.PublicKey(), bip_addr_ctx.PrivateKey()):
+            self.assertFalse(hasattr(ctx, "__dict__"))
+        self.assertTrue(bip_addr_ctx.CoinConf() is bip_mst_ctx.CoinConf())
+        self.assertTrue(bip_addr_ctx.IsLevel(Bip44Levels.ADDRESS_INDEX))
+
+        # Key wrappers created once
+        self.assertTrue(bip_addr_ctx.PublicKey() is bip_addr_ctx.PublicKey())
+        self.assertTrue(bip_addr_ctx.PrivateKey() is bip_addr_ctx.PrivateKey())
+
+        # Raw keys
+        self.assertEqual(bip_addr_ctx.PublicKey().RawCompressed().ToBytes(), bip_addr_ctx.PublicKeyBytes())
+        self.assertEqual(bip_addr_ctx.PublicKey().RawUncompressed().ToBytes(), bip_addr_ctx.PublicKeyBytes(False))
+        self.assertEqual(bip_addr_ctx.PrivateKey().Raw().ToBytes(), bip_addr_ctx.PrivateKeyBytes())
+
     # Test invalid path derivations
     def _test_invalid_derivations(self, bip_class, bip_coin, test_seed_bytes):
         # Create all the derivations
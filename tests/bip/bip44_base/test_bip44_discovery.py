@@ -0,0 +1,178 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import asyncio
+import time
+import unittest
+
+from bip_utils import Bip44, Bip44Changes, Bip44Coins, Bip44DepthError, Bip44Discovery, Bip84, Bip84Coins
+from tests.bip.bip32.test_bip32_base import TEST_SEED
+
+
+# Used address indexes for each account and change (accounts 0 and 1 used, account 2 unused)
+TEST_USED_INDEXES = {
+    (0, Bip44Changes.CHAIN_EXT): [0, 1, 5, 24],
+    (0, Bip44Changes.CHAIN_INT): [3],
+    (1, Bip44Changes.CHAIN_EXT): [2],
+    (1, Bip44Changes.CHAIN_INT): [],
+}
+
+# Gap limits and batch sizes to be tested (results shall not depend on batch size)
+TEST_GAP_BATCH = [(20, 20), (20, 7), (5, 3), (5, 50)]
+
+
+# Helper class implementing the "is used" predicate
+class IsUsedPredicate:
+    def __init__(self, bip_coin_obj):
+        self.used_addresses = set()
+        self.batch_sizes = []
+        for (acc_idx, change), indexes in TEST_USED_INDEXES.items():
+            bip_chg_obj = bip_coin_obj.Account(acc_idx).Change(change)
+            for addr_idx in indexes:
+                self.used_addresses.add(bip_chg_obj.AddressIndex(addr_idx).PublicKey().ToAddress())
+
+    def __call__(self, addresses):
+        self.batch_sizes.append(len(addresses))
+        return [addr in self.used_addresses for addr in addresses]
+
+
+# Expected used indexes of a chain, given the gap limit
+def expected_used_indexes(acc_idx, change, gap_limit):
+    used_indexes = []
+    for addr_idx in TEST_USED_INDEXES.get((acc_idx, change), []):
+        if addr_idx - (used_indexes[-1] + 1 if used_indexes else 0) >= gap_limit:
+            break
+        used_indexes.append(addr_idx)
+    return used_indexes
+
+
+#
+# Tests
+#
+class Bip44DiscoveryTests(unittest.TestCase):
+    # Test chain discovery
+    def test_discover_chain(self):
+        bip_coin_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin()
+        is_used = IsUsedPredicate(bip_coin_obj)
+
+        for gap_limit, batch_size in TEST_GAP_BATCH:
+            discovery = Bip44Discovery(gap_limit, batch_size)
+            for change in (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT):
+                is_used.batch_sizes = []
+                chain = discovery.DiscoverChain(bip_coin_obj.Account(0), change, is_used)
+
+                used_indexes = expected_used_indexes(0, change, gap_limit)
+                self.assertEqual(change, chain.Change())
+                self.assertEqual(used_indexes, chain.UsedIndexes())
+                self.assertEqual(len(used_indexes) > 0, chain.IsUsed())
+                self.assertEqual(used_indexes[-1] + 1 if used_indexes else 0, chain.NextIndex())
+                # Predicate is called with batches, stopping as soon as the gap limit is reached
+                self.assertTrue(all(size == batch_size for size in is_used.batch_sizes))
+                self.assertEqual((chain.NextIndex() + gap_limit + batch_size - 1) // batch_size,
+                                 len(is_used.batch_sizes))
+
+    # Test accounts discovery
+    def test_discover_accounts(self):
+        for bip_cls, coin in ((Bip44, Bip44Coins.ETHEREUM), (Bip84, Bip84Coins.BITCOIN)):
+            bip_coin_obj = bip_cls.FromSeed(TEST_SEED, coin).Purpose().Coin()
+            is_used = IsUsedPredicate(bip_coin_obj)
+
+            for gap_limit, batch_size in TEST_GAP_BATCH:
+                discovery = Bip44Discovery(gap_limit, batch_size)
+                accounts = list(discovery.DiscoverAccounts(bip_coin_obj, is_used))
+                self.__test_accounts(accounts, gap_limit)
+
+                # Same result with the asynchronous predicate
+                accounts = asyncio.run(self.__discover_accounts_async(discovery, bip_coin_obj, is_used))
+                self.__test_accounts(accounts, gap_limit)
+
+            # Maximum number of accounts
+            accounts = list(Bip44Discovery().DiscoverAccounts(bip_coin_obj, is_used, 1))
+            self.assertEqual(1, len(accounts))
+
+            # Single account
+            account = Bip44Discovery().DiscoverAccount(bip_coin_obj.Account(1), is_used)
+            self.assertEqual(1, account.AccountIndex())
+            self.assertEqual([2], account.Chain(Bip44Changes.CHAIN_EXT).UsedIndexes())
+            self.assertEqual([], account.Chain(Bip44Changes.CHAIN_INT).UsedIndexes())
+            account = asyncio.run(Bip44Discovery().DiscoverAccountAsync(bip_coin_obj.Account(2),
+                                                                        self.__async_predicate(is_used)))
+            self.assertFalse(account.IsUsed())
+
+    # Test that the asynchronous discovery does not wait for the next batch if the predicate raises
+    def test_discover_chain_async_error(self):
+        bip_acc_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+        times = {}
+
+        async def is_used_raise(addresses):
+            times["raise"] = time.perf_counter()
+            raise RuntimeError("Predicate error")
+
+        async def discover():
+            times["start"] = time.perf_counter()
+            try:
+                await Bip44Discovery(20, 1000).DiscoverChainAsync(bip_acc_obj, Bip44Changes.CHAIN_EXT, is_used_raise)
+            except RuntimeError:
+                times["end"] = time.perf_counter()
+
+        asyncio.run(discover())
+        # Deriving the first batch gives the time needed for deriving the next one
+        self.assertLess(times["end"] - times["raise"], (times["raise"] - times["start"]) / 2)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, Bip44Discovery, 0)
+        self.assertRaises(ValueError, Bip44Discovery, 20, 0)
+
+        bip_coin_obj = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin()
+        discovery = Bip44Discovery()
+        # Invalid levels
+        self.assertRaises(Bip44DepthError, discovery.DiscoverChain, bip_coin_obj, Bip44Changes.CHAIN_EXT,
+                          lambda addrs: [False] * len(addrs))
+        self.assertRaises(Bip44DepthError, lambda: list(discovery.DiscoverAccounts(bip_coin_obj.Account(0),
+                                                                                   lambda addrs: [])))
+        # Invalid predicate result
+        self.assertRaises(ValueError, discovery.DiscoverChain, bip_coin_obj.Account(0), Bip44Changes.CHAIN_EXT,
+                          lambda addrs: [False])
+
+    def __test_accounts(self, accounts, gap_limit):
+        self.assertEqual([0, 1], [account.AccountIndex() for account in accounts])
+        for account in accounts:
+            self.assertTrue(account.IsUsed())
+            self.assertEqual(account.AccountIndex(), account.Bip44Object().Bip32Object().Index().Unharden().ToInt())
+            for change in (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT):
+                self.assertEqual(expected_used_indexes(account.AccountIndex(), change, gap_limit),
+                                 account.Chain(change).UsedIndexes())
+
+    @staticmethod
+    def __async_predicate(is_used):
+        async def is_used_async(addresses):
+            await asyncio.sleep(0)
+            return is_used(addresses)
+        return is_used_async
+
+    @staticmethod
+    async def __discover_accounts_async(discovery, bip_coin_obj, is_used):
+        return [
+            account
+            async for account in discovery.DiscoverAccountsAsync(bip_coin_obj,
+                                                                 Bip44DiscoveryTests.__async_predicate(is_used))
+        ]
@@ -0,0 +1,113 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils import Bip44, Bip44Coins, Bip44MultiCoinDerivator, Bip49Coins, Bip84, Bip84Coins, Cip1852, Cip1852Coins
+from bip_utils.bip.bip44_base import Bip44Base
+from tests.bip.bip32.test_bip32_base import TEST_SEED
+
+
+# Coins for parallel tests (different groups)
+TEST_COINS_PARALLEL = [
+    Bip44Coins.BITCOIN,
+    Bip44Coins.ETHEREUM,
+    Bip44Coins.AVAX_C_CHAIN,
+    Bip44Coins.SOLANA,
+    Bip44Coins.LITECOIN,
+]
+
+# Child class that does not override GetCoinConf, like the ones defined before it was added
+Bip44NoCoinConf = type("Bip44NoCoinConf",
+                       (Bip44Base,),
+                       {name: Bip44.__dict__[name] for name in Bip44Base.__abstractmethods__})
+
+
+#
+# Tests
+#
+class Bip44MultiCoinTests(unittest.TestCase):
+    # Test default paths of all coins
+    def test_default_paths(self):
+        derivator = Bip44MultiCoinDerivator(TEST_SEED)
+        bip_objs = derivator.DeriveDefaultPaths(Bip44, list(Bip44Coins))
+
+        self.assertEqual(list(Bip44Coins), list(bip_objs.keys()))
+        for coin, bip_obj in bip_objs.items():
+            self.__test_bip_obj(Bip44.FromSeed(TEST_SEED, coin).DeriveDefaultPath(), bip_obj)
+
+        # Derive again, nodes shall be reused
+        bip_objs = derivator.DeriveDefaultPaths(Bip44, [Bip44Coins.ETHEREUM])
+        self.__test_bip_obj(Bip44.FromSeed(TEST_SEED, Bip44Coins.ETHEREUM).DeriveDefaultPath(),
+                            bip_objs[Bip44Coins.ETHEREUM])
+
+        # Purge and derive again
+        derivator.Purge()
+        bip_objs = derivator.DeriveDefaultPaths(Bip44, [Bip44Coins.BITCOIN])
+        self.__test_bip_obj(Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).DeriveDefaultPath(),
+                            bip_objs[Bip44Coins.BITCOIN])
+
+    # Test accounts with different classes
+    def test_accounts(self):
+        derivator = Bip44MultiCoinDerivator(TEST_SEED)
+        for bip_cls, coins in ((Bip44, [Bip44Coins.BITCOIN, Bip44Coins.ETHEREUM, Bip44Coins.CARDANO_BYRON_ICARUS]),
+                               (Bip84, [Bip84Coins.BITCOIN, Bip84Coins.LITECOIN]),
+                               (Cip1852, [Cip1852Coins.CARDANO_ICARUS])):
+            bip_objs = derivator.DeriveAccounts(bip_cls, coins, 1)
+            for coin in coins:
+                self.__test_bip_obj(bip_cls.FromSeed(TEST_SEED, coin).Purpose().Coin().Account(1), bip_objs[coin])
+
+    # Test parallel derivation
+    def test_parallel(self):
+        derivator = Bip44MultiCoinDerivator(TEST_SEED)
+
+        bip_objs = derivator.DeriveDefaultPaths(Bip44, TEST_COINS_PARALLEL, workers=2)
+        self.assertEqual(TEST_COINS_PARALLEL, list(bip_objs.keys()))
+        for coin in TEST_COINS_PARALLEL:
+            self.__test_bip_obj(Bip44.FromSeed(TEST_SEED, coin).DeriveDefaultPath(), bip_objs[coin])
+
+        bip_objs = derivator.DeriveAccounts(Bip44, TEST_COINS_PARALLEL, workers=2)
+        self.assertEqual(TEST_COINS_PARALLEL, list(bip_objs.keys()))
+        for coin in TEST_COINS_PARALLEL:
+            self.__test_bip_obj(Bip44.FromSeed(TEST_SEED, coin).Purpose().Coin().Account(0), bip_objs[coin])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        derivator = Bip44MultiCoinDerivator(TEST_SEED)
+
+        self.assertRaises(TypeError, derivator.DeriveDefaultPaths, Bip44, [Bip49Coins.BITCOIN])
+        self.assertRaises(TypeError, derivator.DeriveAccounts, Bip84, [Bip44Coins.BITCOIN])
+        self.assertRaises(ValueError, derivator.DeriveDefaultPaths, Bip44, [Bip44Coins.BITCOIN], 0)
+        self.assertRaises(ValueError, Bip44MultiCoinDerivator, TEST_SEED, 0)
+
+        # Child classes without GetCoinConf can be constructed, but not used by the derivator
+        bip_obj = Bip44NoCoinConf.FromSeed(TEST_SEED, Bip44Coins.BITCOIN)
+        self.assertEqual(Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).DeriveDefaultPath().PublicKey().ToAddress(),
+                         bip_obj.DeriveDefaultPath().PublicKey().ToAddress())
+        self.assertRaises(TypeError, Bip44NoCoinConf.GetCoinConf, Bip44Coins.BITCOIN)
+        self.assertRaises(TypeError, derivator.DeriveDefaultPaths, Bip44NoCoinConf, [Bip44Coins.BITCOIN])
+
+    # Test a derived object against the expected one
+    def __test_bip_obj(self, bip_obj_exp, bip_obj):
+        self.assertIs(bip_obj_exp.CoinConf(), bip_obj.CoinConf())
+        self.assertEqual(bip_obj_exp.Level(), bip_obj.Level())
+        self.assertEqual(bip_obj_exp.PrivateKey().ToExtended(), bip_obj.PrivateKey().ToExtended())
+        self.assertEqual(bip_obj_exp.PublicKey().ToExtended(), bip_obj.PublicKey().ToExtended())
@@ -736,6 +736,18 @@ class Bip49Tests(Bip44BaseTests):
     def test_type_error(self):
         self._test_type_error(Bip49, [Bip44Coins, Bip84Coins, Bip86Coins, Cip1852Coins])
 
+    # Test default path cache
+    def test_default_path_cache(self):
+        self._test_default_path_cache(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
+    # Test level objects
+    def test_level_objects(self):
+        self._test_level_objects(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         self._test_invalid_derivations(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
+    # Test addresses iteration
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip49, (Bip49Coins.BITCOIN, Bip49Coins.LITECOIN), TEST_SEED)
@@ -228,6 +228,18 @@ class Bip84Tests(Bip44BaseTests):
     def test_type_error(self):
         self._test_type_error(Bip84, [Bip44Coins, Bip49Coins, Bip86Coins, Cip1852Coins])
 
+    # Test default path cache
+    def test_default_path_cache(self):
+        self._test_default_path_cache(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
+    # Test level objects
+    def test_level_objects(self):
+        self._test_level_objects(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         self._test_invalid_derivations(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
+    # Test addresses iteration
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip84, (Bip84Coins.BITCOIN, Bip84Coins.LITECOIN), TEST_SEED)
@@ -165,6 +165,18 @@ class Bip86Tests(Bip44BaseTests):
     def test_type_error(self):
         self._test_type_error(Bip86, [Bip44Coins, Bip49Coins, Bip84Coins, Cip1852Coins])
 
+    # Test default path cache
+    def test_default_path_cache(self):
+        self._test_default_path_cache(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
+    # Test level objects
+    def test_level_objects(self):
+        self._test_level_objects(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         self._test_invalid_derivations(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
+    # Test addresses iteration
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip86, (Bip86Coins.BITCOIN, Bip86Coins.BITCOIN_TESTNET), TEST_SEED)
@@ -235,6 +235,10 @@ class CardanoByronLegacyBip32Tests(Bip32BaseTests):
     def test_from_seed_and_path(self):
         self._test_from_seed_and_path(CardanoByronLegacyBip32, TEST_VECT)
 
+    # Test derivation of a range of children
+    def test_children_range(self):
+        self._test_children_range(CardanoByronLegacyBip32, TEST_VECT)
+
     # Run all tests in test vector using FromExtendedKey for construction
     def test_from_ex_key(self):
         self._test_from_ex_key(CardanoByronLegacyBip32, TEST_VECT)
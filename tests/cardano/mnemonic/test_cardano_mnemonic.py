@@ -121,6 +121,11 @@ class CardanoMnemonicTests(unittest.TestCase):
             seed = CardanoIcarusSeedGenerator(test["mnemonic"]).Generate()
             self.assertEqual(test["seed_icarus"], binascii.hexlify(seed))
 
+    # Test batch Icarus seed generation
+    def test_generate_batch_icarus(self):
+        gen_seeds = CardanoIcarusSeedGenerator.GenerateBatch([test["mnemonic"] for test in TEST_VECT])
+        self.assertEqual([test["seed_icarus"] for test in TEST_VECT], [binascii.hexlify(seed) for seed in gen_seeds])
+
     # Tests invalid parameters
     def test_invalid_params(self):
         self.assertRaises(TypeError, CardanoByronLegacySeedGenerator, "", 0)
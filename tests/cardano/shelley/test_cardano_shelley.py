@@ -151,6 +151,17 @@ class CardanoShelleyTests(unittest.TestCase):
                 self.assertEqual(test_addr["priv_key"], shelley_addr_ctx.PrivateKeys().AddressKey().Raw().ToHex())
                 self.assertEqual(test_addr["address"], shelley_addr_ctx.PublicKeys().ToAddress())
 
+    # Test that the staking configuration does not share the default path cache
+    def test_staking_conf(self):
+        cip1852 = Cip1852.FromExtendedKey(TEST_VECT[0]["ex_acc"], TEST_VECT[0]["coin"])
+        cip1852.CoinConf().EnableDefaultPathCache()
+        try:
+            staking_conf = CardanoShelley.FromCip1852Object(cip1852).StakingObject().CoinConf()
+            self.assertFalse(staking_conf is cip1852.CoinConf())
+            self.assertIsNone(staking_conf.DefaultPathCache())
+        finally:
+            cip1852.CoinConf().DisableDefaultPathCache()
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Construct from a BIP44 object
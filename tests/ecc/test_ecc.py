@@ -37,6 +37,7 @@ from bip_utils import (
     Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey, Sr25519, Sr25519Point,
     Sr25519PrivateKey, Sr25519PublicKey
 )
+from bip_utils.ecc import Secp256k1Utils
 from bip_utils.ecc.conf import EccConf
 from bip_utils.utils.misc import IntegerUtils
 
@@ -609,6 +610,25 @@ class EccTests(unittest.TestCase):
         self.assertEqual(point.Y(), TEST_SECP256K1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_SECP256K1_POINT_DEC_BYTES)
 
+        #
+        # Utils
+        #
+        tweak_bytes = TEST_SECP256K1_PRIV_KEY_BYTES
+        pub_key_tweaked = Secp256k1PublicKey.FromPoint(
+            point + (Secp256k1.Generator() * int.from_bytes(tweak_bytes, "big"))
+        )
+        self.assertEqual(Secp256k1Utils.PublicKeyTweakAdd(TEST_SECP256K1_COMPR_PUB_KEY_BYTES, tweak_bytes),
+                         pub_key_tweaked.RawCompressed().ToBytes())
+        self.assertEqual(Secp256k1Utils.PublicKeyTweakAdd(TEST_SECP256K1_UNCOMPR_PUB_KEY_BYTES, tweak_bytes),
+                         pub_key_tweaked.RawCompressed().ToBytes())
+        self.assertRaises(ValueError, Secp256k1Utils.PublicKeyTweakAdd, TEST_SECP256K1_COMPR_PUB_KEY_BYTES,
+                          IntegerUtils.ToBytes(Secp256k1.Order(), bytes_num=32))
+        # Key object, which shall not be modified
+        pub_key = Secp256k1PublicKey.FromBytes(TEST_SECP256K1_COMPR_PUB_KEY_BYTES)
+        self.assertEqual(Secp256k1Utils.PublicKeyTweakAdd(pub_key, tweak_bytes),
+                         pub_key_tweaked.RawCompressed().ToBytes())
+        self.assertEqual(TEST_SECP256K1_COMPR_PUB_KEY_BYTES, pub_key.RawCompressed().ToBytes())
+
     # Test Sr25519 class
     def test_sr25519(self):
         # Curve
@@ -197,6 +197,11 @@ class ElectrumV2MnemonicTests(unittest.TestCase):
             elif test["mnemonic_type"] == ElectrumV2MnemonicTypes.SEGWIT:
                 self.assertEqual(test["address"], ElectrumV2Segwit.FromSeed(seed).GetAddress(0, 0))
 
+    # Test batch seed generation
+    def test_generate_batch(self):
+        gen_seeds = ElectrumV2SeedGenerator.GenerateBatch([test["mnemonic"] for test in TEST_VECT], workers=2)
+        self.assertEqual([test["seed"] for test in TEST_VECT], [binascii.hexlify(seed) for seed in gen_seeds])
+
     # Test entropy generator and construction from valid entropy bit lengths
     def test_entropy_valid_bitlen(self):
         for test_bit_len in ElectrumV2EntropyBitLen:
@@ -158,6 +158,13 @@ class SubstrateMnemonicTests(unittest.TestCase):
             seed = SubstrateBip39SeedGenerator(test["mnemonic"]).Generate(TEST_PASSPHRASE)
             self.assertEqual(test["seed"], binascii.hexlify(seed))
 
+    # Test batch seed generation
+    def test_generate_batch(self):
+        gen_seeds = SubstrateBip39SeedGenerator.GenerateBatch([test["mnemonic"] for test in TEST_VECT],
+                                                              TEST_PASSPHRASE,
+                                                              workers=2)
+        self.assertEqual([test["seed"] for test in TEST_VECT], [binascii.hexlify(seed) for seed in gen_seeds])
+
     # Tests invalid parameters
     def test_invalid_params(self):
         self.assertRaises(TypeError, SubstrateBip39SeedGenerator, "", 0)
@@ -0,0 +1,59 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import HmacSha512, HmacSha512Context
+
+
+# Tests vector (RFC 4231)
+TEST_VECT = [
+    {
+        "key": b"0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b0b",
+        "data": b"Hi There",
+        "digest": b"87aa7cdea5ef619d4ff0b4241a1d6cb02379f4e2ce4ec2787ad0b30545e17cdedaa833b7d6b8a702038b274eaea3f4e4be9d914eeb61f1702e696c203a126854",
+    },
+    {
+        "key": b"4a656665",
+        "data": b"what do ya want for nothing?",
+        "digest": b"164b7a7bfcf819e2e395fbe73b56e0a387bd64222e831fd610270cd7ea2505549758bf75c05a994a6d034f65f8f0e6fdcaeab1a34d4a6b4b636e070a38bce737",
+    },
+]
+
+
+#
+# Tests
+#
+class HmacTests(unittest.TestCase):
+    # Test HMAC-SHA512 context
+    def test_hmac_sha512_context(self):
+        for test in TEST_VECT:
+            key = binascii.unhexlify(test["key"])
+            digest = binascii.unhexlify(test["digest"])
+            hmac_ctx = HmacSha512Context(key)
+
+            # Digest shall not depend on previous messages
+            for _ in range(2):
+                self.assertEqual(digest, hmac_ctx.Digest(test["data"]))
+                self.assertEqual(HmacSha512.QuickDigest(key, test["data"]), hmac_ctx.Digest(test["data"]))
+                self.assertEqual(HmacSha512.QuickDigestHalves(key, test["data"]), hmac_ctx.DigestHalves(test["data"]))
+            self.assertEqual(HmacSha512.QuickDigest(key, b""), hmac_ctx.Digest(b""))
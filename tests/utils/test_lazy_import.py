@@ -0,0 +1,164 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import ast
+import importlib
+import inspect
+import subprocess
+import sys
+import unittest
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+# Packages using lazy import
+TEST_PACKAGES = [
+    "bip_utils",
+    "bip_utils.addr",
+    "bip_utils.bip.bip32",
+    "bip_utils.bip.bip39",
+    "bip_utils.bip.conf.bip44",
+    "bip_utils.bip.conf.bip49",
+    "bip_utils.bip.conf.bip84",
+    "bip_utils.bip.conf.bip86",
+    "bip_utils.cardano.cip1852.conf",
+    "bip_utils.ecc",
+    "bip_utils.monero.conf",
+    "bip_utils.substrate.conf",
+    "bip_utils.utils.crypto",
+    "bip_utils.utils.misc",
+]
+
+# Heavy third-party modules that shall not be imported by the package itself
+TEST_HEAVY_MODULES = ["Crypto", "cbor2", "coincurve", "crcmod", "ecdsa", "ed25519_blake2b", "nacl", "sr25519"]
+
+# Scenarios, with the heavy modules that they are allowed to import
+TEST_SCENARIOS = [
+    {
+        "code": "import bip_utils",
+        "allowed_modules": [],
+    },
+    {
+        # BIP84 is used since building the BIP44 configurations imports the address classes of all the coins
+        "code": "from bip_utils import Bip39SeedGenerator, Bip84, Bip84Coins\n"
+                "seed = Bip39SeedGenerator('abandon abandon abandon abandon abandon abandon abandon abandon abandon "
+                "abandon abandon about').Generate()\n"
+                "Bip84.FromSeed(seed, Bip84Coins.BITCOIN).DeriveDefaultPath().PublicKey().ToAddress()\n",
+        # crcmod is light, it is imported by the BIP32 snapshot module
+        "allowed_modules": ["coincurve", "crcmod"],
+    },
+]
+
+# Code checking that coin configurations are built only when requested by their getter
+TEST_CONF_CODE = """
+import sys
+from bip_utils import Bip44, Bip44Coins, Bip44ConfGetter, Bip49, Bip84, Bip86, Cip1852, Monero, Substrate
+
+conf_mods = ["bip_utils.bip.conf.bip44.bip44_conf", "bip_utils.bip.conf.bip49.bip49_conf"]
+assert not any(mod in sys.modules for mod in conf_mods)
+Bip44ConfGetter.GetConfig(Bip44Coins.BITCOIN)
+assert conf_mods[0] in sys.modules and conf_mods[1] not in sys.modules
+"""
+
+# Maximum time for importing bip_utils in seconds (very loose, only for detecting regressions)
+TEST_MAX_IMPORT_TIME = 0.25
+
+# Code for running a scenario in a fresh interpreter
+RUNNER_CODE = """
+import sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<scenario>", "exec"))
+print(time.perf_counter() - start)
+print(" ".join(sorted({m.split(".")[0] for m in sys.modules})))
+"""
+
+
+# Run a scenario in a fresh interpreter, returning the elapsed time and the imported top-level modules
+def run_scenario(code):
+    out = subprocess.run([sys.executable, "-c", RUNNER_CODE, code],
+                         check=True,
+                         capture_output=True,
+                         text=True).stdout.splitlines()
+    return float(out[0]), set(out[1].split())
+
+
+# Get the names imported for type checking in the __init__ file of a package, grouped by module
+def type_checking_imports(pkg):
+    tree = ast.parse(inspect.getsource(pkg))
+    type_checking_if = next(node for node in tree.body if isinstance(node, ast.If))
+    return {
+        node.module: tuple(alias.name for alias in node.names)
+        for node in type_checking_if.body
+    }
+
+
+#
+# Tests
+#
+class LazyImportTests(unittest.TestCase):
+    # Test lazy importer
+    def test_lazy_importer(self):
+        lazy_importer = LazyImporter(__name__, {"bip_utils.utils.misc.bytes": ("BytesUtils",)})
+
+        self.assertEqual(lazy_importer.Names(), ["BytesUtils"])
+        self.assertTrue("BytesUtils" in lazy_importer.Dir())
+
+        bytes_utils = lazy_importer.GetAttr("BytesUtils")
+        self.assertTrue(bytes_utils is importlib.import_module("bip_utils.utils.misc.bytes").BytesUtils)
+        # Cached in the module
+        self.assertTrue(sys.modules[__name__].BytesUtils is bytes_utils)
+        del sys.modules[__name__].BytesUtils
+
+        self.assertRaises(AttributeError, lazy_importer.GetAttr, "Invalid")
+
+    # Test that the public names of the packages are unchanged
+    def test_packages(self):
+        for pkg_name in TEST_PACKAGES:
+            pkg = importlib.import_module(pkg_name)
+            mod_to_names = type_checking_imports(pkg)
+
+            all_names = [name for names in mod_to_names.values() for name in names]
+            self.assertEqual(sorted(pkg.__all__), sorted(all_names))
+            self.assertTrue(set(all_names).issubset(dir(pkg)))
+
+            for mod_name, names in mod_to_names.items():
+                mod = importlib.import_module(mod_name)
+                for name in names:
+                    self.assertTrue(getattr(pkg, name) is getattr(mod, name))
+
+            self.assertRaises(AttributeError, getattr, pkg, "InvalidName")
+
+    # Test the heavy modules imported by each scenario
+    def test_imported_modules(self):
+        for test in TEST_SCENARIOS:
+            _, modules = run_scenario(test["code"])
+            heavy_modules = [mod for mod in TEST_HEAVY_MODULES if mod in modules]
+            self.assertEqual(sorted(test["allowed_modules"]), heavy_modules)
+
+    # Test that coin configurations are built lazily
+    def test_lazy_confs(self):
+        run_scenario(TEST_CONF_CODE)
+
+    # Test import time
+    def test_import_time(self):
+        import_time = min(run_scenario("import bip_utils")[0] for _ in range(3))
+        self.assertLess(import_time, TEST_MAX_IMPORT_TIME)
@@ -0,0 +1,116 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import gc
+import unittest
+import weakref
+
+from bip_utils import MemoizedMethod
+from bip_utils.utils.misc.memo import MemoizedMethodConst
+
+
+#
+# Helper classes
+#
+class _Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @MemoizedMethod
+    def Value(self):
+        self.calls += 1
+        return object()
+
+    @MemoizedMethod
+    def Sum(self, a, b=0):
+        self.calls += 1
+        return a + b
+
+
+class _CounterSlots:
+    __slots__ = ("calls",) + MemoizedMethod.AttrNames("_CounterSlots", "Value")
+
+    def __init__(self):
+        self.calls = 0
+
+    @MemoizedMethod
+    def Value(self):
+        self.calls += 1
+        return object()
+
+
+#
+# Tests
+#
+class MemoizedMethodTests(unittest.TestCase):
+    # Test methods without arguments
+    def test_no_args(self):
+        obj = _Counter()
+        value = obj.Value()
+        self.assertIs(obj.Value(), value)
+        self.assertEqual(obj.calls, 1)
+
+        # Results are not shared between instances
+        self.assertIsNot(_Counter().Value(), value)
+
+    # Test methods with arguments
+    def test_args(self):
+        obj = _Counter()
+        self.assertEqual(obj.Sum(1, 2), 3)
+        self.assertEqual(obj.Sum(1, 2), 3)
+        self.assertEqual(obj.Sum(1, b=2), 3)
+        self.assertEqual(obj.Sum(1, b=2), 3)
+        self.assertEqual(obj.calls, 2)
+
+        # The number of stored results is bounded
+        for i in range(MemoizedMethodConst.ARGS_MAX_SIZE + 1):
+            obj.Sum(i)
+        calls = obj.calls
+        obj.Sum(0)
+        self.assertEqual(obj.calls, calls + 1)
+
+    # Test wiping
+    def test_wipe(self):
+        obj = _Counter()
+        obj.Value()
+        obj.Sum(1)
+        MemoizedMethod.Wipe(obj)
+        obj.Value()
+        obj.Sum(1)
+        self.assertEqual(obj.calls, 4)
+
+    # Test classes with __slots__
+    def test_slots(self):
+        obj = _CounterSlots()
+        value = obj.Value()
+        self.assertIs(obj.Value(), value)
+        self.assertEqual(obj.calls, 1)
+        MemoizedMethod.Wipe(obj)
+        self.assertIsNot(obj.Value(), value)
+
+    # Test that results do not keep the instance alive
+    def test_no_leak(self):
+        obj = _Counter()
+        obj.Value()
+        obj_ref = weakref.ref(obj)
+        del obj
+        gc.collect()
+        self.assertIsNone(obj_ref())
@@ -0,0 +1,102 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+from enum import auto, unique
+
+from bip_utils import Bip39Languages, Bip39Mnemonic, MoneroLanguages, MoneroMnemonic
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroWordsListFinder
+from bip_utils.utils.mnemonic import (
+    MnemonicLanguages, MnemonicLanguagesIndex, MnemonicWordsList, MnemonicWordsListGetterBase
+)
+
+
+# Test languages
+TEST_LANGS = [Bip39Languages.ENGLISH, Bip39Languages.FRENCH, Bip39Languages.ITALIAN]
+# Test words lists
+TEST_WORDS_LISTS = {
+    Bip39Languages.ENGLISH: MnemonicWordsList(["abandon", "fatigue", "zoo"]),
+    Bip39Languages.FRENCH: MnemonicWordsList(["abaisser", "fatigue", "zoologie"]),
+    Bip39Languages.ITALIAN: MnemonicWordsList(["abaco", "fatigue", "zucchero"]),
+}
+
+
+# Test language classes
+@unique
+class LanguagesAll(MnemonicLanguages):
+    ENGLISH = auto()
+    FRENCH = auto()
+
+
+@unique
+class LanguagesEnglish(MnemonicLanguages):
+    ENGLISH = auto()
+
+
+# Test words list getter
+class WordsListGetter(MnemonicWordsListGetterBase):
+    def GetByLanguage(self, lang):
+        return MnemonicWordsList(["abandon", "zoo"] if lang.name == "ENGLISH" else ["abaisser", "zoologie"])
+
+
+#
+# Tests
+#
+class MnemonicLanguagesIndexTests(unittest.TestCase):
+    # Test languages index
+    def test_find_languages(self):
+        langs_index = MnemonicLanguagesIndex(TEST_WORDS_LISTS)
+
+        self.assertEqual(TEST_LANGS, langs_index.FindLanguages(["fatigue"]))
+        self.assertEqual(TEST_LANGS, langs_index.FindLanguages([]))
+        self.assertEqual([Bip39Languages.ENGLISH], langs_index.FindLanguages(["fatigue", "zoo", "abandon"]))
+        self.assertEqual([Bip39Languages.FRENCH], langs_index.FindLanguages(["fatigue", "zoologie"]))
+        self.assertEqual([], langs_index.FindLanguages(["zoo", "zoologie"]))
+        self.assertEqual([], langs_index.FindLanguages(["fatigue", "invalid"]))
+
+    # Test that a languages index is built for each language class
+    def test_languages_index_per_class(self):
+        words_list_getter = WordsListGetter()
+
+        langs_index = words_list_getter.GetLanguagesIndex(LanguagesAll)
+        self.assertEqual([LanguagesAll.FRENCH], langs_index.FindLanguages(["zoologie"]))
+        self.assertTrue(langs_index is words_list_getter.GetLanguagesIndex(LanguagesAll))
+
+        langs_index = words_list_getter.GetLanguagesIndex(LanguagesEnglish)
+        self.assertEqual([LanguagesEnglish.ENGLISH], langs_index.FindLanguages(["zoo"]))
+        self.assertEqual([], langs_index.FindLanguages(["zoologie"]))
+
+    # Test language detection
+    def test_find_language(self):
+        for lang in Bip39Languages:
+            mnemonic = Bip39Mnemonic.FromString(
+                " ".join(Bip39WordsListGetter.Instance().GetByLanguage(lang).GetWordAtIdx(i) for i in range(12))
+            )
+            words_list, found_lang = Bip39WordsListFinder.FindLanguage(mnemonic)
+            # Languages sharing all the words shall be detected as the first one
+            self.assertTrue(list(Bip39Languages).index(found_lang) <= list(Bip39Languages).index(lang))
+            self.assertTrue(words_list is Bip39WordsListGetter.Instance().GetByLanguage(found_lang))
+
+        mnemonic = MoneroMnemonic.FromString("abbey " * 24 + "abbey")
+        self.assertEqual(MoneroLanguages.ENGLISH, MoneroWordsListFinder.FindLanguage(mnemonic)[1])
+
+        self.assertRaises(ValueError, Bip39WordsListFinder.FindLanguage, Bip39Mnemonic.FromString("invalid " * 12))
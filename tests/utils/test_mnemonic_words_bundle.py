@@ -0,0 +1,124 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import pkgutil
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+import bip_utils
+from bip_utils import Bip39Languages, MoneroLanguages
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroWordsListGetter
+from bip_utils.utils.mnemonic import MnemonicWordsBundle, MnemonicWordsListFileReader
+from bip_utils.utils.mnemonic.mnemonic_words_bundle import MnemonicWordsBundleBuilder
+
+
+# Package root directory
+TEST_ROOT_DIR = os.path.dirname(bip_utils.__file__)
+# Bundle resource
+TEST_BUNDLE = pkgutil.get_data("bip_utils.utils.mnemonic", "wordlists.bin")
+
+# Tests for words lists in the bundle
+TEST_VECT = [
+    {"key": "bip/bip39/wordlist/english.txt", "words_num": 2048},
+    {"key": "bip/bip39/wordlist/korean.txt", "words_num": 2048},
+    {"key": "electrum/mnemonic_v1/wordlist/english.txt", "words_num": 1626},
+    {"key": "monero/mnemonic/wordlist/russian.txt", "words_num": 1626},
+]
+
+
+#
+# Tests
+#
+class MnemonicWordsBundleTests(unittest.TestCase):
+    # Test that the bundle is up to date with the words lists files
+    def test_up_to_date(self):
+        self.assertEqual(MnemonicWordsBundleBuilder.Build(TEST_ROOT_DIR), TEST_BUNDLE)
+        self.assertTrue(MnemonicWordsBundle(TEST_BUNDLE).IsChecksumValid())
+
+    # Test words lists
+    def test_words_lists(self):
+        bundle = MnemonicWordsBundle.Instance()
+        for test in TEST_VECT:
+            self.assertTrue(bundle.HasKey(test["key"]))
+            self.assertEqual(
+                MnemonicWordsListFileReader.LoadFile(os.path.join(TEST_ROOT_DIR, test["key"]),
+                                                     test["words_num"]).m_idx_to_words,
+                bundle.GetWords(test["key"], test["words_num"])
+            )
+        self.assertFalse(bundle.HasKey("bip/bip39/wordlist/invalid.txt"))
+
+        # Words lists loaded by getters
+        for lang in (Bip39Languages.ENGLISH, Bip39Languages.CHINESE_SIMPLIFIED):
+            self.assertEqual(2048, Bip39WordsListGetter.Instance().GetByLanguage(lang).Length())
+        for lang in (MoneroLanguages.ENGLISH, MoneroLanguages.JAPANESE):
+            self.assertEqual(1626, MoneroWordsListGetter.Instance().GetByLanguage(lang).Length())
+
+    # Test words lists loaded from files if not found in the bundle or if the bundle is not available
+    def test_files_fallback(self):
+        for test in TEST_VECT:
+            self.assertEqual(os.path.join(TEST_ROOT_DIR, test["key"]), MnemonicWordsBundle.KeyToFilePath(test["key"]))
+
+        exp_words = Bip39WordsListGetter.Instance().GetByLanguage(Bip39Languages.ENGLISH).m_idx_to_words
+
+        with mock.patch.object(MnemonicWordsBundle, "HasKey", return_value=False):
+            words_list = Bip39WordsListGetter().GetByLanguage(Bip39Languages.ENGLISH)
+        self.assertEqual(exp_words, words_list.m_idx_to_words)
+
+        with mock.patch.object(MnemonicWordsBundle, "Instance", side_effect=ValueError("Unable to find words bundle")):
+            words_list = Bip39WordsListGetter().GetByLanguage(Bip39Languages.ENGLISH)
+        self.assertEqual(exp_words, words_list.m_idx_to_words)
+
+    # Test build and write
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "test", "wordlist"))
+            with open(os.path.join(tmp_dir, "test", "wordlist", "words.txt"), "w", encoding="utf-8") as fout:
+                fout.write("# Comment\nfirst\n\n  second  \nthird\n")
+
+            file_path = os.path.join(tmp_dir, "wordlists.bin")
+            MnemonicWordsBundleBuilder.Write(tmp_dir, file_path)
+            with open(file_path, "rb") as fin:
+                bundle = MnemonicWordsBundle(fin.read())
+
+            self.assertTrue(bundle.IsChecksumValid())
+            self.assertEqual(["test/wordlist/words.txt"], bundle.Keys())
+            self.assertEqual(["first", "second", "third"], bundle.GetWords("test/wordlist/words.txt", 3))
+            self.assertFalse(os.path.exists(file_path + ".tmp"))
+
+    # Test invalid bundles
+    def test_invalid(self):
+        header_len = struct.calcsize(">4sBxxx32sI")
+
+        self.assertRaises(ValueError, MnemonicWordsBundle, TEST_BUNDLE[:header_len - 1])
+        self.assertRaises(ValueError, MnemonicWordsBundle, b"XXXX" + TEST_BUNDLE[4:])
+        self.assertRaises(ValueError, MnemonicWordsBundle, TEST_BUNDLE[:4] + b"\xff" + TEST_BUNDLE[5:])
+        self.assertRaises(ValueError, MnemonicWordsBundle, TEST_BUNDLE[:-1])
+        # Wrong checksum
+        self.assertFalse(MnemonicWordsBundle(TEST_BUNDLE[:-1] + b"\x00").IsChecksumValid())
+
+        # Invalid words lists
+        bundle = MnemonicWordsBundle(TEST_BUNDLE)
+        self.assertRaises(ValueError, bundle.GetWords, "bip/bip39/wordlist/invalid.txt", 2048)
+        self.assertRaises(ValueError, bundle.GetWords, "bip/bip39/wordlist/english.txt", 2047)